@@ -13,6 +13,7 @@
 # limitations under the License.
 # ===========================================================================
 """Cost model splitter"""
+import heapq
 from functools import reduce
 from .model import PrimLib, Graph, Tensor
 
@@ -31,15 +32,10 @@ class GraphSplitByPattern:
             self.mode = None
             self.is_output = is_output
             self.output_excluded = set()
+            # position in the topological order of the areas, maintained by GraphSplitByPattern
+            self.rank = 0
             if self.pattern == PrimLib.REDUCE:
-                def _gather_reduce_exclude(op):
-                    for to in op.output.to_ops:
-                        idx = to.inputs.index(op.output)
-                        if self.get_relation(to, idx) > PrimLib.ELEMWISE:
-                            self.output_excluded.add(to)
-                        else:
-                            _gather_reduce_exclude(to)
-                _gather_reduce_exclude(init_op)
+                self._gather_reduce_exclude(init_op)
 
         def __str__(self):
             return '<' + '-'.join([op.output.name for op in self.ops]) + '>'
@@ -47,6 +43,19 @@ class GraphSplitByPattern:
         def __repr__(self):
             return str(self)
 
+        def _gather_reduce_exclude(self, init_op):
+            """Gather the ops reached from the reduce through elemwise ops, which are not elemwise to their inputs"""
+            stack, visited = [init_op], {init_op}
+            while stack:
+                op = stack.pop()
+                for to in op.output.to_ops:
+                    idx = to.inputs.index(op.output)
+                    if self.get_relation(to, idx) > PrimLib.ELEMWISE:
+                        self.output_excluded.add(to)
+                    elif to not in visited:
+                        visited.add(to)
+                        stack.append(to)
+
         def get_relation(self, op, i):
             relation = PrimLib.UNKNOWN
             _, elem_relation = PrimLib.input_relation(op, i)
@@ -110,14 +119,26 @@ class GraphSplitByPattern:
 
         def check_circle(self, to):
             """Check circle. It returns false if circle exists"""
-            def _reached(area, to):
-                for out, _ in area.out_relations.items():
-                    if out == to or _reached(out, to):
-                        return True
-                return False
-            for out, _ in self.out_relations.items():
-                if out != to and _reached(out, to):
-                    return False
+            # Only the areas between `self` and `to` in the topological order can be on another path between them.
+            # Search the path forward from `self` and backward from `to` by turns, either search finishing decides.
+            forward = [out for out in self.out_relations if out != to and out.rank < to.rank]
+            backward = [a for a in to.in_relations if a != self and a.rank > self.rank]
+            forward_visited, backward_visited = set(forward), set(backward)
+            while forward and backward:
+                area = forward.pop()
+                for out in area.out_relations:
+                    if out == to:
+                        return False
+                    if out.rank < to.rank and out not in forward_visited:
+                        forward_visited.add(out)
+                        forward.append(out)
+                area = backward.pop()
+                for a in area.in_relations:
+                    if a == self:
+                        return False
+                    if a.rank > self.rank and a not in backward_visited:
+                        backward_visited.add(a)
+                        backward.append(a)
             return True
 
         def dom_op(self):
@@ -135,6 +156,7 @@ class GraphSplitByPattern:
         self.areas = []
         area_map = {}
         _, outputs = graph.deduce_parameters()
+        outputs = set(outputs)
         for op in graph.ops:
             is_output = op.output in outputs
             a = self.Area(op, is_output)
@@ -145,32 +167,122 @@ class GraphSplitByPattern:
             a.link_input(area_map)
         for a in self.areas:
             a.link_output()
+        self.init_topo_order()
 
     def set_default_mode(self, area):
         area.mode = self.get_default_mode(area.ops[0])
 
+    def init_topo_order(self):
+        """Rank the areas in a topological order"""
+        in_degree = {a: len(a.in_relations) for a in self.areas}
+        ready = [a for a in self.areas if in_degree[a] == 0]
+        rank = 0
+        while ready:
+            area = ready.pop()
+            area.rank = rank
+            rank += 1
+            for out in area.out_relations:
+                in_degree[out] -= 1
+                if in_degree[out] == 0:
+                    ready.append(out)
+
+    @staticmethod
+    def _reached_in_range(start, skip, next_areas, in_range):
+        """Get the areas reached from `start` except through `skip`, only the areas in range are visited"""
+        stack = [a for a in next_areas(start) if a != skip and in_range(a)]
+        reached = set(stack)
+        while stack:
+            area = stack.pop()
+            for a in next_areas(area):
+                if a not in reached and in_range(a):
+                    reached.add(a)
+                    stack.append(a)
+        return reached
+
+    def fuse_area(self, dominant, area):
+        """
+        Fuse `area` to `dominant` and keep the topological order of the areas.
+
+        The two areas are adjacent and no other path connects them. Between the upstream and the downstream one,
+        the areas reaching the downstream one are moved before the fused area, and the areas reached from the
+        upstream one after it, the other areas keep their ranks.
+        """
+        up, down = (dominant, area) if area in dominant.out_relations else (area, dominant)
+        lo, hi = up.rank, down.rank
+        if all(a == up or a.rank < lo for a in down.in_relations):
+            # nothing in between reaches the downstream one
+            dominant.fuse(area)
+            dominant.rank = lo
+            return
+        if all(a == down or a.rank > hi for a in up.out_relations):
+            # nothing in between is reached from the upstream one
+            dominant.fuse(area)
+            dominant.rank = hi
+            return
+        before = self._reached_in_range(down, up, lambda a: a.in_relations, lambda a: a.rank > lo)
+        after = self._reached_in_range(up, down, lambda a: a.out_relations, lambda a: a.rank < hi)
+        ranks = sorted([lo, hi] + [a.rank for a in before] + [a.rank for a in after])
+        before = sorted(before, key=lambda a: a.rank)
+        after = sorted(after, key=lambda a: a.rank)
+        for a, rank in zip(before, ranks):
+            a.rank = rank
+        for a, rank in zip(after, ranks[len(before) + 2:]):
+            a.rank = rank
+        dominant.fuse(area)
+        dominant.rank = ranks[len(before)]
+
     def fuse(self, selector):
-        """Fuse areas"""
+        """
+        Fuse areas.
+
+        The areas are visited in order, the first area selecting some areas is fused with them each time. A fusion
+        only adds paths between the other areas, so an area rejected before can only select some areas again if its
+        own neighborhood is changed. Instead of rescanning all the areas after each fusion, only the fused area and
+        the areas within two relations of it are revisited, in the same order.
+        """
+        areas = self.areas
+        order = {a: i for i, a in enumerate(areas)}
+        removed = [False] * len(areas)
+        # indices of the areas to visit
+        worklist = list(range(len(areas)))
+        in_worklist = [True] * len(areas)
         changed = False
-        while True:
-            for dominant in self.areas:
-                result = selector(dominant)
-                if result is not None and result[0]:
-                    fuse_areas, is_forward = result
-                    if is_forward:
-                        for area in fuse_areas:
-                            dominant.fuse(area)
-                            self.areas.remove(area)
-                    else:
-                        forward_area = dominant
-                        for area in fuse_areas:
-                            area.fuse(forward_area)
-                            self.areas.remove(forward_area)
-                            forward_area = area
-                    changed = True
-                    break
+        while worklist:
+            i = heapq.heappop(worklist)
+            in_worklist[i] = False
+            if removed[i]:
+                continue
+            dominant = areas[i]
+            result = selector(dominant)
+            if result is None or not result[0]:
+                continue
+            fuse_areas, is_forward = result
+            if is_forward:
+                for area in fuse_areas:
+                    self.fuse_area(dominant, area)
+                    removed[order[area]] = True
+                fused = dominant
             else:
-                return changed
+                forward_area = dominant
+                for area in fuse_areas:
+                    self.fuse_area(area, forward_area)
+                    removed[order[forward_area]] = True
+                    forward_area = area
+                fused = forward_area
+            changed = True
+            affected = {fused}
+            for a in list(fused.in_relations) + list(fused.out_relations):
+                affected.add(a)
+                affected.update(a.in_relations)
+                affected.update(a.out_relations)
+            for a in affected:
+                j = order[a]
+                if not in_worklist[j]:
+                    in_worklist[j] = True
+                    heapq.heappush(worklist, j)
+        if changed:
+            self.areas = [a for i, a in enumerate(areas) if not removed[i]]
+        return changed
 
     def to_subgraphs(self):
         """Transform op groups to subgraphs"""
@@ -347,17 +347,21 @@ class Graph:
     def deduce_parameters(self):
         """Deduce parameters"""
         inputs, outputs = [], []
+        input_set, output_set, op_set = set(), set(), set(self.ops)
         for op in self.ops:
             for t in op.inputs:
-                if t not in inputs and t.op not in self.ops:
+                if t not in input_set and t.op not in op_set:
                     inputs.append(t)
-            if op.output not in outputs:
+                    input_set.add(t)
+            if op.output not in output_set:
                 if op.output.para_type == Tensor.PARA_OUTPUT or not op.output.to_ops:
                     outputs.append(op.output)
+                    output_set.add(op.output)
                 else:
                     for d in op.output.to_ops:
-                        if d not in self.ops:
+                        if d not in op_set:
                             outputs.append(op.output)
+                            output_set.add(op.output)
                             break
         if self.inputs:
             inputs = self.inputs
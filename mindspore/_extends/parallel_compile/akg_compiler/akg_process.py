@@ -13,26 +13,100 @@
 # limitations under the License.
 # ============================================================================
 """akg process"""
-import os
-import subprocess
-import sys
-from multiprocessing import Pool, cpu_count
+import atexit
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_EXCEPTION
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import cpu_count, TimeoutError as MpTimeoutError
+from mindspore import log as logger
+from ..kernel_cache import get_kernel_cache, get_compiler_version
 
-def _compile_akg_task(*json_strs):
+# The directory of the kernel cache, the cache is disabled if it is not set
+KERNEL_CACHE_PATH_ENV = "MS_AKG_KERNEL_CACHE_PATH"
+
+# The akg module and the kernel cache of a compile worker, they are set up once for all the kernels
+_akg = None
+_akg_version = None
+_kernel_cache = None
+
+# The compile workers are kept alive and reused by all the AkgProcess objects
+_compile_pool = None
+_compile_pool_size = 0
+_compile_pool_lock = threading.Lock()
+
+
+def _init_akg_worker():
+    """Import akg once in a compile worker."""
+    global _akg, _akg_version, _kernel_cache
+    _akg = __import__("akg", globals(), locals(), ['ms'], 0)
+    _akg_version = get_compiler_version(_akg)
+    _kernel_cache = get_kernel_cache(KERNEL_CACHE_PATH_ENV)
+
+
+def _compile_akg_kernel(json_str):
     """
-    compile func called in single process
+    compile func called in a compile worker, the kernel is loaded from the kernel cache if it has been compiled
 
     Parameters:
-        json_strs: list. List contains multiple kernel infos, suitable for json compile api.
+        json_str: str. kernel info, suitable for json compile api.
+
+    Returns:
+        bool, whether the kernel is loaded from the kernel cache.
     """
-    akg_compiler = os.path.join(os.path.split(
-        os.path.realpath(__file__))[0], "compiler.py")
-    for json_str in json_strs:
-        res = subprocess.run(
-            [sys.executable, akg_compiler, json_str], text=True)
-        if res.returncode != 0:
+    if _akg is None:
+        _init_akg_worker()
+
+    def compile_kernel():
+        if not _akg.ms.compilewithjson(json_str):
             raise ValueError("Failed, args: {}!".format(json_str))
 
+    if _kernel_cache is not None:
+        kernel_info = json.loads(json_str)
+        kernel_name = kernel_info.get("op")
+        if kernel_name:
+            key = _kernel_cache.kernel_key(kernel_info, _akg_version, kernel_info.get("process", ""))
+            hit, _ = _kernel_cache.compile_once(key, kernel_name, compile_kernel)
+            return hit
+    compile_kernel()
+    return False
+
+
+def _get_compile_pool(process_num):
+    """Get the pool of compile workers, it is created on the first call and recreated if it is broken or smaller."""
+    global _compile_pool, _compile_pool_size
+    with _compile_pool_lock:
+        if _compile_pool is None or _compile_pool_size < process_num:
+            if _compile_pool is not None:
+                _compile_pool.shutdown(wait=False)
+            _compile_pool = ProcessPoolExecutor(max_workers=process_num, initializer=_init_akg_worker)
+            _compile_pool_size = process_num
+        return _compile_pool
+
+
+def _reset_compile_pool(kill=False):
+    """
+    Shut down the compile workers, the next compilation starts new workers.
+
+    Args:
+        kill (bool): Whether to kill the workers, a running compilation can not be cancelled otherwise.
+    """
+    global _compile_pool, _compile_pool_size
+    with _compile_pool_lock:
+        if _compile_pool is not None:
+            if kill:
+                # ProcessPoolExecutor has no api to stop the running tasks
+                processes = getattr(_compile_pool, "_processes", None) or {}
+                for process in list(processes.values()):
+                    process.kill()
+            _compile_pool.shutdown(wait=False)
+        _compile_pool = None
+        _compile_pool_size = 0
+
+
+atexit.register(_reset_compile_pool)
+
+
 def create_akg_parallel_process(process_num, wait_time):
     """
     create AkgParallelCompiler object
@@ -59,21 +133,37 @@ class AkgProcess:
             process_num = 1
         max_proc_num = 16
         self.process_num = min([cpu_count(), max_proc_num, process_num])
-        self.args = [[] for _ in range(self.process_num)]
+        self.args = []
         self.wait_time = wait_time
         self.argc = 0
 
     def compile(self):
         """
-        compile kernel by multi processes
+        compile kernel by the compile workers, each kernel is taken by the first idle worker
         Return:
             True for all compile success, False for some failed.
         """
         if self.argc == 0:
             raise ValueError("json must be not null")
-        with Pool(processes=self.process_num) as pool:
-            res = pool.starmap_async(_compile_akg_task, self.args)
-            res.get(timeout=self.wait_time)
+        pool = _get_compile_pool(self.process_num)
+        try:
+            futures = [pool.submit(_compile_akg_kernel, json_str) for json_str in self.args]
+            done, not_done = wait(futures, timeout=self.wait_time, return_when=FIRST_EXCEPTION)
+            running = [future for future in not_done if not future.cancel()]
+            if running:
+                # a running kernel can not be cancelled, its worker is killed and the pool is rebuilt next time
+                _reset_compile_pool(kill=True)
+            # raise the first error of the kernels
+            hits = sum(future.result() for future in done)
+            if not_done:
+                logger.error("AKG kernel compilation timed out after {}s, {} of {} kernels not finished."
+                             .format(self.wait_time, len(not_done), self.argc))
+                raise MpTimeoutError()
+        except BrokenProcessPool:
+            # a compile worker crashed, the kernels are compiled by new workers next time
+            _reset_compile_pool()
+            raise ValueError("Failed, a compile worker exited abruptly!")
+        logger.info("AKG kernel cache hits {} of {} kernels.".format(hits, self.argc))
         return True
 
     def accept_json(self, json):
@@ -84,5 +174,5 @@ class AkgProcess:
         """
         if not isinstance(json, str):
             raise ValueError("json must be a str")
-        self.args[self.argc % self.process_num].append(json)
+        self.args.append(json)
         self.argc += 1
@@ -0,0 +1,263 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""content-addressed cache of compiled kernels, shared by the processes and the jobs of a host"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+# The directory where the kernels are compiled into
+KERNEL_META_PATH = "./kernel_meta"
+# The files written by mindspore itself, rather than by the compilers, are not cached
+_EXCLUDED_SUFFIXES = (".info",)
+# The entry file recording the result of the compilation besides the kernel files
+_META_FILE = ".meta.json"
+# A kernel compiled by another process is waited for at most this many seconds
+_LOCK_TIMEOUT = 600
+_LOCK_POLL_INTERVAL = 0.2
+
+
+def get_kernel_cache(env_name):
+    """
+    Get the kernel cache configured by the environment, the cache is opt-in.
+
+    Args:
+        env_name (str): The environment variable of the cache directory, the cache is disabled if it is not set or
+            set to an empty string.
+
+    Returns:
+        KernelCache, the cache, or None if the cache is disabled.
+    """
+    cache_path = os.getenv(env_name)
+    if not cache_path:
+        return None
+    return KernelCache(cache_path)
+
+
+def get_compiler_version(module):
+    """
+    Get the version of a compiler module, the modify time of the module is used if it has no version.
+
+    Args:
+        module (module): The compiler module.
+
+    Returns:
+        str, the version.
+    """
+    version = getattr(module, "__version__", None)
+    if version is not None:
+        return str(version)
+    module_file = getattr(module, "__file__", None) or ""
+    try:
+        return "{}:{}".format(module_file, os.path.getmtime(module_file))
+    except OSError:
+        return module_file
+
+
+def _lock_owner_alive(lock_file):
+    """Check whether the process owning a lock file is alive, a lock being created has no owner yet."""
+    with open(lock_file) as f:
+        owner = f.read().strip()
+    if not owner.isdigit():
+        return True
+    try:
+        os.kill(int(owner), 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # owned by a process of another user
+        pass
+    return True
+
+
+class KernelCache:
+    """
+    Cache of the compiled kernels on disk, shared by the processes and the runs.
+
+    The kernels are keyed by the hash of the normalized kernel json, the compiler version, the target and the
+    contents of the source files out of the compiler, like the implementation of a custom op. The files
+    of a kernel are published into the cache atomically, and a lock file per kernel lets only one process of a host
+    compile a kernel while the others wait for it.
+
+    Args:
+        cache_path (str): The directory of the cache.
+        kernel_meta_path (str): The directory where the kernels are compiled into. Default: "./kernel_meta".
+    """
+
+    def __init__(self, cache_path, kernel_meta_path=KERNEL_META_PATH):
+        self.cache_path = os.path.realpath(cache_path)
+        self.kernel_meta_path = kernel_meta_path
+
+    @staticmethod
+    def kernel_key(kernel_info, compiler_version, target, source_files=()):
+        """
+        Get the key of a kernel.
+
+        Args:
+            kernel_info (dict): The kernel json.
+            compiler_version (str): The version of the compiler.
+            target (str): The target of the kernel.
+            source_files (list[str]): The source files the kernel is generated from besides the compiler, their
+                contents are hashed into the key. Default: ().
+
+        Returns:
+            str, the hex digest of the key.
+        """
+        content = json.dumps(kernel_info, sort_keys=True, separators=(",", ":"))
+        digest = hashlib.sha256()
+        for part in (content, compiler_version, str(target)):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        for source_file in sorted(set(source_files)):
+            digest.update(source_file.encode("utf-8"))
+            digest.update(b"\0")
+            with open(source_file, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        return digest.hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_path, key[:2], key)
+
+    def _kernel_files(self, kernel_name):
+        """Get the files of a compiled kernel in the kernel meta directory."""
+        if not os.path.isdir(self.kernel_meta_path):
+            return []
+        prefix = kernel_name + "."
+        return sorted(f for f in os.listdir(self.kernel_meta_path)
+                      if f.startswith(prefix) and not f.endswith(_EXCLUDED_SUFFIXES))
+
+    def load(self, key, kernel_name):
+        """
+        Copy the cached files of a kernel into the kernel meta directory.
+
+        Args:
+            key (str): The key of the kernel.
+            kernel_name (str): The name of the kernel.
+
+        Returns:
+            dict, the meta of the cached kernel with the result of its compilation, or None if it is not cached.
+        """
+        entry = self._entry_path(key)
+        if not os.path.isdir(entry):
+            return None
+        try:
+            with open(os.path.join(entry, _META_FILE)) as f:
+                meta = json.load(f)
+            files = [f for f in os.listdir(entry) if f != _META_FILE]
+            if not files or any(not f.startswith(kernel_name + ".") for f in files):
+                return None
+            os.makedirs(self.kernel_meta_path, exist_ok=True)
+            for file_name in files:
+                dst = os.path.join(self.kernel_meta_path, file_name)
+                tmp = "{}.{}.tmp".format(dst, os.getpid())
+                shutil.copyfile(os.path.join(entry, file_name), tmp)
+                os.replace(tmp, dst)
+        except (OSError, ValueError):
+            return None
+        return meta
+
+    def save(self, key, kernel_name, result=None):
+        """
+        Publish the compiled files of a kernel in the kernel meta directory into the cache.
+
+        Args:
+            key (str): The key of the kernel.
+            kernel_name (str): The name of the kernel.
+            result (object): The json serializable result of the compilation, returned by `load`. Default: None.
+
+        Returns:
+            bool, whether the kernel is saved.
+        """
+        entry = self._entry_path(key)
+        files = self._kernel_files(kernel_name)
+        if not files or os.path.isdir(entry):
+            return False
+        try:
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            tmp_dir = tempfile.mkdtemp(prefix=key + ".", dir=os.path.dirname(entry))
+            for file_name in files:
+                shutil.copyfile(os.path.join(self.kernel_meta_path, file_name), os.path.join(tmp_dir, file_name))
+            with open(os.path.join(tmp_dir, _META_FILE), "w") as f:
+                json.dump({"kernel_name": kernel_name, "result": result}, f)
+            try:
+                os.rename(tmp_dir, entry)
+            except OSError:
+                # published by another process at the same time
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                return False
+        except (OSError, TypeError, ValueError):
+            return False
+        return True
+
+    def _try_lock(self, key):
+        """
+        Try to create the lock file of a kernel, the pid of the owner is written into it. The lock of a dead owner,
+        like a compile worker killed on timeout, is removed to be taken over, so is a lock older than the timeout.
+        """
+        lock_file = self._entry_path(key) + ".lock"
+        try:
+            os.makedirs(os.path.dirname(lock_file), exist_ok=True)
+            fd = os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            try:
+                os.write(fd, str(os.getpid()).encode("utf-8"))
+            finally:
+                os.close(fd)
+            return lock_file
+        except FileExistsError:
+            try:
+                if not _lock_owner_alive(lock_file) or time.time() - os.path.getmtime(lock_file) > _LOCK_TIMEOUT:
+                    os.remove(lock_file)
+            except OSError:
+                pass
+            return None
+        except OSError:
+            # the cache is not writable, compile without the lock
+            return ""
+
+    def compile_once(self, key, kernel_name, compile_fn):
+        """
+        Load a kernel from the cache, or compile and cache it. While another process is compiling the same kernel,
+        wait for it to be published instead of compiling it again.
+
+        Args:
+            key (str): The key of the kernel.
+            kernel_name (str): The name of the kernel.
+            compile_fn (callable): The function compiling the kernel into the kernel meta directory, its return value
+                is cached as the result of the compilation.
+
+        Returns:
+            tuple, whether the kernel is loaded from the cache and the result of the compilation.
+        """
+        deadline = time.time() + _LOCK_TIMEOUT
+        while True:
+            meta = self.load(key, kernel_name)
+            if meta is not None:
+                return True, meta.get("result")
+            lock_file = self._try_lock(key)
+            if lock_file is not None or time.time() > deadline:
+                break
+            time.sleep(_LOCK_POLL_INTERVAL)
+        try:
+            result = compile_fn()
+            self.save(key, kernel_name, result)
+        finally:
+            if lock_file:
+                try:
+                    os.remove(lock_file)
+                except OSError:
+                    pass
+        return False, result
@@ -35,6 +35,11 @@ def _initialize(impl_path):
     if not op_module_name:
         raise ValueError("Can not find the env TBE_IMPL_PATH")
 
+    # a compile worker initializes the impl path of every op, keep a single entry of it in the front
+    if sys.path and sys.path[0] == op_module_name:
+        return
+    if op_module_name in sys.path:
+        sys.path.remove(op_module_name)
     sys.path.insert(0, op_module_name)
 
 def _replace_range(args):
@@ -86,6 +91,11 @@ def build_op(build_type, json_str):
             _replace_range(outputs_args)
 
         if custom_flag:
+            # a custom op of the same name imported from another path by the same compile worker
+            imported = sys.modules.get(op_name)
+            if imported is not None and \
+                    os.path.dirname(os.path.realpath(getattr(imported, "__file__", "") or "")) != impl_path:
+                del sys.modules[op_name]
             op_module = __import__(op_name)
         else:
             if is_dynamic_shape:
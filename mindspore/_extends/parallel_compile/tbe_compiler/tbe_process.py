@@ -15,13 +15,33 @@
 """tbe process"""
 import traceback
 import multiprocessing
-import subprocess
 import sys
 import os
+import io
 import json
+import queue
+import signal
+import time
+import importlib.util
+from contextlib import redirect_stdout, redirect_stderr
 from mindspore import log as logger
 from .common import check_kernel_info, TBEException
 from .helper import _op_select_format, _check_supported
+from ..kernel_cache import get_kernel_cache, get_compiler_version
+
+# The directory of the kernel cache shared by the jobs of a host, the cache is disabled if it is not set
+KERNEL_CACHE_PATH_ENV = "MS_TBE_KERNEL_CACHE_PATH"
+# The max seconds an op is compiled for since it is started by a worker
+_COMPILE_TIMEOUT = 300
+# The seconds between the checks of the started tasks while waiting for a result
+_POLL_INTERVAL = 1
+
+# The compiler module and the kernel cache of a compile worker, they are set up once for all the ops
+_tbe_compiler = None
+_te_version = None
+_kernel_cache = None
+# The queue a compile worker reports the task id, its pid and the start time of the tasks into
+_started_tasks = None
 
 
 def create_tbe_parallel_process():
@@ -79,26 +99,92 @@ def check_supported(op_json: str):
     return ret
 
 
-def run_compiler(op_json):
+def _init_tbe_worker(started_tasks):
+    """Import the compiler and te once in a compile worker, the errors are reported by the ops compiled."""
+    global _started_tasks
+    _started_tasks = started_tasks
+    try:
+        _load_tbe_compiler()
+    except Exception:  # pylint: disable=broad-except
+        pass
+
+
+def _load_tbe_compiler():
+    """Import the compiler module and te, set up the kernel cache."""
+    global _tbe_compiler, _te_version, _kernel_cache
+    compiler_path = os.path.split(os.path.realpath(__file__))[0]
+    # the compiler imports its sibling modules as top level modules, like running as a script
+    if compiler_path not in sys.path:
+        sys.path.insert(0, compiler_path)
+    spec = importlib.util.spec_from_file_location("compiler", os.path.join(compiler_path, "compiler.py"))
+    compiler = importlib.util.module_from_spec(spec)
+    sys.modules["compiler"] = compiler
+    spec.loader.exec_module(compiler)
+    _tbe_compiler = compiler
+    _te_version = get_compiler_version(sys.modules.get("te"))
+    _kernel_cache = get_kernel_cache(KERNEL_CACHE_PATH_ENV)
+
+
+def _get_kernel_name(kernel_info):
+    """Get the kernel name and the soc version of an op or a fusion op."""
+    if "fusion_op" in kernel_info:
+        fusion_op = kernel_info["fusion_op"]
+        return fusion_op.get("fusion_op_name"), fusion_op.get("socVersion", "")
+    op_info = kernel_info.get("op_info", {})
+    return op_info.get("kernel_name"), op_info.get("socVersion", "")
+
+
+def _get_impl_files(kernel_info):
+    """Get the implementation files of the custom ops in an op or a fusion op, they are out of the te version."""
+    impl_files = []
+    stack = [kernel_info]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            impl_path = item.get("impl_path")
+            if isinstance(impl_path, str) and os.path.isfile(impl_path):
+                impl_files.append(os.path.realpath(impl_path))
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return impl_files
+
+
+def compile_in_worker(task_id, op_json):
     """
-    run compiler to compile op with subprocess
+    compile op in a warm compile worker, the op is loaded from the kernel cache if it has been compiled
 
     Args:
+        task_id (int): id of the compile task, reported with the start time of the task
         op_json (str): json string of the op
 
     Returns:
-        result type, result.
+        result type, result, and whether the op is loaded from the kernel cache.
     """
+    if _started_tasks is not None:
+        _started_tasks.put((task_id, os.getpid(), time.time()))
+    stdout, stderr = io.StringIO(), io.StringIO()
     try:
-        tbe_compiler = os.path.join(os.path.split(os.path.realpath(__file__))[0], "compiler.py")
-        completed_object = subprocess.run([sys.executable, tbe_compiler], input=op_json, timeout=300,
-                                          text=True, capture_output=True, check=True)
-        return "Success", completed_object.stderr
-    except subprocess.TimeoutExpired:
-        tb = traceback.format_exc()
-        return "TBEException", "ERROR: " + tb + "\ninput_args: " + op_json
-    except subprocess.CalledProcessError as e:
-        return "TBEException", "ERROR:\n" + e.stdout + "\n" + e.stderr + "\ninput_args: " + op_json
+        if _tbe_compiler is None:
+            _load_tbe_compiler()
+
+        def compile_op():
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                result = _tbe_compiler.compile_with_json(op_json)
+            # the compile info of a dynamic shape op, written to stderr by the compiler script
+            return json.dumps(result) if isinstance(result, dict) else ""
+
+        if _kernel_cache is not None:
+            kernel_info = json.loads(op_json)
+            kernel_name, soc_version = _get_kernel_name(kernel_info)
+            if kernel_name:
+                key = _kernel_cache.kernel_key(kernel_info, _te_version, soc_version, _get_impl_files(kernel_info))
+                hit, result = _kernel_cache.compile_once(key, kernel_name, compile_op)
+                return "Success", result or "", hit
+        return "Success", compile_op(), False
+    except Exception:  # pylint: disable=broad-except
+        return "TBEException", "ERROR:\n" + stdout.getvalue() + "\n" + stderr.getvalue() + "\n" + \
+               traceback.format_exc() + "\ninput_args: " + op_json, False
 
 
 class TbeProcess:
@@ -125,19 +211,27 @@ class TbeProcess:
             self.__processe_num = self.max_processes_num
         self.__pool = None
         self.__next_task_id = 1
-        self.__running_tasks = []
+        # task id -> (pid of the worker, start time) of the tasks not reported yet, None until a worker starts it
+        self.__running_tasks = {}
+        # (task id, pid of the worker, start time) reported by the workers
+        self.__started_tasks = None
+        # results of the finished tasks, in completion order
+        self.__finished_tasks = queue.Queue()
+        self.__cache_hits = 0
+        self.__compiled = 0
 
     def __del__(self):
-        if self.__pool is not None:
-            self.__pool.terminate()
-            self.__pool.join()
-            del self.__pool
+        self.__terminate_pool()
 
     def exit(self):
+        self.__terminate_pool()
+
+    def __terminate_pool(self):
         if self.__pool is not None:
             self.__pool.terminate()
             self.__pool.join()
-            del self.__pool
+            self.__pool = None
+            self.__started_tasks = None
 
     def start_compile_op(self, op_json):
         """
@@ -152,31 +246,105 @@ class TbeProcess:
         task_id = self.__next_task_id
         self.__next_task_id = self.__next_task_id + 1
         if self.__pool is None:
-            self.__pool = multiprocessing.Pool(processes=self.__processe_num)
-        task_future = self.__pool.apply_async(func=run_compiler, args=(op_json,))
-        self.__running_tasks.append((task_id, task_future))
+            # the workers import te once and compile all the ops
+            self.__started_tasks = multiprocessing.Queue()
+            self.__pool = multiprocessing.Pool(processes=self.__processe_num, initializer=_init_tbe_worker,
+                                               initargs=(self.__started_tasks,))
+        finished_tasks = self.__finished_tasks
+        self.__pool.apply_async(func=compile_in_worker, args=(task_id, op_json),
+                                callback=lambda res: finished_tasks.put((task_id, res)),
+                                error_callback=lambda e: finished_tasks.put((task_id, ("Exception", str(e), False))))
+        self.__running_tasks[task_id] = None
+        return task_id
+
+    def __update_started_tasks(self):
+        """Record the workers and the start times of the tasks started since the last update."""
+        while self.__started_tasks is not None:
+            try:
+                task_id, pid, start_time = self.__started_tasks.get_nowait()
+            except queue.Empty:
+                break
+            if task_id in self.__running_tasks:
+                self.__running_tasks[task_id] = pid, start_time
+
+    def __kill_timeout_task(self):
+        """
+        Kill the worker of the task compiled for the longest time if it is timeout, the pool starts a new worker
+        instead of it and the other tasks go on.
+
+        Returns:
+            int, id of the killed task, 0 if no task is timeout.
+        """
+        started = [(info[1], task_id) for task_id, info in self.__running_tasks.items() if info is not None]
+        if not started:
+            return 0
+        start_time, task_id = min(started)
+        if time.time() - start_time < _COMPILE_TIMEOUT:
+            return 0
+        pid, _ = self.__running_tasks.pop(task_id)
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except OSError:
+            pass
         return task_id
 
     def wait_one(self):
         """
         wait until a compile task finish
 
+        Returns:
+            int, id of the finished task. -1 if error,0 if no unfinished task
+            str, result of compile task
+        """
+        return self.wait_any()
+
+    def wait_any(self):
+        """
+        wait until any compile task finish, the tasks are reported in completion order
+
         Returns:
             int, id of the finished task. -1 if error,0 if no unfinished task
             str, result of compile task
         """
         ret = 0, "Success"
-        if self.__running_tasks:
-            task_id, task_future = self.__running_tasks.pop(0)
-            ret_type, result = task_future.get(330)
+        while self.__running_tasks:
+            self.__update_started_tasks()
+            timeout_id = self.__kill_timeout_task()
+            if timeout_id:
+                logger.error("Kill the compile worker of task {}, which is timeout after {}s."
+                             .format(timeout_id, _COMPILE_TIMEOUT))
+                return timeout_id, "TBEException:ERROR: compile task timeout after {}s".format(_COMPILE_TIMEOUT), "_"
+            try:
+                task_id, (ret_type, result, hit) = self.__finished_tasks.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            if task_id not in self.__running_tasks:
+                # a task dropped by reset_task_info or killed on timeout
+                continue
+            self.__running_tasks.pop(task_id)
+            self.__compiled += 1
+            self.__cache_hits += int(hit)
+            if not self.__running_tasks:
+                logger.info("TBE kernel cache hits {} of {} ops.".format(self.__cache_hits, self.__compiled))
             if ret_type == "Success":
                 ret = task_id, "Success", result
             elif ret_type in ("Exception", "TBEException"):
                 ret = task_id, ret_type + ":" + result, "_"
             else:
                 ret = task_id, "Exception: Not support return type:" + str(ret_type), "_"
+            break
         return ret
 
+    def cache_stats(self):
+        """
+        Get the statistics of the kernel cache.
+
+        Returns:
+            dict, the number of compiled ops, the ops loaded from the kernel cache and the hit rate.
+        """
+        return {"ops": self.__compiled, "hits": self.__cache_hits,
+                "hit_rate": self.__cache_hits / self.__compiled if self.__compiled else 0.0}
+
     def reset_task_info(self):
         """
         reset task info when task compile error
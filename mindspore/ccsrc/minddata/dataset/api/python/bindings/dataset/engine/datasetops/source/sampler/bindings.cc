@@ -58,7 +58,8 @@ PYBIND_REGISTER(PKSamplerRT, 1, ([](const py::module *m) {
 
 PYBIND_REGISTER(PythonSamplerRT, 1, ([](const py::module *m) {
                   (void)py::class_<PythonSamplerRT, SamplerRT, std::shared_ptr<PythonSamplerRT>>(*m, "PythonSampler")
-                    .def(py::init<int64_t, py::object>());
+                    .def(py::init<int64_t, py::object>())
+                    .def(py::init<int64_t, py::object, int64_t>());
                 }));
 
 PYBIND_REGISTER(RandomSamplerRT, 1, ([](const py::module *m) {
@@ -21,13 +21,17 @@ namespace mindspore {
 namespace dataset {
 
 PythonSamplerRT::PythonSamplerRT(int64_t num_samples, py::object py_sampler_instance, int64_t samples_per_buffer)
-    : SamplerRT(num_samples, samples_per_buffer), py_sampler_instance(py_sampler_instance), need_to_reset_(false) {}
+    : SamplerRT(num_samples, samples_per_buffer),
+      py_sampler_instance(py_sampler_instance),
+      need_to_reset_(false),
+      epoch_started_(false) {}
 
 Status PythonSamplerRT::GetNextSample(std::unique_ptr<DataBuffer> *out_buffer) {
   if (need_to_reset_) {
     (*out_buffer) = std::make_unique<DataBuffer>(0, DataBuffer::kDeBFlagEOE);
   } else {
-    if (HasChildSampler()) {
+    // The child ids of the whole epoch come in a single buffer
+    if (HasChildSampler() && !epoch_started_) {
       RETURN_IF_NOT_OK(child_[0]->GetNextSample(&child_ids_));
     }
 
@@ -39,9 +43,17 @@ Status PythonSamplerRT::GetNextSample(std::unique_ptr<DataBuffer> *out_buffer) {
         return Status(StatusCode::kPythonInterpreterFailure, "Python Interpreter is finalized");
       }
       try {
-        py::object py_ret = py_sampler_instance.attr("_get_indices")();
+        // The indices come in chunks of samples_per_buffer_ ids, a shorter chunk is the last one of the epoch
+        py::object py_ret = py_sampler_instance.attr("_get_next_indices")(samples_per_buffer_);
         py::array np_sample_ids = py_ret.cast<py::array>();
+        if (np_sample_ids.size() == 0 && epoch_started_) {
+          // The last chunk was a full one
+          (*out_buffer) = std::make_unique<DataBuffer>(0, DataBuffer::kDeBFlagEOE);
+          need_to_reset_ = true;
+          return Status::OK();
+        }
         Tensor::CreateFromNpArray(np_sample_ids, &sample_ids);  // copy numpy to tensor
+        need_to_reset_ = static_cast<int64_t>(np_sample_ids.size()) < samples_per_buffer_;
 
         if (HasChildSampler()) {
           for (auto it = sample_ids->begin<int64_t>(); it != sample_ids->end<int64_t>(); ++it) {
@@ -59,7 +71,7 @@ Status PythonSamplerRT::GetNextSample(std::unique_ptr<DataBuffer> *out_buffer) {
     }
     TensorRow row(1, sample_ids);
     (*out_buffer)->set_tensor_table(std::make_unique<TensorQTable>(1, row));
-    need_to_reset_ = true;
+    epoch_started_ = true;
   }
   return Status::OK();
 }
@@ -94,6 +106,7 @@ Status PythonSamplerRT::InitSampler() {
 Status PythonSamplerRT::ResetSampler() {
   CHECK_FAIL_RETURN_UNEXPECTED(need_to_reset_, "ERROR Reset() called not at end of an epoch");
   need_to_reset_ = false;
+  epoch_started_ = false;
   py::gil_scoped_acquire gil_acquire;
   if (Py_IsInitialized() == 0) {
     return Status(StatusCode::kPythonInterpreterFailure, "Python Interpreter is finalized");
@@ -29,7 +29,8 @@ class PythonSamplerRT : public SamplerRT {
   // @param num_samples - the number of samples to draw.  Value of 0 means to sample all of the
   //                      data from the dataset.
   // @param py_sampler_instance - the python instance of the sampler
-  // @param int64_t samples_per_buffer - Num of Sampler Ids to fetch via 1 GetNextBuffer call
+  // @param int64_t samples_per_buffer - Num of Sampler Ids to fetch via 1 GetNextBuffer call, the indices of the
+  //                                      python sampler are fetched in chunks of this size
   explicit PythonSamplerRT(int64_t num_samples, py::object py_sampler_instance,
                            int64_t samples_per_buffer = std::numeric_limits<int64_t>::max());
 
@@ -57,6 +58,7 @@ class PythonSamplerRT : public SamplerRT {
 
  private:
   bool need_to_reset_;  // Whether Reset() should be called before calling GetNextBuffer()
+  bool epoch_started_;  // Whether a buffer of the current epoch has been returned
 
   py::object py_sampler_instance;  // The handle to the py_sampler python object
 };
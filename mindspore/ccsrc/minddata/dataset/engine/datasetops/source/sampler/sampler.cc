@@ -17,6 +17,7 @@
 
 #include <algorithm>
 #include <string>
+#include <vector>
 
 namespace mindspore {
 namespace dataset {
@@ -95,21 +96,21 @@ void SamplerRT::SamplerPrint(std::ostream &out, bool show_all) const {
 #ifdef ENABLE_PYTHON
 Status SamplerRT::GetAllIdsThenReset(py::array *data) {
   std::unique_ptr<DataBuffer> db;
-  std::shared_ptr<Tensor> sample_ids;
+  std::vector<std::shared_ptr<Tensor>> sample_ids;
   TensorRow sample_row;
 
   // A call to derived class to get sample ids wrapped inside a buffer
   RETURN_IF_NOT_OK(GetNextSample(&db));
-  // Get the only tensor inside the buffer that contains the actual SampleIds for the entire epoch
-  RETURN_IF_NOT_OK(db->GetRow(0, &sample_row));
-  sample_ids = sample_row[0];
 
   // check this buffer is not a ctrl buffer
   CHECK_FAIL_RETURN_UNEXPECTED(db->buffer_flags() == DataBuffer::kDeBFlagNone, "ERROR ctrl buffer received");
 
-  // perform error checking! Next buffer supposed to be EOE since last one already contains all ids for current epoch
-  RETURN_IF_NOT_OK(GetNextSample(&db));
-  CHECK_FAIL_RETURN_UNEXPECTED(db->eoe(), "ERROR Non EOE received");
+  // The SampleIds of the epoch may be split into several buffers, collect them until the EOE
+  while (!db->eoe()) {
+    RETURN_IF_NOT_OK(db->GetRow(0, &sample_row));
+    sample_ids.push_back(sample_row[0]);
+    RETURN_IF_NOT_OK(GetNextSample(&db));
+  }
   // Reset Sampler since this is the end of the epoch
   RETURN_IF_NOT_OK(ResetSampler());
 
@@ -119,7 +120,17 @@ Status SamplerRT::GetAllIdsThenReset(py::array *data) {
       return Status(StatusCode::kPythonInterpreterFailure, "Python Interpreter is finalized");
     }
     try {
-      RETURN_IF_NOT_OK(sample_ids->GetDataAsNumpy(data));
+      if (sample_ids.size() == 1) {
+        RETURN_IF_NOT_OK(sample_ids[0]->GetDataAsNumpy(data));
+      } else {
+        py::list arrays;
+        for (auto &ids : sample_ids) {
+          py::array array;
+          RETURN_IF_NOT_OK(ids->GetDataAsNumpy(&array));
+          arrays.append(array);
+        }
+        *data = py::module::import("numpy").attr("concatenate")(arrays).cast<py::array>();
+      }
     } catch (const std::runtime_error &e) {
       return Status(StatusCode::kPyFuncException, e.what());
     }
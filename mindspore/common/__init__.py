@@ -14,7 +14,7 @@
 # ============================================================================
 """Top-level reference to dtype of common module."""
 from . import dtype
-from .api import ms_function
+from .api import ms_function, set_ms_function_cache_size, get_ms_function_cache_info, pad_to_bucket, bucket_mask
 from .dtype import *
 from .parameter import Parameter, ParameterTuple
 from .tensor import MetaTensor, Tensor, RowTensor, SparseTensor
@@ -24,7 +24,7 @@ from .seed import set_seed, get_seed
 __all__ = dtype.__all__
 __all__.extend([
     "MetaTensor", "Tensor", "RowTensor", "SparseTensor",  # tensor
-    'ms_function',  # api
+    'ms_function', 'set_ms_function_cache_size', 'get_ms_function_cache_info', 'pad_to_bucket', 'bucket_mask',  # api
     'Parameter', 'ParameterTuple',  # parameter
     "dtype",
     "set_seed", "get_seed"  # random seed
@@ -0,0 +1,243 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Persistent compile cache shared by the runs of the same network.
+
+The cache is enabled by setting the environment variable MS_COMPILE_CACHE_PATH to a directory. A compiled graph is
+keyed by the fingerprint of the network, the signature of the inputs, the context and the parallel context. Its entry
+keeps the searched parallel strategy, which is loaded instead of searched again by the following runs, and the kernel
+caches of the compilers are kept under the same directory, so a warm start reuses the compiled kernels.
+"""
+import hashlib
+import inspect
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+
+from mindspore import context
+from mindspore import log as logger
+from .._c_expression import Tensor, MetaTensor, Primitive_
+from ..parallel._auto_parallel_context import auto_parallel_context, _get_auto_parallel_context
+
+COMPILE_CACHE_ENV = "MS_COMPILE_CACHE_PATH"
+# The kernel caches of the compilers, kept under the compile cache unless they are set explicitly
+_KERNEL_CACHE_ENVS = (("MS_TBE_KERNEL_CACHE_PATH", "tbe_kernels"), ("MS_AKG_KERNEL_CACHE_PATH", "akg_kernels"))
+_META_FILE = "meta.json"
+_STRATEGY_FILE = "strategy.ckpt"
+
+# The context settings that change the compiled graph
+_CONTEXT_KEYS = ("mode", "device_target", "enable_graph_kernel", "enable_reduce_precision", "enable_sparse",
+                 "max_call_depth", "enable_ge")
+# The parallel settings that change the compiled graph, the rank is excluded since the strategy is the same for all
+# the ranks
+_PARALLEL_KEYS = ("parallel_mode", "device_num", "gradients_mean", "gradient_fp32_sync", "loss_repeated_mean",
+                  "pipeline_stages", "auto_parallel_search_mode", "full_batch", "enable_parallel_optimizer",
+                  "grad_accumulation_step", "all_reduce_fusion_config")
+_PARALLEL_MODES_WITH_STRATEGY = ("semi_auto_parallel", "auto_parallel")
+# The attributes of a cell which differ between the instances of the same network
+_VOLATILE_ATTRS = frozenset(["_create_time", "_cell_init_args", "phase_prefix", "_attr_synced", "_param_prefix",
+                             "_auto_prefix", "_scope", "_parameter_layout_dict", "_parallel_inputs_run"])
+_ADDRESS_PATTERN = re.compile(r" at 0x[0-9a-fA-F]+")
+
+_compile_cache = None
+
+
+def _class_source(cls, sources):
+    """Get the source of a class, or its qualified name if the source is unavailable."""
+    if cls not in sources:
+        try:
+            sources[cls] = inspect.getsource(cls)
+        except (OSError, TypeError):
+            sources[cls] = cls.__module__ + "." + cls.__qualname__
+    return sources[cls]
+
+
+def _fingerprint_value(value):
+    """Get the part of a value that the compiled graph depends on."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return repr(value)
+    if isinstance(value, (Tensor, MetaTensor)):
+        return "Tensor({}, {})".format(tuple(value.shape), value.dtype)
+    if isinstance(value, (tuple, list)):
+        return "{}({})".format(type(value).__name__, ", ".join(_fingerprint_value(v) for v in value))
+    if isinstance(value, dict):
+        items = sorted((str(k), _fingerprint_value(v)) for k, v in value.items())
+        return "dict({})".format(", ".join("{}: {}".format(k, v) for k, v in items))
+    if isinstance(value, Primitive_):
+        return "{}{}".format(value.name, _fingerprint_value(getattr(value, "attrs", {})))
+    return type(value).__name__
+
+
+def _network_fingerprint(obj):
+    """Get the fingerprint of a cell or a function from its sources, attributes and parameters."""
+    if not hasattr(obj, "cells_and_names"):
+        try:
+            return inspect.getsource(obj)
+        except (OSError, TypeError):
+            return getattr(obj, "__module__", "") + "." + getattr(obj, "__qualname__", type(obj).__name__)
+    sources = {}
+    parts = []
+    for name, cell in obj.cells_and_names():
+        parts.append(name)
+        for cls in type(cell).__mro__:
+            if cls.__module__ == "mindspore.nn.cell" or cls is object:
+                break
+            parts.append(_class_source(cls, sources))
+        for attr, value in sorted(vars(cell).items()):
+            if attr not in _VOLATILE_ATTRS:
+                parts.append("{}={}".format(attr, _ADDRESS_PATTERN.sub("", _fingerprint_value(value))))
+    for name, param in obj.parameters_and_names():
+        parts.append("{}:{}:{}:{}".format(name, tuple(param.shape), param.dtype, param.requires_grad))
+    return "\n".join(parts)
+
+
+def _get_settings(keys, get_fn):
+    settings = {}
+    for key in keys:
+        try:
+            settings[key] = _fingerprint_value(get_fn(key))
+        except ValueError:
+            settings[key] = None
+    return settings
+
+
+def get_compile_cache():
+    """
+    Get the compile cache configured by the environment.
+
+    Returns:
+        CompileCache, the cache, or None if MS_COMPILE_CACHE_PATH is not set.
+    """
+    global _compile_cache
+    cache_path = os.getenv(COMPILE_CACHE_ENV)
+    if not cache_path:
+        return None
+    if _compile_cache is None or _compile_cache.cache_path != os.path.realpath(cache_path):
+        _compile_cache = CompileCache(cache_path)
+        # the kernel compilers inherit the environment when they are started by the first compilation
+        for env_name, dir_name in _KERNEL_CACHE_ENVS:
+            os.environ.setdefault(env_name, os.path.join(_compile_cache.cache_path, dir_name))
+    return _compile_cache
+
+
+class CompileCache:
+    """
+    Cache of the compiled graphs on disk, shared by the runs of the same network.
+
+    Args:
+        cache_path (str): The directory of the cache.
+    """
+
+    def __init__(self, cache_path):
+        self.cache_path = os.path.realpath(cache_path)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def graph_key(obj, phase, args):
+        """
+        Get the key of a graph.
+
+        Args:
+            obj (Function/Cell): The function or cell to compile.
+            phase (str): The name of the compile phase, without the parts varying between runs.
+            args (tuple): The input arguments.
+
+        Returns:
+            str, the hex digest of the key.
+        """
+        from .. import __version__
+        key = {"phase": phase,
+               "version": __version__,
+               "network": _network_fingerprint(obj),
+               "inputs": _fingerprint_value(tuple(args)),
+               "context": _get_settings(_CONTEXT_KEYS, context.get_context),
+               "parallel": _get_settings(_PARALLEL_KEYS, _get_auto_parallel_context)}
+        content = json.dumps(key, sort_keys=True)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_path, "graphs", key[:2], key)
+
+    def _publish(self, key, meta, strategy_file):
+        """Publish the entry of a compiled graph atomically."""
+        entry = self._entry_path(key)
+        if os.path.isdir(entry):
+            return
+        try:
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            tmp_dir = tempfile.mkdtemp(prefix=key + ".", dir=os.path.dirname(entry))
+            if strategy_file and os.path.isfile(strategy_file):
+                shutil.copyfile(strategy_file, os.path.join(tmp_dir, _STRATEGY_FILE))
+            with open(os.path.join(tmp_dir, _META_FILE), "w") as f:
+                json.dump(meta, f)
+            try:
+                os.rename(tmp_dir, entry)
+            except OSError:
+                # published by another process at the same time
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        except OSError as e:
+            logger.warning("Failed to save the compile cache of {}: {}".format(meta.get("phase"), e))
+
+    def compile(self, obj, phase, args, compile_fn):
+        """
+        Compile a graph. The strategy of a cached graph is loaded instead of searched, the strategy of a new graph is
+        saved into the cache when the compilation succeeds.
+
+        Args:
+            obj (Function/Cell): The function or cell to compile.
+            phase (str): The name of the compile phase, without the parts varying between runs.
+            args (tuple): The input arguments.
+            compile_fn (callable): The function compiling the graph, which returns whether the compilation succeeds.
+
+        Returns:
+            The return value of compile_fn.
+        """
+        key = self.graph_key(obj, phase, args)
+        entry = self._entry_path(key)
+        parallel = _get_auto_parallel_context("parallel_mode") in _PARALLEL_MODES_WITH_STRATEGY
+        load_file = auto_parallel_context().get_strategy_ckpt_load_file()
+        save_file = auto_parallel_context().get_strategy_ckpt_save_file()
+        hit = os.path.isfile(os.path.join(entry, _META_FILE))
+        tmp_dir = None
+        strategy_file = save_file
+        if hit:
+            self.hits += 1
+            cached_strategy = os.path.join(entry, _STRATEGY_FILE)
+            if parallel and not load_file and os.path.isfile(cached_strategy):
+                auto_parallel_context().set_strategy_ckpt_load_file(cached_strategy)
+            logger.info("Compile cache hit of {}, key {}.".format(phase, key))
+        else:
+            self.misses += 1
+            if parallel and not save_file:
+                tmp_dir = tempfile.mkdtemp(prefix="strategy_")
+                strategy_file = os.path.join(tmp_dir, _STRATEGY_FILE)
+                auto_parallel_context().set_strategy_ckpt_save_file(strategy_file)
+        start = time.time()
+        try:
+            result = compile_fn()
+            if result and not hit:
+                meta = {"phase": phase, "compile_time": time.time() - start, "strategy": parallel}
+                self._publish(key, meta, strategy_file if parallel else None)
+        finally:
+            if parallel:
+                auto_parallel_context().set_strategy_ckpt_load_file(load_file)
+                auto_parallel_context().set_strategy_ckpt_save_file(save_file)
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+        return result
@@ -17,20 +17,88 @@
 """Providing interface methods."""
 import types
 import sys
+import time
 from collections import OrderedDict
 from functools import wraps
 
+import numpy as np
+
 from mindspore import context
 from mindspore import log as logger
 from .tensor import Tensor as MsTensor
+from ._compile_cache import get_compile_cache
 from .._c_expression import generate_key, Executor_, Tensor, MetaTensor, PynativeExecutor_
 from .._c_expression import verify_inputs_signature, init_exec_dataset, _set_dataset_mode_config, init_pipeline
 from ..parallel._ps_context import _is_role_pserver
 from ..parallel._utils import _get_device_num, _get_global_rank, _need_to_full, _check_full_batch, _to_full_tensor, \
     _get_parameter_broadcast
 
+
+class _PhaseCache:
+    """
+    LRU cache of the compiled pipelines of ms_function, with the statistics of its use.
+
+    Args:
+        max_size (int): The max number of cached pipelines, None means unlimited.
+    """
+
+    def __init__(self, max_size=None):
+        self.max_size = max_size
+        self._phases = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.compile_time = 0.0
+
+    def __contains__(self, key):
+        return key in self._phases
+
+    def __len__(self):
+        return len(self._phases)
+
+    def get(self, key):
+        """Get the phase of a key and mark it as the most recently used, the hits and misses are counted."""
+        phase = self._phases.get(key)
+        if phase is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._phases.move_to_end(key)
+        return phase
+
+    def put(self, key, phase, executor):
+        """Cache the phase of a key, the least recently used pipelines are released if the cache is full."""
+        self._phases[key] = phase
+        self._phases.move_to_end(key)
+        self.shrink(executor, key)
+
+    def shrink(self, executor, protected_key=None):
+        """
+        Release the least recently used pipelines until the cache is no larger than max_size.
+
+        Args:
+            executor (Executor_): The executor holding the pipelines.
+            protected_key (tuple): The key whose pipeline must not be released. Default: None.
+        """
+        while self.max_size is not None and len(self._phases) > self.max_size:
+            victim = next((k for k in self._phases if k != protected_key), None)
+            if victim is None:
+                return
+            phase = self._phases.pop(victim)
+            # the executor releases all the pipelines whose phase contains the given one
+            executor.del_net_res(phase)
+            for key in [k for k, v in self._phases.items() if phase in v]:
+                del self._phases[key]
+            self.evictions += 1
+
+    def clear(self):
+        self._phases.clear()
+        self.hits = self.misses = self.evictions = 0
+        self.compile_time = 0.0
+
+
 # store ms_function class compiled pipeline cache
-ms_compile_cache = {}
+ms_compile_cache = _PhaseCache()
 
 BROADCAST_PHASE = "_broadcast_"
 
@@ -175,23 +243,31 @@ class _MindSporeFunction:
             generate_name = generate_name + str(id(self.identify_obj))
 
         key = generate_key(generate_name, dic)
-        phase = str(key[1]) + generate_name
-        if key not in ms_compile_cache.keys():
+        # the key id is delimited, so that no phase is contained in another one, e.g. "3name" in "13name"
+        phase = "_" + str(key[1]) + generate_name
+        cached_phase = ms_compile_cache.get(key)
+        if cached_phase is None:
             is_compile = False
-            if self.obj is None:
-                is_compile = self._executor.compile(self.fn, args_list, phase, True)
+            start = time.time()
+            compile_obj = self.fn if self.obj is None else self.obj
+            compile_cache = get_compile_cache()
+            if compile_cache is None:
+                is_compile = self._executor.compile(compile_obj, args_list, phase, True)
             else:
-                is_compile = self._executor.compile(self.obj, args_list, phase, True)
+                cache_phase = method_name + "." + self.fn.__module__ + "." + self.fn.__qualname__
+                is_compile = compile_cache.compile(compile_obj, cache_phase, args_list,
+                                                   lambda: self._executor.compile(compile_obj, args_list, phase, True))
             if not is_compile:
                 raise RuntimeError("Executor compile failed.")
             if context.get_context("enable_ge"):
                 self.build_data_init_graph(phase)
+            ms_compile_cache.compile_time += time.time() - start
             # since function can be redefined, we only cache class method pipeline
             if self.obj is not None or self.identify_obj is not None:
-                ms_compile_cache[key] = phase
+                ms_compile_cache.put(key, phase, self._executor)
             return phase
 
-        return ms_compile_cache[key]
+        return cached_phase
 
     @_wrap_func
     def __call__(self, *args):
@@ -215,7 +291,128 @@ class _MindSporeFunction:
         return self._executor(tuple(new_inputs), phase)
 
 
-def ms_function(fn=None, obj=None, input_signature=None):
+def _bucket_size(dim, buckets):
+    """Get the smallest bucket not smaller than a dimension, or the dimension if it exceeds all the buckets."""
+    for bucket in buckets:
+        if bucket >= dim:
+            return bucket
+    return dim
+
+
+def _check_shape_buckets(shape_buckets):
+    """Check the shape buckets of ms_function."""
+    if not isinstance(shape_buckets, dict):
+        raise TypeError("shape_buckets must be a dict, but got {}.".format(type(shape_buckets).__name__))
+    for index, axis_buckets in shape_buckets.items():
+        if not isinstance(index, int) or not isinstance(axis_buckets, dict):
+            raise TypeError("shape_buckets must map the index of an input to a dict of the buckets of the axes.")
+        for axis, buckets in axis_buckets.items():
+            if not isinstance(axis, int) or not buckets or \
+                    any(not isinstance(b, int) or b <= 0 for b in buckets) or list(buckets) != sorted(buckets):
+                raise ValueError("The buckets of input {} axis {} must be ascending positive ints, but got {}."
+                                 .format(index, axis, buckets))
+
+
+def pad_to_bucket(x, buckets, axis=0, pad_value=0):
+    """
+    Pad a tensor along an axis up to the smallest bucket not smaller than its dimension, so that the inputs of
+    variable lengths share a few compiled graphs.
+
+    Args:
+        x (Union[Tensor, numpy.ndarray]): The tensor to pad.
+        buckets (Union[list, tuple]): The ascending sizes of the buckets.
+        axis (int): The axis to pad. Default: 0.
+        pad_value (Union[int, float, bool]): The value of the padding. Default: 0.
+
+    Returns:
+        Tensor or numpy.ndarray of the same type as `x`, the padded tensor. It is `x` itself if its dimension is a
+        bucket or exceeds all the buckets.
+
+    Examples:
+        >>> x = Tensor(np.ones([2, 5]).astype(np.float32))
+        >>> pad_to_bucket(x, (8, 16), axis=1).shape
+        (2, 8)
+    """
+    dim = x.shape[axis]
+    bucket = _bucket_size(dim, buckets)
+    if bucket == dim:
+        return x
+    data = x.asnumpy() if isinstance(x, MsTensor) else np.asarray(x)
+    pad_width = [(0, 0)] * data.ndim
+    pad_width[axis] = (0, bucket - dim)
+    padded = np.pad(data, pad_width, mode="constant", constant_values=pad_value)
+    return MsTensor(padded) if isinstance(x, MsTensor) else padded
+
+
+def bucket_mask(lengths, buckets, dtype=np.float32):
+    """
+    Get the mask of the valid positions of the sequences padded by `pad_to_bucket`.
+
+    Args:
+        lengths (Union[list, tuple, numpy.ndarray]): The valid lengths of the sequences.
+        buckets (Union[list, tuple]): The ascending sizes of the buckets.
+        dtype (numpy.dtype): The data type of the mask. Default: numpy.float32.
+
+    Returns:
+        Tensor, the mask of shape lengths.shape + (bucket,), where the bucket is the one of the longest sequence.
+
+    Examples:
+        >>> mask = bucket_mask([2, 3], (4, 8))
+        >>> mask.shape
+        (2, 4)
+    """
+    lengths = np.asarray(lengths)
+    bucket = _bucket_size(int(lengths.max()) if lengths.size else 0, buckets)
+    mask = np.arange(bucket) < lengths[..., None]
+    return MsTensor(mask.astype(dtype))
+
+
+def _pad_args_to_buckets(args, shape_buckets, offset):
+    """Pad the tensor arguments to the shape buckets, the first `offset` arguments are not inputs."""
+    args = list(args)
+    for index, axis_buckets in shape_buckets.items():
+        position = index + offset
+        if position >= len(args) or not isinstance(args[position], (MsTensor, np.ndarray)):
+            continue
+        for axis, buckets in axis_buckets.items():
+            args[position] = pad_to_bucket(args[position], buckets, axis)
+    return tuple(args)
+
+
+def set_ms_function_cache_size(size):
+    """
+    Set the max number of the graphs compiled by ms_function that are kept, the least recently used graphs are
+    released when there are more.
+
+    Args:
+        size (int): The max number of the graphs, None means unlimited.
+
+    Raises:
+        ValueError: If `size` is not None or a positive int.
+    """
+    if size is not None and (not isinstance(size, int) or isinstance(size, bool) or size <= 0):
+        raise ValueError("The size of the ms_function cache must be None or a positive int, but got {}.".format(size))
+    ms_compile_cache.max_size = size
+    ms_compile_cache.shrink(Executor_.get_instance())
+
+
+def get_ms_function_cache_info():
+    """
+    Get the statistics of the graphs compiled by ms_function.
+
+    Returns:
+        dict, the number of cache hits, misses and evictions, the total compile time in seconds, the number of cached
+        graphs and the max number of them.
+    """
+    return {"hits": ms_compile_cache.hits,
+            "misses": ms_compile_cache.misses,
+            "evictions": ms_compile_cache.evictions,
+            "compile_time": ms_compile_cache.compile_time,
+            "size": len(ms_compile_cache),
+            "max_size": ms_compile_cache.max_size}
+
+
+def ms_function(fn=None, obj=None, input_signature=None, shape_buckets=None):
     """
     Create a callable MindSpore graph from a python function.
 
@@ -230,6 +427,11 @@ def ms_function(fn=None, obj=None, input_signature=None):
             is specified, each input to `fn` must be a `Tensor`. And the input parameters of `fn` cannot accept
             `**kwargs`. The shape and dtype of actual inputs should keep the same as input_signature. Otherwise,
             TypeError will be raised. Default: None.
+        shape_buckets (dict): The buckets of the dynamic dimensions of the inputs, which maps the index of an input
+            (`self` excluded) to a dict mapping an axis to the ascending sizes of its buckets, e.g.
+            {0: {1: (32, 64, 128)}}. The tensor inputs are padded with zeros along the axes up to the smallest bucket
+            not smaller than their dimensions, so that the inputs of variable shapes share a few compiled graphs.
+            Use `bucket_mask` to mask the padded positions. Default: None.
 
     Returns:
         Function, if `fn` is not None, returns a callable function that will execute the compiled function; If `fn` is
@@ -268,12 +470,18 @@ def ms_function(fn=None, obj=None, input_signature=None):
         >>> out = tensor_add_with_sig(x, y)
     """
 
+    if shape_buckets is not None:
+        _check_shape_buckets(shape_buckets)
+
     def wrap_mindspore(func):
         @wraps(func)
         def staging_specialize(*args):
             process_obj = obj
-            if args and not isinstance(args[0], MsTensor) and hasattr(args[0], func.__name__):
+            is_method = args and not isinstance(args[0], MsTensor) and hasattr(args[0], func.__name__)
+            if is_method:
                 process_obj = args[0]
+            if shape_buckets:
+                args = _pad_args_to_buckets(args, shape_buckets, 1 if is_method else 0)
             return _MindSporeFunction(func, input_signature, process_obj)(*args)
 
         return staging_specialize
@@ -467,6 +675,7 @@ class _Executor:
         dic = dict(zip(args_names, args_list))
         key = generate_key(phase, dic)
         obj.phase_prefix = str(key[1])
+        cache_phase = phase
         if 'export' in phase:
             phase = phase + '.' + obj.phase_prefix + '.' + str(obj.create_time)
         else:
@@ -488,7 +697,12 @@ class _Executor:
         enable_debug_runtime = context.get_context("enable_debug_runtime")
         enable_ge = context.get_context("enable_ge")
         use_vm = not enable_ge or (enable_debug_runtime and context.get_context("mode") == context.PYNATIVE_MODE)
-        result = self._executor.compile(obj, args_list, phase, use_vm)
+        compile_cache = get_compile_cache()
+        if compile_cache is None:
+            result = self._executor.compile(obj, args_list, phase, use_vm)
+        else:
+            result = compile_cache.compile(obj, cache_phase, args_list,
+                                           lambda: self._executor.compile(obj, args_list, phase, use_vm))
         self.compile_cache[phase] = phase
         if not result:
             raise RuntimeError("Executor compile failed.")
@@ -15,16 +15,21 @@
 """Initializer for cell parameters."""
 import numbers
 import math
+import os
 
+from concurrent.futures import ThreadPoolExecutor
 from functools import reduce
 import numpy as np
 from scipy.stats import truncnorm
-from .seed import get_seed, _get_graph_seed
+from .seed import get_seed, _get_graph_seed, _get_init_chunk_seed, _MAXINT32
 from . import dtype as mstype
 from .tensor import Tensor
 from .._c_expression import random_normal
 
 _INITIALIZER_ALIAS = dict()
+# The number of the elements of a chunk of a parameter initialized in chunks
+_INIT_CHUNK_SIZE = 1 << 22
+_LAZY_INIT = {'enable': False, 'num_workers': min(8, os.cpu_count() or 1)}
 
 
 class Initializer:
@@ -57,9 +62,115 @@ class Initializer:
     def _initialize(self, *kwargs):
         raise NotImplementedError('Must be overridden!')
 
+    def _chunk_sampler(self, shape):
+        """
+        Get the sampler of the chunks of an array, override it to support the initialization in chunks.
+
+        Args:
+            shape (tuple[int]): The shape of the whole array.
+
+        Returns:
+            Function, which takes a `numpy.random.Generator` and the shape of a chunk, and returns the chunk. None if
+            the initialization in chunks is not supported.
+        """
+        return None
+
     def __call__(self, arr):
         return self._initialize(arr)
 
+
+def set_lazy_init(enable, num_workers=None):
+    """
+    Set whether to initialize the parameters lazily.
+
+    In the lazy initialization, a parameter created by an initializer is initialized when the network is compiled or
+    a checkpoint is loaded into it, instead of when it is created. The random initializers `TruncatedNormal`,
+    `Normal`, `Uniform`, `HeUniform`, `HeNormal` and `XavierUniform` then generate the data in chunks of rows with
+    multiple threads, each chunk from its own seed derived from the seed of the parameter, so the data do not depend
+    on the number of threads. Under the model parallel, each device only generates its own slice of a parameter,
+    and its own shard of the slice if the optimizer is sharded. The parameters loaded from a checkpoint by
+    `load_param_into_net` or `load_checkpoint` are not initialized at all.
+
+    Note:
+        It should be set before the network is created. In PyNative mode, call `init_parameters_data` of the network
+        to initialize the parameters before running it.
+
+    Args:
+        enable (bool): Whether to initialize the parameters lazily.
+        num_workers (int, optional): The number of the threads generating the chunks. Default: None, not changed,
+            the number of CPUs but at most 8 at the beginning.
+
+    Examples:
+        >>> from mindspore.common.initializer import set_lazy_init
+        >>> set_lazy_init(True, num_workers=16)
+    """
+    if not isinstance(enable, bool):
+        raise TypeError("The enable must be bool, but got {}.".format(type(enable)))
+    if num_workers is not None:
+        if not isinstance(num_workers, int) or isinstance(num_workers, bool) or num_workers <= 0:
+            raise ValueError("The num_workers must be a positive int, but got {}.".format(num_workers))
+        _LAZY_INIT['num_workers'] = num_workers
+    _LAZY_INIT['enable'] = enable
+
+
+def get_lazy_init():
+    """
+    Get whether to initialize the parameters lazily.
+
+    Returns:
+        bool, whether to initialize the parameters lazily.
+    """
+    return _LAZY_INIT['enable']
+
+
+def _init_in_chunks(init, shape, dtype, slice_index=None, rows=None):
+    """
+    Initialize an array in chunks of the rows of its first dimension with multiple threads.
+
+    Args:
+        init (Initializer): The initializer.
+        shape (tuple[int]): The shape of the array.
+        dtype (numpy.dtype): The data type of the array.
+        slice_index (int, optional): The index of the slice of the parameter, the slices are generated from different
+            seeds. Default: None.
+        rows (tuple[int], optional): The start and stop of the rows generated. Default: None, all the rows.
+
+    Returns:
+        numpy.ndarray, the rows of the array, None if the initializer does not support the initialization in chunks.
+    """
+    sample = init._chunk_sampler(tuple(shape))  # pylint: disable=protected-access
+    if sample is None:
+        return None
+    seeds = init.seed
+    if tuple(seeds) == (0, 0):
+        # no seed is set, numpy.random chooses one
+        seeds = (np.random.randint(_MAXINT32),)
+    if slice_index is not None:
+        seeds = tuple(seeds) + (slice_index,)
+    full_shape = tuple(shape) if shape else (1,)
+    start, stop = rows if rows is not None else (0, full_shape[0])
+    row_shape = full_shape[1:]
+    rows_per_chunk = max(1, _INIT_CHUNK_SIZE // max(1, int(np.prod(row_shape))))
+    data = np.empty((stop - start,) + row_shape, dtype=dtype)
+
+    def _fill(chunk_index):
+        chunk_start = chunk_index * rows_per_chunk
+        chunk_stop = min(chunk_start + rows_per_chunk, full_shape[0])
+        generator = np.random.Generator(np.random.PCG64(_get_init_chunk_seed(seeds, chunk_index)))
+        chunk = sample(generator, (chunk_stop - chunk_start,) + row_shape)
+        low, high = max(chunk_start, start), min(chunk_stop, stop)
+        data[low - start:high - start] = chunk[low - chunk_start:high - chunk_start]
+
+    chunk_indices = range(start // rows_per_chunk, (stop + rows_per_chunk - 1) // rows_per_chunk)
+    if len(chunk_indices) > 1 and _LAZY_INIT['num_workers'] > 1:
+        with ThreadPoolExecutor(min(_LAZY_INIT['num_workers'], len(chunk_indices))) as pool:
+            list(pool.map(_fill, chunk_indices))
+    else:
+        for chunk_index in chunk_indices:
+            _fill(chunk_index)
+    return data if rows is not None else data.reshape(shape)
+
+
 def _register(*aliases):
     """Return the alias register."""
     def alias_reg(cls):
@@ -121,6 +232,14 @@ class One(Initializer):
         _assignment(arr, 1)
 
 
+class _Uninitialized(Initializer):
+    """
+    Leave the array uninitialized, used for the parameters whose data are overwritten right after the initialization.
+    """
+    def _initialize(self, arr):
+        """Nothing to initialize."""
+
+
 def _calculate_fan_in_and_fan_out(shape):
     """
     calculate fan_in and fan_out
@@ -252,6 +371,11 @@ class XavierUniform(Initializer):
 
         _assignment(arr, data)
 
+    def _chunk_sampler(self, shape):
+        n_in, n_out = _calculate_fan_in_and_fan_out(shape)
+        boundary = self.gain * math.sqrt(6.0 / (n_in + n_out))
+        return lambda generator, size: generator.uniform(-boundary, boundary, size)
+
 
 @_register('he_uniform')
 class HeUniform(Initializer):
@@ -284,6 +408,12 @@ class HeUniform(Initializer):
 
         _assignment(arr, data)
 
+    def _chunk_sampler(self, shape):
+        fan = _calculate_correct_fan(shape, self.mode)
+        gain = _calculate_gain(self.nonlinearity, self.negative_slope)
+        boundary = math.sqrt(3.0) * gain / math.sqrt(fan)
+        return lambda generator, size: generator.uniform(-boundary, boundary, size)
+
 
 @_register('he_normal')
 class HeNormal(Initializer):
@@ -313,6 +443,12 @@ class HeNormal(Initializer):
 
         _assignment(arr, data)
 
+    def _chunk_sampler(self, shape):
+        fan = _calculate_correct_fan(shape, self.mode)
+        gain = _calculate_gain(self.nonlinearity, self.negative_slope)
+        std = gain / math.sqrt(fan)
+        return lambda generator, size: generator.normal(0, std, size)
+
 
 class Constant(Initializer):
     """
@@ -352,6 +488,9 @@ class Uniform(Initializer):
         tmp = np.random.uniform(-self.scale, self.scale, arr.shape)
         _assignment(arr, tmp)
 
+    def _chunk_sampler(self, shape):
+        return lambda generator, size: generator.uniform(-self.scale, self.scale, size)
+
 
 @_register()
 class Normal(Initializer):
@@ -377,6 +516,9 @@ class Normal(Initializer):
         output_data *= self.sigma
         _assignment(arr, output_data)
 
+    def _chunk_sampler(self, shape):
+        return lambda generator, size: generator.normal(0, self.sigma, size)
+
 @_register()
 class TruncatedNormal(Initializer):
     """
@@ -396,6 +538,18 @@ class TruncatedNormal(Initializer):
         tmp = truncnorm.rvs(-2, 2, loc=0, scale=self.sigma, size=arr.shape, random_state=None)
         _assignment(arr, tmp)
 
+    def _chunk_sampler(self, shape):
+        def _sample(generator, size):
+            # resample the values out of [-2, 2] of the standard normal distribution
+            data = generator.standard_normal(size)
+            invalid = np.abs(data) > 2
+            while invalid.any():
+                data[invalid] = generator.standard_normal(int(invalid.sum()))
+                invalid = np.abs(data) > 2
+            return data * self.sigma
+
+        return _sample
+
 
 def initializer(init, shape=None, dtype=mstype.float32):
     """
@@ -457,6 +611,8 @@ def initializer(init, shape=None, dtype=mstype.float32):
 __all__ = [
     'Initializer',
     'initializer',
+    'set_lazy_init',
+    'get_lazy_init',
     'TruncatedNormal',
     'Normal',
     'Uniform',
@@ -19,7 +19,7 @@ import numbers
 import numpy as np
 from .._c_expression import ParamInfo
 from . import dtype as mstype
-from .initializer import initializer
+from .initializer import initializer, get_lazy_init
 from .tensor import Tensor
 from .._checkparam import Validator
 from .._c_expression import Tensor as Tensor_
@@ -189,8 +189,8 @@ class Parameter(Tensor_):
         if isinstance(data, bool):
             raise ValueError('Parameter data can not be `bool`')
         if isinstance(data, Tensor) and data.has_init:
-            if _is_in_parallel_mode() or _is_role_worker() or _is_role_sched():
-                # do not init data while in auto parallel.
+            if _is_in_parallel_mode() or _is_role_worker() or _is_role_sched() or get_lazy_init():
+                # do not init data while in auto parallel or lazy initialization.
                 return (Tensor, None, data.dtype, data.shape, data.init)
             data = data.init_data().asnumpy()
         elif isinstance(data, Tensor):
@@ -254,3 +254,18 @@ def _get_graph_seed(op_seed, kernel_name):
         seeds = _truncate_seed(global_seed), _truncate_seed(temp_seed)
         _update_seeds(op_seed, kernel_name)
     return seeds
+
+
+def _get_init_chunk_seed(seeds, chunk_index):
+    """
+    Get the seed of a chunk of a parameter initialized in chunks.
+
+    Args:
+        seeds (tuple[int]): The seeds of the parameter.
+        chunk_index (int): The index of the chunk.
+
+    Returns:
+        numpy.random.SeedSequence, the seed of the chunk. It depends only on the seeds of the parameter and the index
+        of the chunk, so the chunks can be generated in any order by any thread.
+    """
+    return np.random.SeedSequence([int(seed) for seed in seeds], spawn_key=(chunk_index,))
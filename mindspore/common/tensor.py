@@ -590,12 +590,24 @@ class Tensor(Tensor_):
                     np.random.seed(self._np_seed)
                     self.init.seed, _ = self.seed
 
-        with seed_context(self.init):
-            self.init(arr)
-        data = np.array(arr)
+        from .initializer import get_lazy_init, _init_in_chunks
+        data = None
         if opt_shard_group:
             rank = get_rank(opt_shard_group)
             size = get_group_size(opt_shard_group)
+        with seed_context(self.init):
+            if get_lazy_init():
+                rows = None
+                if opt_shard_group and shape and shape[0] % size == 0:
+                    # only the shard of the slice of this device is generated
+                    rows = (rank * shape[0] // size, (rank + 1) * shape[0] // size)
+                data = _init_in_chunks(self.init, tuple(shape), arr.dtype, slice_index, rows)
+                if data is not None and rows is not None:
+                    opt_shard_group = None
+            if data is None:
+                self.init(arr)
+                data = np.array(arr)
+        if opt_shard_group:
             data = np.split(data, size)[rank]
         return Tensor(data, dtype=self.dtype)
 
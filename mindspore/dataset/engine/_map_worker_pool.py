@@ -0,0 +1,328 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Persistent worker process pool of the Python operations of map.
+
+The rows submitted by the threads of the map operator are accumulated while the workers are busy and sent to an idle
+worker as one task, the ndarray arguments and results are copied through shared memory rings instead of being
+pickled through a pipe. The pool is owned by the map dataset and reused by all its iterators, across epochs and
+create_dict_iterator calls, it is closed when the map dataset and its iterators are garbage collected.
+"""
+import copy
+import multiprocessing
+import pickle
+import queue
+import signal
+import threading
+import traceback
+import weakref
+from concurrent.futures import Future
+from functools import partial
+
+import numpy as np
+
+from mindspore import log as logger
+from ._shared_memory import SharedMemoryRing
+
+# Max number of tasks sent to a worker and not yet returned
+_MAX_TASKS_IN_FLIGHT = 2
+# Max size in bytes of the arguments or results of a row copied through shared memory
+_MAX_ROW_BYTES = 64 * 1024 * 1024
+# Max number of the map threads submitting rows to a pool, unless there are more workers
+_MAX_SUBMIT_THREADS = 32
+
+
+def _is_ndarray_row(row):
+    return isinstance(row, tuple) and all(isinstance(x, np.ndarray) for x in row)
+
+
+def _picklable_exception(e):
+    """Get the exception to be sent to the main process, replaced by a RuntimeError if it can not be pickled."""
+    try:
+        pickle.dumps(e)
+        return e
+    except Exception:  # pylint: disable=broad-except
+        return RuntimeError("".join(traceback.format_exception(type(e), e, e.__traceback__)))
+
+
+def _map_worker_handle(eof, signum, frame):
+    eof.set()
+
+
+def _map_worker_loop(pyfunc_list, task_queue, res_queue, arg_ring, res_ring, eof, worker_id):
+    """
+    Worker process loop, run the rows of each task and send the results back together.
+    """
+    signal.signal(signal.SIGTERM, partial(_map_worker_handle, eof))
+    while True:
+        try:
+            task = task_queue.get(timeout=1)
+        except queue.Empty:
+            if eof.is_set():
+                break
+            continue
+        except KeyboardInterrupt:
+            raise Exception("Multiprocess MapOp worker receives KeyboardInterrupt")
+        if task is None or eof.is_set():
+            break
+        task_id, rows = task
+        results, shared_args = [], 0
+        for func_idx, args in rows:
+            if arg_ring.is_shared(args):
+                shared_args += 1
+            args = arg_ring.unpack(args)
+            try:
+                result = pyfunc_list[func_idx](*args)
+            except Exception as e:  # pylint: disable=broad-except
+                results.append((False, False, _picklable_exception(e)))
+                continue
+            is_tuple = isinstance(result, tuple)
+            row = result if is_tuple else (result,)
+            if _is_ndarray_row(row):
+                row = res_ring.pack(row, eof)
+                if row is None:
+                    # eof is set while waiting for a free slot
+                    task_queue.cancel_join_thread()
+                    res_queue.cancel_join_thread()
+                    return
+            if shared_args and not res_ring.is_shared(row):
+                # The result is pickled after the argument slots are released, it must not view them
+                row = copy.deepcopy(row)
+            results.append((True, is_tuple, row))
+        for _ in range(shared_args):
+            arg_ring.release()
+        res_queue.put((worker_id, task_id, results))
+    task_queue.cancel_join_thread()
+    res_queue.cancel_join_thread()
+
+
+class _MapWorker(multiprocessing.Process):
+    """
+    Worker process of _MapWorkerPool, with the shared memory rings of its arguments and results.
+    """
+
+    def __init__(self, pyfunc_list, res_queue, eof, worker_id, rows_per_task):
+        self.task_queue = multiprocessing.Queue()
+        slot_count = _MAX_TASKS_IN_FLIGHT * rows_per_task
+        self.arg_ring = SharedMemoryRing(slot_count, _MAX_ROW_BYTES)
+        self.res_ring = SharedMemoryRing(slot_count, _MAX_ROW_BYTES)
+        self.in_flight = 0
+        super().__init__(target=_map_worker_loop, args=(pyfunc_list, self.task_queue, res_queue, self.arg_ring,
+                                                        self.res_ring, eof, worker_id))
+
+
+class _MapWorkerPool:
+    """
+    Persistent pool of worker processes running the Python operations of map in batched tasks.
+
+    Args:
+        pyfunc_list (list): The Python callables, referred by their indices in `submit`.
+        num_workers (int): Number of worker processes.
+        rows_per_task (int): Max number of rows sent to a worker in one task.
+    """
+
+    def __init__(self, pyfunc_list, num_workers, rows_per_task):
+        self.pyfunc_list = pyfunc_list
+        self.num_workers = num_workers
+        self.rows_per_task = rows_per_task
+        self._eof = multiprocessing.Event()
+        self._res_queue = multiprocessing.Queue()
+        self._lock = threading.Lock()
+        # rows waiting for an idle worker, list of (func idx, args, future)
+        self._pending = []
+        # futures of the rows of the tasks in flight, task id -> list of futures
+        self._tasks = {}
+        self._next_task_id = 0
+        self._num_tasks = 0
+        self._num_rows = 0
+        self._closed = False
+        self._workers = []
+        for worker_id in range(num_workers):
+            worker = _MapWorker(pyfunc_list, self._res_queue, self._eof, worker_id, rows_per_task)
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+        self._collector = threading.Thread(target=self._collect, daemon=True)
+        self._collector.start()
+
+    def match(self, pyfunc_list, num_workers, rows_per_task):
+        """Whether the pool runs the same callables with the same settings."""
+        return not self._closed and num_workers == self.num_workers and rows_per_task == self.rows_per_task and \
+            len(pyfunc_list) == len(self.pyfunc_list) and \
+            all(a is b for a, b in zip(pyfunc_list, self.pyfunc_list))
+
+    def is_alive(self):
+        """Whether the pool is able to run rows."""
+        return not self._closed and all(w.is_alive() for w in self._workers)
+
+    def submit(self, func_idx, args):
+        """
+        Submit a row to be run by the callable of func_idx.
+
+        Returns:
+            concurrent.futures.Future, the future of the result of the row.
+        """
+        future = Future()
+        with self._lock:
+            self._pending.append((func_idx, args, future))
+            self._dispatch()
+        return future
+
+    def _dispatch(self):
+        """
+        Send the pending rows to the workers, called with the lock held. An idle worker takes all the pending rows
+        up to rows_per_task, a busy worker only takes a full task, so rows accumulate while all workers are busy.
+        """
+        for worker in sorted(self._workers, key=lambda w: w.in_flight):
+            if not self._pending:
+                return
+            if worker.in_flight >= _MAX_TASKS_IN_FLIGHT or \
+                    (worker.in_flight and len(self._pending) < self.rows_per_task):
+                continue
+            rows = self._pending[:self.rows_per_task]
+            del self._pending[:self.rows_per_task]
+            task_rows = []
+            for func_idx, args, _ in rows:
+                if _is_ndarray_row(args):
+                    args = worker.arg_ring.pack(args, self._eof)
+                task_rows.append((func_idx, args))
+            task_id = self._next_task_id
+            self._next_task_id += 1
+            self._tasks[task_id] = [future for _, _, future in rows]
+            worker.in_flight += 1
+            self._num_tasks += 1
+            self._num_rows += len(rows)
+            worker.task_queue.put((task_id, task_rows))
+
+    def _collect(self):
+        """Receive the results of the tasks, resolve their futures and dispatch the pending rows."""
+        while not self._closed:
+            try:
+                worker_id, task_id, results = self._res_queue.get(timeout=1)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                break
+            worker = self._workers[worker_id]
+            with self._lock:
+                futures = self._tasks.pop(task_id)
+                worker.in_flight -= 1
+            for future, (ok, is_tuple, row) in zip(futures, results):
+                if not ok:
+                    future.set_exception(row)
+                    continue
+                if worker.res_ring.is_shared(row):
+                    # copy the result out of the slot so the slot is released at once
+                    row = tuple([np.array(x) for x in worker.res_ring.unpack(row)])
+                    worker.res_ring.release()
+                future.set_result(row if is_tuple else row[0])
+            with self._lock:
+                self._dispatch()
+
+    def stats(self):
+        """
+        Get the statistics of the pool.
+
+        Returns:
+            dict, the number of tasks and rows sent to the workers and the mean number of rows per task.
+        """
+        return {"tasks": self._num_tasks,
+                "rows": self._num_rows,
+                "rows_per_task": self._num_rows / self._num_tasks if self._num_tasks else 0.0}
+
+    def close(self):
+        """Stop the workers and remove the shared memory."""
+        if self._closed:
+            return
+        self._closed = True
+        self._eof.set()
+        logger.info("Map worker pool is being terminated, {} rows in {} tasks.".format(self._num_rows,
+                                                                                    self._num_tasks))
+        for worker in self._workers:
+            worker.join(timeout=3)
+            if worker.is_alive():
+                worker.terminate()
+            worker.arg_ring.close()
+            worker.res_ring.close()
+        with self._lock:
+            for futures in self._tasks.values():
+                for future in futures:
+                    future.cancel()
+            for _, _, future in self._pending:
+                future.cancel()
+
+
+def get_num_submit_threads(num_workers, rows_per_task):
+    """
+    Get the number of the map threads submitting rows to a pool.
+
+    Each thread waits for the result of its row, so num_workers * rows_per_task threads fill the tasks of all the
+    workers. The number is capped, the idle workers then take the smaller tasks of the rows pending.
+
+    Args:
+        num_workers (int): Number of worker processes.
+        rows_per_task (int): Max number of rows sent to a worker in one task.
+
+    Returns:
+        int, the number of the threads.
+    """
+    return min(num_workers * rows_per_task, max(num_workers, _MAX_SUBMIT_THREADS))
+
+
+class MapWorkerPoolHolder:
+    """
+    Holder of the persistent pool of a map dataset, shared with the copies of the dataset made by its iterators.
+
+    The pool is created by the first iterator and reused by the later ones. It is closed by `close`, or when the holder
+    is garbage collected with the map dataset and its iterators.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pool = None
+        self._finalizer = None
+
+    def get(self, pyfunc_list, num_workers, rows_per_task):
+        """
+        Get the pool of the Python callables, a new pool replaces the one of other callables or settings.
+
+        Args:
+            pyfunc_list (list): The Python callables of the map operation.
+            num_workers (int): Number of worker processes.
+            rows_per_task (int): Max number of rows sent to a worker in one task.
+
+        Returns:
+            _MapWorkerPool, the pool of the callables.
+        """
+        with self._lock:
+            if self._pool is not None and self._pool.match(pyfunc_list, num_workers, rows_per_task) and \
+                    self._pool.is_alive():
+                return self._pool
+            self._close()
+            self._pool = _MapWorkerPool(pyfunc_list, num_workers, rows_per_task)
+            # the finalizer must not refer to the holder, it closes the pool when the holder is collected
+            self._finalizer = weakref.finalize(self, self._pool.close)
+            return self._pool
+
+    def _close(self):
+        """Close the pool, called with the lock held."""
+        if self._finalizer is not None:
+            self._finalizer()
+        self._pool, self._finalizer = None, None
+
+    def close(self):
+        """Stop the workers of the pool and remove its shared memory."""
+        with self._lock:
+            self._close()
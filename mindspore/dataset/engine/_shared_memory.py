@@ -0,0 +1,197 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Shared memory transport of rows between Python worker processes and the main process.
+
+The rows are copied into the slots of a ring buffer backed by a memory-mapped file, only a small descriptor of
+the row goes through the multiprocessing queue, and the main process reads the row through zero-copy numpy views.
+"""
+import mmap
+import os
+import tempfile
+import time
+import multiprocessing
+
+import numpy as np
+
+_SHM_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+_ALIGNMENT = 64
+_MIN_SLOT_SIZE = 4096
+
+
+def _align(size):
+    return (size + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+class _SharedMemoryRow:
+    """Descriptor of a row in a slot of SharedMemoryRing, sent through the queue instead of the row."""
+
+    __slots__ = ("seq", "slot_size", "columns")
+
+    def __init__(self, seq, slot_size, columns):
+        self.seq = seq
+        self.slot_size = slot_size
+        # list of (dtype str, shape, offset in the slot)
+        self.columns = columns
+
+    def __getstate__(self):
+        return self.seq, self.slot_size, self.columns
+
+    def __setstate__(self, state):
+        self.seq, self.slot_size, self.columns = state
+
+
+class SharedMemoryRing:
+    """
+    Ring buffer of fixed size slots shared by one producer process and the main process.
+
+    The backing file is created by the main process, the producer sizes the slots from its first row(twice the
+    size of the row, at most max_sample_bytes) and maps the file. Rows are written into the slots in order and
+    released by the main process in the same order. Rows which contain Python objects or do not fit into a slot
+    are returned as they are, to be sent through the queue.
+
+    Args:
+        slot_count (int): Number of slots of the ring.
+        max_sample_bytes (int): Maximum size of a slot in bytes.
+    """
+
+    def __init__(self, slot_count, max_sample_bytes):
+        fd, self._path = tempfile.mkstemp(prefix="ms_shm_ring_", dir=_SHM_DIR)
+        os.close(fd)
+        self._slot_count = slot_count
+        self._max_sample_bytes = max_sample_bytes
+        self._released = multiprocessing.RawValue('q', 0)
+        # producer states
+        self._produced = 0
+        self._slot_size = None
+        self._mmap = None
+        # consumer states
+        self._reader = None
+        self._rows = 0
+        self._fallback_rows = 0
+        self._peak_occupancy = 0
+        self._total_occupancy = 0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_mmap"] = None
+        state["_reader"] = None
+        return state
+
+    def _map(self, slot_size, create):
+        """Map the backing file, the producer resizes it to hold all the slots."""
+        size = self._slot_count * slot_size
+        with open(self._path, "r+b") as f:
+            if create:
+                f.truncate(size)
+            return mmap.mmap(f.fileno(), size)
+
+    def pack(self, row, eof):
+        """
+        Copy the row into the next slot, called in the producer process.
+
+        Args:
+            row (tuple): The row to be sent.
+            eof (Event): Event of the end of epoch, stop waiting for a free slot when it is set.
+
+        Returns:
+            The descriptor of the row in the slot, the row itself if it can not be put into a slot, or None if eof
+            is set while waiting.
+        """
+        arrays = [np.asarray(x) for x in row]
+        if any(array.dtype.hasobject for array in arrays):
+            return row
+        row_size = sum(_align(array.nbytes) for array in arrays)
+        if self._slot_size is None:
+            if row_size > self._max_sample_bytes:
+                return row
+            self._slot_size = min(self._max_sample_bytes, max(_MIN_SLOT_SIZE, _align(row_size * 2)))
+            self._mmap = self._map(self._slot_size, create=True)
+        if row_size > self._slot_size:
+            return row
+
+        while self._produced - self._released.value >= self._slot_count:
+            if eof.is_set():
+                return None
+            time.sleep(0.001)
+
+        slot_offset = self._produced % self._slot_count * self._slot_size
+        columns, offset = [], 0
+        for array in arrays:
+            dst = np.ndarray(array.shape, array.dtype, buffer=self._mmap, offset=slot_offset + offset)
+            dst[...] = array
+            columns.append((array.dtype.str, array.shape, offset))
+            offset += _align(array.nbytes)
+        descriptor = _SharedMemoryRow(self._produced, self._slot_size, columns)
+        self._produced += 1
+        return descriptor
+
+    def unpack(self, item):
+        """
+        Get the row from the item received from the queue, called in the main process.
+
+        Returns:
+            Tuple, zero-copy views of the slot if item is a descriptor, otherwise item itself. The slot must be
+            released by `release` once the views are no longer used.
+        """
+        self._rows += 1
+        if not isinstance(item, _SharedMemoryRow):
+            self._fallback_rows += 1
+            return item
+        if self._reader is None:
+            self._reader = self._map(item.slot_size, create=False)
+        occupancy = item.seq + 1 - self._released.value
+        self._peak_occupancy = max(self._peak_occupancy, occupancy)
+        self._total_occupancy += occupancy
+        slot_offset = item.seq % self._slot_count * item.slot_size
+        return tuple(np.ndarray(shape, np.dtype(dtype), buffer=self._reader, offset=slot_offset + offset)
+                     for dtype, shape, offset in item.columns)
+
+    @staticmethod
+    def is_shared(item):
+        """Whether the item received from the queue occupies a slot."""
+        return isinstance(item, _SharedMemoryRow)
+
+    def release(self):
+        """Release the oldest occupied slot, called in the main process."""
+        self._released.value += 1
+
+    def stats(self):
+        """
+        Get the statistics of the ring in the main process.
+
+        Returns:
+            dict, the slot count and size, the number of received rows, the number of rows sent through the
+            queue because they do not fit into a slot, and the peak and mean number of occupied slots.
+        """
+        shared_rows = self._rows - self._fallback_rows
+        return {"slot_count": self._slot_count,
+                "slot_size": self._reader.size() // self._slot_count if self._reader is not None else 0,
+                "rows": self._rows,
+                "fallback_rows": self._fallback_rows,
+                "peak_occupancy": self._peak_occupancy,
+                "mean_occupancy": self._total_occupancy / shared_rows if shared_rows else 0.0}
+
+    def close(self):
+        """Unmap and remove the backing file, called in the main process."""
+        if self._reader is not None:
+            try:
+                self._reader.close()
+            except BufferError:
+                # views of the slots are still alive, the mapping is released with them
+                pass
+            self._reader = None
+        if os.path.exists(self._path):
+            os.remove(self._path)
@@ -19,6 +19,8 @@ high performance and parses data precisely. Some of the operations that are
 provided to users to preprocess data include shuffle, batch, repeat, map, and zip.
 """
 import atexit
+import collections
+import concurrent.futures
 import glob
 import json
 import math
@@ -47,6 +49,8 @@ from mindspore.parallel._ps_context import _is_role_pserver, _is_role_sched
 import mindspore.dataset.transforms.py_transforms as py_transforms
 
 from . import samplers
+from ._map_worker_pool import MapWorkerPoolHolder, get_num_submit_threads
+from ._shared_memory import SharedMemoryRing
 from .iterators import DictIterator, TupleIterator, DummyIterator, check_iterator_cleanup, _set_iterator_cleanup, \
     ITERATORS_LIST, _unset_iterator_cleanup
 from .validators import check_batch, check_shuffle, check_map, check_filter, check_repeat, check_skip, check_zip, \
@@ -56,7 +60,7 @@ from .validators import check_batch, check_shuffle, check_map, check_filter, che
     check_generatordataset, check_sync_wait, check_zip_dataset, check_add_column, check_textfiledataset, check_concat, \
     check_random_dataset, check_split, check_bucket_batch_by_length, check_cluedataset, check_save, check_csvdataset, \
     check_paddeddataset, check_tuple_iterator, check_dict_iterator, check_schema, check_to_device_send, replace_none
-from ..core.config import get_callback_timeout, _init_device_info
+from ..core.config import get_callback_timeout, _init_device_info, get_num_parallel_workers
 from ..core.datatypes import mstype_to_detype, mstypelist_to_detypelist
 
 try:
@@ -477,7 +481,8 @@ class Dataset:
 
     @check_map
     def map(self, operations, input_columns=None, output_columns=None, column_order=None,
-            num_parallel_workers=None, python_multiprocessing=False, cache=None, callbacks=None):
+            num_parallel_workers=None, python_multiprocessing=False, cache=None, callbacks=None,
+            persistent_workers=False, rows_per_task=8):
         """
         Apply each operation in operations to this dataset.
 
@@ -521,6 +526,13 @@ class Dataset:
             cache (DatasetCache, optional): Use tensor caching service to speed up dataset processing.
                 (default=None which means no cache is used).
             callbacks: (DSCallback, list[DSCallback], optional): List of Dataset callbacks to be called (Default=None).
+            persistent_workers (bool, optional): Run the Python operations in a persistent worker process pool when
+                python_multiprocessing is True. The pool is reused across epochs and iterators and closed with the
+                dataset, the rows are sent to the workers in tasks of up to rows_per_task rows and the ndarrays are
+                copied through shared memory instead of pipes (default=False).
+            rows_per_task (int, optional): Max number of rows sent to a worker of the persistent pool in one task.
+                The map operator runs up to num_parallel_workers * rows_per_task threads, at most 32 unless there
+                are more workers, to submit enough rows to fill the tasks (default=8).
 
 
         Returns:
@@ -638,7 +650,7 @@ class Dataset:
         """
 
         return MapDataset(self, operations, input_columns, output_columns, column_order, num_parallel_workers,
-                          python_multiprocessing, cache, callbacks)
+                          python_multiprocessing, cache, callbacks, persistent_workers, rows_per_task)
 
     @check_filter
     def filter(self, predicate, input_columns=None, num_parallel_workers=1):
@@ -2256,6 +2268,31 @@ class _PythonCallable:
         return self.py_callable(*args)
 
 
+class _PersistentPythonCallable(_PythonCallable):
+    """
+    Internal Python function wrapper for the persistent map worker pool.
+    """
+
+    def __call__(self, *args):
+        if self.pool is not None and self.pool.is_alive() and check_iterator_cleanup() is False:
+            # The row is sent to a worker together with the rows submitted by the other map threads meanwhile.
+            # Block, yield GIL. Current thread will reacquire GIL once result is returned.
+            future = self.pool.submit(self.idx, args)
+            while check_iterator_cleanup() is False:
+                try:
+                    return future.result(30)
+                except concurrent.futures.TimeoutError:
+                    continue
+                except concurrent.futures.CancelledError:
+                    break
+                except KeyboardInterrupt:
+                    _set_iterator_cleanup()
+                    raise Exception("Multiprocess MapOp worker receives KeyboardInterrupt.")
+            return (None,)
+        # Invoke original Python callable in master process in case the pool is gone.
+        return self.py_callable(*args)
+
+
 def _mp_pool_exit_preprocess():
     if check_iterator_cleanup() is False:
         logger.info("Execution preprocessing process before map exit.")
@@ -2298,13 +2335,18 @@ class MapDataset(Dataset):
         cache (DatasetCache, optional): Use tensor caching service to speed up dataset processing.
             (default=None which means no cache is used).
         callbacks: (DSCallback, list[DSCallback], optional): List of Dataset callbacks to be called (Default=None)
+        persistent_workers (bool, optional): Run the Python operations in a persistent worker process pool shared by
+            all the iterators when python_multiprocessing is True (default=False).
+        rows_per_task (int, optional): Max number of rows sent to a worker of the persistent pool in one task
+            (default=8).
 
         Raises:
             ValueError: If len(input_columns) != len(output_columns) and column_order is not specified.
     """
 
     def __init__(self, input_dataset, operations=None, input_columns=None, output_columns=None, column_order=None,
-                 num_parallel_workers=None, python_multiprocessing=False, cache=None, callbacks=None):
+                 num_parallel_workers=None, python_multiprocessing=False, cache=None, callbacks=None,
+                 persistent_workers=False, rows_per_task=8):
         super().__init__(children=input_dataset, num_parallel_workers=num_parallel_workers)
         if operations is not None:
             if not isinstance(operations, list):
@@ -2342,7 +2384,12 @@ class MapDataset(Dataset):
                              " column_order must be specified.")
 
         self.python_multiprocessing = python_multiprocessing
+        self.persistent_workers = persistent_workers
+        self.rows_per_task = rows_per_task
         self.process_pool = None
+        self.worker_pool = None
+        # shared by the copies of the dataset, the pool is closed when all of them are collected
+        self.worker_pool_holder = MapWorkerPoolHolder() if persistent_workers else None
 
         if callbacks is not None and not isinstance(callbacks, list):
             callbacks = [callbacks]
@@ -2361,8 +2408,12 @@ class MapDataset(Dataset):
 
         cc = self.cache.cache_client if self.cache else None
         callbacks = [cb.create_runtime_obj() for cb in self.callbacks] if self.callbacks else []
+        num_parallel_workers = self.num_parallel_workers
+        if self.worker_pool is not None:
+            # Enough map threads to fill the tasks of the persistent worker pool
+            num_parallel_workers = get_num_submit_threads(self.worker_pool.num_workers, self.rows_per_task)
         return cde.MapNode(children[0], operations, self.input_columns, self.output_columns, column_order, cc,
-                           callbacks).SetNumWorkers(self.num_parallel_workers)
+                           callbacks).SetNumWorkers(num_parallel_workers)
 
     def get_args(self):
         args = super().get_args()
@@ -2390,6 +2441,10 @@ class MapDataset(Dataset):
         new_op.parent = copy.deepcopy(self.parent, memodict)
         new_op.input_indexs = copy.deepcopy(self._input_indexs, memodict)
         new_op.python_multiprocessing = copy.deepcopy(self.python_multiprocessing, memodict)
+        new_op.persistent_workers = self.persistent_workers
+        new_op.rows_per_task = self.rows_per_task
+        new_op.worker_pool = None
+        new_op.worker_pool_holder = self.worker_pool_holder
         new_op.cache = copy.deepcopy(self.cache, memodict)
         new_op.hook = copy.deepcopy(self.hook, memodict)
         new_op.operations = self.operations
@@ -2419,7 +2474,19 @@ class MapDataset(Dataset):
                 if callable(op) and str(op).find("c_transform") < 0:
                     callable_list.append(op)
 
-            if callable_list:
+            if callable_list and self.persistent_workers:
+                # The pool of the same callables is created by the first iterator and reused afterwards
+                num_workers = replace_none(self.num_parallel_workers, get_num_parallel_workers())
+                self.worker_pool = self.worker_pool_holder.get(callable_list, num_workers, self.rows_per_task)
+                idx = 0
+                for op in self.operations:
+                    if callable(op) and str(op).find("c_transform") < 0:
+                        iter_specific_operations.append(_PersistentPythonCallable(op, idx, self.worker_pool))
+                        idx += 1
+                    else:
+                        iter_specific_operations.append(op)
+                self.operations = iter_specific_operations
+            elif callable_list:
                 # Construct pool with the callable list
                 # The callable list and _pyfunc_worker_init are used to pass lambda function in to subprocesses
                 self.process_pool = multiprocessing.Pool(processes=self.num_parallel_workers,
@@ -3485,33 +3552,64 @@ def _fill_worker_indices(workers, indices, idx):
     return idx
 
 
+# Max number of index chunks dispatched to a worker and not yet returned
+_MAX_CHUNKS_IN_FLIGHT = 2
+# Number of chunks per worker that may be dispatched ahead of the earliest chunk not yet yielded in order
+_REORDER_WINDOW_CHUNKS = 4
+
+
 class SamplerFn:
     """
     Multiprocessing or multithread generator function wrapper master process.
+
+    By default the indices are dispatched one by one to the workers in round robin order and the results are
+    fetched in the same order. When dispatch_chunk_size is set or deterministic is False, the indices are
+    dispatched in chunks to whichever worker has capacity, the workers return each chunk tagged with its id
+    through a result queue shared by all the workers, and the chunks are either reordered within a bounded window
+    or yielded in the order they are completed.
     """
 
-    def __init__(self, dataset, num_worker, multi_process):
+    def __init__(self, dataset, num_worker, multi_process, shared_memory_slots=0, max_sample_bytes=None,
+                 dispatch_chunk_size=None, deterministic=True):
         self.workers = []
         self.num_worker = num_worker
         self.multi_process = multi_process
         self.joined = False
         self.ppid = os.getpid()
+        self.deterministic = deterministic
+        self.dispatch_chunk_size = dispatch_chunk_size
+        if dispatch_chunk_size is None and not deterministic:
+            self.dispatch_chunk_size = 1
+        if self.dispatch_chunk_size is not None and shared_memory_slots > 0:
+            # all the rows of a chunk must fit into the shared memory ring of the worker at once
+            self.dispatch_chunk_size = min(self.dispatch_chunk_size, shared_memory_slots)
+        # Result queue shared by all the workers in chunk dispatch mode
+        res_queue = None
+        res_queue_size = num_worker * _MAX_CHUNKS_IN_FLIGHT
         # Event for end of epoch
         if multi_process is True:
             self.eof = multiprocessing.Event()
+            if self.dispatch_chunk_size is not None:
+                res_queue = multiprocessing.Queue(res_queue_size)
         else:
             self.eof = threading.Event()
+            if self.dispatch_chunk_size is not None:
+                res_queue = queue.Queue(res_queue_size)
+        self.res_queue = res_queue
         # Create workers
-        for _ in range(num_worker):
+        for worker_id in range(num_worker):
             if multi_process is True:
-                worker = _GeneratorWorkerMp(dataset, self.eof)
+                ring = None
+                if shared_memory_slots > 0:
+                    ring = SharedMemoryRing(shared_memory_slots, max_sample_bytes)
+                worker = _GeneratorWorkerMp(dataset, self.eof, ring, worker_id, res_queue)
                 worker.daemon = True
                 # When multi processes fork a subprocess, the lock of the main process is copied to the subprocess,
                 # which may cause deadlock. Therefore, the subprocess startup is performed in che initialization phase.
                 # In this phase, the main process is not locked.
                 worker.start()
             else:
-                worker = _GeneratorWorkerMt(dataset, self.eof)
+                worker = _GeneratorWorkerMt(dataset, self.eof, worker_id, res_queue)
                 worker.daemon = True
             self.workers.append(worker)
 
@@ -3528,6 +3626,10 @@ class SamplerFn:
             if not w.is_alive():
                 w.start()
 
+        if self.dispatch_chunk_size is not None:
+            yield from self._process_chunks(indices)
+            return
+
         # Fill initial index queues
         idx_cursor = 0
         idx_cursor = _fill_worker_indices(self.workers, indices, idx_cursor)
@@ -3538,8 +3640,9 @@ class SamplerFn:
                 self._stop_subprocess()
                 return
             # Fetch result and put index
+            worker = self.workers[i % self.num_worker]
             try:
-                result = self.workers[i % self.num_worker].get()
+                result = worker.get()
             except queue.Empty:
                 self._stop_subprocess()
                 raise Exception("Generator worker process timeout.")
@@ -3551,7 +3654,81 @@ class SamplerFn:
                 return
             if idx_cursor < len(indices):
                 idx_cursor = _fill_worker_indices(self.workers, indices, idx_cursor)
-            yield tuple([np.array(x, copy=False) for x in result])
+            try:
+                yield tuple([np.array(x, copy=False) for x in result])
+            finally:
+                # The row has been copied by the pipeline when the generator is resumed, free its slot
+                worker.release()
+        self._log_shared_memory_stats()
+
+    def _process_chunks(self, indices):
+        """
+        Dispatch the indices in chunks and yield the rows of the chunks returned by the workers.
+        """
+        chunk_size = self.dispatch_chunk_size
+        chunks = [indices[start:start + chunk_size] for start in range(0, len(indices), chunk_size)]
+        in_flight = [0] * self.num_worker
+        # Completed chunks waiting for the earlier chunks in deterministic mode, chunk id -> (worker, rows)
+        pending = {}
+        next_chunk = 0
+        next_yield = 0
+        window = _REORDER_WINDOW_CHUNKS * self.num_worker
+        peak_pending = 0
+
+        for _ in range(len(chunks)):
+            if self.eof.is_set():
+                self._stop_subprocess()
+                return
+            # Dispatch chunks to the workers with capacity, without running too far ahead of the next chunk to yield
+            for worker_id, worker in enumerate(self.workers):
+                while next_chunk < len(chunks) and in_flight[worker_id] < _MAX_CHUNKS_IN_FLIGHT and \
+                        (not self.deterministic or next_chunk < next_yield + window):
+                    worker.put((next_chunk, chunks[next_chunk]))
+                    in_flight[worker_id] += 1
+                    next_chunk += 1
+            # Fetch the chunk completed first by any worker
+            try:
+                worker_id, chunk_id, rows = self.res_queue.get(timeout=30)
+            except queue.Empty:
+                self._stop_subprocess()
+                raise Exception("Generator worker process timeout.")
+            except KeyboardInterrupt:
+                self._stop_subprocess()
+                raise Exception("Generator worker receives KeyboardInterrupt.")
+            if self.eof.is_set():
+                self._stop_subprocess()
+                return
+            in_flight[worker_id] -= 1
+            worker = self.workers[worker_id]
+            rows = [worker.unpack(row) for row in rows]
+            if not self.deterministic:
+                yield from _yield_worker_rows(worker, rows)
+                continue
+            pending[chunk_id] = (worker, rows)
+            peak_pending = max(peak_pending, len(pending))
+            while next_yield in pending:
+                worker, rows = pending.pop(next_yield)
+                next_yield += 1
+                yield from _yield_worker_rows(worker, rows)
+        logger.info("Generator dispatched {} chunks of {} indices, peak {} chunks waiting to be reordered."
+                    .format(len(chunks), chunk_size, peak_pending))
+        self._log_shared_memory_stats()
+
+    def get_shared_memory_stats(self):
+        """
+        Get the shared memory statistics of every worker process.
+
+        Returns:
+            list[dict], the statistics of the shared memory ring of each worker, empty if shared memory is not used.
+        """
+        return [w.ring.stats() for w in self.workers if getattr(w, "ring", None) is not None]
+
+    def _log_shared_memory_stats(self):
+        for worker_id, stats in enumerate(self.get_shared_memory_stats()):
+            logger.info("Generator worker {} shared memory: {} slots of {} bytes, {} rows with {} sent through "
+                        "queue, peak occupancy {}, mean occupancy {:.2f}."
+                        .format(worker_id, stats["slot_count"], stats["slot_size"], stats["rows"],
+                                stats["fallback_rows"], stats["peak_occupancy"], stats["mean_occupancy"]))
 
     def _stop_subprocess(self):
         # Only the main process can call join
@@ -3560,19 +3737,35 @@ class SamplerFn:
             self.joined = True
             for w in self.workers:
                 w.join()
+                if getattr(w, "ring", None) is not None:
+                    w.ring.close()
 
     def __del__(self):
         self._stop_subprocess()
 
 
+def _yield_worker_rows(worker, rows):
+    """
+    Yield the rows got from the worker, each row is released once the generator is resumed.
+    """
+    for row in rows:
+        try:
+            yield tuple([np.array(x, copy=False) for x in row])
+        finally:
+            worker.release()
+
+
 def _subprocess_handle(eof, signum, frame):
     logger.info("The subprocess receives a termination signal.")
     eof.set()
 
 
-def _generator_worker_loop(dataset, idx_queue, result_queue, eof, is_multiprocessing):
+def _generator_worker_loop(dataset, idx_queue, result_queue, eof, is_multiprocessing, ring=None, worker_id=0):
     """
     Multithread or multiprocess generator worker process loop.
+
+    An item of idx_queue is either an index, whose row is sent back, or a tuple of chunk id and a chunk of indices,
+    whose rows are sent back together as a tuple of worker_id, chunk id and the rows.
     """
     if is_multiprocessing:
         signal.signal(signal.SIGTERM, partial(_subprocess_handle, eof))
@@ -3601,7 +3794,18 @@ def _generator_worker_loop(dataset, idx_queue, result_queue, eof, is_multiproces
                 result_queue.cancel_join_thread()
             return
         # Fetch data, any exception from __getitem__ will terminate worker and timeout master process
-        result = dataset[idx]
+        if isinstance(idx, tuple):
+            chunk_id, chunk = idx
+            result = (worker_id, chunk_id, [_fetch_worker_row(dataset, i, ring, eof) for i in chunk])
+            packed = all(row is not None for row in result[2])
+        else:
+            result = _fetch_worker_row(dataset, idx, ring, eof)
+            packed = result is not None
+        if not packed:
+            # eof is set while waiting for a free shared memory slot
+            idx_queue.cancel_join_thread()
+            result_queue.cancel_join_thread()
+            return
         # Send data, block
         while True:
             try:
@@ -3620,15 +3824,27 @@ def _generator_worker_loop(dataset, idx_queue, result_queue, eof, is_multiproces
         del result, idx
 
 
+def _fetch_worker_row(dataset, idx, ring, eof):
+    """
+    Fetch the row of idx in the worker, copy it into shared memory if ring is not None, only its descriptor is
+    sent through the queue. Return None if eof is set while waiting for a free slot.
+    """
+    row = dataset[idx]
+    if ring is not None:
+        row = ring.pack(row, eof)
+    return row
+
+
 class _GeneratorWorkerMt(threading.Thread):
     """
     Worker process for multi-thread Generator.
     """
 
-    def __init__(self, dataset, eof):
+    def __init__(self, dataset, eof, worker_id=0, res_queue=None):
         self.idx_queue = queue.Queue(16)
-        self.res_queue = queue.Queue(16)
-        super().__init__(target=_generator_worker_loop, args=(dataset, self.idx_queue, self.res_queue, eof, False))
+        self.res_queue = res_queue if res_queue is not None else queue.Queue(16)
+        super().__init__(target=_generator_worker_loop,
+                         args=(dataset, self.idx_queue, self.res_queue, eof, False, None, worker_id))
 
     def put(self, item):
         """
@@ -3642,6 +3858,18 @@ class _GeneratorWorkerMt(threading.Thread):
         """
         return self.res_queue.get(timeout=30)
 
+    @staticmethod
+    def unpack(row):
+        """
+        Get the row from the item of a chunk returned by the worker.
+        """
+        return row
+
+    def release(self):
+        """
+        Release the earliest row got from the worker, nothing to do for thread worker.
+        """
+
     def queue_empty(self):
         if not self.idx_queue.empty():
             logger.warning("idx_queue is not empty")
@@ -3657,10 +3885,13 @@ class _GeneratorWorkerMp(multiprocessing.Process):
     Worker process for multiprocess Generator.
     """
 
-    def __init__(self, dataset, eof):
+    def __init__(self, dataset, eof, ring=None, worker_id=0, res_queue=None):
         self.idx_queue = multiprocessing.Queue(16)
-        self.res_queue = multiprocessing.Queue(16)
-        super().__init__(target=_generator_worker_loop, args=(dataset, self.idx_queue, self.res_queue, eof, True))
+        self.res_queue = res_queue if res_queue is not None else multiprocessing.Queue(16)
+        self.ring = ring
+        self.shared_rows = collections.deque()
+        super().__init__(target=_generator_worker_loop,
+                         args=(dataset, self.idx_queue, self.res_queue, eof, True, ring, worker_id))
 
     def put(self, item):
         """
@@ -3674,7 +3905,23 @@ class _GeneratorWorkerMp(multiprocessing.Process):
         """
         # Relax 10s to 30s, since it sometimes will cause "Generator worker process timeout"
         # when we run too many iterators with infinite epoch(num_epoch=-1)
-        return self.res_queue.get(timeout=30)
+        return self.unpack(self.res_queue.get(timeout=30))
+
+    def unpack(self, row):
+        """
+        Get the row from the item received from the worker, read it from shared memory if it is in a slot.
+        """
+        if self.ring is None:
+            return row
+        self.shared_rows.append(self.ring.is_shared(row))
+        return self.ring.unpack(row)
+
+    def release(self):
+        """
+        Release the earliest row got from the worker, free its shared memory slot if it has one.
+        """
+        if self.shared_rows and self.shared_rows.popleft():
+            self.ring.release()
 
     def queue_empty(self):
         if not self.idx_queue.empty():
@@ -3746,6 +3993,20 @@ class GeneratorDataset(MappableDataset):
             when num_shards is also specified. Random accessible input is required.
         python_multiprocessing (bool, optional): Parallelize Python operations with multiple worker process. This
             option could be beneficial if the Python operation is computational heavy (default=True).
+        shared_memory_slots (int, optional): Number of shared memory slots of each worker process to send rows
+            back to the main process, instead of pickling the rows through a pipe. The slots are sized from the
+            first row of the worker and rows are read through zero-copy views. Only used when python_multiprocessing
+            is True and a sampler or random accessible source is used (default=0, shared memory is not used).
+        max_sample_bytes (int, optional): Maximum size in bytes of a shared memory slot, larger rows are sent
+            through the pipe (default=64MB).
+        dispatch_chunk_size (int, optional): Number of indices sent to a worker at a time. When set, the chunks
+            are dispatched to whichever worker has capacity and collected in the order they are completed, so a
+            slow sample does not stall the finished samples of the other workers. The chunk size is capped to
+            shared_memory_slots when shared memory is used (default=None, indices are dispatched one by one in
+            round robin order).
+        deterministic (bool, optional): Whether to yield the rows in the order of the sampler when multiple workers
+            are used. If False, the rows are yielded in the order they are completed, chunks of one index are
+            dispatched if dispatch_chunk_size is not set (default=True).
 
     Examples:
         >>> import mindspore.dataset as ds
@@ -3787,13 +4048,18 @@ class GeneratorDataset(MappableDataset):
     @check_generatordataset
     def __init__(self, source, column_names=None, column_types=None, schema=None, num_samples=None,
                  num_parallel_workers=1, shuffle=None, sampler=None, num_shards=None, shard_id=None,
-                 python_multiprocessing=True):
+                 python_multiprocessing=True, shared_memory_slots=0, max_sample_bytes=64 * 1024 * 1024,
+                 dispatch_chunk_size=None, deterministic=True):
         super().__init__(num_parallel_workers=num_parallel_workers)
         self.source = source
         self.sampler = _select_sampler(num_samples, sampler, shuffle, num_shards, shard_id)
         self.num_samples = num_samples
         self.num_shards = num_shards
         self.python_multiprocessing = python_multiprocessing
+        self.shared_memory_slots = shared_memory_slots
+        self.max_sample_bytes = max_sample_bytes
+        self.dispatch_chunk_size = dispatch_chunk_size
+        self.deterministic = deterministic
         self.num_parallel_workers = num_parallel_workers
 
         if column_names is not None and not isinstance(column_names, list):
@@ -3851,13 +4117,17 @@ class GeneratorDataset(MappableDataset):
                 sampler_instance.set_num_rows(len(self.source))
                 sampler_instance.initialize()
                 if new_op.num_parallel_workers > 1:
-                    sample_fn = SamplerFn(self.source, new_op.num_parallel_workers, self.python_multiprocessing)
+                    sample_fn = SamplerFn(self.source, new_op.num_parallel_workers, self.python_multiprocessing,
+                                          self.shared_memory_slots, self.max_sample_bytes,
+                                          self.dispatch_chunk_size, self.deterministic)
                     new_op.source = (lambda: _cpp_sampler_fn_mp(sampler_instance, sample_fn))
                 else:
                     new_op.source = (lambda: _cpp_sampler_fn(sampler_instance, self.source))
             else:
                 if new_op.num_parallel_workers > 1:
-                    sample_fn = SamplerFn(self.source, new_op.num_parallel_workers, self.python_multiprocessing)
+                    sample_fn = SamplerFn(self.source, new_op.num_parallel_workers, self.python_multiprocessing,
+                                          self.shared_memory_slots, self.max_sample_bytes,
+                                          self.dispatch_chunk_size, self.deterministic)
                     new_op.source = (lambda: _py_sampler_fn_mp(new_op.sampler, new_op.num_samples, sample_fn))
                 else:
                     new_op.source = (lambda: _py_sampler_fn(new_op.sampler, new_op.num_samples, self.source))
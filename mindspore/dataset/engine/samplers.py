@@ -19,12 +19,36 @@ SequentialSampler, SubsetRandomSampler, and WeightedRandomSampler.
 Users can also define a custom sampler by extending from the Sampler class.
 """
 
+import itertools
 import numbers
 import numpy as np
 import mindspore._c_dataengine as cde
 import mindspore.dataset as ds
 
 
+# The number of the indices of a user defined sampler passed to the C++ sampler at a time
+_INDICES_PER_BUFFER = 1 << 20
+# A parent sampler takes all the indices of an epoch of its child sampler at once
+_ALL_INDICES = np.iinfo(np.int64).max
+
+
+def _index_arrays(indices):
+    """Convert the indices, an array or an iterator of arrays, into the 1-D int64 arrays."""
+    if isinstance(indices, np.ndarray):
+        indices = (indices,)
+    for array in indices:
+        yield np.asarray(array, dtype=np.int64).reshape(-1)
+
+
+def _create_child(child_sampler):
+    """Create the C++ sampler of a child sampler."""
+    if child_sampler is None:
+        return None
+    if isinstance(child_sampler, Sampler):
+        return child_sampler.create(samples_per_buffer=_ALL_INDICES)
+    return child_sampler.create()
+
+
 class Sampler:
     """
     Base class for user defined sampler.
@@ -33,6 +57,11 @@ class Sampler:
     A required  _iter_() method should by overridden by the user for sample index generation.
     An optional reset() method can be overridden for per repeat reset,
 
+    For a large dataset, the indices() method can be overridden instead of __iter__() to generate the indices of an
+    epoch as a NumPy array, or as an iterator of NumPy arrays of chunks of the indices. The indices are then passed
+    to the dataset in chunks without looping over them in Python. An optional __len__() method gives the number of
+    the indices without generating them.
+
     dataset_size and num_samples will be set by dataset once a dataset iterator is created.
 
     Examples:
@@ -44,19 +73,46 @@ class Sampler:
         >>>             yield i
         >>>
         >>> ds = ds.ImageFolderDataset(path, sampler=ReverseSampler())
+        >>>
+        >>> class ArrayReverseSampler(ds.Sampler):
+        >>>     def indices(self):
+        >>>         return np.arange(self.dataset_size - 1, -1, -1)
+        >>>
+        >>> ds = ds.ImageFolderDataset(path, sampler=ArrayReverseSampler())
     """
 
     def __init__(self, num_samples=None):
         self.dataset_size = 0
         self.child_sampler = None
         self.num_samples = num_samples
+        self._indices_chunks = None
 
     def __iter__(self):
         """
-        User defined iterator, must be overridden.
+        User defined iterator, must be overridden unless indices() is overridden.
         _handshake is guaranteed to be called prior to iterator construction.
         """
-        raise NotImplementedError
+        indices = self.indices()
+        if indices is None:
+            raise NotImplementedError
+        return itertools.chain.from_iterable(_index_arrays(indices))
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # the indices being passed in the current epoch are not copied
+        state.pop('_indices_chunks', None)
+        return state
+
+    def indices(self):
+        """
+        User defined array-backed index generation, override this method instead of __iter__ if necessary.
+        _handshake is guaranteed to be called prior to it.
+
+        Returns:
+            Union[numpy.ndarray, Iterator[numpy.ndarray]], the indices of an epoch, or an iterator of the chunks of
+            them. None (default) to get the indices from __iter__.
+        """
+        return None
 
     def reset(self):
         """
@@ -68,25 +124,69 @@ class Sampler:
     def _handshake(self, ds_size, num_samples):
         self.dataset_size = ds_size
         self.num_samples = num_samples
+        self._indices_chunks = None
+
+    # Generate the indices of an epoch in int64 arrays, at most num_samples indices in total
+    # Do not override this method!
+    def _iter_index_arrays(self):
+        remaining = self.num_samples if self.num_samples is not None else _ALL_INDICES
+        indices = self.indices()
+        if indices is None:
+            sampler_iter = iter(self)
+            while remaining > 0:
+                array = np.fromiter(itertools.islice(sampler_iter, min(remaining, _INDICES_PER_BUFFER)),
+                                    dtype=np.int64)
+                if not array.size:
+                    return
+                remaining -= array.size
+                yield array
+            return
+        for array in _index_arrays(indices):
+            array = array[:remaining]
+            remaining -= array.size
+            if array.size:
+                yield array
+            if remaining <= 0:
+                return
+
+    # Generate the indices of an epoch in chunks of samples_per_buffer indices, the last one may be shorter
+    # Do not override this method!
+    def _iter_chunks(self, samples_per_buffer):
+        pending = []
+        num_pending = 0
+        for array in self._iter_index_arrays():
+            while array.size:
+                pending.append(array[:samples_per_buffer - num_pending])
+                num_pending += pending[-1].size
+                array = array[pending[-1].size:]
+                if num_pending == samples_per_buffer:
+                    yield np.concatenate(pending) if len(pending) > 1 else pending[0]
+                    pending = []
+                    num_pending = 0
+        if pending:
+            yield np.concatenate(pending) if len(pending) > 1 else pending[0]
 
     # Indices fetcher
     # Do not override this method!
     def _get_indices(self):
-        sampler_iter = iter(self)
-        ret = []
-        for _ in range(self.num_samples):
-            try:
-                idx = next(sampler_iter)
-                ret.append(idx)
-            except StopIteration:
-                break
-        return np.array(ret)
+        arrays = list(self._iter_index_arrays())
+        return np.concatenate(arrays) if arrays else np.empty(0, dtype=np.int64)
+
+    # Chunked indices fetcher, a chunk shorter than samples_per_buffer is the last one of the epoch
+    # Do not override this method!
+    def _get_next_indices(self, samples_per_buffer):
+        if getattr(self, '_indices_chunks', None) is None:
+            self._indices_chunks = self._iter_chunks(samples_per_buffer)
+        chunk = next(self._indices_chunks, None)
+        if chunk is None or chunk.size < samples_per_buffer:
+            self._indices_chunks = None
+        return chunk if chunk is not None else np.empty(0, dtype=np.int64)
 
     # Instance fetcher
     # Do not override this method!
-    def create(self):
+    def create(self, samples_per_buffer=_INDICES_PER_BUFFER):
         num_samples = self.num_samples if self.num_samples is not None else 0
-        c_sampler = cde.PythonSampler(num_samples, self)
+        c_sampler = cde.PythonSampler(num_samples, self, samples_per_buffer)
         c_child_sampler = self.create_child()
         c_sampler.add_child(c_child_sampler)
         return c_sampler
@@ -98,11 +198,7 @@ class Sampler:
         return self.child_sampler
 
     def create_child(self):
-        c_child_sampler = None
-        if self.child_sampler is not None:
-            c_child_sampler = self.child_sampler.create()
-
-        return c_child_sampler
+        return _create_child(self.child_sampler)
 
     def is_shuffled(self):
         if self.child_sampler is None:
@@ -119,7 +215,10 @@ class Sampler:
     def get_num_samples(self):
         if self.num_samples is None:
             return None
-        return self._get_indices().size
+        if hasattr(self, '__len__'):
+            return min(len(self), self.num_samples)
+        # count the indices chunk by chunk without keeping them
+        return sum(array.size for array in self._iter_index_arrays())
 
 
 class BuiltinSampler:
@@ -143,10 +242,7 @@ class BuiltinSampler:
         return self.child_sampler
 
     def create_child(self):
-        c_child_sampler = None
-        if self.child_sampler is not None:
-            c_child_sampler = self.child_sampler.create()
-        return c_child_sampler
+        return _create_child(self.child_sampler)
 
     def create_child_for_minddataset(self):
         c_child_sampler = None
@@ -26,7 +26,7 @@ from mindspore._c_expression import typing
 from ..core.validator_helpers import parse_user_args, type_check, type_check_list, check_value, \
     INT32_MAX, check_valid_detype, check_dir, check_file, check_sampler_shuffle_shard_options, \
     validate_dataset_param_value, check_padding_options, check_gnn_list_or_ndarray, check_num_parallel_workers, \
-    check_columns, check_pos_int32, check_valid_str
+    check_columns, check_pos_int32, check_valid_str, check_uint32, check_pos_int64
 
 from . import datasets
 from . import samplers
@@ -389,13 +389,24 @@ def check_generatordataset(method):
                 raise ValueError("schema should be a path to schema file or a schema object.")
 
         # check optional argument
-        nreq_param_int = ["num_samples", "num_parallel_workers", "num_shards", "shard_id"]
+        nreq_param_int = ["num_samples", "num_parallel_workers", "num_shards", "shard_id", "shared_memory_slots",
+                          "max_sample_bytes", "dispatch_chunk_size"]
         validate_dataset_param_value(nreq_param_int, param_dict, int)
         nreq_param_list = ["column_types"]
         validate_dataset_param_value(nreq_param_list, param_dict, list)
-        nreq_param_bool = ["shuffle"]
+        nreq_param_bool = ["shuffle", "deterministic"]
         validate_dataset_param_value(nreq_param_bool, param_dict, bool)
 
+        dispatch_chunk_size = param_dict.get("dispatch_chunk_size")
+        if dispatch_chunk_size is not None:
+            check_pos_int32(dispatch_chunk_size, "dispatch_chunk_size")
+        shared_memory_slots = param_dict.get("shared_memory_slots")
+        if shared_memory_slots is not None:
+            check_uint32(shared_memory_slots, "shared_memory_slots")
+        max_sample_bytes = param_dict.get("max_sample_bytes")
+        if max_sample_bytes is not None:
+            check_pos_int64(max_sample_bytes, "max_sample_bytes")
+
         num_shards = param_dict.get("num_shards")
         shard_id = param_dict.get("shard_id")
         if (num_shards is None) != (shard_id is None):
@@ -623,7 +634,7 @@ def check_map(method):
     def new_method(self, *args, **kwargs):
         from mindspore.dataset.callback import DSCallback
         [_, input_columns, output_columns, column_order, num_parallel_workers, python_multiprocessing, cache,
-         callbacks], _ = \
+         callbacks, persistent_workers, rows_per_task], _ = \
             parse_user_args(method, *args, **kwargs)
 
         nreq_param_columns = ['input_columns', 'output_columns', 'column_order']
@@ -633,6 +644,9 @@ def check_map(method):
         if num_parallel_workers is not None:
             check_num_parallel_workers(num_parallel_workers)
         type_check(python_multiprocessing, (bool,), "python_multiprocessing")
+        type_check(persistent_workers, (bool,), "persistent_workers")
+        type_check(rows_per_task, (int,), "rows_per_task")
+        check_pos_int32(rows_per_task, "rows_per_task")
         check_cache_option(cache)
 
         if callbacks is not None:
@@ -17,7 +17,7 @@ The module transforms.py_transform is implemented based on Python. It provides c
 operations including OneHotOp.
 """
 from .validators import check_one_hot_op, check_compose_list, check_random_apply, check_transforms_list, \
-    check_compose_call
+    check_compose_call, check_batch_compose
 from . import py_transforms_util as util
 
 
@@ -135,6 +135,58 @@ class Compose:
         return util.compose(self.transforms, *args)
 
 
+class BatchCompose:
+    """
+    Compose a list of transforms applied on a batch of images at once.
+
+    The transforms of py_transforms.vision that support the batch execution, such as ToTensor, Normalize, HWC2CHW,
+    CenterCrop, RandomHorizontalFlip, RandomVerticalFlip, RandomColorAdjust, RandomErasing, Cutout and
+    LinearTransformation, transform the whole batch with NumPy array operations instead of looping over its images
+    in Python, the random transforms draw the random parameters of every image at once. The other transforms are
+    applied on the images one by one. The images of a batch should have the same shape and be NumPy ndarrays, so
+    the images are usually decoded and resized before batch().
+
+    Args:
+        transforms (list): List of transformations to be applied.
+        is_hwc (bool, optional): Whether the shape of the input images is (N, H, W, C) or (N, C, H, W)
+            (default=True).
+
+    Examples:
+        >>> import mindspore.dataset.vision.py_transforms as py_vision
+        >>> from mindspore.dataset.transforms.py_transforms import BatchCompose
+        >>>
+        >>> transform = BatchCompose([py_vision.RandomHorizontalFlip(0.5),
+        >>>                           py_vision.ToTensor(),
+        >>>                           py_vision.Normalize((0.491, 0.482, 0.447), (0.247, 0.243, 0.262)),
+        >>>                           py_vision.RandomErasing()])
+        >>> # apply the transform to the batches through per_batch_map of batch()
+        >>> data1 = data1.batch(32, input_columns=["image"], per_batch_map=transform)
+        >>> # or to the batched image column through map() after batch()
+        >>> data2 = data2.batch(32).map(operations=transform, input_columns=["image"])
+    """
+
+    @check_batch_compose
+    def __init__(self, transforms, is_hwc=True):
+        self.transforms = transforms
+        self.is_hwc = is_hwc
+
+    def __call__(self, imgs, *batch_info):
+        """
+        Call method.
+
+        Args:
+            imgs (Union[numpy.ndarray, list]): A batch of images in a NumPy ndarray, or a list of images as the input
+                column of per_batch_map.
+            batch_info (BatchInfo, optional): The batch info passed to per_batch_map, not used.
+
+        Returns:
+            Union[numpy.ndarray, tuple], the augmented images, a tuple of a list of the images if the input is a list.
+        """
+        if isinstance(imgs, list):
+            return (list(util.batch_compose(self.transforms, imgs, self.is_hwc)),)
+        return util.batch_compose(self.transforms, imgs, self.is_hwc)
+
+
 class RandomApply:
     """
     Randomly perform a series of transforms with a given probability.
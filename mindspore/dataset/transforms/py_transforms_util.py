@@ -53,6 +53,32 @@ def compose(transforms, *args):
     raise TypeError('args should be NumPy ndarray. Got {}.'.format(type(args)))
 
 
+def batch_compose(transforms, imgs, is_hwc):
+    """
+    Compose a list of transforms and apply on a batch of images at once.
+
+    The transforms with an `apply_batch` method transform the whole batch, the others are applied on the images one
+    by one.
+
+    Args:
+        transforms (list): A list of transform Class objects to be composed.
+        imgs (Union[numpy.ndarray, list]): A batch of images in a NumPy ndarray or a list of images of the same shape.
+        is_hwc (bool): Whether the shape of the images is (N, H, W, C).
+
+    Returns:
+        numpy.ndarray, the augmented images in a NumPy ndarray.
+    """
+    imgs = np.stack(imgs) if isinstance(imgs, list) else imgs
+    if not is_numpy(imgs):
+        raise TypeError('imgs should be NumPy ndarray. Got {}.'.format(type(imgs)))
+    for transform in transforms:
+        if hasattr(transform, "apply_batch"):
+            imgs, is_hwc = transform.apply_batch(imgs, is_hwc)
+        else:
+            imgs = np.stack([transform(img) for img in imgs])
+    return imgs
+
+
 def one_hot_encoding(label, num_classes, epsilon):
     """
     Apply label smoothing transformation to the input label, and make label be more smoothing and continuous.
@@ -282,6 +282,25 @@ def check_random_apply(method):
     return new_method
 
 
+def check_batch_compose(method):
+    """Wrapper method to check the parameters of batch compose."""
+
+    @wraps(method)
+    def new_method(self, *args, **kwargs):
+        [transforms, is_hwc], _ = parse_user_args(method, *args, **kwargs)
+        type_check(transforms, (list,), "transforms")
+
+        for i, transfrom in enumerate(transforms):
+            if not callable(transfrom):
+                raise ValueError("transforms[{}] is not callable.".format(i))
+
+        type_check(is_hwc, (bool,), "is_hwc")
+
+        return method(self, *args, **kwargs)
+
+    return new_method
+
+
 def check_transforms_list(method):
     """Wrapper method to check the parameters of transform list."""
 
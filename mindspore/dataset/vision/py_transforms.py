@@ -83,6 +83,19 @@ class ToTensor:
         """
         return util.to_tensor(img, self.output_type)
 
+    def apply_batch(self, np_imgs, is_hwc):
+        """
+        Batch call method.
+
+        Args:
+            np_imgs (numpy.ndarray): NumPy images of shape (N, H, W, C) or (N, H, W) to be converted.
+            is_hwc (bool): Whether the shape of the images is (N, H, W, C).
+
+        Returns:
+            tuple, converted images of shape (N, C, H, W) and whether their shape is (N, H, W, C).
+        """
+        return util.to_tensors(np_imgs, self.output_type), False
+
 
 class ToType:
     """
@@ -118,6 +131,19 @@ class ToType:
         """
         return util.to_type(img, self.output_type)
 
+    def apply_batch(self, np_imgs, is_hwc):
+        """
+        Batch call method.
+
+        Args:
+            np_imgs (numpy.ndarray): NumPy images to be type swapped.
+            is_hwc (bool): Whether the shape of the images is (N, H, W, C).
+
+        Returns:
+            tuple, converted images and whether their shape is (N, H, W, C).
+        """
+        return util.to_type(np_imgs, self.output_type), is_hwc
+
 
 class HWC2CHW:
     """
@@ -144,6 +170,19 @@ class HWC2CHW:
         """
         return util.hwc_to_chw(img)
 
+    def apply_batch(self, np_imgs, is_hwc):
+        """
+        Batch call method.
+
+        Args:
+            np_imgs (numpy.ndarray): NumPy images of shape (N, H, W, C) to be converted.
+            is_hwc (bool): Whether the shape of the images is (N, H, W, C).
+
+        Returns:
+            tuple, converted images of shape (N, C, H, W) and whether their shape is (N, H, W, C).
+        """
+        return util.hwc_to_chws(np_imgs), False
+
 
 class ToPIL:
     """
@@ -240,6 +279,19 @@ class Normalize:
         """
         return util.normalize(img, self.mean, self.std)
 
+    def apply_batch(self, np_imgs, is_hwc):
+        """
+        Batch call method.
+
+        Args:
+            np_imgs (numpy.ndarray): NumPy images of shape (N, C, H, W) to be normalized.
+            is_hwc (bool): Whether the shape of the images is (N, H, W, C).
+
+        Returns:
+            tuple, normalized images and whether their shape is (N, H, W, C).
+        """
+        return util.normalizes(np_imgs, self.mean, self.std), is_hwc
+
 
 class NormalizePad:
     """
@@ -284,6 +336,19 @@ class NormalizePad:
         """
         return util.normalize(img, self.mean, self.std, pad_channel=True, dtype=self.dtype)
 
+    def apply_batch(self, np_imgs, is_hwc):
+        """
+        Batch call method.
+
+        Args:
+            np_imgs (numpy.ndarray): NumPy images of shape (N, C, H, W) to be normalized.
+            is_hwc (bool): Whether the shape of the images is (N, H, W, C).
+
+        Returns:
+            tuple, normalized and padded images and whether their shape is (N, H, W, C).
+        """
+        return util.normalizes(np_imgs, self.mean, self.std, pad_channel=True, dtype=self.dtype), is_hwc
+
 
 class RandomCrop:
     """
@@ -387,6 +452,19 @@ class RandomHorizontalFlip:
         """
         return util.random_horizontal_flip(img, self.prob)
 
+    def apply_batch(self, np_imgs, is_hwc):
+        """
+        Batch call method.
+
+        Args:
+            np_imgs (numpy.ndarray): NumPy images of shape (N, H, W, C) or (N, C, H, W) to be flipped.
+            is_hwc (bool): Whether the shape of the images is (N, H, W, C).
+
+        Returns:
+            tuple, randomly flipped images and whether their shape is (N, H, W, C).
+        """
+        return util.random_horizontal_flips(np_imgs, self.prob, is_hwc), is_hwc
+
 
 class RandomVerticalFlip:
     """
@@ -421,6 +499,19 @@ class RandomVerticalFlip:
         """
         return util.random_vertical_flip(img, self.prob)
 
+    def apply_batch(self, np_imgs, is_hwc):
+        """
+        Batch call method.
+
+        Args:
+            np_imgs (numpy.ndarray): NumPy images of shape (N, H, W, C) or (N, C, H, W) to be flipped.
+            is_hwc (bool): Whether the shape of the images is (N, H, W, C).
+
+        Returns:
+            tuple, randomly flipped images and whether their shape is (N, H, W, C).
+        """
+        return util.random_vertical_flips(np_imgs, self.prob, is_hwc), is_hwc
+
 
 class Resize:
     """
@@ -563,6 +654,19 @@ class CenterCrop:
         """
         return util.center_crop(img, self.size)
 
+    def apply_batch(self, np_imgs, is_hwc):
+        """
+        Batch call method.
+
+        Args:
+            np_imgs (numpy.ndarray): NumPy images of shape (N, H, W, C) or (N, C, H, W) to be cropped.
+            is_hwc (bool): Whether the shape of the images is (N, H, W, C).
+
+        Returns:
+            tuple, cropped images and whether their shape is (N, H, W, C).
+        """
+        return util.center_crops(np_imgs, self.size, is_hwc), is_hwc
+
 
 class RandomColorAdjust:
     """
@@ -611,6 +715,21 @@ class RandomColorAdjust:
         """
         return util.random_color_adjust(img, self.brightness, self.contrast, self.saturation, self.hue)
 
+    def apply_batch(self, np_imgs, is_hwc):
+        """
+        Batch call method.
+
+        Args:
+            np_imgs (numpy.ndarray): NumPy images of shape (N, H, W, C) or (N, C, H, W) to have their color
+                adjusted randomly.
+            is_hwc (bool): Whether the shape of the images is (N, H, W, C).
+
+        Returns:
+            tuple, adjusted images and whether their shape is (N, H, W, C).
+        """
+        return util.random_color_adjust_array(np_imgs, self.brightness, self.contrast, self.saturation, self.hue,
+                                              is_hwc), is_hwc
+
 
 class RandomRotation:
     """
@@ -1004,6 +1123,22 @@ class RandomErasing:
             return util.erase(np_img, i, j, erase_h, erase_w, erase_value, self.inplace)
         return np_img
 
+    def apply_batch(self, np_imgs, is_hwc):
+        """
+        Batch call method.
+
+        Args:
+            np_imgs (numpy.ndarray): NumPy images of shape (N, C, H, W) to be randomly erased.
+            is_hwc (bool): Whether the shape of the images is (N, H, W, C).
+
+        Returns:
+            tuple, erased images and whether their shape is (N, H, W, C).
+        """
+        i, j, erase_h, erase_w, erased = util.get_erase_params_batch(np_imgs, self.scale, self.ratio, True,
+                                                                      self.max_attempts)
+        erased &= np.random.random_sample(np_imgs.shape[0]) < self.prob
+        return util.erases(np_imgs, i, j, erase_h, erase_w, erased, self.value, self.inplace), is_hwc
+
 
 class Cutout:
     """
@@ -1053,6 +1188,24 @@ class Cutout:
             np_img = util.erase(np_img, i, j, erase_h, erase_w, erase_value)
         return np_img
 
+    def apply_batch(self, np_imgs, is_hwc):
+        """
+        Batch call method.
+
+        Args:
+            np_imgs (numpy.ndarray): NumPy images of shape (N, C, H, W) to be cut out.
+            is_hwc (bool): Whether the shape of the images is (N, H, W, C).
+
+        Returns:
+            tuple, images with square patches cut out and whether their shape is (N, H, W, C).
+        """
+        _, _, image_h, image_w = np_imgs.shape
+        scale = (self.length * self.length) / (image_h * image_w)
+        for _ in range(self.num_patches):
+            i, j, erase_h, erase_w, erased = util.get_erase_params_batch(np_imgs, (scale, scale), (1, 1), False, 1)
+            np_imgs = util.erases(np_imgs, i, j, erase_h, erase_w, erased, 0)
+        return np_imgs, is_hwc
+
 
 class LinearTransformation:
     """
@@ -1100,6 +1253,19 @@ class LinearTransformation:
         """
         return util.linear_transform(np_img, self.transformation_matrix, self.mean_vector)
 
+    def apply_batch(self, np_imgs, is_hwc):
+        """
+        Batch call method.
+
+        Args:
+            np_imgs (numpy.ndarray): NumPy images of shape (N, C, H, W) to be linear transformed.
+            is_hwc (bool): Whether the shape of the images is (N, H, W, C).
+
+        Returns:
+            tuple, linear transformed images and whether their shape is (N, H, W, C).
+        """
+        return util.linear_transforms(np_imgs, self.transformation_matrix, self.mean_vector), is_hwc
+
 
 class RandomAffine:
     """
@@ -1251,6 +1417,11 @@ class RgbToHsv:
     """
     Convert a NumPy RGB image or a batch of NumPy RGB images to HSV images.
 
+    Note:
+        The images keep their dtype. The HSV values of uint8 images are rounded to integers in [0, 255], the hue
+        included, as the HSV mode of PIL, so converting a uint8 image to HSV and back may change its values by up
+        to 3. Convert float images of values in [0, 1] to avoid the rounding.
+
     Args:
         is_hwc (bool): The flag of image shape, (H, W, C) or (N, H, W, C) if True
                        and (C, H, W) or (N, C, H, W) if False (default=False).
@@ -1282,11 +1453,29 @@ class RgbToHsv:
         """
         return util.rgb_to_hsvs(rgb_imgs, self.is_hwc)
 
+    def apply_batch(self, np_imgs, is_hwc):
+        """
+        Batch call method.
+
+        Args:
+            np_imgs (numpy.ndarray): NumPy images of shape (N, H, W, C) or (N, C, H, W) as `is_hwc` of the transform.
+            is_hwc (bool): Whether the shape of the images is (N, H, W, C).
+
+        Returns:
+            tuple, HSV images and whether their shape is (N, H, W, C).
+        """
+        return util.rgb_to_hsvs(np_imgs, self.is_hwc), is_hwc
+
 
 class HsvToRgb:
     """
     Convert a NumPy HSV image or one batch NumPy HSV images to RGB images.
 
+    Note:
+        The images keep their dtype. The HSV values of uint8 images are read in [0, 255], the hue included, as the
+        HSV mode of PIL, and the RGB values are rounded to integers, so converting a uint8 image to HSV and back may
+        change its values by up to 3. Convert float images of values in [0, 1] to avoid the rounding.
+
     Args:
         is_hwc (bool): The flag of image shape, (H, W, C) or (N, H, W, C) if True
                        and (C, H, W) or (N, C, H, W) if False (default=False).
@@ -1318,6 +1507,19 @@ class HsvToRgb:
         """
         return util.hsv_to_rgbs(hsv_imgs, self.is_hwc)
 
+    def apply_batch(self, np_imgs, is_hwc):
+        """
+        Batch call method.
+
+        Args:
+            np_imgs (numpy.ndarray): NumPy images of shape (N, H, W, C) or (N, C, H, W) as `is_hwc` of the transform.
+            is_hwc (bool): Whether the shape of the images is (N, H, W, C).
+
+        Returns:
+            tuple, RGB images and whether their shape is (N, H, W, C).
+        """
+        return util.hsv_to_rgbs(np_imgs, self.is_hwc), is_hwc
+
 
 class RandomColor:
     """
@@ -18,7 +18,6 @@ import io
 import math
 import numbers
 import random
-import colorsys
 
 import numpy as np
 from PIL import Image, ImageOps, ImageEnhance, __version__
@@ -520,7 +519,8 @@ def adjust_hue(img, hue_factor):
     Adjust hue of an image. The Hue is changed by changing the HSV values after image is converted to HSV.
 
     Args:
-        img (PIL image): PIL image to be adjusted.
+        img (Union[PIL image, numpy.ndarray]): Image to be adjusted, a NumPy image of shape (H, W, C) is adjusted by
+            `adjust_hue_array`.
         hue_factor (float):  Amount to shift the Hue channel. Value should be in
             [-0.5, 0.5]. 0.5 and -0.5 give complete reversal of hue channel. This
             is because Hue wraps around when rotated 360 degrees.
@@ -528,13 +528,15 @@ def adjust_hue(img, hue_factor):
             will give an image with complementary colors .
 
     Returns:
-        img (PIL image), Hue adjusted image.
+        img (Union[PIL image, numpy.ndarray]), Hue adjusted image.
     """
     image = img
     image_hue_factor = hue_factor
     if not -0.5 <= image_hue_factor <= 0.5:
         raise ValueError('image_hue_factor {} is not in [-0.5, 0.5].'.format(image_hue_factor))
 
+    if is_numpy(image):
+        return adjust_hue_array(image, image_hue_factor)
     if not is_pil(image):
         raise TypeError(augment_error_message.format(type(image)))
 
@@ -604,12 +606,32 @@ def rotate(img, angle, resample, expand, center, fill_value):
     return img.rotate(angle, resample, expand, center, fillcolor=fill_value)
 
 
+def _color_factor_range(value, input_name, center=1, bound=(0, float('inf')), non_negative=True):
+    """Get the range [min, max] of a color adjustment factor."""
+    if isinstance(value, numbers.Number):
+        if value < 0:
+            raise ValueError("The input value of {} cannot be negative.".format(input_name))
+        # convert value into a range
+        value = [center - value, center + value]
+        if non_negative:
+            value[0] = max(0, value[0])
+    elif isinstance(value, (list, tuple)) and len(value) == 2:
+        if not bound[0] <= value[0] <= value[1] <= bound[1]:
+            raise ValueError("Please check your value range of {} is valid and "
+                             "within the bound {}.".format(input_name, bound))
+    else:
+        raise TypeError("Input of {} should be either a single value, or a list/tuple of "
+                        "length 2.".format(input_name))
+    return value[0], value[1]
+
+
 def random_color_adjust(img, brightness, contrast, saturation, hue):
     """
     Randomly adjust the brightness, contrast, saturation, and hue of an image.
 
     Args:
-        img (PIL image): Image to have its color adjusted randomly.
+        img (Union[PIL image, numpy.ndarray]): Image to have its color adjusted randomly, a NumPy image of shape
+            (H, W, C) is adjusted by `random_color_adjust_array`.
         brightness (Union[float, tuple]): Brightness adjustment factor. Cannot be negative.
             If it is a float, the factor is uniformly chosen from the range [max(0, 1-brightness), 1+brightness].
             If it is a sequence, it should be [min, max] for the range.
@@ -626,31 +648,15 @@ def random_color_adjust(img, brightness, contrast, saturation, hue):
     Returns:
         img (PIL image), Image after random adjustment of its color.
     """
+    if is_numpy(img):
+        return random_color_adjust_array(img, brightness, contrast, saturation, hue)
     if not is_pil(img):
         raise TypeError(augment_error_message.format(type(img)))
 
-    def _input_to_factor(value, input_name, center=1, bound=(0, float('inf')), non_negative=True):
-        if isinstance(value, numbers.Number):
-            if value < 0:
-                raise ValueError("The input value of {} cannot be negative.".format(input_name))
-            # convert value into a range
-            value = [center - value, center + value]
-            if non_negative:
-                value[0] = max(0, value[0])
-        elif isinstance(value, (list, tuple)) and len(value) == 2:
-            if not bound[0] <= value[0] <= value[1] <= bound[1]:
-                raise ValueError("Please check your value range of {} is valid and "
-                                 "within the bound {}.".format(input_name, bound))
-        else:
-            raise TypeError("Input of {} should be either a single value, or a list/tuple of "
-                            "length 2.".format(input_name))
-        factor = random.uniform(value[0], value[1])
-        return factor
-
-    brightness_factor = _input_to_factor(brightness, 'brightness')
-    contrast_factor = _input_to_factor(contrast, 'contrast')
-    saturation_factor = _input_to_factor(saturation, 'saturation')
-    hue_factor = _input_to_factor(hue, 'hue', center=0, bound=(-0.5, 0.5), non_negative=False)
+    brightness_factor = random.uniform(*_color_factor_range(brightness, 'brightness'))
+    contrast_factor = random.uniform(*_color_factor_range(contrast, 'contrast'))
+    saturation_factor = random.uniform(*_color_factor_range(saturation, 'saturation'))
+    hue_factor = random.uniform(*_color_factor_range(hue, 'hue', center=0, bound=(-0.5, 0.5), non_negative=False))
 
     transforms = []
     transforms.append(lambda img: adjust_brightness(img, brightness_factor))
@@ -1208,6 +1214,74 @@ def mix_up_muti(tmp, batch_size, img, label, alpha=0.2):
     return mix_img, mix_label
 
 
+def _to_unit_float(np_imgs):
+    """Get the float image of values in [0, 1], the integer images are of values in [0, 255]."""
+    if np.issubdtype(np_imgs.dtype, np.floating):
+        return np_imgs
+    return np_imgs.astype(np.float32) / 255
+
+
+def _from_unit_float(np_imgs, dtype):
+    """Convert the float image of values in [0, 1] to the dtype, the integer images are of values in [0, 255]."""
+    if np.issubdtype(dtype, np.floating):
+        return np_imgs.astype(dtype, copy=False)
+    return np.rint(np.clip(np_imgs, 0, 1) * 255).astype(dtype)
+
+
+def _split_channels(np_imgs, is_hwc):
+    """Split the 3 channels of the images of shape (..., H, W, C) or (..., C, H, W)."""
+    channels = np.moveaxis(np_imgs, -1 if is_hwc else -3, 0)
+    return channels[0], channels[1], channels[2]
+
+
+def _merge_channels(channels, is_hwc):
+    """Merge the 3 channels into the images of shape (..., H, W, C) or (..., C, H, W)."""
+    return np.stack(channels, axis=-1 if is_hwc else -3)
+
+
+def _rgb_to_hsv_channels(r, g, b):
+    """Convert the RGB channels to the HSV channels elementwise, the same as colorsys.rgb_to_hsv."""
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    delta = maxc - minc
+    chromatic = delta > 0
+    safe_delta = np.where(chromatic, delta, 1)
+    s = np.where(chromatic, delta / np.where(chromatic, maxc, 1), 0)
+    rc = (maxc - r) / safe_delta
+    gc = (maxc - g) / safe_delta
+    bc = (maxc - b) / safe_delta
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    h = np.where(chromatic, (h / 6.0) % 1.0, 0)
+    return h, s, maxc
+
+
+def _hsv_to_rgb_channels(h, s, v):
+    """Convert the HSV channels to the RGB channels elementwise, the same as colorsys.hsv_to_rgb."""
+    sector = np.trunc(h * 6.0)
+    f = h * 6.0 - sector
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    sector = sector.astype(np.int64) % 6
+    r = np.choose(sector, [v, q, p, p, t, v])
+    g = np.choose(sector, [t, v, v, q, p, p])
+    b = np.choose(sector, [p, p, t, v, v, q])
+    gray = s == 0
+    return np.where(gray, v, r), np.where(gray, v, g), np.where(gray, v, b)
+
+
+def _check_rgb_images(np_imgs, is_hwc):
+    """Check the images are NumPy images of 3 channels of shape (H, W, C)/(N, H, W, C)/(C, H, W)/(N, C, H, W)."""
+    if not is_numpy(np_imgs):
+        raise TypeError("img should be NumPy image. Got {}.".format(type(np_imgs)))
+    if len(np_imgs.shape) not in (3, 4):
+        raise TypeError("img shape should be (H, W, C)/(N, H, W, C)/(C, H, W)/(N, C, H, W). "
+                        "Got {}.".format(np_imgs.shape))
+    num_channels = np_imgs.shape[-1] if is_hwc else np_imgs.shape[-3]
+    if num_channels != 3:
+        raise TypeError("img should be 3 channels RGB img. Got {} channels.".format(num_channels))
+
+
 def rgb_to_hsv(np_rgb_img, is_hwc):
     """
     Convert RGB img to HSV img.
@@ -1217,20 +1291,12 @@ def rgb_to_hsv(np_rgb_img, is_hwc):
         is_hwc (Bool): If True, the shape of np_hsv_img is (H, W, C), otherwise must be (C, H, W).
 
     Returns:
-        np_hsv_img (numpy.ndarray), NumPy HSV image with same type of np_rgb_img.
+        np_hsv_img (numpy.ndarray), NumPy HSV image with same type of np_rgb_img. The values of an integer image are
+        in [0, 255], the hue included, as the HSV mode of PIL.
     """
-    if is_hwc:
-        r, g, b = np_rgb_img[:, :, 0], np_rgb_img[:, :, 1], np_rgb_img[:, :, 2]
-    else:
-        r, g, b = np_rgb_img[0, :, :], np_rgb_img[1, :, :], np_rgb_img[2, :, :]
-    to_hsv = np.vectorize(colorsys.rgb_to_hsv)
-    h, s, v = to_hsv(r, g, b)
-    if is_hwc:
-        axis = 2
-    else:
-        axis = 0
-    np_hsv_img = np.stack((h, s, v), axis=axis)
-    return np_hsv_img
+    r, g, b = _split_channels(_to_unit_float(np_rgb_img), is_hwc)
+    np_hsv_img = _merge_channels(_rgb_to_hsv_channels(r, g, b), is_hwc)
+    return _from_unit_float(np_hsv_img, np_rgb_img.dtype)
 
 
 def rgb_to_hsvs(np_rgb_imgs, is_hwc):
@@ -1246,33 +1312,9 @@ def rgb_to_hsvs(np_rgb_imgs, is_hwc):
     Returns:
         np_hsv_imgs (numpy.ndarray), NumPy HSV images with same type of np_rgb_imgs.
     """
-    if not is_numpy(np_rgb_imgs):
-        raise TypeError("img should be NumPy image. Got {}".format(type(np_rgb_imgs)))
-
-    shape_size = len(np_rgb_imgs.shape)
-
-    if not shape_size in (3, 4):
-        raise TypeError("img shape should be (H, W, C)/(N, H, W, C)/(C ,H, W)/(N, C, H, W). \
-                         Got {}.".format(np_rgb_imgs.shape))
-
-    if shape_size == 3:
-        batch_size = 0
-        if is_hwc:
-            num_channels = np_rgb_imgs.shape[2]
-        else:
-            num_channels = np_rgb_imgs.shape[0]
-    else:
-        batch_size = np_rgb_imgs.shape[0]
-        if is_hwc:
-            num_channels = np_rgb_imgs.shape[3]
-        else:
-            num_channels = np_rgb_imgs.shape[1]
-
-    if num_channels != 3:
-        raise TypeError("img should be 3 channels RGB img. Got {} channels.".format(num_channels))
-    if batch_size == 0:
-        return rgb_to_hsv(np_rgb_imgs, is_hwc)
-    return np.array([rgb_to_hsv(img, is_hwc) for img in np_rgb_imgs])
+    _check_rgb_images(np_rgb_imgs, is_hwc)
+    # all the images of the batch are converted at once
+    return rgb_to_hsv(np_rgb_imgs, is_hwc)
 
 
 def hsv_to_rgb(np_hsv_img, is_hwc):
@@ -1286,19 +1328,9 @@ def hsv_to_rgb(np_hsv_img, is_hwc):
     Returns:
         np_rgb_img (numpy.ndarray), NumPy HSV image with same shape of np_hsv_img.
     """
-    if is_hwc:
-        h, s, v = np_hsv_img[:, :, 0], np_hsv_img[:, :, 1], np_hsv_img[:, :, 2]
-    else:
-        h, s, v = np_hsv_img[0, :, :], np_hsv_img[1, :, :], np_hsv_img[2, :, :]
-    to_rgb = np.vectorize(colorsys.hsv_to_rgb)
-    r, g, b = to_rgb(h, s, v)
-
-    if is_hwc:
-        axis = 2
-    else:
-        axis = 0
-    np_rgb_img = np.stack((r, g, b), axis=axis)
-    return np_rgb_img
+    h, s, v = _split_channels(_to_unit_float(np_hsv_img), is_hwc)
+    np_rgb_img = _merge_channels(_hsv_to_rgb_channels(h, s, v), is_hwc)
+    return _from_unit_float(np_rgb_img, np_hsv_img.dtype)
 
 
 def hsv_to_rgbs(np_hsv_imgs, is_hwc):
@@ -1314,33 +1346,144 @@ def hsv_to_rgbs(np_hsv_imgs, is_hwc):
     Returns:
         np_rgb_imgs (numpy.ndarray), NumPy RGB images with same type of np_hsv_imgs.
     """
-    if not is_numpy(np_hsv_imgs):
-        raise TypeError("img should be NumPy image. Got {}.".format(type(np_hsv_imgs)))
+    _check_rgb_images(np_hsv_imgs, is_hwc)
+    # all the images of the batch are converted at once
+    return hsv_to_rgb(np_hsv_imgs, is_hwc)
 
-    shape_size = len(np_hsv_imgs.shape)
 
-    if not shape_size in (3, 4):
-        raise TypeError("img shape should be (H, W, C)/(N, H, W, C)/(C, H, W)/(N, C, H, W). \
-                         Got {}.".format(np_hsv_imgs.shape))
+def _expand_factor(factor, np_imgs, ndim):
+    """Get the factor of each image, broadcast with the arrays of `ndim` dimensions of the images."""
+    factor = np.asarray(factor, dtype=np.float32 if np_imgs.dtype != np.float64 else np.float64)
+    return factor.reshape(factor.shape + (1,) * (ndim - factor.ndim))
 
-    if shape_size == 3:
-        batch_size = 0
-        if is_hwc:
-            num_channels = np_hsv_imgs.shape[2]
-        else:
-            num_channels = np_hsv_imgs.shape[0]
-    else:
-        batch_size = np_hsv_imgs.shape[0]
-        if is_hwc:
-            num_channels = np_hsv_imgs.shape[3]
-        else:
-            num_channels = np_hsv_imgs.shape[1]
 
-    if num_channels != 3:
-        raise TypeError("img should be 3 channels RGB img. Got {} channels.".format(num_channels))
-    if batch_size == 0:
-        return hsv_to_rgb(np_hsv_imgs, is_hwc)
-    return np.array([hsv_to_rgb(img, is_hwc) for img in np_hsv_imgs])
+def _grayscale(r, g, b):
+    """Get the luma of the channels, as the L mode of PIL."""
+    return r * 0.299 + g * 0.587 + b * 0.114
+
+
+def adjust_brightness_array(np_imgs, brightness_factor, is_hwc=True):
+    """
+    Adjust brightness of NumPy images, blending them with a black image as `adjust_brightness`.
+
+    Args:
+        np_imgs (numpy.ndarray): NumPy RGB images of shape (H, W, C)/(N, H, W, C) or (C, H, W)/(N, C, H, W), of
+            values in [0, 1] for float images and [0, 255] for integer images.
+        brightness_factor (Union[float, numpy.ndarray]): The factor, or the factors of shape (N,) of the images.
+        is_hwc (bool): Whether the shape is (H, W, C)/(N, H, W, C). Default: True.
+
+    Returns:
+        numpy.ndarray, brightness adjusted images.
+    """
+    _check_rgb_images(np_imgs, is_hwc)
+    adjusted = _to_unit_float(np_imgs) * _expand_factor(brightness_factor, np_imgs, np_imgs.ndim)
+    return _from_unit_float(np.clip(adjusted, 0, 1), np_imgs.dtype)
+
+
+def adjust_contrast_array(np_imgs, contrast_factor, is_hwc=True):
+    """
+    Adjust contrast of NumPy images, blending them with the solid gray of their mean luma as `adjust_contrast`.
+
+    Args:
+        np_imgs (numpy.ndarray): NumPy RGB images of shape (H, W, C)/(N, H, W, C) or (C, H, W)/(N, C, H, W), of
+            values in [0, 1] for float images and [0, 255] for integer images.
+        contrast_factor (Union[float, numpy.ndarray]): The factor, or the factors of shape (N,) of the images.
+        is_hwc (bool): Whether the shape is (H, W, C)/(N, H, W, C). Default: True.
+
+    Returns:
+        numpy.ndarray, contrast adjusted images.
+    """
+    _check_rgb_images(np_imgs, is_hwc)
+    float_imgs = _to_unit_float(np_imgs)
+    mean = _grayscale(*_split_channels(float_imgs, is_hwc)).mean(axis=(-2, -1))
+    if not np.issubdtype(np_imgs.dtype, np.floating):
+        mean = np.floor(mean * 255 + 0.5) / 255
+    mean = _expand_factor(mean, np_imgs, np_imgs.ndim)
+    adjusted = mean + _expand_factor(contrast_factor, np_imgs, np_imgs.ndim) * (float_imgs - mean)
+    return _from_unit_float(np.clip(adjusted, 0, 1), np_imgs.dtype)
+
+
+def adjust_saturation_array(np_imgs, saturation_factor, is_hwc=True):
+    """
+    Adjust saturation of NumPy images, blending them with their grayscale images as `adjust_saturation`.
+
+    Args:
+        np_imgs (numpy.ndarray): NumPy RGB images of shape (H, W, C)/(N, H, W, C) or (C, H, W)/(N, C, H, W), of
+            values in [0, 1] for float images and [0, 255] for integer images.
+        saturation_factor (Union[float, numpy.ndarray]): The factor, or the factors of shape (N,) of the images.
+        is_hwc (bool): Whether the shape is (H, W, C)/(N, H, W, C). Default: True.
+
+    Returns:
+        numpy.ndarray, saturation adjusted images.
+    """
+    _check_rgb_images(np_imgs, is_hwc)
+    channels = _split_channels(_to_unit_float(np_imgs), is_hwc)
+    gray = _grayscale(*channels)
+    factor = _expand_factor(saturation_factor, np_imgs, gray.ndim)
+    adjusted = [np.clip(gray + factor * (channel - gray), 0, 1) for channel in channels]
+    return _from_unit_float(_merge_channels(adjusted, is_hwc), np_imgs.dtype)
+
+
+def adjust_hue_array(np_imgs, hue_factor, is_hwc=True):
+    """
+    Adjust hue of NumPy images, shifting the hue channel of their HSV images as `adjust_hue`.
+
+    Args:
+        np_imgs (numpy.ndarray): NumPy RGB images of shape (H, W, C)/(N, H, W, C) or (C, H, W)/(N, C, H, W), of
+            values in [0, 1] for float images and [0, 255] for integer images.
+        hue_factor (Union[float, numpy.ndarray]): The shift in [-0.5, 0.5], or the shifts of shape (N,) of the
+            images.
+        is_hwc (bool): Whether the shape is (H, W, C)/(N, H, W, C). Default: True.
+
+    Returns:
+        numpy.ndarray, hue adjusted images.
+    """
+    _check_rgb_images(np_imgs, is_hwc)
+    h, s, v = _rgb_to_hsv_channels(*_split_channels(_to_unit_float(np_imgs), is_hwc))
+    h = (h + _expand_factor(hue_factor, np_imgs, h.ndim)) % 1.0
+    return _from_unit_float(_merge_channels(_hsv_to_rgb_channels(h, s, v), is_hwc), np_imgs.dtype)
+
+
+def random_color_adjust_array(np_imgs, brightness, contrast, saturation, hue, is_hwc=True):
+    """
+    Randomly adjust the brightness, contrast, saturation, and hue of NumPy images as `random_color_adjust`.
+
+    The factors of all the images are drawn at once, and the adjustments of each image are applied in its own random
+    order, each adjustment to all the images scheduled for it at once.
+
+    Args:
+        np_imgs (numpy.ndarray): NumPy RGB images of shape (H, W, C)/(N, H, W, C) or (C, H, W)/(N, C, H, W), of
+            values in [0, 1] for float images and [0, 255] for integer images.
+        brightness (Union[float, tuple]): Brightness adjustment factor, the same as `random_color_adjust`.
+        contrast (Union[float, tuple]): Contrast adjustment factor, the same as `random_color_adjust`.
+        saturation (Union[float, tuple]): Saturation adjustment factor, the same as `random_color_adjust`.
+        hue (Union[float, tuple]): Hue adjustment factor, the same as `random_color_adjust`.
+        is_hwc (bool): Whether the shape is (H, W, C)/(N, H, W, C). Default: True.
+
+    Returns:
+        numpy.ndarray, images after random adjustment of their color.
+    """
+    _check_rgb_images(np_imgs, is_hwc)
+    ranges = [_color_factor_range(brightness, 'brightness'),
+              _color_factor_range(contrast, 'contrast'),
+              _color_factor_range(saturation, 'saturation'),
+              _color_factor_range(hue, 'hue', center=0, bound=(-0.5, 0.5), non_negative=False)]
+    adjustments = [adjust_brightness_array, adjust_contrast_array, adjust_saturation_array, adjust_hue_array]
+
+    is_batch = np_imgs.ndim == 4
+    imgs = np_imgs if is_batch else np_imgs[np.newaxis]
+    num_imgs = imgs.shape[0]
+    factors = [np.random.uniform(low, high, size=num_imgs) for low, high in ranges]
+    # the random order of the adjustments of each image
+    orders = np.argsort(np.random.random_sample((num_imgs, len(adjustments))), axis=1)
+
+    imgs = imgs.copy()
+    for step in range(len(adjustments)):
+        for index, adjustment in enumerate(adjustments):
+            selected = orders[:, step] == index
+            if selected.any():
+                imgs[selected] = adjustment(imgs[selected], factors[index][selected], is_hwc)
+    return imgs if is_batch else imgs[0]
 
 
 def random_color(img, degrees):
@@ -1464,3 +1607,254 @@ def uniform_augment(img, transforms, num_ops):
             img = AugmentOp(img.copy())
 
     return img
+
+
+def _check_batch(np_imgs, ndim=4):
+    """Check the input is a NumPy batch of images."""
+    if not is_numpy(np_imgs):
+        raise TypeError("imgs should be NumPy images. Got {}.".format(type(np_imgs)))
+    if np_imgs.ndim != ndim:
+        raise ValueError("imgs dimension should be {}. Got {}.".format(ndim, np_imgs.ndim))
+
+
+def to_tensors(np_imgs, output_type):
+    """
+    Change the batch of images of shape (N, H, W, C) or (N, H, W) to the NumPy images of shape (N, C, H, W).
+
+    Args:
+        np_imgs (numpy.ndarray): Images to be converted, of values in [0, 255].
+        output_type: The datatype of the NumPy output. e.g. np.float32
+
+    Returns:
+        numpy.ndarray, converted images of values in [0.0, 1.0].
+    """
+    if not is_numpy(np_imgs) or np_imgs.ndim not in (3, 4):
+        raise TypeError("imgs should be NumPy images of shape (N, H, W, C) or (N, H, W). Got {}.".format(
+            np_imgs.shape if is_numpy(np_imgs) else type(np_imgs)))
+    if np_imgs.ndim == 3:
+        np_imgs = np_imgs[:, :, :, None]
+    return to_type(hwc_to_chws(np_imgs) / 255., output_type)
+
+
+def hwc_to_chws(np_imgs):
+    """
+    Transpose the batch of images; shape (N, H, W, C) to shape (N, C, H, W).
+
+    Args:
+        np_imgs (numpy.ndarray): Images to be converted.
+
+    Returns:
+        numpy.ndarray, converted images.
+    """
+    _check_batch(np_imgs)
+    return np.ascontiguousarray(np_imgs.transpose(0, 3, 1, 2))
+
+
+def normalizes(np_imgs, mean, std, pad_channel=False, dtype="float32"):
+    """
+    Normalize the batch of images with respect to mean and standard deviation, the same as `normalize`.
+
+    Args:
+        np_imgs (numpy.ndarray): Images of shape (N, C, H, W) to be normalized.
+        mean (list): List of mean values for each channel, w.r.t channel order.
+        std (list): List of standard deviations for each channel, w.r.t. channel order.
+        pad_channel (bool): Whether to pad a extra channel with value zero.
+        dtype (str): Output datatype of normalize, only worked when pad_channel is True. (default is "float32")
+
+    Returns:
+        numpy.ndarray, normalized images.
+    """
+    _check_batch(np_imgs)
+    num_channels = np_imgs.shape[1]
+    if len(mean) != len(std):
+        raise ValueError("Length of mean and std must be equal.")
+    if len(mean) == 1:
+        mean = [mean[0]] * num_channels
+        std = [std[0]] * num_channels
+    elif len(mean) != num_channels:
+        raise ValueError("Length of mean and std must both be 1 or equal to the number of channels({0})."
+                         .format(num_channels))
+
+    mean = np.array(mean, dtype=np_imgs.dtype)
+    std = np.array(std, dtype=np_imgs.dtype)
+    images = (np_imgs - mean[:, None, None]) / std[:, None, None]
+    if pad_channel:
+        zeros = np.zeros(images.shape[:1] + (1,) + images.shape[2:], dtype=np.float32)
+        images = np.concatenate((images, zeros), axis=1)
+        if dtype == "float16":
+            images = images.astype(np.float16)
+    return images
+
+
+def center_crops(np_imgs, size, is_hwc):
+    """
+    Crop the center of the batch of images, the same box as `center_crop`.
+
+    Args:
+        np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be cropped.
+        size (Union[int, tuple]): The size of the crop box, (height, width) if it is a sequence.
+        is_hwc (bool): Whether the shape is (N, H, W, C).
+
+    Returns:
+        numpy.ndarray, cropped images.
+    """
+    _check_batch(np_imgs)
+    if isinstance(size, int):
+        size = (size, size)
+    img_height, img_width = np_imgs.shape[1:3] if is_hwc else np_imgs.shape[2:4]
+    crop_height, crop_width = size
+    if crop_height > img_height or crop_width > img_width:
+        raise ValueError("Crop size {} is larger than the image size {}.".format(size, (img_height, img_width)))
+    crop_top = int(round((img_height - crop_height) / 2.))
+    crop_left = int(round((img_width - crop_width) / 2.))
+    rows = slice(crop_top, crop_top + crop_height)
+    cols = slice(crop_left, crop_left + crop_width)
+    return np_imgs[:, rows, cols] if is_hwc else np_imgs[:, :, rows, cols]
+
+
+def _random_flips(np_imgs, prob, axis):
+    """Flip the images along the axis, each with the probability."""
+    _check_batch(np_imgs)
+    flipped = np.random.random_sample(np_imgs.shape[0]) < prob
+    np_imgs = np_imgs.copy()
+    np_imgs[flipped] = np.flip(np_imgs[flipped], axis=axis)
+    return np_imgs
+
+
+def random_horizontal_flips(np_imgs, prob, is_hwc):
+    """
+    Randomly flip each image of the batch horizontally with a given probability.
+
+    Args:
+        np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be flipped.
+        prob (float): Probability of an image being flipped.
+        is_hwc (bool): Whether the shape is (N, H, W, C).
+
+    Returns:
+        numpy.ndarray, randomly flipped images.
+    """
+    return _random_flips(np_imgs, prob, 2 if is_hwc else 3)
+
+
+def random_vertical_flips(np_imgs, prob, is_hwc):
+    """
+    Randomly flip each image of the batch vertically with a given probability.
+
+    Args:
+        np_imgs (numpy.ndarray): Images of shape (N, H, W, C) or (N, C, H, W) to be flipped.
+        prob (float): Probability of an image being flipped.
+        is_hwc (bool): Whether the shape is (N, H, W, C).
+
+    Returns:
+        numpy.ndarray, randomly flipped images.
+    """
+    return _random_flips(np_imgs, prob, 1 if is_hwc else 2)
+
+
+def get_erase_params_batch(np_imgs, scale, ratio, bounded, max_attempts):
+    """
+    Helper function to get the parameters of RandomErasing/ Cutout of all the images of a batch at once.
+
+    The parameters of each image are drawn as `get_erase_params`, an image without a valid erase area within
+    `max_attempts` is not erased.
+
+    Args:
+        np_imgs (numpy.ndarray): Images of shape (N, C, H, W).
+        scale (sequence): Range of the relative erase area.
+        ratio (sequence): Range of the aspect ratio of the erase area.
+        bounded (bool): Whether the erase area is within the images, or centered randomly and clipped.
+        max_attempts (int): The maximum number of attempts to propose a valid erase area.
+
+    Returns:
+        tuple[numpy.ndarray], the top, left, height and width of the erase areas, and whether the images are erased.
+    """
+    _check_batch(np_imgs)
+    num_imgs, _, image_h, image_w = np_imgs.shape
+    area = image_h * image_w
+    erase_area = np.random.uniform(scale[0], scale[1], size=(num_imgs, max_attempts)) * area
+    aspect_ratio = np.random.uniform(ratio[0], ratio[1], size=(num_imgs, max_attempts))
+    erase_w = np.rint(np.sqrt(erase_area * aspect_ratio)).astype(np.int64)
+    erase_h = np.rint(erase_w / aspect_ratio).astype(np.int64)
+    valid = (erase_h < image_h) & (erase_w < image_w)
+    # the first valid attempt of each image
+    attempt = np.argmax(valid, axis=1)
+    erased = valid[np.arange(num_imgs), attempt]
+    erase_h = erase_h[np.arange(num_imgs), attempt]
+    erase_w = erase_w[np.arange(num_imgs), attempt]
+    if bounded:
+        i = (np.random.random_sample(num_imgs) * (image_h - erase_h + 1)).astype(np.int64)
+        j = (np.random.random_sample(num_imgs) * (image_w - erase_w + 1)).astype(np.int64)
+    else:
+        x = np.random.randint(0, image_w + 1, size=num_imgs)
+        y = np.random.randint(0, image_h + 1, size=num_imgs)
+        j = np.clip(x - erase_w // 2, 0, image_w)
+        i = np.clip(y - erase_h // 2, 0, image_h)
+        erase_w = np.clip(x + erase_w // 2, 0, image_w) - j
+        erase_h = np.clip(y + erase_h // 2, 0, image_h) - i
+    return i, j, erase_h, erase_w, erased
+
+
+def erases(np_imgs, i, j, height, width, erased, value, inplace=False):
+    """
+    Erase the pixels of each image of the batch, within its rectangle region, to the given value.
+
+    Args:
+        np_imgs (numpy.ndarray): Images of shape (N, C, H, W) to be erased.
+        i (numpy.ndarray): The tops of the regions.
+        j (numpy.ndarray): The lefts of the regions.
+        height (numpy.ndarray): The heights of the regions.
+        width (numpy.ndarray): The widths of the regions.
+        erased (numpy.ndarray): Whether each image is erased.
+        value (Union[int, sequence, string]): Erasing value, a single value, a sequence of 3 values for the R, G, B
+            channels or 'random' for values from a standard normal distribution.
+        inplace (bool, optional): Apply this transform inplace. Default is False.
+
+    Returns:
+        numpy.ndarray, erased images.
+    """
+    _check_batch(np_imgs)
+    if isinstance(value, numbers.Number):
+        erase_value = value
+    elif isinstance(value, (str, bytes)):
+        erase_value = np.random.normal(loc=0.0, scale=1.0, size=np_imgs.shape)
+    elif isinstance(value, (tuple, list)) and len(value) == 3:
+        erase_value = np.array(value)[:, None, None]
+    else:
+        raise ValueError("The value for erasing should be either a single value, or a string "
+                         "'random', or a sequence of 3 elements for RGB respectively.")
+    rows = np.arange(np_imgs.shape[2])
+    cols = np.arange(np_imgs.shape[3])
+    in_rows = (rows >= i[:, None]) & (rows < (i + height)[:, None])
+    in_cols = (cols >= j[:, None]) & (cols < (j + width)[:, None])
+    # the mask of shape (N, 1, H, W)
+    mask = (in_rows[:, :, None] & in_cols[:, None, :] & erased[:, None, None])[:, None]
+    if not inplace:
+        np_imgs = np_imgs.copy()
+    np.copyto(np_imgs, erase_value, casting='unsafe', where=mask)
+    return np_imgs
+
+
+def linear_transforms(np_imgs, transformation_matrix, mean_vector):
+    """
+    Apply linear transformation to each image of the batch, the same as `linear_transform`.
+
+    Args:
+        np_imgs (numpy.ndarray): Images of shape (N, C, H, W) to be linear transformed.
+        transformation_matrix (numpy.ndarray): a square transformation matrix of shape (D, D), D = C x H x W.
+        mean_vector (numpy.ndarray): a NumPy ndarray of shape (D,) where D = C x H x W.
+
+    Returns:
+        numpy.ndarray, linear transformed images.
+    """
+    _check_batch(np_imgs)
+    if transformation_matrix.shape[0] != transformation_matrix.shape[1]:
+        raise ValueError("transformation_matrix should be a square matrix. "
+                         "Got shape {} instead".format(transformation_matrix.shape))
+    if np.prod(np_imgs.shape[1:]) != transformation_matrix.shape[0]:
+        raise ValueError("transformation_matrix shape {0} not compatible with "
+                         "Numpy image shape {1}.".format(transformation_matrix.shape, np_imgs.shape[1:]))
+    if mean_vector.shape[0] != transformation_matrix.shape[0]:
+        raise ValueError("mean_vector length {0} should match either one dimension of the square "
+                         "transformation_matrix {1}.".format(mean_vector.shape[0], transformation_matrix.shape))
+    zero_centered_imgs = np_imgs.reshape(np_imgs.shape[0], -1) - mean_vector
+    return np.dot(zero_centered_imgs, transformation_matrix).reshape(np_imgs.shape)
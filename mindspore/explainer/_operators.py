@@ -21,6 +21,7 @@ __all__ = [
     'argmin',
     'argsort',
     'assign',
+    'batch_matmul',
     'intersection',
     'matmul',
     'maximum',
@@ -114,6 +115,13 @@ def assign(inputs: Tensor, idx: _Idx, value: Tensor) -> Tensor:
     return outputs
 
 
+def batch_matmul(inputs_x: Tensor, inputs_y: Tensor, transpose_a: bool = False, transpose_b: bool = False) -> Tensor:
+    """Multiplies the matrices of the batch of `inputs_x` and the batch of `inputs_y`."""
+    batch_matmul_op = op.BatchMatMul(transpose_a, transpose_b)
+    outputs = batch_matmul_op(inputs_x, inputs_y)
+    return outputs
+
+
 def intersection(*inputs: Tensor) -> Tensor:
     """Get the intersection value by the given tensor list."""
     outputs_np = np.ones_like(inputs[0])
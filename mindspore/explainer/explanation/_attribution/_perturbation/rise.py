@@ -13,8 +13,6 @@
 # limitations under the License.
 # ============================================================================
 """RISE."""
-import math
-
 import numpy as np
 
 from mindspore import Tensor
@@ -22,7 +20,6 @@ from mindspore.train._utils import check_value_type
 
 from .perturbation import PerturbationAttribution
 from .... import _operators as op
-from ...._utils import resize
 
 
 class RISE(PerturbationAttribution):
@@ -37,6 +34,9 @@ class RISE(PerturbationAttribution):
     .. math::
         attribution = \sum_{i}f_c(I\odot M_i)  M_i
 
+    The random masks are generated once with a fixed seed and reused for all the inputs, so the attribution of an
+    input does not depend on the other inputs of its batch.
+
     For more details, please refer to the original paper via: `RISE <https://arxiv.org/abs/1806.07421>`_.
 
     Args:
@@ -46,8 +46,9 @@ class RISE(PerturbationAttribution):
             `nn.Sigmoid` is usually be applied. Users can also pass their own customized `activation_fn` as long as
             when combining this function with network, the final output is the probability of the input.
         perturbation_per_eval (int, optional): Number of perturbations for each inference during inferring the
-            perturbed samples. Within the memory capacity, usually the larger this number is, the faster the
-            explanation is obtained. Default: 32.
+            perturbed samples. The masks perturb all the inputs of a batch together, so an inference covers about
+            `perturbation_per_eval` // N masks. Within the memory capacity, usually the larger this number is, the
+            faster the explanation is obtained. Default: 32.
 
     Inputs:
         - **inputs** (Tensor) - The input data to be explained, a 4D tensor of shape :math:`(N, C, H, W)`.
@@ -90,70 +91,87 @@ class RISE(PerturbationAttribution):
         self._num_masks = 6000  # number of masks to be sampled
         self._mask_probability = 0.2  # ratio of inputs to be masked
         self._down_sample_size = 10  # the original size of binary masks
-        self._resize_mode = 'bilinear'  # mode choice to resize the down-sized binary masks to size of the inputs
         self._perturbation_mode = 'constant'  # setting the perturbed pixels to a constant value
         self._base_value = 0  # setting the perturbed pixels to this constant value
         self._num_classes = None  # placeholder of self._num_classes just for future assignment in other methods
-
-    def _generate_masks(self, data, batch_size):
-        """Generate a batch of binary masks for data."""
-
-        height, width = data.shape[2], data.shape[3]
-
-        mask_size = (self._down_sample_size, self._down_sample_size)
-
-        up_size = (height + mask_size[0], width + mask_size[1])
-        mask = np.random.random((batch_size, 1) + mask_size) < self._mask_probability
-        upsample = resize(op.Tensor(mask, data.dtype), up_size,
-                          self._resize_mode).asnumpy()
-        shift_x = np.random.randint(0, mask_size[0] + 1, size=batch_size)
-        shift_y = np.random.randint(0, mask_size[1] + 1, size=batch_size)
-
-        masks = [sample[:, x_i: x_i + height, y_i: y_i + width] for sample, x_i, y_i
-                 in zip(upsample, shift_x, shift_y)]
-        masks = Tensor(np.array(masks), data.dtype)
-        return masks
+        self._mask_seed = 0  # the seed of the mask bank, the same masks are used for all the inputs
+        self._mask_bank = None  # the down-sized binary masks and their shifts, generated at the first call
+        self._interpolation = {}  # the bilinear interpolation matrices for each size of the inputs
+
+    def _get_mask_bank(self):
+        """Get the down-sized binary masks and the random shifts of all the masks."""
+        if self._mask_bank is None:
+            random_state = np.random.RandomState(self._mask_seed)
+            mask_size = (self._down_sample_size, self._down_sample_size)
+            grids = (random_state.random_sample((self._num_masks,) + mask_size) < self._mask_probability)
+            shifts = random_state.randint(0, self._down_sample_size + 1, size=(self._num_masks, 2))
+            self._mask_bank = (grids.astype(np.float32), shifts)
+        return self._mask_bank
+
+    def _get_interpolation(self, height, width):
+        """Get the matrices of the bilinear interpolation from the down-sized masks to the shifted upsampled size."""
+        if (height, width) not in self._interpolation:
+            self._interpolation[(height, width)] = (
+                _bilinear_matrix(self._down_sample_size, height + self._down_sample_size),
+                _bilinear_matrix(self._down_sample_size, width + self._down_sample_size))
+        return self._interpolation[(height, width)]
+
+    def _generate_masks(self, start, end, height, width):
+        """
+        Generate the masks of the bank from `start` to `end`.
+
+        The down-sized masks are upsampled by bilinear interpolation and shifted, only the rows and the columns within
+        the shifted windows are interpolated, all the masks at once.
+        """
+        grids, shifts = self._get_mask_bank()
+        interp_y, interp_x = self._get_interpolation(height, width)
+        rows = interp_y[shifts[start:end, 0:1] + np.arange(height)]
+        cols = interp_x[shifts[start:end, 1:2] + np.arange(width)]
+        return np.einsum('nhi,nij,nwj->nhw', rows, grids[start:end], cols, optimize=True)
 
     def __call__(self, inputs, targets):
         """Generates attribution maps for inputs."""
         self._verify_data(inputs, targets)
-        height, width = inputs.shape[2], inputs.shape[3]
-
-        batch_size = inputs.shape[0]
+        batch_size, channels, height, width = inputs.shape
 
         if self._num_classes is None:
             logits = self.network(inputs)
             num_classes = logits.shape[1]
             self._num_classes = num_classes
 
-        # Due to the unsupported Op of slice assignment, we use numpy array here
-        attr_np = np.zeros(shape=(batch_size, self._num_classes, height, width))
-
-        cal_times = math.ceil(self._num_masks / self._perturbation_per_eval)
-
-        for idx, data in enumerate(inputs):
-            bg_data = data * 0 + self._base_value
-            for j in range(cal_times):
-                bs = min(self._num_masks - j * self._perturbation_per_eval,
-                         self._perturbation_per_eval)
-                data = op.reshape(data, (1, -1, height, width))
-                masks = self._generate_masks(data, bs)
-
-                masked_input = masks * data + (1 - masks) * bg_data
-                weights = self._activation_fn(self.network(masked_input))
-                while len(weights.shape) > 2:
-                    weights = op.mean(weights, axis=2)
-                weights = op.reshape(weights,
-                                     (bs, self._num_classes, 1, 1))
-
-                attr_np[idx] += op.summation(weights * masks, axis=0).asnumpy()
-
-        attr_np = attr_np / self._num_masks
         targets = self._unify_targets(inputs, targets)
-
-        attr_classes = [att_i[target] for att_i, target in zip(attr_np, targets)]
-
-        return op.Tensor(attr_classes, dtype=inputs.dtype)
+        targets = np.asarray(targets, dtype=np.int64).reshape(batch_size, -1)
+        num_targets = targets.shape[1]
+        # the one-hot selection of the targets of each sample, of shape (N, num_classes, num_targets)
+        selection = np.zeros((batch_size, self._num_classes, num_targets), dtype=np.float32)
+        selection[np.arange(batch_size)[:, None], targets, np.arange(num_targets)] = 1
+        selection = op.Tensor(selection, inputs.dtype)
+
+        # the masks of a chunk perturb all the inputs, about `perturbation_per_eval` samples are inferred at once
+        chunk_size = max(1, self._perturbation_per_eval // batch_size)
+        data = op.reshape(inputs, (batch_size, 1, channels, height, width))
+        bg_data = data * 0 + self._base_value
+        attribution = None
+        for start in range(0, self._num_masks, chunk_size):
+            end = min(start + chunk_size, self._num_masks)
+            masks = op.Tensor(self._generate_masks(start, end, height, width), inputs.dtype)
+            masks_broadcast = op.reshape(masks, (1, end - start, 1, height, width))
+
+            masked_input = masks_broadcast * data + (1 - masks_broadcast) * bg_data
+            masked_input = op.reshape(masked_input, (-1, channels, height, width))
+            weights = self._activation_fn(self.network(masked_input))
+            while len(weights.shape) > 2:
+                weights = op.mean(weights, axis=2)
+            weights = op.reshape(weights, (batch_size, end - start, self._num_classes))
+
+            # the weights of the targets, of shape (N, num_targets, masks in the chunk)
+            weights = op.batch_matmul(selection, weights, transpose_a=True, transpose_b=True)
+            weights = op.reshape(weights, (batch_size * num_targets, end - start))
+            chunk_attribution = op.matmul(weights, op.reshape(masks, (end - start, height * width)))
+            attribution = chunk_attribution if attribution is None else attribution + chunk_attribution
+
+        attribution = op.reshape(attribution, (batch_size, num_targets, height, width)) / self._num_masks
+        return attribution
 
     @staticmethod
     def _verify_data(inputs, targets):
@@ -184,3 +202,20 @@ class RISE(PerturbationAttribution):
             if len(targets.shape) == 2:
                 return np.array([t.asnumpy() for t in targets]).astype(np.int)
         return targets
+
+
+def _bilinear_matrix(in_size, out_size):
+    """
+    Get the matrix of the bilinear interpolation, of shape (out_size, in_size), from a length to a larger one.
+
+    The pixel centers are aligned as the bilinear resize of images.
+    """
+    centers = (np.arange(out_size) + 0.5) * in_size / out_size - 0.5
+    centers = np.clip(centers, 0, in_size - 1)
+    lower = np.floor(centers).astype(np.int64)
+    upper = np.minimum(lower + 1, in_size - 1)
+    frac = (centers - lower).astype(np.float32)
+    matrix = np.zeros((out_size, in_size), dtype=np.float32)
+    matrix[np.arange(out_size), lower] += 1 - frac
+    matrix[np.arange(out_size), upper] += frac
+    return matrix
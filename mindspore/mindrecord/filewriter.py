@@ -18,9 +18,10 @@ This module is to write data into mindrecord.
 import os
 import re
 import stat
+import multiprocessing
 import numpy as np
 from mindspore import log as logger
-from .shardwriter import ShardWriter
+from .shardwriter import ShardWriter, pack_raw_data
 from .shardreader import ShardReader
 from .shardheader import ShardHeader
 from .shardindexgenerator import ShardIndexGenerator
@@ -30,6 +31,87 @@ from .common.exceptions import ParamValueError, ParamTypeError, MRMInvalidSchema
 
 __all__ = ['FileWriter']
 
+# Min number of rows of a batch sent to a packing worker
+_MIN_PACK_CHUNK_SIZE = 64
+
+
+def _match_shape(size, shape):
+    """Check whether an array of size elements can be reshaped to shape, the same as np.reshape does."""
+    known, unknown = 1, 0
+    for dim in shape:
+        if dim == -1:
+            unknown += 1
+        elif dim < 0:
+            return False
+        else:
+            known *= dim
+    if unknown > 1:
+        return False
+    if unknown == 1:
+        return known != 0 and size % known == 0
+    return size == known
+
+
+def _verify_rows(raw_data, schema_content, start=0):
+    """
+    Verify the rows column by column according to schema.
+
+    Args:
+       raw_data (list[dict]): List of raw data.
+       schema_content (dict): Dict of schema.
+       start (int): Index of the first row in the whole batch, used in the error messages.
+
+    Returns:
+        dict, the index of each invalid row in raw_data to its error message.
+    """
+    error_data_dic = {}
+
+    def type_error(i, field):
+        return "for schema, {} th data is wrong, data type for '{}' is not matched.".format(start + i, field)
+
+    for field, field_schema in schema_content.items():
+        field_shape = field_schema.get('shape')
+        # whether the schema type accepts each python type, computed once for the column
+        type_matched = {}
+        array_rows = []
+        for i, v in enumerate(raw_data):
+            if i in error_data_dic:
+                continue
+            if field not in v:
+                error_data_dic[i] = "for schema, {} th data is wrong, " \
+                                    "there is not '{}' object in the raw data.".format(start + i, field)
+                continue
+            field_type = type(v[field]).__name__
+            if field_type not in type_matched:
+                type_matched[field_type] = field_type in VALUE_TYPE_MAP and \
+                    field_schema["type"] in VALUE_TYPE_MAP[field_type]
+            if not type_matched[field_type]:
+                error_data_dic[i] = type_error(i, field)
+            elif field_type == 'ndarray':
+                array_rows.append(i)
+        if not array_rows:
+            continue
+        if field_shape is None:
+            for i in array_rows:
+                error_data_dic[i] = type_error(i, field)
+            continue
+        # check the shape once for each distinct size instead of reshaping each array
+        sizes = np.array([raw_data[i][field].size for i in array_rows], dtype=np.int64)
+        unique_sizes, inverse = np.unique(sizes, return_inverse=True)
+        size_matched = np.array([_match_shape(int(size), field_shape) for size in unique_sizes], dtype=np.bool_)
+        for i in np.asarray(array_rows)[~size_matched[inverse]]:
+            error_data_dic[int(i)] = type_error(int(i), field)
+    return error_data_dic
+
+
+def _verify_and_pack(args):
+    """Verify and pack a chunk of rows in a packing worker process."""
+    raw_data, schema_content, blob_fields, start = args
+    error_data_dic = _verify_rows(raw_data, schema_content, start)
+    valid_data = [v for i, v in enumerate(raw_data) if i not in error_data_dic]
+    packed_raw, packed_blob = pack_raw_data(valid_data, schema_content, blob_fields)
+    return error_data_dic, packed_raw, packed_blob
+
 
 class FileWriter:
     """
@@ -76,6 +158,8 @@ class FileWriter:
         self._header = ShardHeader()
         self._writer = ShardWriter()
         self._generator = None
+        self._pack_workers = 1
+        self._pack_pool = None
 
     @classmethod
     def open_for_append(cls, file_name):
@@ -168,42 +252,78 @@ class FileWriter:
         Args:
            raw_data (list[dict]): List of raw data.
         """
-        error_data_dic = {}
-        schema_content = self._header.schema
-        for field in schema_content:
-            for i, v in enumerate(raw_data):
-                if i in error_data_dic:
-                    continue
-
-                if field not in v:
-                    error_data_dic[i] = "for schema, {} th data is wrong, " \
-                                        "there is not '{}' object in the raw data.".format(i, field)
-                    continue
-                field_type = type(v[field]).__name__
-                if field_type not in VALUE_TYPE_MAP:
-                    error_data_dic[i] = "for schema, {} th data is wrong, " \
-                                        "data type for '{}' is not matched.".format(i, field)
-                    continue
-
-                if schema_content[field]["type"] not in VALUE_TYPE_MAP[field_type]:
-                    error_data_dic[i] = "for schema, {} th data is wrong, " \
-                                        "data type for '{}' is not matched.".format(i, field)
-                    continue
-
-                if field_type == 'ndarray':
-                    if 'shape' not in schema_content[field]:
-                        error_data_dic[i] = "for schema, {} th data is wrong, " \
-                                            "data type for '{}' is not matched.".format(i, field)
-                    else:
-                        try:
-                            np.reshape(v[field], schema_content[field]['shape'])
-                        except ValueError:
-                            error_data_dic[i] = "for schema, {} th data is wrong, " \
-                                                "data type for '{}' is not matched.".format(i, field)
-        error_data_dic = sorted(error_data_dic.items(), reverse=True)
-        for i, v in error_data_dic:
-            raw_data.pop(i)
+        error_data_dic = _verify_rows(raw_data, self._header.schema)
+        self._remove_invalid_rows(raw_data, error_data_dic)
+
+    @staticmethod
+    def _remove_invalid_rows(raw_data, error_data_dic):
+        """Remove the invalid rows from raw_data and log their error messages."""
+        for i, v in sorted(error_data_dic.items()):
             logger.warning(v)
+        if error_data_dic:
+            raw_data[:] = [v for i, v in enumerate(raw_data) if i not in error_data_dic]
+
+    def _verify_and_pack_parallel(self, raw_data):
+        """
+        Verify and pack the rows in chunks by the packing worker processes.
+
+        Returns:
+            list[dict], the raw data of the valid rows.
+            list[bytearray], the merged blob data of the valid rows.
+        """
+        if self._pack_pool is None:
+            self._pack_pool = multiprocessing.Pool(processes=self._pack_workers)
+        schema_content = self._header.schema
+        blob_fields = self._header.blob_fields
+        chunk_size = max(_MIN_PACK_CHUNK_SIZE, -(-len(raw_data) // self._pack_workers))
+        chunks = [(raw_data[start:start + chunk_size], schema_content, blob_fields, start)
+                  for start in range(0, len(raw_data), chunk_size)]
+        error_data_dic, packed_raw, packed_blob = {}, [], []
+        for (_, _, _, start), (chunk_errors, chunk_raw, chunk_blob) in \
+                zip(chunks, self._pack_pool.map(_verify_and_pack, chunks)):
+            error_data_dic.update({start + i: v for i, v in chunk_errors.items()})
+            packed_raw.extend(chunk_raw)
+            packed_blob.extend(chunk_blob)
+        self._remove_invalid_rows(raw_data, error_data_dic)
+        return packed_raw, packed_blob
+
+    def set_pack_workers(self, num_workers):
+        """
+        Set the number of worker processes which verify the raw data and pack the blob data before writing.
+        Verifying and packing run in the calling process if it is 1.
+
+        Args:
+           num_workers (int): Number of packing worker processes, between 1 and the number of CPUs.
+
+        Raises:
+            ParamValueError: If `num_workers` is invalid.
+        """
+        if not isinstance(num_workers, int) or isinstance(num_workers, bool) or \
+                num_workers < 1 or num_workers > multiprocessing.cpu_count():
+            raise ParamValueError("Pack workers should between 1 and {}.".format(multiprocessing.cpu_count()))
+        if num_workers != self._pack_workers:
+            self._close_pack_pool()
+        self._pack_workers = num_workers
+
+    def _close_pack_pool(self, terminate=False):
+        """Stop the packing worker processes, the pending chunks are dropped if terminate is True."""
+        if self._pack_pool is not None:
+            if terminate:
+                self._pack_pool.terminate()
+            else:
+                self._pack_pool.close()
+            self._pack_pool.join()
+            self._pack_pool = None
+
+    def close(self):
+        """
+        Stop the packing worker processes, e.g. when the data is not committed after a failure.
+        """
+        self._close_pack_pool(terminate=True)
+
+    def __del__(self):
+        if getattr(self, '_pack_pool', None) is not None:
+            self._close_pack_pool(terminate=True)
 
     def open_and_set_header(self):
         """
@@ -242,6 +362,13 @@ class FileWriter:
         for each_raw in raw_data:
             if not isinstance(each_raw, dict):
                 raise ParamTypeError('raw_data item', 'dict')
+        if self._pack_workers > 1 and len(raw_data) > _MIN_PACK_CHUNK_SIZE:
+            try:
+                packed_raw, packed_blob = self._verify_and_pack_parallel(raw_data)
+            except BaseException:
+                self._close_pack_pool(terminate=True)
+                raise
+            return self._writer.write_packed_data(packed_raw, packed_blob, True, parallel_writer)
         self._verify_based_on_schema(raw_data)
         return self._writer.write_raw_data(raw_data, True, parallel_writer)
 
@@ -299,6 +426,7 @@ class FileWriter:
         # permit commit without data
         if not self._writer.get_shard_header():
             self._writer.set_shard_header(self._header)
+        self._close_pack_pool()
         ret = self._writer.commit()
         if self._index_generator is True:
             if self._append:
@@ -23,6 +23,74 @@ from .common.exceptions import MRMOpenError, MRMOpenForAppendError, MRMInvalidHe
 
 __all__ = ['ShardWriter']
 
+# Size in bytes of the length prefix of each blob in a merged blob
+_BLOB_LEN_BYTES = 8
+
+
+def _convert_np_types(val):
+    """convert numpy type to python primitive type"""
+    if isinstance(val, (np.int32, np.int64, np.float32, np.float64)):
+        return val.item()
+    return val
+
+
+def _merge_blob(blob_data, schema):
+    """
+    Merge multiple blob data whose type is bytes or ndarray into one preallocated buffer.
+
+    Args:
+       blob_data (dict): Dict of blob data.
+       schema (dict): Dict of schema, the ndarray blobs are converted to the type of their field.
+
+    Returns:
+        bytearray, merged blob data, each blob is prefixed by its length in 8 big-endian bytes.
+    """
+    if len(blob_data) == 1:
+        values = [v for v in blob_data.values()]
+        return bytearray(values[0])
+
+    blobs = []
+    for field, v in blob_data.items():
+        # view ndarray as bytes, copy only if it needs a type conversion
+        if isinstance(v, np.ndarray):
+            v = memoryview(np.ascontiguousarray(v, dtype=schema[field]["type"])).cast("B")
+        blobs.append(v)
+    merged = bytearray(sum(_BLOB_LEN_BYTES + len(v) for v in blobs))
+    view = memoryview(merged)
+    offset = 0
+    for v in blobs:
+        view[offset:offset + _BLOB_LEN_BYTES] = len(v).to_bytes(_BLOB_LEN_BYTES, 'big')
+        offset += _BLOB_LEN_BYTES
+        view[offset:offset + len(v)] = v
+        offset += len(v)
+    return merged
+
+
+def pack_raw_data(data, schema, blob_fields):
+    """
+    Slice the rows into the merged blob data and the raw data filtered according to schema.
+
+    Args:
+       data (list[dict]): List of raw data.
+       schema (dict): Dict of schema.
+       blob_fields (list[str]): The blob fields of schema.
+
+    Returns:
+        list[dict], the raw data of the rows.
+        list[bytearray], the merged blob data of the rows.
+    """
+    raw_fields = [field for field in schema if field not in blob_fields]
+    blob_data = []
+    raw_data = []
+    for item in data:
+        row_blob = _merge_blob({field: item[field] for field in blob_fields}, schema)
+        if row_blob:
+            blob_data.append(row_blob)
+        row_raw = {field: _convert_np_types(item[field]) for field in raw_fields if field in item}
+        if row_raw:
+            raw_data.append(row_raw)
+    return raw_data, blob_data
+
 
 class ShardWriter:
     """
@@ -155,18 +223,26 @@ class ShardWriter:
         Raises:
             MRMWriteCVError: If failed to write cv type dataset.
         """
-        blob_data = []
-        raw_data = []
         # slice data to blob data and raw data
-        for item in data:
-            row_blob = self._merge_blob({field: item[field] for field in self._header.blob_fields})
-            if row_blob:
-                blob_data.append(list(row_blob))
-            # filter raw data according to schema
-            row_raw = {field: self._convert_np_types(item[field])
-                       for field in self._header.schema.keys() - self._header.blob_fields if field in item}
-            if row_raw:
-                raw_data.append(row_raw)
+        raw_data, blob_data = pack_raw_data(data, self._header.schema, self._header.blob_fields)
+        return self.write_packed_data(raw_data, blob_data, validate, parallel_writer)
+
+    def write_packed_data(self, raw_data, blob_data, validate=True, parallel_writer=False):
+        """
+        Write the raw data and merged blob data sliced by `pack_raw_data`.
+
+        Args:
+           raw_data (list[dict]): List of raw data filtered according to schema.
+           blob_data (list[bytearray]): List of merged blob data.
+           validate (bool, optional): verify data according schema if it equals to True.
+           parallel_writer (bool, optional): Load data parallel if it equals to True.
+
+        Returns:
+            MSRStatus, SUCCESS or FAILED.
+
+        Raises:
+            MRMWriteDatasetError: If failed to write dataset.
+        """
         raw_data = {0: raw_data} if raw_data else {}
         ret = self._writer.write_raw_data(raw_data, blob_data, validate, parallel_writer)
         if ret != ms.MSRStatus.SUCCESS:
@@ -176,9 +252,7 @@ class ShardWriter:
 
     def _convert_np_types(self, val):
         """convert numpy type to python primitive type"""
-        if isinstance(val, (np.int32, np.int64, np.float32, np.float64)):
-            return val.item()
-        return val
+        return _convert_np_types(val)
 
     def _merge_blob(self, blob_data):
         """
@@ -188,24 +262,9 @@ class ShardWriter:
            blob_data (dict): Dict of blob data
 
         Returns:
-            bytes, merged blob data
-        """
-        if len(blob_data) == 1:
-            values = [v for v in blob_data.values()]
-            return bytes(values[0])
-
-        # convert int to bytes
-        def int_to_bytes(x: int) -> bytes:
-            return x.to_bytes(8, 'big')
-
-        merged = bytes()
-        for field, v in blob_data.items():
-            # convert ndarray to bytes
-            if isinstance(v, np.ndarray):
-                v = v.astype(self._header.schema[field]["type"]).tobytes()
-            merged += int_to_bytes(len(v))
-            merged += v
-        return merged
+            bytearray, merged blob data
+        """
+        return _merge_blob(blob_data, self._header.schema)
 
     def commit(self):
         """
@@ -0,0 +1,232 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Pipelined conversion engine shared by the MindRecord convert tools.
+
+The tasks of a converter(e.g. image files) are loaded into rows by a process pool, the batches of rows are passed
+through a bounded queue to a writer thread, which writes them into all the partitions concurrently while the next
+batches are loaded. With a progress file the writer commits periodically and records the number of committed
+tasks, so a crashed conversion resumes by appending to the committed files.
+"""
+import collections
+import itertools
+import json
+import multiprocessing
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+from mindspore import log as logger
+from ..filewriter import FileWriter
+from ..shardutils import SUCCESS
+
+__all__ = ['ConvertEngine']
+
+# Interval in seconds of the progress logs
+_PROGRESS_INTERVAL = 10
+
+
+def _row_bytes(row):
+    """Approximate size in bytes of a row."""
+    size = 0
+    for value in row.values():
+        if isinstance(value, (bytes, str)):
+            size += len(value)
+        elif isinstance(value, np.ndarray):
+            size += value.nbytes
+        else:
+            size += 8
+    return size
+
+
+def _load_batch(load_fn, tasks):
+    """Load the rows of a batch of tasks, the tasks whose row is None are skipped."""
+    if load_fn is None:
+        return list(tasks)
+    return [row for row in map(load_fn, tasks) if row is not None]
+
+
+class ConvertEngine:
+    """
+    Pipelined driver of the MindRecord convert tools.
+
+    Args:
+        writer (FileWriter): The writer whose schema and index have been added.
+        load_fn (callable, optional): Module level function which loads the row dict of a task, or returns None to
+            skip the task. It runs in the worker processes. If None, the tasks are the rows (default=None).
+        num_workers (int, optional): Number of loading worker processes. The tasks are loaded in the calling thread
+            if it is None or 0 (default=None).
+        batch_size (int, optional): Number of tasks loaded and written at a time (default=256).
+        queue_size (int, optional): Max number of batches loaded and not written yet (default=8).
+        progress_file (str, optional): File recording the number of committed tasks. If it exists when running,
+            the committed tasks are skipped and the rows are appended to the committed files (default=None).
+        commit_interval (int, optional): Number of batches written between two commits when progress_file is set
+            (default=100).
+    """
+
+    def __init__(self, writer, load_fn=None, num_workers=None, batch_size=256, queue_size=8, progress_file=None,
+                 commit_interval=100):
+        self._writer = writer
+        self._load_fn = load_fn
+        self._num_workers = num_workers or 0
+        if load_fn is None:
+            self._num_workers = 0
+        self._batch_size = batch_size
+        self._queue_size = queue_size
+        self._progress_file = progress_file
+        self._commit_interval = commit_interval
+        self._parallel_writer = len(writer._paths) > 1  # pylint: disable=W0212
+        self._file_name = writer._paths[0]  # pylint: disable=W0212
+        self._committed_tasks = 0
+        self._tasks_done = 0
+        self._rows = 0
+        self._bytes = 0
+        self._start_time = None
+        self._last_log_time = None
+        self._error = None
+
+    def _load_progress(self):
+        """Load the progress file, reopen the committed files for append."""
+        if self._progress_file is None or not os.path.exists(self._progress_file):
+            return None
+        with open(self._progress_file) as f:
+            progress = json.load(f)
+        if not progress.get("finished"):
+            self._file_name = progress["file_name"]
+            self._writer = FileWriter.open_for_append(self._file_name)
+            self._committed_tasks = self._tasks_done = progress["tasks"]
+            self._rows = progress["rows"]
+            logger.info("Resume the conversion of {} from {} committed tasks.".format(self._file_name,
+                                                                                    self._committed_tasks))
+        return progress
+
+    def _save_progress(self, finished=False):
+        """Save the progress file atomically."""
+        progress = {"file_name": self._file_name, "tasks": self._committed_tasks, "rows": self._rows,
+                    "finished": finished}
+        tmp_file = self._progress_file + ".tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(progress, f)
+        os.replace(tmp_file, self._progress_file)
+
+    def _commit(self):
+        """Commit the written rows, record the progress and reopen the files for the following rows."""
+        ret = self._writer.commit()
+        self._committed_tasks = self._tasks_done
+        self._save_progress()
+        self._writer = FileWriter.open_for_append(self._file_name)
+        return ret
+
+    def _log_progress(self, force=False):
+        now = time.time()
+        if not force and now - self._last_log_time < _PROGRESS_INTERVAL:
+            return
+        self._last_log_time = now
+        elapsed = max(now - self._start_time, 1e-6)
+        logger.info("transformed {} record... {:.1f} rows/s, {:.2f} MB/s.".format(
+            self._rows, self._rows / elapsed, self._bytes / elapsed / (1 << 20)))
+
+    def _write_loop(self, batches):
+        """Writer thread, write the batches until None is received."""
+        batches_since_commit = 0
+        try:
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    return
+                rows, num_tasks = batch
+                if rows:
+                    self._writer.write_raw_data(rows, self._parallel_writer)
+                self._tasks_done += num_tasks
+                self._rows += len(rows)
+                self._bytes += sum(_row_bytes(row) for row in rows)
+                self._log_progress()
+                batches_since_commit += 1
+                if self._progress_file is not None and batches_since_commit >= self._commit_interval:
+                    self._commit()
+                    batches_since_commit = 0
+        except Exception as e:  # pylint: disable=W0703
+            self._error = e
+            # drain the queue so that the loading side is never blocked
+            while batches.get() is not None:
+                pass
+
+    def _put(self, batches, batch, writer_thread):
+        while True:
+            try:
+                batches.put(batch, timeout=1)
+                return
+            except queue.Full:
+                if not writer_thread.is_alive():
+                    return
+
+    def run(self, tasks):
+        """
+        Load the tasks and write their rows, then commit.
+
+        Args:
+            tasks (iterable): The tasks, each one is loaded into one row by load_fn.
+
+        Returns:
+            MSRStatus, SUCCESS or FAILED.
+        """
+        progress = self._load_progress()
+        if progress is not None and progress.get("finished"):
+            logger.info("The conversion of {} has been finished.".format(progress["file_name"]))
+            return SUCCESS
+        tasks = iter(tasks)
+        if self._committed_tasks:
+            tasks = itertools.islice(tasks, self._committed_tasks, None)
+
+        self._start_time = self._last_log_time = time.time()
+        # the workers are forked before the writer thread starts, forking a process with running threads may deadlock
+        pool = multiprocessing.Pool(processes=self._num_workers) if self._num_workers > 0 else None
+        batches = queue.Queue(self._queue_size)
+        writer_thread = threading.Thread(target=self._write_loop, args=(batches,), daemon=True)
+        writer_thread.start()
+        try:
+            pending = collections.deque()
+            while self._error is None:
+                chunk = list(itertools.islice(tasks, self._batch_size))
+                if not chunk:
+                    break
+                if pool is None:
+                    self._put(batches, (_load_batch(self._load_fn, chunk), len(chunk)), writer_thread)
+                    continue
+                pending.append((pool.apply_async(_load_batch, (self._load_fn, chunk)), len(chunk)))
+                if len(pending) >= self._queue_size:
+                    result, num_tasks = pending.popleft()
+                    self._put(batches, (result.get(), num_tasks), writer_thread)
+            while pending and self._error is None:
+                result, num_tasks = pending.popleft()
+                self._put(batches, (result.get(), num_tasks), writer_thread)
+        finally:
+            batches.put(None)
+            writer_thread.join()
+            if pool is not None:
+                pool.close()
+                pool.join()
+        if self._error is not None:
+            raise self._error
+
+        ret = self._writer.commit()
+        self._log_progress(force=True)
+        if self._progress_file is not None:
+            self._committed_tasks = self._tasks_done
+            self._save_progress(finished=True)
+        return ret
@@ -18,9 +18,9 @@ Cifar10 convert tool for MindRecord.
 
 from importlib import import_module
 import os
-import numpy as np
 
 from mindspore import log as logger
+from ._convert_engine import ConvertEngine
 from .cifar10 import Cifar10
 from ..common.exceptions import PathNotExistsError
 from ..filewriter import FileWriter
@@ -41,12 +41,13 @@ class Cifar10ToMR:
     Args:
         source (str): the cifar10 directory to be transformed.
         destination (str): the MindRecord file path to transform into.
+        num_workers (int, optional): Number of processes encoding the images (default=None, in the calling process).
 
     Raises:
         ValueError: If source or destination is invalid.
     """
 
-    def __init__(self, source, destination):
+    def __init__(self, source, destination, num_workers=None):
         check_filename(source)
         self.source = source
 
@@ -66,6 +67,9 @@ class Cifar10ToMR:
 
         check_filename(destination)
         self.destination = destination
+        if num_workers is not None and (not isinstance(num_workers, int) or num_workers < 0):
+            raise ValueError("The parameter num_workers must be int and not less than 0")
+        self.num_workers = num_workers
         self.writer = None
 
     def run(self, fields=None):
@@ -94,12 +98,14 @@ class Cifar10ToMR:
         test_labels = cifar10_data.Test.labels
         logger.info("test images label: {}".format(test_labels.shape))
 
-        data_list = _construct_raw_data(images, labels)
-        test_data_list = _construct_raw_data(test_images, test_labels)
+        if not cv2:
+            raise ModuleNotFoundError("opencv-python module not found, please use pip install it.")
 
-        if _generate_mindrecord(self.destination, data_list, fields, "img_train") != SUCCESS:
+        if _generate_mindrecord(self.destination, _construct_tasks(images, labels), fields, "img_train",
+                                self.num_workers) != SUCCESS:
             return FAILED
-        if _generate_mindrecord(self.destination + "_test", test_data_list, fields, "img_test") != SUCCESS:
+        if _generate_mindrecord(self.destination + "_test", _construct_tasks(test_images, test_labels), fields,
+                                "img_test", self.num_workers) != SUCCESS:
             return FAILED
         return SUCCESS
 
@@ -113,41 +119,31 @@ class Cifar10ToMR:
         return t.res
 
 
-def _construct_raw_data(images, labels):
-    """
-    Construct raw data from cifar10 data.
-
-    Args:
-        images (list): image list from cifar10.
-        labels (list): label list from cifar10.
+def _construct_tasks(images, labels):
+    """Get the id, image and label of each cifar10 image."""
+    return ((i, img, labels[i][0]) for i, img in enumerate(images))
 
-    Returns:
-        list[dict], data dictionary constructed from cifar10.
-    """
-    if not cv2:
-        raise ModuleNotFoundError("opencv-python module not found, please use pip install it.")
 
-    raw_data = []
-    for i, img in enumerate(images):
-        label = np.int(labels[i][0])
-        _, img = cv2.imencode(".jpeg", img[..., [2, 1, 0]])
-        row_data = {"id": int(i),
-                    "data": img.tobytes(),
-                    "label": int(label)}
-        raw_data.append(row_data)
-    return raw_data
+def _encode_cifar10_image(task):
+    """Encode the image of a task into jpeg in a loading worker."""
+    i, img, label = task
+    _, img = cv2.imencode(".jpeg", img[..., [2, 1, 0]])
+    return {"id": int(i),
+            "data": img.tobytes(),
+            "label": int(label)}
 
 
-def _generate_mindrecord(file_name, raw_data, fields, schema_desc):
+def _generate_mindrecord(file_name, tasks, fields, schema_desc, num_workers=None):
     """
-    Generate MindRecord file from raw data.
+    Generate MindRecord file from the cifar10 images.
 
     Args:
         file_name (str): File name of MindRecord File.
+        tasks (iterable): The id, image and label of each image.
         fields (list[str]): Fields would be set as index which
           could not belong to blob fields and type could not be 'array' or 'bytes'.
-        raw_data (dict): dict of raw data.
         schema_desc (str): String of schema description.
+        num_workers (int, optional): Number of processes encoding the images (default=None, in the calling process).
 
     Returns:
         MSRStatus, whether successfully written into MindRecord.
@@ -161,5 +157,4 @@ def _generate_mindrecord(file_name, raw_data, fields, schema_desc):
     writer.add_schema(schema, schema_desc)
     if fields and isinstance(fields, list):
         writer.add_index(fields)
-    writer.write_raw_data(raw_data)
-    return writer.commit()
+    return ConvertEngine(writer, _encode_cifar10_image, num_workers).run(tasks)
@@ -19,6 +19,7 @@ from importlib import import_module
 import os
 
 from mindspore import log as logger
+from ._convert_engine import ConvertEngine
 from ..filewriter import FileWriter
 from ..shardutils import check_filename, ExceptionThread
 
@@ -108,13 +109,11 @@ class CsvToMR:
 
     def _get_row_of_csv(self, df):
         """Get row data from csv file."""
-        for _, r in df.iterrows():
-            row = {}
-            for col in self.columns_list:
-                if str(df[col].dtype) == 'bool':
-                    row[col] = int(r[col])
-                else:
-                    row[col] = r[col]
+        bool_columns = [col for col in self.columns_list if str(df[col].dtype) == 'bool']
+        # convert the columns to records at once instead of building a Series for each row
+        for row in df[list(self.columns_list)].to_dict('records'):
+            for col in bool_columns:
+                row[col] = int(row[col])
             yield row
 
     def run(self):
@@ -146,27 +145,9 @@ class CsvToMR:
         # add the index
         self.writer.add_index(list(self.columns_list))
 
-        csv_iter = self._get_row_of_csv(df)
-        batch_size = 256
-        transform_count = 0
-        while True:
-            data_list = []
-            try:
-                for _ in range(batch_size):
-                    data_list.append(csv_iter.__next__())
-                    transform_count += 1
-                self.writer.write_raw_data(data_list)
-                logger.info("transformed {} record...".format(transform_count))
-            except StopIteration:
-                if data_list:
-                    self.writer.write_raw_data(data_list)
-                    logger.info(
-                        "transformed {} record...".format(transform_count))
-                break
-
-        ret = self.writer.commit()
-
-        return ret
+        # the rows are converted in this thread while the former batches are written
+        engine = ConvertEngine(self.writer)
+        return engine.run(self._get_row_of_csv(df))
 
     def transform(self):
         t = ExceptionThread(target=self.run)
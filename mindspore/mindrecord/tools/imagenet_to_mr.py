@@ -19,6 +19,7 @@ import os
 import time
 
 from mindspore import log as logger
+from ._convert_engine import ConvertEngine
 from ..common.exceptions import PathNotExistsError
 from ..filewriter import FileWriter
 from ..shardutils import check_filename, ExceptionThread
@@ -26,6 +27,25 @@ from ..shardutils import check_filename, ExceptionThread
 __all__ = ['ImageNetToMR']
 
 
+def _read_imagenet_image(task):
+    """
+    Read the image of a task in a loading worker.
+
+    Args:
+        task (tuple): The image file name and its label.
+
+    Returns:
+        dict, the row of the image, or None if the image is invalid.
+    """
+    file_name, label = task
+    with open(file_name, "rb") as image_file:
+        image_bytes = image_file.read()
+    if not image_bytes:
+        logger.warning("The image file: {} is invalid.".format(file_name))
+        return None
+    return {"file_name": str(file_name), "label": int(label), "image": image_bytes}
+
+
 class ImageNetToMR:
     """
     A class to transform from imagenet to MindRecord.
@@ -43,12 +63,16 @@ class ImageNetToMR:
         image_dir (str): image directory contains n02119789, n02100735, n02110185 and n02096294 directory.
         destination (str): the MindRecord file path to transform into.
         partition_number (int, optional): partition size (default=1).
+        num_workers (int, optional): Number of processes reading the images (default=None, in the calling process).
+        progress_file (str, optional): File recording the progress of the transformation. The transformation is
+            committed periodically, if it is interrupted, running it again with the same progress file resumes from
+            the last commit (default=None).
 
     Raises:
         ValueError: If `map_file`, `image_dir` or `destination` is invalid.
     """
 
-    def __init__(self, map_file, image_dir, destination, partition_number=1):
+    def __init__(self, map_file, image_dir, destination, partition_number=1, num_workers=None, progress_file=None):
         check_filename(map_file)
         self.map_file = map_file
 
@@ -65,6 +89,11 @@ class ImageNetToMR:
         else:
             raise ValueError("The parameter partition_number must be int")
 
+        if num_workers is not None and (not isinstance(num_workers, int) or num_workers < 0):
+            raise ValueError("The parameter num_workers must be int and not less than 0")
+        self.num_workers = num_workers
+        self.progress_file = progress_file
+
         self.writer = FileWriter(self.destination, self.partition_number)
 
     def _get_imagenet_as_dict(self):
@@ -74,6 +103,18 @@ class ImageNetToMR:
         Yields:
             data (dict of list): imagenet data list which contains dict.
         """
+        for task in self._get_imagenet_tasks():
+            data = _read_imagenet_image(task)
+            if data is not None:
+                yield data
+
+    def _get_imagenet_tasks(self):
+        """
+        Get the image files of imagenet.
+
+        Yields:
+            tuple, the image file name and its label.
+        """
         if not os.path.exists(self.map_file):
             raise IOError("map file {} not exists".format(self.map_file))
 
@@ -99,24 +140,13 @@ class ImageNetToMR:
 
         # get the filename, label and image binary as a dict
         for label in dir_paths:
-            for item in os.listdir(dir_paths[label]):
+            # sorted so that the tasks are in the same order when the transformation is resumed
+            for item in sorted(os.listdir(dir_paths[label])):
                 file_name = os.path.join(dir_paths[label], item)
                 if not item.endswith("JPEG") and not item.endswith("jpg"):
                     logger.warning("{} file is not suffix with JPEG/jpg, skip it.".format(file_name))
                     continue
-                data = {}
-                data["file_name"] = str(file_name)
-                data["label"] = int(label)
-
-                # get the image data
-                image_file = open(file_name, "rb")
-                image_bytes = image_file.read()
-                image_file.close()
-                if not image_bytes:
-                    logger.warning("The image file: {} is invalid.".format(file_name))
-                    continue
-                data["image"] = image_bytes
-                yield data
+                yield file_name, label
 
     def run(self):
         """
@@ -145,24 +175,9 @@ class ImageNetToMR:
         # add the index
         self.writer.add_index(["label", "file_name"])
 
-        imagenet_iter = self._get_imagenet_as_dict()
-        batch_size = 256
-        transform_count = 0
-        while True:
-            data_list = []
-            try:
-                for _ in range(batch_size):
-                    data_list.append(imagenet_iter.__next__())
-                    transform_count += 1
-                self.writer.write_raw_data(data_list)
-                logger.info("transformed {} record...".format(transform_count))
-            except StopIteration:
-                if data_list:
-                    self.writer.write_raw_data(data_list)
-                    logger.info("transformed {} record...".format(transform_count))
-                break
-
-        ret = self.writer.commit()
+        engine = ConvertEngine(self.writer, _read_imagenet_image, self.num_workers,
+                               progress_file=self.progress_file)
+        ret = engine.run(self._get_imagenet_tasks())
 
         t1_total = time.time()
         logger.info("--------------------------------------------")
@@ -22,6 +22,7 @@ import gzip
 import numpy as np
 
 from mindspore import log as logger
+from ._convert_engine import ConvertEngine
 from ..filewriter import FileWriter
 from ..shardutils import check_filename, ExceptionThread, SUCCESS, FAILED
 
@@ -33,6 +34,13 @@ except ModuleNotFoundError:
 __all__ = ['MnistToMR']
 
 
+def _encode_mnist_image(task):
+    """Encode the image of a task into jpeg in a loading worker."""
+    data, label = task
+    _, img = cv2.imencode(".jpeg", data)
+    return {"label": int(label), "data": img.tobytes()}
+
+
 class MnistToMR:
     """
     A class to transform from Mnist to MindRecord.
@@ -43,12 +51,13 @@ class MnistToMR:
                       and train-labels-idx1-ubyte.gz.
         destination (str): the MindRecord file directory to transform into.
         partition_number (int, optional): partition size (default=1).
+        num_workers (int, optional): Number of processes encoding the images (default=None, in the calling process).
 
     Raises:
         ValueError: If `source`, `destination`, `partition_number` is invalid.
     """
 
-    def __init__(self, source, destination, partition_number=1):
+    def __init__(self, source, destination, partition_number=1, num_workers=None):
         self.image_size = 28
         self.num_channels = 1
 
@@ -73,6 +82,10 @@ class MnistToMR:
         else:
             raise ValueError("The parameter partition_number must be int")
 
+        if num_workers is not None and (not isinstance(num_workers, int) or num_workers < 0):
+            raise ValueError("The parameter num_workers must be int and not less than 0")
+        self.num_workers = num_workers
+
         self.writer_train = FileWriter("{}_train.mindrecord".format(destination), self.partition_number)
         self.writer_test = FileWriter("{}_test.mindrecord".format(destination), self.partition_number)
 
@@ -102,11 +115,14 @@ class MnistToMR:
         Yields:
             data (dict of list): mnist data list which contains dict.
         """
+        for task in self._mnist_train_tasks():
+            yield _encode_mnist_image(task)
+
+    def _mnist_train_tasks(self):
+        """Get the images and labels of mnist train data."""
         train_data = self._extract_images(self.train_data_filename_)
         train_labels = self._extract_labels(self.train_labels_filename_)
-        for data, label in zip(train_data, train_labels):
-            _, img = cv2.imencode(".jpeg", data)
-            yield {"label": int(label), "data": img.tobytes()}
+        return zip(train_data, train_labels)
 
     def _mnist_test_iterator(self):
         """
@@ -115,11 +131,14 @@ class MnistToMR:
         Yields:
             data (dict of list): mnist data list which contains dict.
         """
+        for task in self._mnist_test_tasks():
+            yield _encode_mnist_image(task)
+
+    def _mnist_test_tasks(self):
+        """Get the images and labels of mnist test data."""
         test_data = self._extract_images(self.test_data_filename_)
         test_labels = self._extract_labels(self.test_labels_filename_)
-        for data, label in zip(test_data, test_labels):
-            _, img = cv2.imencode(".jpeg", data)
-            yield {"label": int(label), "data": img.tobytes()}
+        return zip(test_data, test_labels)
 
     def _transform_train(self):
         """
@@ -143,24 +162,8 @@ class MnistToMR:
         # add the index
         self.writer_train.add_index(["label"])
 
-        train_iter = self._mnist_train_iterator()
-        batch_size = 256
-        transform_count = 0
-        while True:
-            data_list = []
-            try:
-                for _ in range(batch_size):
-                    data_list.append(train_iter.__next__())
-                    transform_count += 1
-                self.writer_train.write_raw_data(data_list)
-                logger.info("transformed {} record...".format(transform_count))
-            except StopIteration:
-                if data_list:
-                    self.writer_train.write_raw_data(data_list)
-                    logger.info("transformed {} record...".format(transform_count))
-                break
-
-        ret = self.writer_train.commit()
+        engine = ConvertEngine(self.writer_train, _encode_mnist_image, self.num_workers)
+        ret = engine.run(self._mnist_train_tasks())
 
         t1_total = time.time()
         logger.info("--------------------------------------------")
@@ -192,24 +195,8 @@ class MnistToMR:
         # add the index
         self.writer_test.add_index(["label"])
 
-        train_iter = self._mnist_test_iterator()
-        batch_size = 256
-        transform_count = 0
-        while True:
-            data_list = []
-            try:
-                for _ in range(batch_size):
-                    data_list.append(train_iter.__next__())
-                    transform_count += 1
-                self.writer_test.write_raw_data(data_list)
-                logger.info("transformed {} record...".format(transform_count))
-            except StopIteration:
-                if data_list:
-                    self.writer_test.write_raw_data(data_list)
-                    logger.info("transformed {} record...".format(transform_count))
-                break
-
-        ret = self.writer_test.commit()
+        engine = ConvertEngine(self.writer_test, _encode_mnist_image, self.num_workers)
+        ret = engine.run(self._mnist_test_tasks())
 
         t1_total = time.time()
         logger.info("--------------------------------------------")
@@ -20,6 +20,7 @@ from string import punctuation
 import numpy as np
 
 from mindspore import log as logger
+from ._convert_engine import ConvertEngine
 from ..filewriter import FileWriter
 from ..shardutils import check_filename, ExceptionThread
 
@@ -276,23 +277,9 @@ class TFRecordToMR:
             tf_iter = self.tfrecord_iterator_oldversion()
         else:
             tf_iter = self.tfrecord_iterator()
-        batch_size = 256
-        transform_count = 0
-        while True:
-            data_list = []
-            try:
-                for _ in range(batch_size):
-                    data_list.append(tf_iter.__next__())
-                    transform_count += 1
-
-                writer.write_raw_data(data_list)
-                logger.info("Transformed {} records...".format(transform_count))
-            except StopIteration:
-                if data_list:
-                    writer.write_raw_data(data_list)
-                    logger.info("Transformed {} records...".format(transform_count))
-                break
-        return writer.commit()
+        # the records are parsed by tensorflow in this thread while the former batches are written
+        engine = ConvertEngine(writer)
+        return engine.run(tf_iter)
 
     def transform(self):
         t = ExceptionThread(target=self.run)
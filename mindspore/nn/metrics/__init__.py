@@ -27,6 +27,7 @@ from .recall import Recall
 from .fbeta import Fbeta, F1
 from .dice import Dice
 from .roc import ROC
+from .streaming_curve import StreamingROC, StreamingAUC, StreamingPrecisionRecall
 from .auc import auc
 from .topk import TopKCategoricalAccuracy, Top1CategoricalAccuracy, Top5CategoricalAccuracy
 from .loss import Loss
@@ -53,6 +54,9 @@ __all__ = [
     "F1",
     "Dice",
     "ROC",
+    "StreamingROC",
+    "StreamingAUC",
+    "StreamingPrecisionRecall",
     "auc",
     "TopKCategoricalAccuracy",
     "Top1CategoricalAccuracy",
@@ -71,6 +75,9 @@ __factory__ = {
     'F1': F1,
     'dice': Dice,
     'roc': ROC,
+    'streaming_roc': StreamingROC,
+    'streaming_auc': StreamingAUC,
+    'streaming_precision_recall': StreamingPrecisionRecall,
     'auc': auc,
     'bleu_score': BleuScore,
     'cosine_similarity': CosineSimilarity,
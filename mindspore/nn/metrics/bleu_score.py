@@ -14,10 +14,136 @@
 # ============================================================================
 """BleuScore."""
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 from mindspore._checkparam import Validator as validator
 from .metric import Metric
 
+_INT64_LIMIT = 1 << 63
+
+
+def _flatten_token_ids(sentences):
+    """Concatenate the token ids of the sentences, return the tokens and the lengths of the sentences."""
+    arrays = [np.asarray(sentence).reshape(-1) for sentence in sentences]
+    for array in arrays:
+        if array.size and array.dtype.kind not in 'iu':
+            raise TypeError('The corpus should be of integer token ids, but got {}.'.format(array.dtype))
+    lengths = np.array([array.size for array in arrays], dtype=np.int64)
+    if not arrays:
+        return np.zeros(0, dtype=np.int64), lengths
+    return np.concatenate([array.astype(np.int64, copy=False) for array in arrays]), lengths
+
+
+class _NgramEncoder:
+    """
+    Encode the n-grams of the concatenated sentences to int64 keys with a rolling hash.
+
+    The hash of an n-gram is its token ids in the base of the vocabulary size, so equal keys are equal n-grams while the
+    base to the power of n fits in int64. Otherwise, the keys are the ranks of the n-grams sorted by their token ids.
+    """
+    def __init__(self, tokens, lengths):
+        low = int(tokens.min()) if tokens.size else 0
+        self._base = int(tokens.max()) - low + 1 if tokens.size else 1
+        self._tokens = tokens - low
+        self._owners = np.repeat(np.arange(lengths.size), lengths)
+        # the number of the tokens from each token to the end of its sentence
+        self._remains = np.repeat(np.cumsum(lengths), lengths) - np.arange(tokens.size)
+        self._hashes = self._tokens.copy()
+        self._n = 1
+
+    def encode(self, n):
+        """
+        Encode the n-grams.
+
+        Args:
+            n (int): The number of the tokens of the n-grams.
+
+        Returns:
+            A tuple of the sentences of the n-grams, their keys and the upper bound of the keys.
+        """
+        starts = np.flatnonzero(self._remains >= n)
+        if self._base ** n < _INT64_LIMIT:
+            while self._n < n:
+                self._hashes = self._hashes[:-1] * self._base + self._tokens[self._n:]
+                self._n += 1
+            return self._owners[starts], self._hashes[starts], self._base ** n
+
+        columns = [self._tokens[starts + i] for i in range(n)]
+        order = np.lexsort(columns[::-1])
+        change = np.zeros(order.size, dtype=np.int64)
+        for column in columns:
+            sorted_column = column[order]
+            change[1:] |= sorted_column[1:] != sorted_column[:-1]
+        keys = np.empty(order.size, dtype=np.int64)
+        keys[order] = np.cumsum(change)
+        return self._owners[starts], keys, order.size
+
+
+def _combine(owners, keys, key_limit):
+    """Combine the sentences and the keys of the n-grams into int64 keys."""
+    if int(owners.max(initial=0)) + 1 > (_INT64_LIMIT - 1) // key_limit:
+        # the ranks of the keys are less than the number of the n-grams, whose product with the number of the
+        # sentences fits in int64 for any corpus in memory
+        keys = np.unique(keys, return_inverse=True)[1].reshape(-1)
+        key_limit = keys.size
+    return owners * key_limit + keys, key_limit
+
+
+def _count_clipped_ngrams(candidate_corpus, reference_corpus, n_gram):
+    """
+    Count the clipped and total n-grams of the candidates and the lengths of the corpora.
+
+    The same counts as `BleuScore.update` of the corpora of token ids, computed with numpy over all the sentences.
+
+    Args:
+        candidate_corpus (list): The token ids of the candidates.
+        reference_corpus (list): The lists of the token ids of the references.
+        n_gram (int): gram value ranged 1 to 4.
+
+    Returns:
+        A tuple of the clipped counts, the total counts, the candidate length and the closest reference length.
+    """
+    cand_tokens, cand_lengths = _flatten_token_ids(candidate_corpus)
+    ref_counts = np.array([len(references) for references in reference_corpus], dtype=np.int64)
+    if ref_counts.size and ref_counts.min() == 0:
+        raise ValueError('Each candidate should have at least one reference.')
+    ref_tokens, ref_lengths = _flatten_token_ids([ref for references in reference_corpus for ref in references])
+    num_candidates = cand_lengths.size
+    ref_owners = np.repeat(np.arange(num_candidates), ref_counts)
+
+    # the closest reference length of each candidate, the first one of the ties
+    ref_diffs = np.abs(np.repeat(cand_lengths, ref_counts) - ref_lengths)
+    closest = np.lexsort((ref_diffs, ref_owners))[np.cumsum(ref_counts) - ref_counts]
+
+    # the candidates and the references are encoded together, the references are the sentences after the candidates
+    encoder = _NgramEncoder(np.concatenate([cand_tokens, ref_tokens]), np.concatenate([cand_lengths, ref_lengths]))
+    numerator = np.zeros(n_gram, dtype=np.int64)
+    denominator = np.zeros(n_gram, dtype=np.int64)
+    for n in range(1, n_gram + 1):
+        owners, keys, key_limit = encoder.encode(n)
+        keys, key_limit = _combine(owners, keys, key_limit)
+        is_candidate = owners < num_candidates
+        cand_keys, cand_counts = np.unique(keys[is_candidate], return_counts=True)
+        denominator[n - 1] = cand_counts.sum()
+        if not cand_keys.size:
+            continue
+
+        # the counts of the n-grams of each reference, then the maximum of the references of each candidate
+        ref_keys, ref_ngram_counts = np.unique(keys[~is_candidate], return_counts=True)
+        ref_keys = ref_owners[ref_keys // key_limit - num_candidates] * key_limit + ref_keys % key_limit
+        order = np.lexsort((ref_ngram_counts, ref_keys))
+        ref_keys, ref_ngram_counts = ref_keys[order], ref_ngram_counts[order]
+        last = np.ones(ref_keys.size, dtype=np.bool_)
+        last[:-1] = ref_keys[1:] != ref_keys[:-1]
+        ref_keys, ref_ngram_counts = ref_keys[last], ref_ngram_counts[last]
+
+        # clip the counts of the n-grams of each candidate by the maximum counts of its references
+        index = np.minimum(np.searchsorted(ref_keys, cand_keys), max(ref_keys.size - 1, 0))
+        matched = ref_keys[index] == cand_keys if ref_keys.size else np.zeros(cand_keys.size, dtype=np.bool_)
+        numerator[n - 1] = np.minimum(cand_counts[matched], ref_ngram_counts[index[matched]]).sum()
+
+    return numerator, denominator, int(cand_lengths.sum()), int(ref_lengths[closest].sum())
+
 
 class BleuScore(Metric):
     """
@@ -26,6 +152,11 @@ class BleuScore(Metric):
     Args:
         n_gram (int): The n_gram value ranged from 1 to 4. Default: 4
         smooth (bool): Whether or not to apply smoothing. Default: False
+        token_ids (bool): Whether the corpora are of integer token ids. If True, the n-grams of all the sentences of
+            an update are hashed to int64 and counted with numpy, which is much faster than counting them sentence by
+            sentence and gives the same score. Default: False
+        num_workers (int, optional): The number of the processes counting the n-grams of the sentences, only used
+            when `token_ids` is True. Default: None, counting in the current process.
 
     Example:
         >>> candidate_corpus = [['i', 'have', 'a', 'pen', 'on', 'my', 'desk']]
@@ -36,14 +167,23 @@ class BleuScore(Metric):
         >>> metric.update(candidate_corpus, reference_corpus)
         >>> bleu_score = metric.eval()
         0.5946035575013605
+        >>> metric = BleuScore(token_ids=True)
+        >>> metric.clear()
+        >>> metric.update([np.array([1, 2, 3, 4, 5, 6, 7])], [[np.array([1, 2, 3, 4, 8, 6, 7]),
+        >>>                                                  np.array([9, 10, 3, 4, 5, 11, 7])]])
+        >>> bleu_score = metric.eval()
+        0.5946035575013605
     """
-    def __init__(self, n_gram=4, smooth=False):
+    def __init__(self, n_gram=4, smooth=False, token_ids=False, num_workers=None):
         super().__init__()
         self.n_gram = validator.check_value_type("n_gram", n_gram, [int])
         if self.n_gram > 4 or self.n_gram < 1:
             raise ValueError('The n_gram value ranged from 1 to 4, but got {}'.format(n_gram))
 
         self.smooth = validator.check_value_type("smooth", smooth, [bool])
+        self.token_ids = validator.check_value_type("token_ids", token_ids, [bool])
+        self.num_workers = num_workers if num_workers is None else validator.check_positive_int(num_workers,
+                                                                                                 "num_workers")
         self.clear()
 
     def clear(self):
@@ -99,6 +239,10 @@ class BleuScore(Metric):
             raise ValueError('translate_corpus and reference_corpus should be equal in length, '
                              'but got {} {}'.format(len(candidate_corpus), len(reference_corpus)))
 
+        if self.token_ids:
+            self._update_token_ids(candidate_corpus, reference_corpus)
+            return
+
         for (candidate, references) in zip(candidate_corpus, reference_corpus):
             self._c += len(candidate)
             ref_len_list = [len(ref) for ref in references]
@@ -122,6 +266,29 @@ class BleuScore(Metric):
         self._ref_len = np.array(self._r)
         self._is_update = True
 
+    def _update_token_ids(self, candidate_corpus, reference_corpus):
+        """Update with the n-grams of the corpora of token ids counted with numpy."""
+        num_sentences = len(candidate_corpus)
+        num_workers = min(self.num_workers or 1, num_sentences)
+        if num_workers > 1:
+            bounds = np.linspace(0, num_sentences, num_workers + 1).astype(np.int64)
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                futures = [executor.submit(_count_clipped_ngrams, candidate_corpus[start:end],
+                                           reference_corpus[start:end], self.n_gram)
+                           for start, end in zip(bounds[:-1], bounds[1:])]
+                results = [future.result() for future in futures]
+        else:
+            results = [_count_clipped_ngrams(candidate_corpus, reference_corpus, self.n_gram)]
+
+        for numerator, denominator, trans_len, ref_len in results:
+            self._numerator += numerator
+            self._denominator += denominator
+            self._c += trans_len
+            self._r += ref_len
+        self._trans_len = np.array(self._c)
+        self._ref_len = np.array(self._r)
+        self._is_update = True
+
     def eval(self):
         """
          Computes the bleu score.
@@ -0,0 +1,350 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Streaming ROC, AUC and precision recall curve"""
+import numpy as np
+from mindspore._checkparam import Validator as validator
+from .metric import Metric
+from .auc import auc
+
+
+class _StreamingCurve(Metric):
+    """
+    Base class of the streaming curve metrics.
+
+    The scores are accumulated into the histograms of `num_bins` equal width bins over `score_range`, one histogram of
+    the positive samples and one of the negative samples per class, so the memory does not grow with the number of the
+    samples. The scores out of `score_range` are counted in the first or the last bin.
+
+    The curves are evaluated at the lower edges of the non-empty bins. At these thresholds the true and false positive
+    counts are the same as the exact ones, only the thresholds within a bin are lost. The histograms of the metrics of
+    the same `num_bins` and `score_range` can be summed, e.g. across the data parallel ranks, see `merge`.
+
+    Args:
+        class_num (int): Integer with the number of classes. For the problem of binary classification, it is not
+                         necessary to provide this argument. Default: None.
+        pos_label (int): Determine the integer of positive class. For binary problems, it is translated to 1. For
+                         multiclass problems, this argument should not be set. Default: None.
+        num_bins (int): The number of the bins of the histograms. Default: 10000.
+        score_range (tuple): The lower and upper bounds of the scores. Default: (0.0, 1.0).
+    """
+    def __init__(self, class_num=None, pos_label=None, num_bins=10000, score_range=(0.0, 1.0)):
+        super().__init__()
+        self.class_num = class_num if class_num is None else validator.check_value_type("class_num", class_num, [int])
+        self.pos_label = pos_label if pos_label is None else validator.check_value_type("pos_label", pos_label, [int])
+        self.num_bins = validator.check_positive_int(num_bins, "num_bins")
+        validator.check_value_type("score_range", score_range, [tuple, list])
+        if len(score_range) != 2 or not score_range[0] < score_range[1]:
+            raise ValueError('score_range should be the lower and upper bounds of the scores, but got {}.'
+                             .format(score_range))
+        self.score_range = (float(score_range[0]), float(score_range[1]))
+        self.clear()
+
+    def clear(self):
+        """Clear the internal evaluation result."""
+        self._histograms = None
+        self._is_update = False
+
+    @property
+    def histograms(self):
+        """
+        The accumulated histograms.
+
+        Returns:
+            numpy.ndarray, the counts of the shape :math:`(2, C, B)`, the first of the positive samples and the
+            second of the negative samples, where :math:`C` is the number of classes, 1 for binary problems, and
+            :math:`B` is `num_bins`. None before the update.
+        """
+        return self._histograms
+
+    def _check_inputs(self, y_pred, y):
+        """Get the scores of the shape (N, C) and whether the samples are positive of each class."""
+        if y_pred.ndim == y.ndim:
+            if self.class_num is not None and self.class_num != 1:
+                raise ValueError('y_pred and y should have the same shape, but number of classes is different from 1.')
+            pos_label = 1 if self.pos_label is None else self.pos_label
+            return y_pred.reshape(-1, 1), y.reshape(-1, 1) == pos_label
+
+        if y_pred.ndim == y.ndim + 1:
+            if self.pos_label is not None:
+                raise ValueError('Argument `pos_label` should be `None` when running multiclass curve, but got {}.'
+                                 .format(self.pos_label))
+            class_num = y_pred.shape[1]
+            if self.class_num is not None and self.class_num != class_num:
+                raise ValueError('Argument `class_num` was set to {}, but detected {} number of classes from '
+                                 'predictions.'.format(self.class_num, class_num))
+            y_pred = np.moveaxis(y_pred, 1, -1).reshape(-1, class_num)
+            return y_pred, y.reshape(-1, 1) == np.arange(class_num)
+
+        raise ValueError("y_pred and y must have the same number of dimensions, or one additional dimension for"
+                         " y_pred.")
+
+    def _bin_indices(self, scores):
+        """Get the bins of the scores."""
+        scores = scores.astype(np.float64)
+        if np.isnan(scores).any():
+            raise ValueError('y_pred should not contain NaN.')
+        lower, upper = self.score_range
+        bins = np.floor((scores - lower) * (self.num_bins / (upper - lower)))
+        np.clip(bins, 0, self.num_bins - 1, out=bins)
+        return bins.astype(np.int64)
+
+    def _add_histograms(self, histograms):
+        """Add the histograms to the accumulated ones."""
+        class_num = self.class_num if self._histograms is None else self._histograms.shape[1]
+        if histograms.ndim != 3 or histograms.shape[0] != 2 or histograms.shape[2] != self.num_bins or \
+                (class_num is not None and histograms.shape[1] != class_num):
+            raise ValueError('The histograms should be of the shape (2, {}, {}), but got {}.'
+                             .format(class_num or 'C', self.num_bins, histograms.shape))
+        if self._histograms is None:
+            self._histograms = histograms.copy()
+        else:
+            self._histograms += histograms
+        self._is_update = True
+
+    def update(self, *inputs):
+        """
+        Update the histograms with predictions and targets.
+
+        Args:
+            inputs: Input `y_pred` and `y`. `y_pred` and `y` are Tensor, list or numpy.ndarray.
+                    In most cases (not strictly), y_pred is a list of floating numbers in `score_range`
+                    and the shape is :math:`(N, C)`, where :math:`N` is the number of cases and :math:`C`
+                    is the number of categories. y contains values of integers.
+        """
+        if len(inputs) != 2:
+            raise ValueError('{} need 2 inputs (y_pred, y), but got {}'.format(self.__class__.__name__, len(inputs)))
+        y_pred = self._convert_data(inputs[0])
+        y = self._convert_data(inputs[1])
+        scores, positive = self._check_inputs(y_pred, y)
+        if scores.shape[0] != positive.shape[0]:
+            raise ValueError('y_pred and y should have the same number of samples, but got {} and {}.'
+                             .format(scores.shape[0], positive.shape[0]))
+
+        class_num = scores.shape[1]
+        size = class_num * self.num_bins
+        # the bins of all the classes in one histogram
+        bins = self._bin_indices(scores) + np.arange(class_num) * self.num_bins
+        histograms = np.stack([np.bincount(bins[positive], minlength=size),
+                               np.bincount(bins[~positive], minlength=size)]).astype(np.int64)
+        self._add_histograms(histograms.reshape(2, class_num, self.num_bins))
+
+    def merge(self, other):
+        """
+        Add the histograms of another metric, e.g. of another data parallel rank.
+
+        Args:
+            other (Union[_StreamingCurve, Tensor, numpy.ndarray]): The metric of the same `num_bins` and `score_range`,
+                or its `histograms`, e.g. the sum of the histograms of all the ranks.
+
+        Examples:
+            >>> histograms = ops.AllReduce()(Tensor(metric.histograms))
+            >>> metric.clear()
+            >>> metric.merge(histograms)
+        """
+        if isinstance(other, _StreamingCurve):
+            if other.num_bins != self.num_bins or other.score_range != self.score_range:
+                raise ValueError('The metrics to merge should have the same num_bins and score_range, but got {}, {} '
+                                 'and {}, {}.'.format(self.num_bins, self.score_range,
+                                                      other.num_bins, other.score_range))
+            if other.histograms is None:
+                return
+            histograms = other.histograms
+        else:
+            histograms = np.rint(self._convert_data(other)).astype(np.int64)
+        self._add_histograms(histograms)
+
+    def _binary_curves(self):
+        """Get the false and true positive counts and the thresholds of the non-empty bins of each class."""
+        if self._is_update is False:
+            raise RuntimeError('Call the update method before calling eval.')
+
+        lower, upper = self.score_range
+        thresholds = (lower + np.arange(self.num_bins) * ((upper - lower) / self.num_bins))[::-1]
+        curves = []
+        for pos, neg in zip(self._histograms[0, :, ::-1], self._histograms[1, :, ::-1]):
+            non_empty = (pos + neg) > 0
+            curves.append((np.cumsum(neg)[non_empty], np.cumsum(pos)[non_empty], thresholds[non_empty]))
+        return curves
+
+    def _roc_curves(self):
+        """Get the false and true positive rates and the thresholds of each class."""
+        curves = []
+        for fps, tps, thresholds in self._binary_curves():
+            if not fps.size or fps[-1] <= 0:
+                raise ValueError("No negative samples in y, false positive value should be meaningless.")
+            if tps[-1] <= 0:
+                raise ValueError("No positive samples in y, true positive value should be meaningless.")
+            fpr = np.hstack([np.zeros(1), fps / fps[-1]])
+            tpr = np.hstack([np.zeros(1), tps / tps[-1]])
+            thresholds = np.hstack([thresholds[0] + 1, thresholds])
+            curves.append((fpr, tpr, thresholds))
+        return curves
+
+    def _per_class(self, results):
+        """Return the result of binary problems, or the list of the results of each class."""
+        if self._histograms.shape[1] == 1:
+            return results[0]
+        return results
+
+
+class StreamingROC(_StreamingCurve):
+    """
+    Calculate the ROC curve from the histograms of the scores, in bounded memory over any number of samples. It is
+    suitable for solving binary classification and multi classification problems. In the case of multiclass, the values
+    will be calculated based on a one-vs-the-rest approach.
+
+    Unlike `ROC`, the updates accumulate, so the curve of an epoch is evaluated without keeping its predictions. The
+    points of the curve are the exact ones at the lower edges of the non-empty bins of the width
+    `(score_range[1] - score_range[0]) / num_bins`, so the thresholds are within a bin width of the exact ones.
+
+    Args:
+        class_num (int): Integer with the number of classes. For the problem of binary classification, it is not
+                         necessary to provide this argument. Default: None.
+        pos_label (int): Determine the integer of positive class. For binary problems, it is translated to 1. For
+                         multiclass problems, this argument should not be set. Default: None.
+        num_bins (int): The number of the bins of the histograms. Default: 10000.
+        score_range (tuple): The lower and upper bounds of the scores, the scores out of it are counted in the first or
+                             the last bin. Default: (0.0, 1.0).
+
+    Examples:
+        >>> x = Tensor(np.array([0.9, 0.3, 0.7, 0.1]))
+        >>> y = Tensor(np.array([1, 0, 1, 0]))
+        >>> metric = StreamingROC(num_bins=10)
+        >>> metric.clear()
+        >>> metric.update(x, y)
+        >>> fpr, tpr, thresholds = metric.eval()
+        [0., 0., 0., 0.5, 1.]
+        [0., 0.5, 1., 1., 1.]
+        [1.9, 0.9, 0.7, 0.3, 0.1]
+    """
+    def eval(self):
+        """
+        Computes the ROC curve.
+
+        Returns:
+            A tuple, composed of `fpr`, `tpr`, and `thresholds`.
+
+            - **fpr** (np.array) - np.array with false positive rates. If multiclass, this is a list of such np.array,
+                                   one for each class.
+            - **tpr** (np.array) - np.array with true positive rates. If multiclass, this is a list of such np.array,
+                                   one for each class.
+            - **thresholds** (np.array) - thresholds used for computing false- and true postive rates.
+        """
+        curves = self._roc_curves()
+        return tuple(self._per_class(list(results)) for results in zip(*curves))
+
+
+class StreamingAUC(_StreamingCurve):
+    """
+    Calculate the area under the ROC curve from the histograms of the scores, in bounded memory over any number of
+    samples.
+
+    The area counts a positive and a negative sample of the same bin as a half, like a tie of the scores. So the error
+    from the exact AUC is not greater than half of the fraction of the positive and negative pairs sharing a bin,
+    :math:`\\frac{1}{2PN} \\sum_b p_b n_b \\le \\frac{1}{2} \\max_b \\frac{n_b}{N}`, where :math:`p_b` and
+    :math:`n_b` are the positive and negative counts of the bin :math:`b`, :math:`P` and :math:`N` are the total ones.
+    `error_bound` returns it.
+
+    Args:
+        class_num (int): Integer with the number of classes. For the problem of binary classification, it is not
+                         necessary to provide this argument. Default: None.
+        pos_label (int): Determine the integer of positive class. For binary problems, it is translated to 1. For
+                         multiclass problems, this argument should not be set. Default: None.
+        num_bins (int): The number of the bins of the histograms. Default: 10000.
+        score_range (tuple): The lower and upper bounds of the scores, the scores out of it are counted in the first or
+                             the last bin. Default: (0.0, 1.0).
+
+    Examples:
+        >>> x = Tensor(np.array([0.9, 0.3, 0.7, 0.1]))
+        >>> y = Tensor(np.array([1, 0, 1, 0]))
+        >>> metric = StreamingAUC(num_bins=10)
+        >>> metric.clear()
+        >>> metric.update(x, y)
+        >>> area = metric.eval()
+        1.0
+    """
+    def eval(self):
+        """
+        Computes the AUC.
+
+        Returns:
+            Float, the area under the ROC curve. If multiclass, this is a list of such float, one for each class.
+        """
+        return self._per_class([float(auc(fpr, tpr)) for fpr, tpr, _ in self._roc_curves()])
+
+    def error_bound(self):
+        """
+        Computes the bound of the error of the AUC.
+
+        Returns:
+            Float, the maximum difference between the AUC and the exact one. If multiclass, this is a list of such
+            float, one for each class.
+        """
+        if self._is_update is False:
+            raise RuntimeError('Call the update method before calling error_bound.')
+        bounds = []
+        for pos, neg in zip(self._histograms[0], self._histograms[1]):
+            pairs = float(pos.sum()) * float(neg.sum())
+            bounds.append(float(np.dot(pos.astype(np.float64), neg)) / (2 * pairs) if pairs else 0.0)
+        return self._per_class(bounds)
+
+
+class StreamingPrecisionRecall(_StreamingCurve):
+    """
+    Calculate the precision recall curve from the histograms of the scores, in bounded memory over any number of
+    samples. In the case of multiclass, the values will be calculated based on a one-vs-the-rest approach.
+
+    The points of the curve are the exact ones at the lower edges of the non-empty bins, in the descending order of the
+    thresholds, see `StreamingROC`.
+
+    Args:
+        class_num (int): Integer with the number of classes. For the problem of binary classification, it is not
+                         necessary to provide this argument. Default: None.
+        pos_label (int): Determine the integer of positive class. For binary problems, it is translated to 1. For
+                         multiclass problems, this argument should not be set. Default: None.
+        num_bins (int): The number of the bins of the histograms. Default: 10000.
+        score_range (tuple): The lower and upper bounds of the scores, the scores out of it are counted in the first or
+                             the last bin. Default: (0.0, 1.0).
+
+    Examples:
+        >>> x = Tensor(np.array([0.9, 0.3, 0.7, 0.1]))
+        >>> y = Tensor(np.array([1, 0, 1, 0]))
+        >>> metric = StreamingPrecisionRecall(num_bins=10)
+        >>> metric.clear()
+        >>> metric.update(x, y)
+        >>> precision, recall, thresholds = metric.eval()
+        [1., 1., 0.66666667, 0.5]
+        [0.5, 1., 1., 1.]
+        [0.9, 0.7, 0.3, 0.1]
+    """
+    def eval(self):
+        """
+        Computes the precision recall curve.
+
+        Returns:
+            A tuple, composed of `precision`, `recall`, and `thresholds`.
+
+            - **precision** (np.array) - np.array with precisions. If multiclass, this is a list of such np.array,
+                                         one for each class.
+            - **recall** (np.array) - np.array with recalls. If multiclass, this is a list of such np.array,
+                                      one for each class.
+            - **thresholds** (np.array) - thresholds used for computing precisions and recalls.
+        """
+        curves = []
+        for fps, tps, thresholds in self._binary_curves():
+            if not tps.size or tps[-1] <= 0:
+                raise ValueError("No positive samples in y, recall value should be meaningless.")
+            curves.append((tps / (tps + fps), tps / tps[-1], thresholds))
+        return tuple(self._per_class(list(results)) for results in zip(*curves))
@@ -118,6 +118,47 @@ def _convert_to_new_device_coordinate(device_coordinate, tensor_map):
     return device_coordinate_new
 
 
+def _get_tensor_slice_offset(tensor_strategy, slice_shape, slice_index):
+    """
+    Get the offset of a tensor slice in the whole tensor.
+
+    Args:
+        tensor_strategy (list): The split strategy with the same size of the tensor.
+        slice_shape (list): The shape of the tensor slice.
+        slice_index (int): The index of the tensor slice, slices are numbered in row-major order.
+
+    Returns:
+        List, the start index of the slice in each dimension of the whole tensor.
+    """
+    offset = []
+    slice_index = int(slice_index)
+    for i in range(len(tensor_strategy) - 1, -1, -1):
+        offset.insert(0, slice_index % tensor_strategy[i] * slice_shape[i])
+        slice_index = slice_index // tensor_strategy[i]
+    return offset
+
+
+def _get_unique_slice_ranks(dev_mat, tensor_map):
+    """
+    Get the first rank holding each slice of a tensor, repeated slices on other ranks are ignored.
+
+    Args:
+        dev_mat (list): The device matrix of devices.
+        tensor_map (list): The split strategy of tensor.
+
+    Returns:
+        Dict, key is the slice index, value is the first rank holding the slice.
+    """
+    tensor_strategy = _get_tensor_strategy(dev_mat, tensor_map)
+    device_count = int(np.prod(dev_mat))
+    slice_ranks = {}
+    for rank in range(device_count):
+        slice_index = int(_get_tensor_slice_index(dev_mat, tensor_strategy, tensor_map, rank))
+        if slice_index not in slice_ranks:
+            slice_ranks[slice_index] = rank
+    return slice_ranks
+
+
 def _chunk_tensor(np_tensor, strategy, depth):
     """
     Recursive function to chunk tensor.
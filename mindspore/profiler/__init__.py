@@ -24,5 +24,6 @@ Now, Profiler supports the AICore operator analysis.
 """
 from mindspore.profiler.profiling import Profiler
 from mindspore.profiler.profiling import ProfileOption
+from mindspore.profiler.common.step_sampler import StepSampler
 
-__all__ = ["Profiler", "ProfileOption"]
+__all__ = ["Profiler", "ProfileOption", "StepSampler"]
@@ -0,0 +1,135 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""The sampler of the profiled steps."""
+import numpy as np
+
+
+def _check_positive_int(value, name, allow_none=False):
+    """Check the value is a positive int."""
+    if value is None and allow_none:
+        return
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise TypeError("The parameter {} must be int, but got {}.".format(name, type(value).__name__))
+    if value < 1:
+        raise ValueError("The parameter {} must be positive, but got {}.".format(name, value))
+
+
+class StepSampler:
+    """
+    Select the steps whose profiling data are analysed.
+
+    The steps are sampled in windows of `window_steps` consecutive steps, a window starts every `step_interval`
+    steps from `start_step` until `stop_step`. For example, `StepSampler(start_step=10, step_interval=100,
+    window_steps=5)` samples the steps 10 to 14, 110 to 114 and so on. The sampled steps can be limited further to a
+    time window, and only the most recent `max_windows` windows can be retained, like a ring buffer.
+
+    Args:
+        start_step (int): The first sampled step, the steps are numbered from 1. Default: 1.
+        stop_step (int, optional): The last sampled step. Default: None, to the end.
+        step_interval (int): The number of the steps between the starts of two windows. Default: 1.
+        window_steps (int): The number of the consecutive steps of a window, not greater than `step_interval`.
+            Default: 1.
+        time_window (tuple[float], optional): The start and end seconds, relative to the start of the first profiled
+            step, of the steps sampled. A step is sampled if it starts within [start, end). Default: None.
+        max_windows (int, optional): The number of the most recent windows retained. Default: None, all the windows.
+
+    Examples:
+        >>> from mindspore.profiler import Profiler, StepSampler
+        >>> profiler = Profiler(step_sampler=StepSampler(start_step=100, step_interval=1000, window_steps=10,
+        >>>                                              max_windows=5))
+    """
+
+    def __init__(self, start_step=1, stop_step=None, step_interval=1, window_steps=1, time_window=None,
+                 max_windows=None):
+        _check_positive_int(start_step, 'start_step')
+        _check_positive_int(stop_step, 'stop_step', allow_none=True)
+        _check_positive_int(step_interval, 'step_interval')
+        _check_positive_int(window_steps, 'window_steps')
+        _check_positive_int(max_windows, 'max_windows', allow_none=True)
+        if stop_step is not None and stop_step < start_step:
+            raise ValueError("The parameter stop_step {} is less than start_step {}.".format(stop_step, start_step))
+        if step_interval > 1 and window_steps > step_interval:
+            raise ValueError("The parameter window_steps {} is greater than step_interval {}."
+                             .format(window_steps, step_interval))
+        if time_window is not None:
+            if not isinstance(time_window, (tuple, list)) or len(time_window) != 2 or \
+                    not all(isinstance(item, (int, float)) and not isinstance(item, bool) for item in time_window):
+                raise TypeError("The parameter time_window must be a tuple of the start and end seconds.")
+            if not 0 <= time_window[0] < time_window[1]:
+                raise ValueError("The parameter time_window {} must satisfy 0 <= start < end.".format(time_window))
+            time_window = tuple(time_window)
+        self._start_step = start_step
+        self._stop_step = stop_step
+        self._step_interval = step_interval
+        # a window of every step is the same as a single window of all the steps
+        self._window_steps = window_steps if step_interval > 1 else 1
+        self._time_window = time_window
+        self._max_windows = max_windows
+
+    def window_ids(self, step_nums):
+        """
+        Get the windows of the steps.
+
+        Args:
+            step_nums (numpy.ndarray): The numbers of the steps.
+
+        Returns:
+            numpy.ndarray, the window ID of each step, -1 if the step is not sampled.
+        """
+        step_nums = np.asarray(step_nums, dtype=np.int64)
+        offsets = step_nums - self._start_step
+        sampled = (offsets >= 0) & (offsets % self._step_interval < self._window_steps)
+        if self._stop_step is not None:
+            sampled &= step_nums <= self._stop_step
+        return np.where(sampled, offsets // self._step_interval, -1)
+
+    def select(self, step_nums, start_times, syscnt_per_second):
+        """
+        Select the sampled steps.
+
+        Args:
+            step_nums (numpy.ndarray): The numbers of the steps in time order.
+            start_times (numpy.ndarray): The start sys counts of the steps.
+            syscnt_per_second (int): The number of the sys counts in a second.
+
+        Returns:
+            numpy.ndarray, the bool mask of the sampled steps.
+        """
+        window_ids = self.window_ids(step_nums)
+        mask = window_ids >= 0
+        if self._time_window is not None and mask.size:
+            start_times = np.asarray(start_times, dtype=np.float64)
+            seconds = (start_times - start_times[0]) / syscnt_per_second
+            mask &= (seconds >= self._time_window[0]) & (seconds < self._time_window[1])
+        if self._max_windows is not None:
+            retained = np.unique(window_ids[mask])[-self._max_windows:]
+            mask &= np.isin(window_ids, retained)
+        return mask
+
+    def to_dict(self):
+        """
+        Get the parameters of the sampler.
+
+        Returns:
+            dict, the parameters.
+        """
+        return {
+            'start_step': self._start_step,
+            'stop_step': self._stop_step,
+            'step_interval': self._step_interval,
+            'window_steps': self._window_steps,
+            'time_window': self._time_window,
+            'max_windows': self._max_windows
+        }
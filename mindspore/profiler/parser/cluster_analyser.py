@@ -0,0 +1,161 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""The analyser of the step traces of the devices of a cluster."""
+import csv
+import json
+import os
+import stat
+
+import numpy as np
+
+from mindspore import log as logger
+from mindspore.profiler.common.exceptions.exceptions import ProfilerIOException
+from mindspore.profiler.common.util import PER_MS_SYSCNT
+from mindspore.profiler.common.validator.validate_path import validate_and_normalize_path
+
+SLOW_RANK_THRESHOLD_DEFAULT = 0.1
+
+
+def _round(value):
+    return round(float(value), 4)
+
+
+class ClusterStepTraceAnalyser:
+    """
+    Summarize the step traces of the devices of a cluster.
+
+    The summary has the distribution of the step time across the ranks, the slow ranks whose mean step time exceeds
+    the median of the ranks by the threshold, and the skew of the AllReduce operators. The AllReduce operators of a
+    step end together on all the ranks, so the rank that arrives last has the shortest duration, and the difference
+    of the durations between the ranks is the time the other ranks wait for it, which needs no synchronized clock.
+
+    Args:
+        profiling_dir (str): The directory of the parsed step trace files.
+        device_ids (list[str]): The IDs of the devices.
+        slow_rank_threshold (float): The relative excess of the mean step time of a slow rank over the median of the
+            ranks. Default: 0.1.
+    """
+    _file_name_step_trace = 'step_trace_raw_{}_detail_time.csv'
+    _file_name_summary = 'cluster_step_trace_summary.json'
+
+    def __init__(self, profiling_dir, device_ids, slow_rank_threshold=SLOW_RANK_THRESHOLD_DEFAULT):
+        self._profiling_dir = profiling_dir
+        self._device_ids = [str(device_id) for device_id in device_ids]
+        self._slow_rank_threshold = slow_rank_threshold
+        self._step_traces = {}
+
+    def _load_step_trace(self, device_id):
+        """Load the steps of a device, the average row is excluded, the time is in milliseconds."""
+        file_path = os.path.join(self._profiling_dir, self._file_name_step_trace.format(device_id))
+        file_path = validate_and_normalize_path(file_path)
+        if not os.path.isfile(file_path):
+            logger.warning('The step trace file of device %s does not exist.', device_id)
+            return None
+        with open(file_path, 'r') as file:
+            csv_reader = csv.reader(file)
+            header = next(csv_reader, None)
+            rows = [row for row in csv_reader if row and row[0] != '-']
+        if not header or not rows:
+            return None
+        columns = np.array(rows, dtype=np.float64).T
+        return {name: column / PER_MS_SYSCNT for name, column in zip(header, columns)
+                if name != 'step_num' and not name.endswith('_point')}
+
+    def _summarize_device(self, step_trace):
+        """Summarize the step time of a device."""
+        total = step_trace['total']
+        summary = {
+            'steps': int(total.size),
+            'mean': _round(total.mean()),
+            'median': _round(np.median(total)),
+            'p90': _round(np.percentile(total, 90)),
+            'max': _round(total.max())
+        }
+        for name in ('iteration_interval', 'fp_and_bp', 'fp', 'tail'):
+            if name in step_trace:
+                summary[name] = _round(step_trace[name].mean())
+        return summary
+
+    def _summarize_all_reduce(self, device_ids):
+        """Summarize the skew of the AllReduce operators shared by all the ranks."""
+        fields = set.intersection(*[{name for name in self._step_traces[device_id] if name.startswith('stream_')}
+                                    for device_id in device_ids])
+        summary = {}
+        for field in sorted(fields):
+            num_steps = min(self._step_traces[device_id][field].size for device_id in device_ids)
+            # durations of the ranks x steps
+            durations = np.stack([self._step_traces[device_id][field][:num_steps] for device_id in device_ids])
+            wait = durations.max(axis=0) - durations.min(axis=0)
+            last_arrivals = np.bincount(durations.argmin(axis=0), minlength=len(device_ids))
+            summary[field] = {
+                'mean_duration': {device_id: _round(durations[i].mean()) for i, device_id in enumerate(device_ids)},
+                'mean_wait_skew': _round(wait.mean()),
+                'max_wait_skew': _round(wait.max()),
+                'last_arrival_steps': {device_id: int(last_arrivals[i]) for i, device_id in enumerate(device_ids)
+                                       if last_arrivals[i]}
+            }
+        return summary
+
+    def analyse(self):
+        """
+        Analyse the step traces of the devices.
+
+        Returns:
+            dict, the summary of the cluster.
+        """
+        for device_id in self._device_ids:
+            step_trace = self._load_step_trace(device_id)
+            if step_trace is not None and 'total' in step_trace:
+                self._step_traces[device_id] = step_trace
+        device_ids = list(self._step_traces)
+        devices = {device_id: self._summarize_device(self._step_traces[device_id]) for device_id in device_ids}
+        summary = {'devices': devices, 'missing_devices': [d for d in self._device_ids if d not in devices]}
+        if not devices:
+            return summary
+
+        means = np.array([devices[device_id]['mean'] for device_id in device_ids])
+        median = np.median(means)
+        summary['step_time'] = {
+            'min': _round(means.min()),
+            'median': _round(median),
+            'max': _round(means.max()),
+            'skew': _round(means.max() - means.min()),
+            'fastest_rank': device_ids[int(means.argmin())],
+            'slowest_rank': device_ids[int(means.argmax())]
+        }
+        summary['slow_ranks'] = [device_id for device_id, mean in zip(device_ids, means)
+                                 if mean > median * (1 + self._slow_rank_threshold)]
+        summary['all_reduce'] = self._summarize_all_reduce(device_ids)
+        return summary
+
+    def save(self, summary):
+        """
+        Save the summary of the cluster into a json file.
+
+        Args:
+            summary (dict): The summary of the cluster.
+
+        Returns:
+            str, the path of the summary file.
+        """
+        file_path = validate_and_normalize_path(os.path.join(self._profiling_dir, self._file_name_summary))
+        try:
+            with open(file_path, 'w') as json_file:
+                json.dump(summary, json_file, indent=4)
+            os.chmod(file_path, stat.S_IREAD | stat.S_IWRITE)
+        except (IOError, OSError) as err:
+            logger.error('Error occurred when write cluster summary file: %s', err)
+            raise ProfilerIOException
+        return file_path
@@ -0,0 +1,134 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""The columnar store of the parsed profiling data."""
+import os
+import stat
+
+import numpy as np
+
+
+class ColumnarStore:
+    """
+    A table of the parsed profiling data, kept in a numpy structured array and saved as a npy file.
+
+    The filters of the columns are vectorized, and the indexes of the columns, mapping a value to its rows, are built
+    once when they are queried at the first time.
+
+    Args:
+        data (numpy.ndarray): The structured array of the table.
+    """
+
+    def __init__(self, data):
+        self._data = data
+        self._indexes = {}
+
+    @classmethod
+    def from_columns(cls, columns):
+        """
+        Create a store from its columns.
+
+        Args:
+            columns (list[tuple]): The names and values of the columns, the values are str or float.
+
+        Returns:
+            ColumnarStore, the store.
+        """
+        arrays = [np.asarray(values) if len(values) else np.zeros(0, dtype=str) for _, values in columns]
+        dtype = [(name, array.dtype) for (name, _), array in zip(columns, arrays)]
+        data = np.empty(len(arrays[0]) if arrays else 0, dtype=dtype)
+        for (name, _), array in zip(columns, arrays):
+            data[name] = array
+        return cls(data)
+
+    @classmethod
+    def load(cls, file_path):
+        """
+        Load a store from its npy file.
+
+        Args:
+            file_path (str): The path of the npy file.
+
+        Returns:
+            ColumnarStore, the store.
+        """
+        return cls(np.load(file_path, allow_pickle=False))
+
+    def save(self, file_path):
+        """
+        Save the store into a npy file.
+
+        Args:
+            file_path (str): The path of the npy file.
+        """
+        with open(file_path, 'wb') as npy_file:
+            np.save(npy_file, self._data, allow_pickle=False)
+        os.chmod(file_path, stat.S_IREAD | stat.S_IWRITE)
+
+    def __len__(self):
+        return len(self._data)
+
+    @property
+    def data(self):
+        """numpy.ndarray, the structured array of the table."""
+        return self._data
+
+    def column(self, name):
+        """Get the values of a column."""
+        return self._data[name]
+
+    def index(self, name):
+        """
+        Get the index of a column.
+
+        Args:
+            name (str): The name of the column.
+
+        Returns:
+            dict, mapping a value of the column to the ascending indexes of its rows.
+        """
+        if name not in self._indexes:
+            values, inverse = np.unique(self._data[name], return_inverse=True)
+            order = np.argsort(inverse, kind='stable')
+            bounds = np.cumsum(np.bincount(inverse, minlength=len(values)))
+            self._indexes[name] = {value: rows for value, rows in zip(values.tolist(), np.split(order, bounds[:-1]))}
+        return self._indexes[name]
+
+    def match(self, name, exp_key, exp_value):
+        """
+        Match the values of a column with a condition.
+
+        Args:
+            name (str): The name of the column.
+            exp_key (str): The kind of the condition, `in`, `not_in` or `partial_match_str_in`.
+            exp_value (list): The values of the condition.
+
+        Returns:
+            numpy.ndarray, the bool mask of the matched rows.
+        """
+        column = self._data[name]
+        if exp_key == 'partial_match_str_in':
+            mask = np.zeros(len(column), dtype=bool)
+            for partial_match_str in exp_value:
+                mask |= np.char.find(column, partial_match_str) >= 0
+            return mask
+        if exp_key in ('in', 'not_in'):
+            index = self.index(name)
+            mask = np.zeros(len(column), dtype=bool)
+            for value in set(exp_value):
+                rows = index.get(value)
+                if rows is not None:
+                    mask[rows] = True
+            return mask if exp_key == 'in' else ~mask
+        return np.zeros(len(column), dtype=bool)
@@ -13,13 +13,33 @@
 # limitations under the License.
 # ============================================================================
 """The parser for hwts log file."""
+import mmap
 import os
-import struct
+import numpy as np
 from mindspore.profiler.common.util import fwrite_format, get_file_join_name
 from mindspore import log as logger
 from mindspore.profiler.common.validator.validate_path import \
     validate_and_normalize_path
 
+HWTS_RECORD_SIZE = 64
+# The fields of a 64 bytes hwts record, the layouts of the log types overlap:
+# the log type 0 to 3 have the syscnt at offset 8, the log type 4 has it at offset 24.
+HWTS_RECORD_DTYPE = np.dtype({
+    'names': ['head', 'core_id', 'blk_id', 'task_id', 'syscnt', 'stream_id', 'pmu_syscnt'],
+    'formats': ['u1', 'u1', '<u2', '<u2', '<u8', '<u4', '<u8'],
+    'offsets': [0, 1, 4, 6, 8, 16, 24],
+    'itemsize': HWTS_RECORD_SIZE})
+# The columnar output of the parsed records, syscnt is invalid when syscnt_valid is False.
+HWTS_COLUMN_DTYPE = np.dtype([('log_type', 'u1'), ('cnt', 'u1'), ('core_id', 'u1'), ('blk_id', 'u2'),
+                              ('task_id', 'u2'), ('stream_id', 'u4'), ('syscnt', 'u8'), ('syscnt_valid', '?')])
+_PARSE_CHUNK_RECORDS = 1 << 20
+_BLOCK_PMU_TYPE = 4
+# The task ids less than it are printed with their stream ids
+_STREAM_TASK_ID_LIMIT = 25000
+# bytes.strip() removes these bytes, a record made up of them is skipped
+_WHITESPACE_BYTES = np.frombuffer(b' \t\n\r\x0b\x0c', dtype=np.uint8)
+
+
 class HWTSLogParser:
     """
     The Parser for hwts log files.
@@ -27,16 +47,28 @@ class HWTSLogParser:
     Args:
          input_path (str): The profiling job path. Such as: '/var/log/npu/profiling/JOBAIFGJEJFEDCBAEADIFJAAAAAAAAAA".
          output_filename (str): The output data path and name. Such as: './output_format_data_hwts_0.txt'.
+         columnar_filename (str, optional): The path and name of the columnar output, the parsed records are saved as
+             a numpy structured array of `HWTS_COLUMN_DTYPE`. Such as: './output_format_data_hwts_0.npy'.
+             Default: None.
+         time_ranges (numpy.ndarray, optional): The start and end sys counts of the sampled steps, one row a step, the
+             records out of them are skipped. Default: None, all the records.
     """
 
     _source_file_target_old = 'hwts.log.data.45.dev.profiler_default_tag'
     _source_file_target = 'hwts.data'
     _dst_file_title = 'title:45 HWTS data'
     _dst_file_column_title = 'Type           cnt  Core_ID  Block_ID  Task_ID  Cycle_counter   Stream_ID'
+    _log_type = ['Start of task', 'End of task', 'Start of block', 'End of block', 'Block PMU']
 
-    def __init__(self, input_path, output_filename):
+    def __init__(self, input_path, output_filename, columnar_filename=None, time_ranges=None):
         self._input_path = input_path
         self._output_filename = output_filename
+        self._columnar_filename = columnar_filename
+        self._time_ranges = None
+        if time_ranges is not None:
+            time_ranges = np.asarray(time_ranges, dtype=np.uint64).reshape(-1, 2)
+            self._time_ranges = time_ranges[np.argsort(time_ranges[:, 0], kind='stable')]
+        self._last_record_kept = True
         self._source_flie_name = self._get_source_file()
 
     def _get_source_file(self):
@@ -56,64 +88,129 @@ class HWTSLogParser:
 
         return file_name
 
-    def execute(self):
+    @staticmethod
+    def parse_records(records):
         """
-        Execute the parser, get result data, and write it to the output file.
+        Decode the hwts records.
+
+        Args:
+            records (numpy.ndarray): The records of `HWTS_RECORD_DTYPE`.
 
         Returns:
-            bool, whether succeed to analyse hwts log.
+            numpy.ndarray, the valid records of `HWTS_COLUMN_DTYPE`, the records made up of whitespace bytes and the
+            records of invalid log types are skipped.
+        """
+        raw = records.view(np.uint8).reshape(-1, HWTS_RECORD_SIZE)
+        head = records['head']
+        # bits 0-2 of the head refer to the log type, bit 3 to is_warn_res0_ov and bits 4-7 to the count
+        log_type = head & 0x7
+        is_warn_res0_ov = (head >> 3) & 0x1
+        keep = ~np.isin(raw, _WHITESPACE_BYTES).all(axis=1)
+        invalid = keep & (log_type > _BLOCK_PMU_TYPE)
+        if invalid.any():
+            logger.info("Profiling: %d invalid hwts log records of types %s", int(invalid.sum()),
+                        np.unique(log_type[invalid]).tolist())
+        keep &= ~invalid
+
+        is_pmu = log_type[keep] == _BLOCK_PMU_TYPE
+        columns = np.empty(int(keep.sum()), dtype=HWTS_COLUMN_DTYPE)
+        columns['log_type'] = log_type[keep]
+        columns['cnt'] = head[keep] >> 4
+        columns['core_id'] = records['core_id'][keep]
+        columns['blk_id'] = records['blk_id'][keep]
+        columns['task_id'] = records['task_id'][keep]
+        columns['stream_id'] = records['stream_id'][keep]
+        columns['syscnt'] = np.where(is_pmu, records['pmu_syscnt'][keep], records['syscnt'][keep])
+        columns['syscnt_valid'] = ~is_pmu | (is_warn_res0_ov[keep] == 0)
+        return columns
+
+    def filter_records(self, columns):
+        """
+        Keep the parsed records within the time ranges of the sampled steps.
+
+        A record without a valid sys count follows the previous record, across the chunks of the records.
+
+        Args:
+            columns (numpy.ndarray): The parsed records of `HWTS_COLUMN_DTYPE`.
+
+        Returns:
+            numpy.ndarray, the records kept.
         """
+        if self._time_ranges is None or not columns.size:
+            return columns
+        syscnt = columns['syscnt']
+        # the last range starting before the record, the ranges of the steps do not overlap
+        range_index = np.searchsorted(self._time_ranges[:, 0], syscnt, side='right') - 1
+        keep = range_index >= 0
+        keep[keep] = syscnt[keep] <= self._time_ranges[range_index[keep], 1]
+        valid = columns['syscnt_valid']
+        if not valid.all():
+            # index of the latest valid record, -1 before the first one of the chunk
+            latest = np.maximum.accumulate(np.where(valid, np.arange(valid.size), -1))
+            keep = np.where(valid, keep, np.where(latest >= 0, keep[np.maximum(latest, 0)],
+                                                  self._last_record_kept))
+        self._last_record_kept = bool(keep[-1])
+        return columns[keep]
 
-        content_format = ['QIIIIIIIIIIII', 'QIIQIIIIIIII', 'IIIIQIIIIIIII']
-        log_type = ['Start of task', 'End of task', 'Start of block', 'End of block', 'Block PMU']
+    def format_records(self, columns):
+        """
+        Format the parsed records into the lines of the text output.
+
+        Args:
+            columns (numpy.ndarray): The parsed records of `HWTS_COLUMN_DTYPE`.
+
+        Returns:
+            str, the lines of the records.
+        """
+        stream_ids = columns['stream_id'].tolist()
+        task_ids = columns['task_id'].tolist()
+        task_ids = [str(stream_id) + "_" + str(task_id) if task_id < _STREAM_TASK_ID_LIMIT else task_id
+                    for stream_id, task_id in zip(stream_ids, task_ids)]
+        syscnts = [syscnt if valid else None
+                   for syscnt, valid in zip(columns['syscnt'].tolist(), columns['syscnt_valid'].tolist())]
+        log_types = [self._log_type[log_type] for log_type in columns['log_type'].tolist()]
+        return "".join(["%-14s %-4s %-8s %-9s %-8s %-15s %s\n" % row
+                        for row in zip(log_types, columns['cnt'].tolist(), columns['core_id'].tolist(),
+                                       columns['blk_id'].tolist(), task_ids, syscnts, stream_ids)])
+
+    def execute(self):
+        """
+        Execute the parser, get result data, and write it to the output file.
 
-        result_data = ""
+        The whole file is mapped and decoded in chunks of records with numpy, the lines of each chunk are written at
+        once.
 
+        Returns:
+            bool, whether succeed to analyse hwts log.
+        """
         self._source_flie_name = validate_and_normalize_path(self._source_flie_name)
-        with open(self._source_flie_name, 'rb') as hwts_data:
-            while True:
-                # read 64 bit data
-                line = hwts_data.read(64)
-                if line:
-                    if not line.strip():
-                        continue
-                else:
-                    break
-                byte_first_four = struct.unpack('BBHHH', line[0:8])
-                # byte_first[0:4] refers to count. byte_first[4] refers to is_warn_res0_0v.
-                # byte_first[5:8] refers to the type of ms.
-                byte_first = bin(byte_first_four[0]).replace('0b', '').zfill(8)
-                ms_type = byte_first[-3:]
-                is_warn_res0_ov = byte_first[4]
-                cnt = int(byte_first[0:4], 2)
-                core_id = byte_first_four[1]
-                blk_id, task_id = byte_first_four[3], byte_first_four[4]
-                if ms_type in ['000', '001', '010']:  # log type 0,1,2
-                    result = struct.unpack(content_format[0], line[8:])
-                    syscnt = result[0]
-                    stream_id = result[1]
-                elif ms_type == '011':  # log type 3
-                    result = struct.unpack(content_format[1], line[8:])
-                    syscnt = result[0]
-                    stream_id = result[1]
-                elif ms_type == '100':  # log type 4
-                    result = struct.unpack(content_format[2], line[8:])
-                    stream_id = result[2]
-                    if is_warn_res0_ov == '0':
-                        syscnt = result[4]
-                    else:
-                        syscnt = None
-                else:
-                    logger.info("Profiling: invalid hwts log record type %s", ms_type)
-                    continue
-
-                if int(task_id) < 25000:
-                    task_id = str(stream_id) + "_" + str(task_id)
-                result_data += ("%-14s %-4s %-8s %-9s %-8s %-15s %s\n" %(log_type[int(ms_type, 2)], cnt, core_id,
-                                                                         blk_id, task_id, syscnt, stream_id))
 
         fwrite_format(self._output_filename, data_source=self._dst_file_title, is_start=True)
         fwrite_format(self._output_filename, data_source=self._dst_file_column_title)
-        fwrite_format(self._output_filename, data_source=result_data)
+
+        column_chunks = []
+        with open(self._source_flie_name, 'rb') as hwts_data, open(self._output_filename, 'a+') as output:
+            file_size = os.fstat(hwts_data.fileno()).st_size
+            num_records = file_size // HWTS_RECORD_SIZE
+            if file_size % HWTS_RECORD_SIZE:
+                logger.warning("Profiling: the hwts log file has %d trailing bytes of an incomplete record, "
+                               "ignore them.", file_size % HWTS_RECORD_SIZE)
+            if num_records:
+                with mmap.mmap(hwts_data.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    for start in range(0, num_records, _PARSE_CHUNK_RECORDS):
+                        count = min(_PARSE_CHUNK_RECORDS, num_records - start)
+                        records = np.frombuffer(buffer, dtype=HWTS_RECORD_DTYPE, count=count,
+                                                offset=start * HWTS_RECORD_SIZE)
+                        columns = self.filter_records(self.parse_records(records))
+                        del records
+                        output.write(self.format_records(columns))
+                        if self._columnar_filename is not None:
+                            column_chunks.append(columns)
+            # the same trailing line as the text of all the records written at once
+            output.write("\n")
+
+        if self._columnar_filename is not None:
+            columns = np.concatenate(column_chunks) if column_chunks else np.empty(0, dtype=HWTS_COLUMN_DTYPE)
+            np.save(self._columnar_filename, columns)
 
         return True
@@ -19,12 +19,16 @@ import os
 import stat
 from decimal import Decimal
 
+import numpy as np
+
 from mindspore import log as logger
 from mindspore.profiler.common.exceptions.exceptions import ProfilerIOException, \
     ProfilerFileNotFoundException, ProfilerRawFileException, ProfilerParamValueErrorException
 from mindspore.profiler.common.util import query_latest_trace_time_file, to_int, to_millisecond
 from mindspore.profiler.common.validator.validate_path import validate_and_normalize_path
+from mindspore.profiler.parser.columnar_store import ColumnarStore
 from mindspore.profiler.parser.container import TimelineContainer
+from mindspore.profiler.parser.timeline_writer import TimelineWriter
 
 SIZE_LIMIT_DEFAULT = 20 * 1024 * 1024  # 20MB
 
@@ -51,16 +55,18 @@ class Integrator:
     _file_name_aicore_detail_info = 'aicore_intermediate_{}_detail.csv'
     _col_names_detail = ['op_name', 'op_type', 'avg_execution_time', 'subgraph', 'full_op_name', 'op_info']
     _none_filter_condition_key = ['is_display_detail', 'is_display_full_op_name']
+    _file_name_aicore_detail_store = 'aicore_intermediate_{}_detail.npy'
     _none_sort_col_names = ['op_info']
-    _aicore_data = []
-    _aicore_detail_data = []
-    _aicore_trace_data = []
 
     def __init__(self, profiling_dir, device_id):
         self._profiling_dir = profiling_dir
         self._device_id = device_id
         self._op_time_cache = {}
         self._total_time = Decimal('0.0')
+        self._aicore_data = []
+        self._aicore_detail_data = []
+        self._aicore_detail_store = None
+        self._aicore_trace_data = []
 
     def integrate(self):
         """Integrate the parsed profiling files."""
@@ -74,6 +80,8 @@ class Integrator:
 
     def get_aicore_detail_data(self):
         self._aicore_detail_data_load()
+        if not self._aicore_detail_data and self._aicore_detail_store is not None:
+            self._aicore_detail_data = self._store_rows(np.arange(len(self._aicore_detail_store)))
         return self._aicore_detail_data
 
     def get_aicore_trace_data(self):
@@ -206,6 +214,7 @@ class Integrator:
             logger.warning('The file <%s> does not exist.', op_type_file_path)
             return
 
+        self._aicore_data = []
         with open(op_type_file_path, 'r') as file:
             csv_reader = csv.reader(file)
             _ = next(csv_reader)
@@ -213,7 +222,12 @@ class Integrator:
                 self._aicore_data.append([info[0], float(info[1]), int(info[2]), float(info[3])])
 
     def _aicore_detail_data_load(self):
-        """Load data according to the parsed AICORE operator file."""
+        """
+        Load data according to the parsed AICORE operator file into the columnar store. The store is saved as a npy
+        file, which is loaded instead of the csv files until they are updated.
+        """
+        if self._aicore_detail_store is not None:
+            return
         op_detail_file_path = os.path.join(
             self._profiling_dir,
             self._file_name_aicore_detail_info.format(self._device_id)
@@ -222,8 +236,13 @@ class Integrator:
             self._profiling_dir,
             self._file_name_framework.format(self._device_id)
         )
+        store_file_path = os.path.join(
+            self._profiling_dir,
+            self._file_name_aicore_detail_store.format(self._device_id)
+        )
         op_detail_file_path = validate_and_normalize_path(op_detail_file_path)
         framework_file_path = validate_and_normalize_path(framework_file_path)
+        store_file_path = validate_and_normalize_path(store_file_path)
         if not os.path.isfile(op_detail_file_path):
             logger.warning('The file <%s> does not exist.', op_detail_file_path)
             return
@@ -231,27 +250,60 @@ class Integrator:
             logger.warning('The file <%s> does not exist.', framework_file_path)
             return
 
+        if os.path.isfile(store_file_path) and os.path.getmtime(store_file_path) >= max(
+                os.path.getmtime(op_detail_file_path), os.path.getmtime(framework_file_path)):
+            try:
+                self._aicore_detail_store = ColumnarStore.load(store_file_path)
+                return
+            except (IOError, OSError, ValueError) as err:
+                logger.warning('Failed to load the AICORE detail store, rebuild it: %s', err)
+
         framework_infos = dict()
         with open(framework_file_path, 'r') as file:
             csv_reader = csv.reader(file)
             _ = next(csv_reader)
             for info in csv_reader:
-                framework_infos[info[3]] = [
-                    info[3], info[4], info[5], info[6], json.loads(info[7]) if info[7] else None]
+                framework_infos[info[3]] = info[3:8]
 
+        columns = [[] for _ in self._col_names_detail]
         with open(op_detail_file_path, 'r') as file:
             csv_reader = csv.reader(file)
             _ = next(csv_reader)
             for info in csv_reader:
                 framework_info = framework_infos.get(info[0])
-                self._aicore_detail_data.append(
-                    [
-                        framework_info[1], framework_info[2], float(info[1]),
-                        framework_info[3], framework_info[0], framework_info[4]
-                    ]
-                )
+                if framework_info is None:
+                    logger.warning('The framework info of operator <%s> does not exist.', info[0])
+                    continue
+                for column, value in zip(columns, (framework_info[1], framework_info[2], float(info[1]),
+                                                   framework_info[3], framework_info[0], framework_info[4])):
+                    column.append(value)
         del framework_infos
 
+        self._aicore_detail_store = ColumnarStore.from_columns(list(zip(self._col_names_detail, columns)))
+        try:
+            self._aicore_detail_store.save(store_file_path)
+        except (IOError, OSError) as err:
+            logger.warning('Failed to save the AICORE detail store: %s', err)
+
+    def _store_rows(self, rows, col_names=None):
+        """
+        Get the rows of the AICORE detail store as lists, the operator info is decoded from json.
+
+        Args:
+            rows (numpy.ndarray): The indexes of the rows.
+            col_names (list[str]): The names of the columns. Default: None, all the columns.
+
+        Returns:
+            list[list], the rows.
+        """
+        col_names = col_names or self._col_names_detail
+        data = self._aicore_detail_store.data[rows]
+        columns = [data[name].tolist() for name in col_names]
+        if 'op_info' in col_names:
+            index = col_names.index('op_info')
+            columns[index] = [json.loads(info) if info else None for info in columns[index]]
+        return [list(row) for row in zip(*columns)]
+
     def _aicore_trace_data_load(self):
         """Load data according to the parsed AICORE operator types file."""
         file_path = query_latest_trace_time_file(self._profiling_dir, int(self._device_id))
@@ -370,24 +422,17 @@ class Integrator:
             filter_condition = {}
         self._filter(filter_condition)
 
-        type_detail_cache = {}
-        for detail_info in self._result:
-            op_type = detail_info[1]
-            if op_type not in op_type_order:
-                continue
-            infos = type_detail_cache.get(op_type)
-            if infos:
-                infos.append(detail_info)
-            else:
-                type_detail_cache[op_type] = [detail_info]
-
         result = []
-        for op_type in op_type_order:
-            detail_infos = type_detail_cache.get(op_type)
-            if detail_infos is None:
-                continue
-            detail_infos.sort(key=lambda item: item[2], reverse=True)
-            result.extend(detail_infos)
+        if self._aicore_detail_store is not None:
+            type_index = self._aicore_detail_store.index('op_type')
+            execution_time = self._aicore_detail_store.column('avg_execution_time')
+            for op_type in op_type_order:
+                rows = type_index.get(op_type)
+                if rows is None:
+                    continue
+                rows = rows[self._result_mask[rows]]
+                rows = rows[np.argsort(-execution_time[rows], kind='stable')]
+                result.extend(self._store_rows(rows, self._display_col_names_detail))
 
         return {
             'col_name_detail': self._display_col_names_detail,
@@ -396,56 +441,33 @@ class Integrator:
 
     def _filter(self, filter_condition):
         """
-        Filter the profiling data according to the filter condition.
+        Filter the profiling data according to the filter condition, the mask of the matched rows is kept.
 
         Args:
             filter_condition (dict): The filter condition.
         """
-        def _inner_filter(item: list):
-            return self._default_filter(item, filter_condition)
-
-        def _inner_map(item: list):
-            inner_item = item[0:4]
-            if is_display_full_op_name:
-                inner_item.append(item[4])
-            if is_display_detail:
-                inner_item.append(item[5])
-            return inner_item
-
         is_display_detail = filter_condition.get('is_display_detail', True)
         is_display_full_op_name = filter_condition.get(
             'is_display_full_op_name', True
         )
         self._set_display_col_name(is_display_detail, is_display_full_op_name)
-        if is_display_detail and is_display_full_op_name:
-            self._result = list(filter(_inner_filter, self._aicore_detail_data))
-        else:
-            self._result = list(
-                map(_inner_map, filter(_inner_filter, self._aicore_detail_data))
-            )
-
-    def _default_filter(self, item, condition):
-        """
-        The default filter method.
-
-        Args:
-            item (list[Union[str, float, int]]): A piece of data to be filtered.
-            condition (dict): The filter condition.
+        if self._aicore_detail_store is None:
+            self._result_mask = np.zeros(0, dtype=bool)
+            return
 
-        Returns:
-            bool, `True` if the item is satisfied.
-        """
-        for condition_key, condition_value in condition.items():
-            if condition_key in self._none_filter_condition_key:
+        mask = np.ones(len(self._aicore_detail_store), dtype=bool)
+        for condition_key, condition_value in filter_condition.items():
+            if condition_key in self._none_filter_condition_key or condition_key not in self._col_names_detail:
                 continue
-            if condition_key in self._col_names_detail:
-                index = self._col_names_detail.index(condition_key)
-                actual_value = item[index]
-                for exp_key, exp_value in condition_value.items():
-                    if not self._is_match_condition(
-                            exp_key, exp_value, actual_value):
-                        return False
-        return True
+            for exp_key, exp_value in condition_value.items():
+                if condition_key in self._none_sort_col_names:
+                    # the operator info is json, matched row by row
+                    infos = self._aicore_detail_store.column(condition_key).tolist()
+                    mask &= np.array([self._is_match_condition(exp_key, exp_value, json.loads(info) if info else None)
+                                      for info in infos], dtype=bool)
+                else:
+                    mask &= self._aicore_detail_store.match(condition_key, exp_key, exp_value)
+        self._result_mask = mask
 
     def _is_match_condition(self, exp_key, exp_value, actual_value):
         """
@@ -516,36 +538,37 @@ class BaseTimelineGenerator:
     def init_timeline(self):
         """Init timeline metadata, adding all collected info."""
 
-    def write_timeline(self, size_limit=SIZE_LIMIT_DEFAULT):
-        """Load data according to the parsed profiling files."""
+    def write_timeline(self, size_limit=SIZE_LIMIT_DEFAULT, columnar=False):
+        """
+        Load data according to the parsed profiling files.
+
+        Args:
+            size_limit (int): The max size in bytes of a display file. Default: 20MB.
+            columnar (bool): Whether to save the timeline in a columnar npz file too. Default: False.
+        """
         # Write timeline to file.
         logger.info('Writing timeline file...')
-        self.write_timeline_to_json_by_limitation(size_limit)
+        self.write_timeline_to_json_by_limitation(size_limit, columnar)
         logger.info('Finished file writing!')
 
-    def write_timeline_to_json_by_limitation(self, size_limit):
-        """Write timeline to json by limitation."""
+    def write_timeline_to_json_by_limitation(self, size_limit, columnar=False):
+        """
+        Write timeline to json files of limited size, the events beyond the limit go to the following files.
+
+        Args:
+            size_limit (int): The max size in bytes of a display file.
+            columnar (bool): Whether to save the timeline in a columnar npz file too. Default: False.
+        """
         display_filename = self._display_filename.format(self._device_id)
         display_file_path = os.path.join(
             self._profiling_dir,
             display_filename
         )
-        display_file_path = validate_and_normalize_path(display_file_path)
+        columnar_file_path = os.path.splitext(display_file_path)[0] + '.npz' if columnar else None
 
-        length = len(self._timeline_meta)
         try:
-            with open(display_file_path, 'w') as json_file:
-                json_file.write('[')
-                for index, item in enumerate(self._timeline_meta):
-                    json.dump(item, json_file)
-                    file_size = os.path.getsize(display_file_path)
-                    if file_size > size_limit:
-                        break
-                    if index == length - 1:
-                        break
-                    json_file.write(',')
-                json_file.write(']')
-                os.chmod(display_file_path, stat.S_IREAD | stat.S_IWRITE)
+            with TimelineWriter(display_file_path, size_limit, columnar_file_path=columnar_file_path) as writer:
+                writer.write_all(self._timeline_meta)
         except (IOError, OSError) as err:
             logger.error('Error occurred when write timeline display file: %s', err)
             raise ProfilerIOException
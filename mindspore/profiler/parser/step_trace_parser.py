@@ -21,10 +21,12 @@ import struct
 from collections import namedtuple
 from decimal import Decimal
 
+import numpy as np
+
 from mindspore.profiler.common.exceptions.exceptions import ProfilerPathErrorException, \
     JobIdMismatchException, ProfilerIOException, ProfilerRawFileException
 from mindspore import log
-from mindspore.profiler.common.util import get_summary_for_step_trace
+from mindspore.profiler.common.util import get_summary_for_step_trace, PER_MS_SYSCNT
 from mindspore.profiler.common.validator.validate_path import \
     validate_and_normalize_path
 
@@ -43,9 +45,13 @@ class BaseStepTraceParser:
         job_id (int): The job id used to define the start of new step. Default: 0.
         skip_first_step (bool): Whether skip the first step or not.
         is_training_mode (bool): Whether in training mode or not.
+        step_sampler (StepSampler, optional): The sampler of the steps saved. Default: None, all the steps.
     """
+    # the number of the sys counts of the step trace in a second
+    _syscnt_per_second = 10 ** 9
 
-    def __init__(self, input_dir, output_file_path, job_id=0, skip_first_step=False, is_training_mode=True):
+    def __init__(self, input_dir, output_file_path, job_id=0, skip_first_step=False, is_training_mode=True,
+                 step_sampler=None):
         self._input_dir = input_dir
         self._output_path = output_file_path
         self._job_id = job_id
@@ -56,6 +62,7 @@ class BaseStepTraceParser:
         self._tag_map = {}
         self._is_training_mode = is_training_mode
         self._step_end_tag_id = 255
+        self._step_sampler = step_sampler
 
     @property
     def output_file(self):
@@ -63,6 +70,16 @@ class BaseStepTraceParser:
         file_name = self._output_path.rsplit('/', 2)
         return file_name[-1] if len(file_name) == 3 else ''
 
+    @property
+    def step_time_ranges(self):
+        """
+        numpy.ndarray, the start and end sys counts of the saved steps, one row a step.
+        """
+        if len(self._result) < 2:
+            return np.zeros((0, 2), dtype=np.int64)
+        start_index, end_index = self._header.index('start_point'), self._header.index('end_point')
+        return np.array([[row[start_index], row[end_index]] for row in self._result[:-1]], dtype=np.int64)
+
     def show(self):
         """The property of step trace info."""
         summary_info = {}
@@ -304,21 +321,34 @@ class BaseStepTraceParser:
         ret_dict = {}
         return ret_dict
 
+    def _sample_steps(self):
+        """Keep the steps selected by the step sampler."""
+        if self._step_sampler is None or not self._result:
+            return
+        step_index, start_index = self._header.index('step_num'), self._header.index('start_point')
+        mask = self._step_sampler.select([row[step_index] for row in self._result],
+                                         [row[start_index] for row in self._result], self._syscnt_per_second)
+        log.info("Sample %d of %d steps for step trace analysis.", int(mask.sum()), len(self._result))
+        self._result = [row for row, keep in zip(self._result, mask.tolist()) if keep]
+
     def _record_average_info(self):
         """Calculate average info."""
-        result_size = len(self._result)
+        self._sample_steps()
+        # the first step is excluded from the average, the other sampled steps are included
+        step_num_index = self._header.index('step_num') if self._header else 0
+        average_rows = [row_info for row_info in self._result if row_info[step_num_index] != 1]
+        result_size = len(average_rows)
         # calculate average data for each column in result data
         average_data = [0] * len(self._header)
-        if result_size >= 2:
-            for row_info in self._result[1:]:
+        if result_size >= 1:
+            for row_info in average_rows:
                 average_data = [
                     Decimal(i) + Decimal(j) for i, j in zip(row_info, average_data)
                 ]
             average_data = [
-                round((item / (result_size - 1))) for item in average_data
+                round((item / result_size)) for item in average_data
             ]
             # change step num info in average_data to None
-            step_num_index = self._header.index('step_num')
             average_data[step_num_index] = '-'
         self._result.append(average_data)
         log.info("Finish add average info for step trace.")
@@ -474,6 +504,7 @@ class GpuStepTraceParser(BaseStepTraceParser):
 
 class AscendStepTraceParser(BaseStepTraceParser):
     """The parser for ascend step trace data."""
+    _syscnt_per_second = PER_MS_SYSCNT * 1000
     _event_size = 20
     _fp_tag = 1
     _bp_tag = 2
@@ -501,10 +532,13 @@ class AscendStepTraceParser(BaseStepTraceParser):
             }
         if os.path.exists(output_path):
             return points
+        # the devices of a cluster may be analysed concurrently, the file is published by a rename
+        tmp_path = '{}.{}'.format(output_path, os.getpid())
         try:
-            with open(output_path, 'w') as json_file:
+            with open(tmp_path, 'w') as json_file:
                 json.dump(points, json_file)
-            os.chmod(output_path, stat.S_IRUSR)
+            os.chmod(tmp_path, stat.S_IRUSR)
+            os.replace(tmp_path, output_path)
         except (IOError, OSError) as err:
             log.warning('Failed to save point info. %s', err)
             raise ProfilerIOException
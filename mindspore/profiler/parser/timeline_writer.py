@@ -0,0 +1,180 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""The streaming writer of the timeline display files."""
+import json
+import os
+import stat
+
+import numpy as np
+
+from mindspore.profiler.common.validator.validate_path import validate_and_normalize_path
+
+BUFFER_SIZE_DEFAULT = 1024 * 1024  # 1MB
+
+
+class TimelineWriter:
+    """
+    Write the timeline events into Chrome trace json files in a stream.
+
+    The events are encoded and buffered in memory, and the size of the output is counted while encoding. When a file
+    would exceed the size limit, the following events go to the next file, so no event is dropped. The first file is
+    the display file itself, the following ones are named with the suffix `_part{n}`. An index file records the file
+    names with the time window and the number of the events of each file. Optionally the events are also saved in a
+    compact columnar npz file.
+
+    Args:
+        file_path (str): The path of the display file.
+        size_limit (int, optional): The max size in bytes of a display file, None means unlimited. Default: None.
+        buffer_size (int): The size in bytes of the encoded events buffered before writing. Default: 1MB.
+        columnar_file_path (str, optional): The path of the columnar npz file. Default: None.
+    """
+
+    def __init__(self, file_path, size_limit=None, buffer_size=BUFFER_SIZE_DEFAULT, columnar_file_path=None):
+        self._file_path = validate_and_normalize_path(file_path)
+        self._size_limit = size_limit
+        self._buffer_size = buffer_size
+        self._columnar_file_path = columnar_file_path
+        self._base_path, self._ext = os.path.splitext(self._file_path)
+        self._file = None
+        self._files = []
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._file_bytes = 0
+        self._file_events = 0
+        self._window = None
+        self._columns = {'name': [], 'pid': [], 'tid': [], 'ts': [], 'dur': []} if columnar_file_path else None
+
+    @property
+    def index_file_path(self):
+        """str, the path of the index file."""
+        return self._base_path + '_index' + self._ext
+
+    def _part_path(self, part):
+        if not part:
+            return self._file_path
+        return '{}_part{}{}'.format(self._base_path, part, self._ext)
+
+    def _open_part(self):
+        """Open the next display file."""
+        path = self._part_path(len(self._files))
+        self._file = open(path, 'w')
+        self._files.append({'file': os.path.basename(path), 'start_ts': None, 'end_ts': None, 'num_events': 0})
+        self._file.write('[')
+        self._file_bytes = 1
+        self._file_events = 0
+        self._window = self._files[-1]
+
+    def _flush(self):
+        if self._buffer:
+            self._file.write(''.join(self._buffer))
+            self._buffer = []
+            self._buffer_bytes = 0
+
+    def _close_part(self):
+        """Close the current display file."""
+        self._flush()
+        self._file.write(']')
+        self._file.close()
+        os.chmod(self._part_path(len(self._files) - 1), stat.S_IREAD | stat.S_IWRITE)
+        self._window['num_events'] = self._file_events
+        self._file = None
+
+    def write(self, event):
+        """
+        Write an event.
+
+        Args:
+            event (dict): The timeline event in Chrome trace format.
+        """
+        encoded = json.dumps(event)
+        if self._file is None:
+            self._open_part()
+        elif self._size_limit is not None and self._file_events and \
+                self._file_bytes + len(encoded) + 2 > self._size_limit:
+            self._close_part()
+            self._open_part()
+        if self._file_events:
+            encoded = ',' + encoded
+        self._buffer.append(encoded)
+        self._buffer_bytes += len(encoded)
+        self._file_bytes += len(encoded)
+        self._file_events += 1
+        if self._buffer_bytes >= self._buffer_size:
+            self._flush()
+
+        ts = event.get('ts')
+        if ts is not None:
+            end_ts = ts + event.get('dur', 0)
+            if self._window['start_ts'] is None or ts < self._window['start_ts']:
+                self._window['start_ts'] = ts
+            if self._window['end_ts'] is None or end_ts > self._window['end_ts']:
+                self._window['end_ts'] = end_ts
+        if self._columns is not None:
+            for key, column in self._columns.items():
+                column.append(event.get(key))
+
+    def write_all(self, events):
+        """
+        Write the events.
+
+        Args:
+            events (iterable): The timeline events in Chrome trace format.
+        """
+        for event in events:
+            self.write(event)
+
+    def _write_columnar(self):
+        """Save the events in the columnar file, the names are saved once and referred to by their indexes."""
+        names, name_ids = np.unique(np.array([str(name) for name in self._columns['name']]), return_inverse=True)
+        columns = {'names': names, 'name_id': name_ids.astype(np.int32)}
+        for key in ('pid', 'tid'):
+            values = self._columns[key]
+            try:
+                columns[key] = np.array(values, dtype=np.int64)
+            except (TypeError, ValueError):
+                columns[key] = np.array([str(value) for value in values])
+        for key in ('ts', 'dur'):
+            columns[key] = np.array([np.nan if value is None else value for value in self._columns[key]],
+                                    dtype=np.float64)
+        with open(self._columnar_file_path, 'wb') as columnar_file:
+            np.savez(columnar_file, **columns)
+        os.chmod(self._columnar_file_path, stat.S_IREAD | stat.S_IWRITE)
+
+    def close(self):
+        """
+        Close the display files and write the index file.
+
+        Returns:
+            list[dict], the display files with their time windows and numbers of events.
+        """
+        if self._file is None and not self._files:
+            self._open_part()
+        if self._file is not None:
+            self._close_part()
+        with open(self.index_file_path, 'w') as index_file:
+            json.dump(self._files, index_file)
+        os.chmod(self.index_file_path, stat.S_IREAD | stat.S_IWRITE)
+        if self._columns is not None:
+            self._write_columnar()
+        return self._files
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        elif self._file is not None:
+            self._file.close()
@@ -17,16 +17,19 @@ import os
 import stat
 import time
 import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from enum import Enum
 
 from mindspore import log as logger, context
 from mindspore.communication.management import release, get_rank
 from mindspore.profiler.common.exceptions.exceptions import ProfilerFileNotFoundException, \
     ProfilerIOException, ProfilerException
+from mindspore.profiler.common.step_sampler import StepSampler
 from mindspore.profiler.common.util import get_file_names, fwrite_format
 from mindspore.profiler.common.validator.validate_path import \
     validate_and_normalize_path
 from mindspore.profiler.parser.aicpu_data_parser import DataPreProcessParser
+from mindspore.profiler.parser.cluster_analyser import ClusterStepTraceAnalyser, SLOW_RANK_THRESHOLD_DEFAULT
 from mindspore.profiler.parser.framework_parser import FrameworkParser
 from mindspore.profiler.parser.hwts_log_parser import HWTSLogParser
 from mindspore.profiler.parser.integrator import Integrator
@@ -39,6 +42,8 @@ from mindspore.profiler.parser.step_trace_parser import GpuStepTraceParser, Asce
 from mindspore.nn.cell import Cell
 
 INIT_OP_NAME = 'Default/InitDataSetQueue'
+# The number of the threads running the parsers of a device concurrently
+_ANALYSE_THREADS = 4
 
 class ProfileOption(Enum):
     """
@@ -60,6 +65,10 @@ class Profiler:
             and analysed,will deal with all op if null; Different op types should be separated by comma.
         ascend_job_id (str): (Ascend only) The directory where the profiling files to be parsed are located;
             This parameter is used to support offline parsing.
+        timeline_columnar (bool): Whether to save the timeline in a columnar npz file besides the json display files.
+            Default: False.
+        step_sampler (StepSampler, optional): The sampler of the steps analysed. The step trace of the other steps,
+            and on Ascend their operator and timeline data, are skipped when parsing. Default: None, all the steps.
 
     Examples:
         >>> from mindspore.profiler import Profiler
@@ -77,11 +86,29 @@ class Profiler:
     _aicpu_op_output_filename_target = "output_data_preprocess_aicpu_"
 
     def __init__(self, **kwargs):
+        # the Ascend device whose data are analysed offline by analyse_cluster, the profiling is not started then
+        offline_dev_id = kwargs.pop("_offline_dev_id", None)
         # get device_id and device_target
-        self._get_devid_and_devtarget()
+        if offline_dev_id is None:
+            self._get_devid_and_devtarget()
+        else:
+            self._dev_id, self._device_target = offline_dev_id, "Ascend"
         format_time = int(time.time())
         output_path = kwargs.pop("output_path", f"data-{format_time}")
+        self._timeline_columnar = kwargs.pop("timeline_columnar", False)
+        if not isinstance(self._timeline_columnar, bool):
+            raise TypeError("The parameter timeline_columnar must be bool.")
+        self._step_sampler = kwargs.pop("step_sampler", None)
+        if self._step_sampler is not None and not isinstance(self._step_sampler, StepSampler):
+            raise TypeError("The parameter step_sampler must be StepSampler.")
+        if self._step_sampler is not None:
+            logger.info("Profiling: sample the steps by %s", self._step_sampler.to_dict())
         self._output_path = validate_and_normalize_path(output_path)
+        if offline_dev_id is not None:
+            self._init_ascend_analysis(kwargs.pop("optypes_not_deal", "Variable"))
+            if kwargs:
+                logger.warning("There are invalid params which don't work.")
+            return
         self._output_path = os.path.join(self._output_path, f"profiler-{format_time}")
         if not os.path.exists(self._output_path):
             os.makedirs(self._output_path, exist_ok=True)
@@ -105,9 +132,7 @@ class Profiler:
             if kwargs:
                 logger.warning("Params not be supported yet on GPU.")
         elif self._device_target and self._device_target == "Ascend":
-            optypes_not_deal = kwargs.pop("optypes_not_deal", "Variable")
-            if not isinstance(optypes_not_deal, str):
-                raise TypeError("The parameter optypes_not_deal must be str.")
+            self._init_ascend_analysis(kwargs.pop("optypes_not_deal", "Variable"))
             job_dir = kwargs.pop("ascend_job_id", "")
             if job_dir:
                 job_dir = validate_and_normalize_path(job_dir)
@@ -148,12 +173,17 @@ class Profiler:
             if not os.path.exists(data_path):
                 os.makedirs(data_path, exist_ok=True)
 
-            self._filt_optype_names = optypes_not_deal.split(",") if optypes_not_deal else []
-            # add job id env through user input later
-            self._job_id_env = 0
             self._start_time = int(time.time() * 10000000)
             logger.info("Profiling: profiling start time: %d", self._start_time)
 
+    def _init_ascend_analysis(self, optypes_not_deal):
+        """Set up the analysis of the Ascend data, shared by the profiling and the offline analysis."""
+        if not isinstance(optypes_not_deal, str):
+            raise TypeError("The parameter optypes_not_deal must be str.")
+        self._filt_optype_names = optypes_not_deal.split(",") if optypes_not_deal else []
+        # add job id env through user input later
+        self._job_id_env = 0
+
     def analyse(self):
         """
         Collect and analyse performance data, called after training or during training.
@@ -196,24 +226,163 @@ class Profiler:
 
             job_id = self._get_profiling_job_id()
             logger.info("Profiling: job id is %s ", job_id)
+            self._ascend_analyse(job_id)
 
-            source_path = os.path.join(self._output_path, job_id)
-            # parse hwts.log.data.45.dev file, and get task profiling data
-            hwts_output_filename = self._hwts_output_filename_target + self._dev_id + ".txt"
-            hwts_output_filename = os.path.join(self._output_path, hwts_output_filename)
-            source_path = validate_and_normalize_path(source_path)
-            hwts_output_filename = validate_and_normalize_path(hwts_output_filename)
-            hwtslog_parser = HWTSLogParser(source_path, hwts_output_filename)
-            _ = hwtslog_parser.execute()
+            os.environ['PROFILING_MODE'] = str("false")
+            context.set_context(enable_profiling=False)
+
+    @classmethod
+    def analyse_cluster(cls, profiling_dir, num_workers=None, optypes_not_deal="Variable",
+                        slow_rank_threshold=SLOW_RANK_THRESHOLD_DEFAULT, step_sampler=None):
+        """
+        Analyse the profiling data of all the devices of an Ascend job offline and summarize the cluster.
+
+        The devices are analysed in parallel by a pool of processes. The summary has the distribution of the step
+        time across the ranks, the slow ranks and the skew of the AllReduce operators, and it is saved into
+        cluster_step_trace_summary.json under `profiling_dir`.
+
+        Args:
+            profiling_dir (str): The directory containing the JOB directories of the devices.
+            num_workers (int, optional): The number of the processes. Default: None, the number of CPUs.
+            optypes_not_deal (str): Op type names whose data are not analysed, separated by comma. Default: "Variable".
+            slow_rank_threshold (float): The relative excess of the mean step time of a slow rank over the median of
+                the ranks. Default: 0.1.
+            step_sampler (StepSampler, optional): The sampler of the steps analysed. Default: None, all the steps.
+
+        Returns:
+            dict, the summary of the cluster.
+
+        Examples:
+            >>> from mindspore.profiler import Profiler
+            >>> summary = Profiler.analyse_cluster("/path/to/profiler")
+            >>> print(summary['slow_ranks'])
+        """
+        if not isinstance(optypes_not_deal, str):
+            raise TypeError("The parameter optypes_not_deal must be str.")
+        if step_sampler is not None and not isinstance(step_sampler, StepSampler):
+            raise TypeError("The parameter step_sampler must be StepSampler.")
+        profiling_dir = validate_and_normalize_path(profiling_dir)
+        device_jobs = cls._get_device_jobs(profiling_dir)
+        if not device_jobs:
+            msg = "Fail to get profiling job, please check whether job dir was generated"
+            raise RuntimeError(msg)
+        logger.info("Profiling: analyse the jobs of %d devices: %s", len(device_jobs), device_jobs)
+
+        num_workers = min(num_workers or os.cpu_count() or 1, len(device_jobs))
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = {executor.submit(_analyse_device, profiling_dir, job_id, dev_id, optypes_not_deal,
+                                       step_sampler): dev_id
+                       for dev_id, job_id in device_jobs.items()}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    logger.info("Profiling: finish analysing device %s.", futures[future])
+                except Exception as err:  # pylint: disable=W0703
+                    logger.error("Profiling: fail to analyse device %s, %s", futures[future], err)
+
+        analyser = ClusterStepTraceAnalyser(profiling_dir, sorted(device_jobs, key=int), slow_rank_threshold)
+        summary = analyser.analyse()
+        analyser.save(summary)
+        return summary
+
+    @classmethod
+    def _get_device_jobs(cls, profiling_dir):
+        """
+        Get the profiling jobs of the devices, the latest one is taken if a device has several jobs.
+
+        Args:
+            profiling_dir (str): The directory containing the JOB directories.
+
+        Returns:
+            dict, the job ID of each device ID.
+        """
+        device_jobs = {}
+        start_times = {}
+        for item in sorted(os.listdir(profiling_dir)):
+            path = os.path.join(profiling_dir, item)
+            if not item.startswith('JOB') or not os.path.isdir(path):
+                continue
+            log_file = get_file_names(path, "host_start.log")
+            if not log_file:
+                logger.warning("Profiling: job path %s, host_start.log not exist.", path)
+                continue
+            item_dict = cls._parse_host_start_log(os.path.join(path, log_file[0]))
+            dev_id = item_dict.get("device_id")
+            if not dev_id or not dev_id.isdigit():
+                logger.warning("Profiling: job path %s, fail to get job start info.", path)
+                continue
+            start_time = item_dict.get("start_time", "")
+            start_time = int(start_time) if start_time.isdigit() else 0
+            if dev_id not in device_jobs or start_time > start_times[dev_id]:
+                device_jobs[dev_id] = item
+                start_times[dev_id] = start_time
+        return device_jobs
+
+    @classmethod
+    def _create_offline(cls, output_path, dev_id, optypes_not_deal, step_sampler=None):
+        """Create a profiler analysing the data of an Ascend device offline, the profiling is not started."""
+        return cls(output_path=output_path, _offline_dev_id=dev_id, optypes_not_deal=optypes_not_deal,
+                   step_sampler=step_sampler)
+
+    @staticmethod
+    def _run_and_warn(func, *args):
+        """Run a step of the analysis, its profiler exception is logged instead of raised, None is returned then."""
+        try:
+            return func(*args)
+        except ProfilerException as err:
+            logger.warning(err.message)
+        return None
+
+    def _parse_minddata_pipeline(self):
+        """Parse the minddata pipeline operator and queue, the parser raises if the pipeline file is missing."""
+        pipeline_parser = MinddataPipelineParser(self._output_path, self._dev_id, self._output_path)
+        pipeline_parser.parse()
+
+    def _ascend_analyse(self, job_id):
+        """
+        Analyse the profiling data of an Ascend device, the parsers independent of each other run concurrently.
+
+        Args:
+            job_id (str): The profiling job ID of the device.
+        """
+        source_path = os.path.join(self._output_path, job_id)
+        # parse hwts.log.data.45.dev file, and get task profiling data
+        hwts_output_filename = self._hwts_output_filename_target + self._dev_id + ".txt"
+        hwts_output_filename = os.path.join(self._output_path, hwts_output_filename)
+        source_path = validate_and_normalize_path(source_path)
+        hwts_output_filename = validate_and_normalize_path(hwts_output_filename)
+
+        # parse Framework file, and get the relation of op and tasks
+        framework_parser = FrameworkParser(job_id, self._dev_id, self._output_path)
+
+        # parse DATA_PREPROCESS.dev.AICPU file, write output_data_preprocess_aicpu_x.txt
+        output_data_preprocess_aicpu = self._aicpu_op_output_filename_target + self._dev_id + ".txt"
+        output_data_preprocess_aicpu = os.path.join(self._output_path, output_data_preprocess_aicpu)
+        output_data_preprocess_aicpu = validate_and_normalize_path(output_data_preprocess_aicpu)
+        aicpu_data_parser = DataPreProcessParser(source_path, output_data_preprocess_aicpu)
+
+        with ThreadPoolExecutor(max_workers=_ANALYSE_THREADS) as executor:
+            # the raw data files are parsed independently, including minddata AICPU, pipeline operator and queue
+            futures = [executor.submit(framework_parser.parse),
+                       executor.submit(aicpu_data_parser.execute),
+                       executor.submit(MinddataParser.execute, source_path, self._output_path, self._dev_id),
+                       executor.submit(self._run_and_warn, self._parse_minddata_pipeline)]
+            if self._step_sampler is None:
+                futures.append(executor.submit(HWTSLogParser(source_path, hwts_output_filename).execute))
+            for future in futures:
+                future.result()
 
-            # parse Framework file, and get the relation of op and tasks
-            framework_parser = FrameworkParser(job_id, self._dev_id, self._output_path)
-            framework_parser.parse()
             op_task_dict = framework_parser.to_task_id_full_op_name_dict()
             if not op_task_dict:
                 logger.error("Profiling: fail to parse framework files.")
                 return
 
+            if self._step_sampler is not None:
+                # the hwts records are kept within the time ranges of the sampled steps
+                step_trace_parser = self._run_and_warn(self._analyse_step_trace, source_path, framework_parser)
+                time_ranges = step_trace_parser.step_time_ranges if step_trace_parser else None
+                HWTSLogParser(source_path, hwts_output_filename, time_ranges=time_ranges).execute()
+
             # get op compute time from hwts data and framework data, write output_op_compute_time.txt
             opcompute_output_filename = self._opcompute_output_filename_target + self._dev_id + ".txt"
             opcompute_output_filename = os.path.join(self._output_path, opcompute_output_filename)
@@ -222,45 +391,24 @@ class Profiler:
                 hwts_output_filename, opcompute_output_filename,
                 op_task_dict, self._output_path, self._dev_id
             )
-            optime_parser.execute()
-
-            # parse DATA_PREPROCESS.dev.AICPU file, write output_data_preprocess_aicpu_x.txt
-            output_data_preprocess_aicpu = self._aicpu_op_output_filename_target + self._dev_id + ".txt"
-            output_data_preprocess_aicpu = os.path.join(self._output_path, output_data_preprocess_aicpu)
-            output_data_preprocess_aicpu = validate_and_normalize_path(output_data_preprocess_aicpu)
-            aicpu_data_parser = DataPreProcessParser(source_path, output_data_preprocess_aicpu)
-            aicpu_data_parser.execute()
-
-            # Parsing minddata AICPU profiling
-            MinddataParser.execute(source_path, self._output_path, self._dev_id)
-
-            # parse minddata pipeline operator and queue
-            try:
-                pipeline_parser = MinddataPipelineParser(self._output_path, self._dev_id, self._output_path)
-                pipeline_parser.parse()
-            except ProfilerException as err:
-                logger.warning(err.message)
-
-            # analyse op compute time info
-            try:
-                self._analyser_op_info()
-            except ProfilerException as err:
-                logger.warning(err.message)
-
-            # analyse step trace info
-            try:
-                self._analyse_step_trace(source_path, framework_parser)
-            except ProfilerException as err:
-                logger.warning(err.message)
-
-            # analyse timeline info
-            try:
-                self._analyse_timeline(aicpu_data_parser, optime_parser)
-            except (ProfilerIOException, ProfilerFileNotFoundException, RuntimeError) as err:
-                logger.warning('Fail to write timeline data: %s', err)
-
-            os.environ['PROFILING_MODE'] = str("false")
-            context.set_context(enable_profiling=False)
+            if self._step_sampler is None:
+                # the step trace depends on the framework info only, analyse it while computing the op time
+                futures = [executor.submit(optime_parser.execute),
+                           executor.submit(self._run_and_warn, self._analyse_step_trace, source_path,
+                                           framework_parser)]
+                for future in futures:
+                    future.result()
+            else:
+                optime_parser.execute()
+
+        # analyse op compute time info
+        self._run_and_warn(self._analyser_op_info)
+
+        # analyse timeline info
+        try:
+            self._analyse_timeline(aicpu_data_parser, optime_parser)
+        except (ProfilerIOException, ProfilerFileNotFoundException, RuntimeError) as err:
+            logger.warning('Fail to write timeline data: %s', err)
 
     def _analyse_step_trace(self, source_path=None, framework_parser=None, is_training_mode_flag=True):
         """
@@ -270,6 +418,9 @@ class Profiler:
             source_path (str): The directory that contains the step trace original data.
             framework_parser (FrameworkParser): The framework parse instance.
             is_training_mode_flag (bool): Whether in training mode or not.
+
+        Returns:
+            BaseStepTraceParser, the parser of the step trace.
         """
         logger.info("Begin to parse step trace.")
         # construct output path
@@ -291,7 +442,8 @@ class Profiler:
             )
             parser = GpuStepTraceParser(input_dir=input_file_path,
                                         output_file_path=step_trace_intermediate_file_path,
-                                        is_training_mode=is_training_mode_flag)
+                                        is_training_mode=is_training_mode_flag,
+                                        step_sampler=self._step_sampler)
             parser.parse_and_save()
             point_info = parser.record_point_info(input_file_path, point_info_file_path)
         else:
@@ -306,7 +458,8 @@ class Profiler:
                                            output_file_path=step_trace_intermediate_file_path,
                                            job_id=self._job_id_env,
                                            skip_first_step=skip_first_step_flag,
-                                           is_training_mode=is_traning_mode_flag)
+                                           is_training_mode=is_traning_mode_flag,
+                                           step_sampler=self._step_sampler)
             parser.update_tag_op_type_map(point_info)
             parser.parse_and_save()
             point_info = parser.record_point_info(point_info, point_info_file_path)
@@ -314,6 +467,7 @@ class Profiler:
         parser.show()
         logger.info("Finish saving the intermediate result: %s", step_trace_intermediate_file_path)
         logger.info("The point info is: %s", point_info)
+        return parser
 
     def _analyse_timeline(self, aicpu_parser, optime_parser):
         """
@@ -349,7 +503,7 @@ class Profiler:
         min_cycle_counter = min(aicpu_parser.min_cycle_counter, optime_parser.min_cycle_counter)
         timeline_analyser.init_timeline(all_reduce_info, framework_info, aicpu_info, min_cycle_counter)
         size_limit = 20 * 1024 * 1024  # 20MB
-        timeline_analyser.write_timeline(size_limit)
+        timeline_analyser.write_timeline(size_limit, self._timeline_columnar)
         timeline_analyser.write_timeline_summary()
 
     def _generate_timeline(self):
@@ -358,7 +512,7 @@ class Profiler:
             size_limit = 100 * 1024 * 1024  # 100MB
             timeline_generator = GpuTimelineGenerator(self._output_path, self._dev_id)
             timeline_generator.init_timeline()
-            timeline_generator.write_timeline(size_limit)
+            timeline_generator.write_timeline(size_limit, self._timeline_columnar)
             timeline_generator.write_timeline_summary()
             return timeline_generator
         except (ProfilerIOException, ProfilerFileNotFoundException, RuntimeError) as err:
@@ -406,7 +560,8 @@ class Profiler:
 
         return job_id
 
-    def _parse_host_start_log(self, input_file):
+    @staticmethod
+    def _parse_host_start_log(input_file):
         """
         Parse host start log file, get the device id and start time of the job.
 
@@ -535,3 +690,18 @@ class Profiler:
             raise ValueError("Wrong options.")
 
         return result
+
+
+def _analyse_device(output_path, job_id, dev_id, optypes_not_deal, step_sampler=None):
+    """
+    Analyse the profiling data of an Ascend device in a worker process of the cluster analysis.
+
+    Args:
+        output_path (str): The directory containing the JOB directory of the device.
+        job_id (str): The profiling job ID of the device.
+        dev_id (str): The device ID.
+        optypes_not_deal (str): Op type names whose data are not analysed, separated by comma.
+        step_sampler (StepSampler, optional): The sampler of the steps analysed. Default: None, all the steps.
+    """
+    profiler = Profiler._create_offline(output_path, dev_id, optypes_not_deal, step_sampler)  # pylint: disable=W0212
+    profiler._ascend_analyse(job_id)  # pylint: disable=W0212
@@ -23,9 +23,10 @@ from . import amp
 from .amp import build_train_network
 from .loss_scale_manager import LossScaleManager, FixedLossScaleManager, DynamicLossScaleManager
 from .serialization import save_checkpoint, load_checkpoint, load_param_into_net, export, parse_print,\
-    build_searched_strategy, merge_sliced_parameter, load_distributed_checkpoint
+    build_searched_strategy, merge_sliced_parameter, load_distributed_checkpoint, save_sharded_checkpoint, \
+    load_sharded_checkpoint
 
 __all__ = ["Model", "DatasetHelper", "amp", "connect_network_with_dataset", "build_train_network", "LossScaleManager",
            "FixedLossScaleManager", "DynamicLossScaleManager", "save_checkpoint", "load_checkpoint",
            "load_param_into_net", "export", "parse_print", "build_searched_strategy", "merge_sliced_parameter",
-           "load_distributed_checkpoint"]
+           "load_distributed_checkpoint", "save_sharded_checkpoint", "load_sharded_checkpoint"]
@@ -0,0 +1,213 @@
+# Copyright 2020 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""
+Indexed raw checkpoint layout.
+
+The file is made up of a fixed size preamble, a json header and the raw tensor bytes::
+
+    | magic(8) | version(uint32) | header length(uint64) | header(json) | padding | tensor data ... |
+
+The header holds the tensor items and an optional base checkpoint. Every tensor item records the name, tensor
+type, dims, numpy dtype, and the offset(relative to the start of the data section) and byte size of one parameter.
+Each tensor is aligned to `RAW_CKPT_ALIGNMENT` bytes, so the file can be memory-mapped and every parameter viewed
+in place without copying or parsing.
+
+A file with a base is a delta checkpoint, it only holds the parameters changed since the base was saved, and the
+base path is relative to the directory of the delta file.
+"""
+import os
+import json
+import mmap
+import struct
+import numpy as np
+
+RAW_CKPT_MAGIC = b"MSCKPTRW"
+RAW_CKPT_VERSION = 1
+RAW_CKPT_ALIGNMENT = 64
+_PREAMBLE = struct.Struct("<8sIQ")
+_WRITE_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+def _align(size, alignment=RAW_CKPT_ALIGNMENT):
+    """Round size up to the next multiple of alignment."""
+    return (size + alignment - 1) // alignment * alignment
+
+
+def is_raw_checkpoint(ckpt_file_name):
+    """Check whether the file starts with the raw checkpoint magic number."""
+    with open(ckpt_file_name, "rb") as f:
+        return f.read(len(RAW_CKPT_MAGIC)) == RAW_CKPT_MAGIC
+
+
+def build_raw_header(data_list):
+    """
+    Build the header items of a raw checkpoint.
+
+    Args:
+        data_list (dict): Key is parameter name, value is a list of [dims, tensor_type, flatten numpy data].
+
+    Returns:
+        list[dict], the header items in the order of data_list.
+    """
+    items = []
+    offset = 0
+    for name, value in data_list.items():
+        data = value[2]
+        items.append({"name": name, "type": value[1], "dims": list(value[0]), "dtype": data.dtype.str,
+                      "offset": offset, "nbytes": int(data.nbytes)})
+        offset = _align(offset + data.nbytes)
+    return items
+
+
+def _pack_head(header, base=None):
+    """Pack the preamble and header, padded to the start of the data section."""
+    header_bytes = json.dumps({"tensors": header, "base": base}).encode("utf-8")
+    head = _PREAMBLE.pack(RAW_CKPT_MAGIC, RAW_CKPT_VERSION, len(header_bytes)) + header_bytes
+    return head + b"\0" * (_align(len(head)) - len(head))
+
+
+def write_raw_checkpoint(f, data_list, base=None):
+    """
+    Write data_list into an opened binary file with the raw layout.
+
+    Args:
+        f (file): File object opened in binary write mode.
+        data_list (dict): Key is parameter name, value is a list of [dims, tensor_type, flatten numpy data].
+        base (str): Path of the base checkpoint relative to the directory of the file, only set for a delta
+            checkpoint. Default: None.
+    """
+    header = build_raw_header(data_list)
+    f.write(_pack_head(header, base))
+
+    written = 0
+    for item in header:
+        data = np.ascontiguousarray(data_list[item["name"]][2])
+        if item["offset"] > written:
+            f.write(b"\0" * (item["offset"] - written))
+            written = item["offset"]
+        f.write(memoryview(data).cast("B"))
+        written += data.nbytes
+
+
+def _write_at(ckpt_file_name, offset, buffer):
+    """Write buffer into the file at offset, with a file handle of its own."""
+    with open(ckpt_file_name, "r+b") as f:
+        f.seek(offset)
+        f.write(buffer)
+
+
+def write_raw_checkpoint_parallel(ckpt_file_name, data_list, executor, base=None):
+    """
+    Write data_list into a file with the raw layout, the tensors are written concurrently by executor.
+
+    The header fixes the offset of every tensor, so the file is preallocated and the tensors, split into chunks
+    of at most `_WRITE_CHUNK_SIZE` bytes, are written into their own byte ranges independently.
+
+    Args:
+        ckpt_file_name (str): Checkpoint file name.
+        data_list (dict): Key is parameter name, value is a list of [dims, tensor_type, flatten numpy data].
+        executor (concurrent.futures.Executor): Executor that runs the writing tasks.
+        base (str): Path of the base checkpoint relative to the directory of the file, only set for a delta
+            checkpoint. Default: None.
+    """
+    header = build_raw_header(data_list)
+    head = _pack_head(header, base)
+    file_size = len(head)
+    if header:
+        file_size += header[-1]["offset"] + header[-1]["nbytes"]
+    with open(ckpt_file_name, "wb") as f:
+        f.write(head)
+        f.truncate(file_size)
+
+    futures = []
+    for item in header:
+        buffer = memoryview(np.ascontiguousarray(data_list[item["name"]][2])).cast("B")
+        for start in range(0, item["nbytes"], _WRITE_CHUNK_SIZE):
+            futures.append(executor.submit(_write_at, ckpt_file_name, len(head) + item["offset"] + start,
+                                           buffer[start:start + _WRITE_CHUNK_SIZE]))
+    for future in futures:
+        future.result()
+
+
+def read_raw_header(buffer):
+    """
+    Parse the preamble and header of a raw checkpoint.
+
+    Args:
+        buffer (Union[bytes, mmap.mmap]): Buffer of the whole file.
+
+    Returns:
+        Tuple, the header items, the base checkpoint and the offset of the data section.
+
+    Raises:
+        ValueError: The buffer is not a raw checkpoint or its version is not supported.
+    """
+    if len(buffer) < _PREAMBLE.size:
+        raise ValueError("The raw checkpoint file is truncated.")
+    magic, version, header_len = _PREAMBLE.unpack_from(buffer, 0)
+    if magic != RAW_CKPT_MAGIC:
+        raise ValueError("The file is not a raw checkpoint file.")
+    if version > RAW_CKPT_VERSION:
+        raise ValueError(f"The raw checkpoint version {version} is not supported, "
+                         f"the max supported version is {RAW_CKPT_VERSION}.")
+    header_end = _PREAMBLE.size + header_len
+    header = json.loads(bytes(buffer[_PREAMBLE.size:header_end]).decode("utf-8"))
+    return header["tensors"], header.get("base"), _align(header_end)
+
+
+class RawCheckpointReader:
+    """
+    Memory-mapped reader of a raw checkpoint file.
+
+    The tensors returned by `get` are read-only numpy views of the mapped file, the pages are only touched
+    when the data is used. The mapping is released when the reader and all the views are garbage collected.
+
+    Args:
+        ckpt_file_name (str): Checkpoint file name.
+    """
+    def __init__(self, ckpt_file_name):
+        with open(ckpt_file_name, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._header, self._base, self._data_offset = read_raw_header(self._mmap)
+        self._items = {item["name"]: item for item in self._header}
+        self._base_path = None
+        if self._base is not None:
+            self._base_path = os.path.join(os.path.dirname(os.path.realpath(ckpt_file_name)), self._base)
+
+    @property
+    def items(self):
+        """Header items in the order of saving."""
+        return self._header
+
+    @property
+    def base_path(self):
+        """Path of the base checkpoint if the file is a delta checkpoint, otherwise None."""
+        return self._base_path
+
+    def __contains__(self, name):
+        return name in self._items
+
+    def get_item(self, name):
+        """Get the header item of the parameter named `name`."""
+        return self._items[name]
+
+    def get(self, name):
+        """Get the flatten zero-copy numpy view of the parameter named `name`."""
+        item = self._items[name]
+        dtype = np.dtype(item["dtype"])
+        offset = self._data_offset + item["offset"]
+        if offset + item["nbytes"] > len(self._mmap):
+            raise ValueError(f"The data of parameter {name} is out of the checkpoint file range.")
+        return np.frombuffer(self._mmap, dtype=dtype, count=item["nbytes"] // dtype.itemsize, offset=offset)
@@ -24,7 +24,7 @@ from mindspore import log as logger
 from mindspore import nn
 from mindspore._checkparam import Validator
 from mindspore.train._utils import _make_directory
-from mindspore.train.serialization import save_checkpoint, _save_graph
+from mindspore.train.serialization import save_checkpoint, _save_graph, _CheckpointWriter, _get_checkpoint_base
 from mindspore.parallel._ps_context import _is_role_pserver, _get_ps_mode_rank
 from ._callback import Callback, set_cur_net
 
@@ -92,9 +92,19 @@ class CheckpointConfig:
         async_save (bool): Whether asynchronous execution saves the checkpoint to a file. Default: False.
         saved_network (Cell): Network to be saved in checkpoint file. If the saved_network has no relation
             with the network in training, the initial value of saved_network will be saved. Default: None.
+        ckpt_format (str): The layout of the checkpoint files, "protobuf" or "raw". Raw checkpoints are saved by a
+            pipelined writer, which snapshots parameters into reusable host buffers and writes the file with
+            `write_workers` threads. Default: "protobuf".
+        write_workers (int): Number of threads writing a raw checkpoint file. Default: 1.
+        incremental_save (bool): Whether to only save the parameters changed since the last save, as a delta
+            checkpoint based on the previous checkpoint. Only supported when ckpt_format is "raw". `load_checkpoint`
+            resolves the chain of delta checkpoints transparently. A full checkpoint with its delta checkpoints is
+            removed as a whole by `keep_checkpoint_max`, and a full checkpoint is saved earlier than
+            `full_save_interval` if the files kept would be a single chain. Default: False.
+        full_save_interval (int): Number of saves between two full checkpoints in incremental save. Default: 10.
 
     Raises:
-        ValueError: If the input_param is None or 0.
+        ValueError: If the input_param is None or 0, or incremental_save is True while ckpt_format is not "raw".
 
     Examples:
         >>> class LeNet5(nn.Cell):
@@ -135,7 +145,11 @@ class CheckpointConfig:
                  keep_checkpoint_per_n_minutes=0,
                  integrated_save=True,
                  async_save=False,
-                 saved_network=None):
+                 saved_network=None,
+                 ckpt_format="protobuf",
+                 write_workers=1,
+                 incremental_save=False,
+                 full_save_interval=10):
 
         if save_checkpoint_steps is not None:
             save_checkpoint_steps = Validator.check_non_negative_int(save_checkpoint_steps)
@@ -169,6 +183,12 @@ class CheckpointConfig:
         self._integrated_save = Validator.check_bool(integrated_save)
         self._async_save = Validator.check_bool(async_save)
         self._saved_network = saved_network
+        self._ckpt_format = Validator.check_string(ckpt_format, ["protobuf", "raw"], "ckpt_format")
+        self._write_workers = Validator.check_positive_int(write_workers)
+        self._incremental_save = Validator.check_bool(incremental_save)
+        self._full_save_interval = Validator.check_positive_int(full_save_interval)
+        if self._incremental_save and self._ckpt_format != "raw":
+            raise ValueError("The incremental_save is only supported when ckpt_format is 'raw'.")
 
     @property
     def save_checkpoint_steps(self):
@@ -205,6 +225,26 @@ class CheckpointConfig:
         """Get the value of _saved_network"""
         return self._saved_network
 
+    @property
+    def ckpt_format(self):
+        """Get the value of _ckpt_format."""
+        return self._ckpt_format
+
+    @property
+    def write_workers(self):
+        """Get the value of _write_workers."""
+        return self._write_workers
+
+    @property
+    def incremental_save(self):
+        """Get the value of _incremental_save."""
+        return self._incremental_save
+
+    @property
+    def full_save_interval(self):
+        """Get the value of _full_save_interval."""
+        return self._full_save_interval
+
     def get_checkpoint_policy(self):
         """Get the policy of checkpoint."""
         checkpoint_policy = {'save_checkpoint_steps': self.save_checkpoint_steps,
@@ -261,6 +301,10 @@ class ModelCheckpoint(Callback):
         self._manager = CheckpointManager()
         self._prefix = _chg_ckpt_file_name_if_same_exist(self._directory, self._prefix)
         self._graph_saved = False
+        self._writer = None
+        if self._config.ckpt_format == "raw":
+            self._writer = _CheckpointWriter(self._config.write_workers, self._config.incremental_save,
+                                             self._config.full_save_interval)
 
     def step_end(self, run_context):
         """
@@ -300,6 +344,9 @@ class ModelCheckpoint(Callback):
                 if thread.getName() == "asyn_save_ckpt":
                     thread.join()
 
+        if self._writer is not None:
+            self._writer.close()
+
         from mindspore.parallel._cell_wrapper import destroy_allgather_cell
         destroy_allgather_cell()
 
@@ -339,6 +386,11 @@ class ModelCheckpoint(Callback):
                         < self._config.keep_checkpoint_per_n_minutes * 60:
                     self._manager.keep_one_ckpoint_per_minutes(self._config.keep_checkpoint_per_n_minutes,
                                                                self._cur_time_for_keep)
+            if self._config.incremental_save and self._config.keep_checkpoint_max and \
+                    0 < self._config.keep_checkpoint_max <= self._manager.ckpoint_num + 1 and \
+                    self._manager.ckpoint_chain_num <= 1:
+                # a chain of delta checkpoints can only be removed after the next chain is started
+                self._writer.force_full_save()
 
             # generate the new checkpoint file and rename it.
             global _save_dir
@@ -352,8 +404,11 @@ class ModelCheckpoint(Callback):
                 cb_params.train_network.exec_checkpoint_graph()
 
             network = self._config.saved_network if self._config.saved_network is not None else cb_params.train_network
-            save_checkpoint(network, cur_file, self._config.integrated_save,
-                            self._config.async_save)
+            if self._writer is not None:
+                self._writer.save(network, cur_file, self._config.integrated_save, self._config.async_save)
+            else:
+                save_checkpoint(network, cur_file, self._config.integrated_save,
+                                self._config.async_save)
 
             self._latest_ckpt_file_name = cur_file
 
@@ -403,13 +458,49 @@ class CheckpointManager:
         except ValueError:
             logger.warning("ValueError, failed to remove the older ckpt file %s.", file_name)
 
+    @property
+    def ckpoint_chain_num(self):
+        """Get the number of the chains of the checkpoint files managed here."""
+        return len(self._get_chains())
+
+    def _get_chains(self):
+        """
+        Group the checkpoint files into chains, a full checkpoint file with the delta checkpoint files based on it.
+
+        Returns:
+            list, the chains from the oldest one, the files of a chain are sorted by the modify time.
+        """
+        files = {os.path.realpath(ck_file): ck_file for ck_file in self._ckpoint_filelist}
+        bases = {real_path: _get_checkpoint_base(ck_file) for real_path, ck_file in files.items()}
+        chains = {}
+        for real_path, ck_file in files.items():
+            root, visited = real_path, {real_path}
+            while bases[root] in files and bases[root] not in visited:
+                root = bases[root]
+                visited.add(root)
+            chains.setdefault(root, []).append(ck_file)
+        chains = [sorted(chain, key=os.path.getmtime) for chain in chains.values()]
+        return sorted(chains, key=lambda chain: os.path.getmtime(chain[0]))
+
     def remove_oldest_ckpoint_file(self):
-        """Remove the oldest checkpoint file from this checkpoint manager and also from the directory."""
-        ckpoint_files = sorted(self._ckpoint_filelist, key=os.path.getmtime)
-        self.remove_ckpoint_file(ckpoint_files[0])
+        """
+        Remove the oldest checkpoint file from this checkpoint manager and also from the directory.
+
+        The oldest chain, a full checkpoint file with its delta checkpoint files, is removed as a whole. The only
+        chain is kept unless it is a single file, the next save starts another chain then.
+        """
+        chains = self._get_chains()
+        if len(chains) > 1 or (chains and len(chains[0]) == 1):
+            # the delta checkpoint files first, so that no file is left without its base
+            for ck_file in reversed(chains[0]):
+                self.remove_ckpoint_file(ck_file)
 
     def keep_one_ckpoint_per_minutes(self, minutes, cur_time):
-        """Only keep the latest one ckpt file per minutes, remove other files generated in [last_time, cur_time]."""
+        """
+        Only keep the latest one ckpt file per minutes, remove other files generated in [last_time, cur_time].
+
+        The files removed are newer than all the files kept, so no delta checkpoint file kept loses its base.
+        """
         movs = []
         oldest_file = ''
         oldest_time = cur_time
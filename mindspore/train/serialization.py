@@ -14,9 +14,11 @@
 # ============================================================================
 """Model and parameters serialization."""
 import os
+import json
 import stat
 import math
 from threading import Thread, Lock
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import mindspore.nn as nn
 import mindspore.context as context
@@ -24,15 +26,19 @@ from mindspore import log as logger
 from mindspore.train.checkpoint_pb2 import Checkpoint
 from mindspore.train.print_pb2 import Print
 from mindspore.train.node_strategy_pb2 import ParallelStrategyMap, ParallelLayouts
+from mindspore.train._raw_checkpoint import is_raw_checkpoint, write_raw_checkpoint, write_raw_checkpoint_parallel, \
+    RawCheckpointReader
 from mindspore.common.tensor import Tensor
-from mindspore.common.initializer import initializer
+from mindspore.common.initializer import initializer, _Uninitialized
 from mindspore.common.parameter import Parameter
 from mindspore.common.api import _executor
 from mindspore.common import dtype as mstype
 from mindspore._checkparam import check_input_data, Validator
 from mindspore.compression.export import quant_export
-from mindspore.parallel._tensor import _load_tensor
-from mindspore.parallel._utils import _infer_rank_list, _remove_repeated_slices
+from mindspore.parallel._tensor import _load_tensor, _get_tensor_strategy, _get_tensor_slice_index, \
+    _get_tensor_slice_offset, _get_unique_slice_ranks
+from mindspore.parallel._utils import _infer_rank_list, _remove_repeated_slices, _get_global_rank
+from mindspore.train._utils import _make_directory
 
 
 tensor_to_ms_type = {"Int8": mstype.int8, "Uint8": mstype.uint8, "Int16": mstype.int16, "Uint16": mstype.uint16,
@@ -46,6 +52,8 @@ tensor_to_np_type = {"Int8": np.int8, "Uint8": np.uint8, "Int16": np.int16, "Uin
 
 _ckpt_mutex = Lock()
 SLICE_SIZE = 512 * 1024 * 1024
+_CKPT_FORMATS = ("protobuf", "raw")
+_SHARDED_MANIFEST_NAME = "layout_manifest.json"
 
 
 def _special_process_par(par, new_par):
@@ -108,7 +116,7 @@ def _update_param(param, new_param):
         param.set_data(type(param.data)(new_param.data))
 
 
-def _exec_save(ckpt_file_name, data_list):
+def _exec_save(ckpt_file_name, data_list, ckpt_format="protobuf"):
     """Execute the process of saving checkpoint into file."""
 
     try:
@@ -116,24 +124,10 @@ def _exec_save(ckpt_file_name, data_list):
             if os.path.exists(ckpt_file_name):
                 os.remove(ckpt_file_name)
             with open(ckpt_file_name, "ab") as f:
-                for name, value in data_list.items():
-                    data_size = value[2].nbytes
-                    if data_size > SLICE_SIZE:
-                        slice_count = math.ceil(data_size / SLICE_SIZE)
-                        param_slice_list = np.array_split(value[2], slice_count)
-                    else:
-                        param_slice_list = [value[2]]
-
-                    for param_slice in param_slice_list:
-                        checkpoint_list = Checkpoint()
-                        param_value = checkpoint_list.value.add()
-                        param_value.tag = name
-                        param_tensor = param_value.tensor
-                        param_tensor.dims.extend(value[0])
-                        param_tensor.tensor_type = value[1]
-                        param_tensor.tensor_content = param_slice.tobytes()
-
-                        f.write(checkpoint_list.SerializeToString())
+                if ckpt_format == "raw":
+                    write_raw_checkpoint(f, data_list)
+                else:
+                    _write_protobuf_checkpoint(f, data_list)
 
         os.chmod(ckpt_file_name, stat.S_IRUSR)
 
@@ -142,7 +136,65 @@ def _exec_save(ckpt_file_name, data_list):
         raise e
 
 
-def save_checkpoint(save_obj, ckpt_file_name, integrated_save=True, async_save=False):
+def _write_protobuf_checkpoint(f, data_list):
+    """Write data_list into an opened file as a sequence of Checkpoint protobuf messages."""
+    for name, value in data_list.items():
+        data_size = value[2].nbytes
+        if data_size > SLICE_SIZE:
+            slice_count = math.ceil(data_size / SLICE_SIZE)
+            param_slice_list = np.array_split(value[2], slice_count)
+        else:
+            param_slice_list = [value[2]]
+
+        for param_slice in param_slice_list:
+            checkpoint_list = Checkpoint()
+            param_value = checkpoint_list.value.add()
+            param_value.tag = name
+            param_tensor = param_value.tensor
+            param_tensor.dims.extend(value[0])
+            param_tensor.tensor_type = value[1]
+            param_tensor.tensor_content = param_slice.tobytes()
+
+            f.write(checkpoint_list.SerializeToString())
+
+
+def _get_param_list(net, integrated_save):
+    """Gets the list of parameters to save of net, like [{"name": param_name, "data": param_data},...]."""
+    net.init_parameters_data()
+    param_dict = {}
+    for _, param in net.parameters_and_names():
+        param_dict[param.name] = param
+    param_list = []
+    for (key, value) in param_dict.items():
+        each_param = {"name": key}
+        param_data = Tensor(value.data)
+
+        # in automatic model parallel scenario, some parameters were spliteds to all the devices,
+        # which should be combined before saving
+        if key in net.parameter_layout_dict:
+            param_data = _get_merged_param_data(net, key, param_data, integrated_save)
+
+        each_param["data"] = param_data
+        param_list.append(each_param)
+    return param_list
+
+
+def _get_param_save_data(param_data):
+    """Gets the dims, tensor type and flatten numpy data of a parameter or tensor to save."""
+    if isinstance(param_data, Parameter):
+        param_data.init_data()
+    dims = []
+    if param_data.shape == ():
+        dims.append(0)
+    else:
+        for dim in param_data.shape:
+            dims.append(dim)
+    tensor_type = str(param_data.dtype)
+    data = param_data.asnumpy().reshape(-1)
+    return dims, tensor_type, data
+
+
+def save_checkpoint(save_obj, ckpt_file_name, integrated_save=True, async_save=False, ckpt_format="protobuf"):
     """
     Saves checkpoint info to a specified file.
 
@@ -153,66 +205,176 @@ def save_checkpoint(save_obj, ckpt_file_name, integrated_save=True, async_save=F
         ckpt_file_name (str): Checkpoint file name. If the file name already exists, it will be overwritten.
         integrated_save (bool): Whether to integrated save in automatic model parallel scene. Default: True
         async_save (bool): Whether asynchronous execution saves the checkpoint to a file. Default: False
+        ckpt_format (str): The layout of the checkpoint file, "protobuf" or "raw". The "raw" layout stores an
+                           indexed header followed by aligned tensor bytes, which can be memory-mapped by
+                           `load_checkpoint` without copying. Default: "protobuf".
 
     Raises:
         TypeError: If the parameter save_obj is not nn.Cell or list type.And if the parameter integrated_save and
                    async_save are not bool type.
+        ValueError: If the parameter ckpt_format is not "protobuf" or "raw".
     """
 
     if not isinstance(save_obj, nn.Cell) and not isinstance(save_obj, list):
         raise TypeError("The parameter save_obj should be nn.Cell or list, but got {}".format(type(save_obj)))
     integrated_save = Validator.check_bool(integrated_save)
     async_save = Validator.check_bool(async_save)
+    ckpt_format = Validator.check_string(ckpt_format, _CKPT_FORMATS, "ckpt_format", "save_checkpoint")
 
     logger.info("Execute the process of saving checkpoint files.")
 
     if isinstance(save_obj, nn.Cell):
-        save_obj.init_parameters_data()
-        param_dict = {}
-        for _, param in save_obj.parameters_and_names():
-            param_dict[param.name] = param
-        param_list = []
-        for (key, value) in param_dict.items():
-            each_param = {"name": key}
-            param_data = Tensor(value.data)
-
-            # in automatic model parallel scenario, some parameters were spliteds to all the devices,
-            # which should be combined before saving
-            if key in save_obj.parameter_layout_dict:
-                param_data = _get_merged_param_data(save_obj, key, param_data, integrated_save)
-
-            each_param["data"] = param_data
-            param_list.append(each_param)
-        save_obj = param_list
+        save_obj = _get_param_list(save_obj, integrated_save)
 
     data_list = {}
     with _ckpt_mutex:
         for param in save_obj:
             key = param["name"]
-            data_list[key] = []
-            if isinstance(param["data"], Parameter):
-                param["data"].init_data()
-            dims = []
-            if param['data'].shape == ():
-                dims.append(0)
-            else:
-                for dim in param['data'].shape:
-                    dims.append(dim)
-            data_list[key].append(dims)
-            tensor_type = str(param["data"].dtype)
-            data_list[key].append(tensor_type)
-            data = param["data"].asnumpy().reshape(-1)
-            data_list[key].append(data)
+            dims, tensor_type, data = _get_param_save_data(param["data"])
+            data_list[key] = [dims, tensor_type, data]
 
     if async_save:
-        thr = Thread(target=_exec_save, args=(ckpt_file_name, data_list), name="asyn_save_ckpt")
+        thr = Thread(target=_exec_save, args=(ckpt_file_name, data_list, ckpt_format), name="asyn_save_ckpt")
         thr.start()
     else:
-        _exec_save(ckpt_file_name, data_list)
+        _exec_save(ckpt_file_name, data_list, ckpt_format)
 
     logger.info("Saving checkpoint process is finished.")
 
 
+class _CheckpointStagingPool:
+    """
+    Reusable host buffers that hold the latest saved snapshot of every parameter.
+
+    The buffers are allocated at the first save and then overwritten in place, they also serve as the reference
+    to find the parameters changed since the last save.
+    """
+    def __init__(self):
+        self._buffers = {}
+
+    def stage(self, name, data, compare=False):
+        """
+        Copies the flatten data of parameter into its staging buffer.
+
+        Args:
+            name (str): Parameter name.
+            data (numpy.ndarray): Flatten data of the parameter.
+            compare (bool): Whether to compare data with the last snapshot before copying. Default: False.
+
+        Returns:
+            Tuple, the staging buffer and whether the data is changed since the last snapshot.
+        """
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != data.shape or buffer.dtype != data.dtype:
+            buffer = np.array(data, copy=True)
+            self._buffers[name] = buffer
+            return buffer, True
+        if compare and np.array_equal(buffer, data):
+            return buffer, False
+        np.copyto(buffer, data)
+        return buffer, True
+
+
+class _CheckpointWriter:
+    """
+    Pipelined writer of raw checkpoints.
+
+    Parameters are snapshotted into a reusable staging pool, then the file is written by a pool of threads, each
+    thread writing its own byte ranges of the file. With incremental save, only the parameters changed since the
+    previous save are written, into a delta checkpoint whose base is the previous checkpoint, and a full checkpoint
+    is written every `full_save_interval` saves to bound the length of the delta chain.
+
+    Args:
+        write_workers (int): Number of threads writing the file. Default: 1.
+        incremental_save (bool): Whether to save delta checkpoints. Default: False.
+        full_save_interval (int): Number of saves between two full checkpoints in incremental save. Default: 10.
+    """
+    def __init__(self, write_workers=1, incremental_save=False, full_save_interval=10):
+        self._write_workers = Validator.check_positive_int(write_workers)
+        self._incremental_save = Validator.check_bool(incremental_save)
+        self._full_save_interval = Validator.check_positive_int(full_save_interval)
+        self._pool = _CheckpointStagingPool()
+        self._executor = ThreadPoolExecutor(max_workers=self._write_workers)
+        self._last_file = None
+        self._save_count = 0
+        self._thread = None
+        self._error = None
+
+    def save(self, save_obj, ckpt_file_name, integrated_save=True, async_save=False):
+        """
+        Saves the parameters of save_obj into ckpt_file_name.
+
+        Args:
+            save_obj (nn.Cell or list): Same as the save_obj of `save_checkpoint`.
+            ckpt_file_name (str): Checkpoint file name.
+            integrated_save (bool): Whether to integrated save in automatic model parallel scene. Default: True
+            async_save (bool): Whether to write the file asynchronously. Default: False
+        """
+        # the staging buffers are reused, so the previous writing must be finished before snapshotting
+        self.wait()
+        if isinstance(save_obj, nn.Cell):
+            save_obj = _get_param_list(save_obj, integrated_save)
+
+        is_full = not self._incremental_save or self._last_file is None or \
+            not os.path.exists(self._last_file) or self._save_count % self._full_save_interval == 0
+        data_list = {}
+        for param in save_obj:
+            dims, tensor_type, data = _get_param_save_data(param["data"])
+            buffer, changed = self._pool.stage(param["name"], data, compare=not is_full)
+            if is_full or changed:
+                data_list[param["name"]] = [dims, tensor_type, buffer]
+
+        base = None
+        if not is_full:
+            base = os.path.relpath(os.path.realpath(self._last_file),
+                                   os.path.dirname(os.path.realpath(ckpt_file_name)))
+            logger.info("Save delta checkpoint %s with %d changed parameters, base is %s.",
+                        ckpt_file_name, len(data_list), base)
+        self._last_file = ckpt_file_name
+        self._save_count += 1
+
+        if async_save:
+            self._thread = Thread(target=self._write, args=(ckpt_file_name, data_list, base), name="asyn_save_ckpt")
+            self._thread.start()
+        else:
+            self._write(ckpt_file_name, data_list, base)
+            self._raise_error()
+
+    def force_full_save(self):
+        """Makes the next save a full checkpoint, which starts a new chain of delta checkpoints."""
+        self._save_count = 0
+
+    def _write(self, ckpt_file_name, data_list, base):
+        """Writes data_list into a temporary file and renames it to ckpt_file_name."""
+        tmp_file_name = ckpt_file_name + ".tmp"
+        try:
+            write_raw_checkpoint_parallel(tmp_file_name, data_list, self._executor, base)
+            os.chmod(tmp_file_name, stat.S_IRUSR)
+            os.replace(tmp_file_name, ckpt_file_name)
+        except BaseException as e:
+            logger.error("Failed to save the checkpoint file %s.", ckpt_file_name)
+            self._error = e
+            if os.path.exists(tmp_file_name):
+                os.remove(tmp_file_name)
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def wait(self):
+        """Waits for the asynchronous writing to finish."""
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._raise_error()
+
+    def close(self):
+        """Waits for the writing to finish and shuts down the writing threads."""
+        self.wait()
+        self._executor.shutdown()
+
+
 def _check_param_prefix(filter_prefix, param_name):
     """Checks whether the prefix of parameter name matches the given filter_prefix."""
     for prefix in filter_prefix:
@@ -270,6 +432,37 @@ def load_checkpoint(ckpt_file_name, net=None, strict_load=False, filter_prefix=N
                                 f"but got {str(type(prefix))} at index {index}.")
 
     logger.info("Execute the process of loading checkpoint files.")
+    if is_raw_checkpoint(ckpt_file_name):
+        parameter_dict = _load_raw_checkpoint(ckpt_file_name, filter_prefix)
+    else:
+        parameter_dict = _load_protobuf_checkpoint(ckpt_file_name, filter_prefix)
+
+    if not parameter_dict:
+        raise ValueError(f"The loaded parameter dict is empty after filtering, please check filter_prefix.")
+
+    if net is not None:
+        load_param_into_net(net, parameter_dict, strict_load)
+
+    return parameter_dict
+
+
+def _create_parameter(name, data_type, dims, param_data):
+    """Creates a Parameter from the flatten numpy data read from checkpoint file."""
+    ms_type = tensor_to_ms_type[data_type]
+    if dims == [0]:
+        if 'Float' in data_type:
+            param_data = float(param_data[0])
+        elif 'Int' in data_type:
+            param_data = int(param_data[0])
+        return Parameter(Tensor(param_data, ms_type), name=name)
+    if dims == [1]:
+        return Parameter(Tensor(param_data, ms_type), name=name)
+    param_value = param_data.reshape(list(dims))
+    return Parameter(Tensor(param_value, ms_type), name=name)
+
+
+def _load_protobuf_checkpoint(ckpt_file_name, filter_prefix=None):
+    """Loads the parameters of a checkpoint file saved as Checkpoint protobuf messages."""
     checkpoint_list = Checkpoint()
 
     try:
@@ -289,29 +482,14 @@ def load_checkpoint(ckpt_file_name, net=None, strict_load=False, filter_prefix=N
             data = element.tensor.tensor_content
             data_type = element.tensor.tensor_type
             np_type = tensor_to_np_type[data_type]
-            ms_type = tensor_to_ms_type[data_type]
             element_data = np.frombuffer(data, np_type)
             param_data_list.append(element_data)
             if (element_id == len(checkpoint_list.value) - 1) or \
                     (element.tag != checkpoint_list.value[element_id + 1].tag):
                 param_data = np.concatenate((param_data_list), axis=0)
                 param_data_list.clear()
-                dims = element.tensor.dims
-
-                if dims == [0]:
-                    if 'Float' in data_type:
-                        param_data = float(param_data[0])
-                    elif 'Int' in data_type:
-                        param_data = int(param_data[0])
-                    parameter_dict[element.tag] = Parameter(Tensor(param_data, ms_type), name=element.tag)
-                elif dims == [1]:
-                    parameter_dict[element.tag] = Parameter(Tensor(param_data, ms_type), name=element.tag)
-                else:
-                    param_dim = []
-                    for dim in dims:
-                        param_dim.append(dim)
-                    param_value = param_data.reshape(param_dim)
-                    parameter_dict[element.tag] = Parameter(Tensor(param_value, ms_type), name=element.tag)
+                parameter_dict[element.tag] = _create_parameter(element.tag, data_type, list(element.tensor.dims),
+                                                                param_data)
 
         logger.info("Loading checkpoint files process is finished.")
 
@@ -319,11 +497,77 @@ def load_checkpoint(ckpt_file_name, net=None, strict_load=False, filter_prefix=N
         logger.error("Failed to load the checkpoint file `%s`.", ckpt_file_name)
         raise RuntimeError(e.__str__())
 
-    if not parameter_dict:
-        raise ValueError(f"The loaded parameter dict is empty after filtering, please check filter_prefix.")
+    return parameter_dict
 
-    if net is not None:
-        load_param_into_net(net, parameter_dict, strict_load)
+
+def _get_checkpoint_chain(ckpt_file_name):
+    """
+    Gets the readers of a raw checkpoint and all its bases, from the full checkpoint to the latest delta.
+
+    Raises:
+        ValueError: A base checkpoint does not exist or the chain is circular.
+    """
+    chain = []
+    visited = set()
+    file_name = ckpt_file_name
+    while file_name is not None:
+        real_name = os.path.realpath(file_name)
+        if real_name in visited:
+            raise ValueError(f"The delta checkpoint chain of {ckpt_file_name} is circular at {file_name}.")
+        visited.add(real_name)
+        if not os.path.exists(file_name) or not is_raw_checkpoint(file_name):
+            raise ValueError(f"The base checkpoint {file_name} of {ckpt_file_name} does not exist "
+                             f"or is not a raw checkpoint.")
+        reader = RawCheckpointReader(file_name)
+        chain.append(reader)
+        file_name = reader.base_path
+    chain.reverse()
+    return chain
+
+
+def _get_checkpoint_base(ckpt_file_name):
+    """Gets the real path of the base checkpoint if the file is a delta checkpoint, otherwise None."""
+    try:
+        if not is_raw_checkpoint(ckpt_file_name):
+            return None
+        base_path = RawCheckpointReader(ckpt_file_name).base_path
+    except (OSError, ValueError):
+        return None
+    return None if base_path is None else os.path.realpath(base_path)
+
+
+def _load_raw_checkpoint(ckpt_file_name, filter_prefix=None):
+    """
+    Loads the parameters of a checkpoint file saved with the raw layout.
+
+    The file is memory-mapped and every parameter is built from a zero-copy view of it, parameters matching
+    filter_prefix are skipped without touching their bytes. A delta checkpoint is resolved through its chain of
+    base checkpoints, the latest saved data of each parameter wins.
+    """
+    try:
+        chain = _get_checkpoint_chain(ckpt_file_name)
+    except BaseException as e:
+        logger.error("Failed to read the checkpoint file `%s`, please check the correct of the file.", ckpt_file_name)
+        raise ValueError(e.__str__())
+
+    latest_reader = {}
+    for reader in chain:
+        for item in reader.items:
+            latest_reader[item["name"]] = reader
+
+    parameter_dict = {}
+    try:
+        for name, reader in latest_reader.items():
+            if filter_prefix is not None and _check_param_prefix(filter_prefix, name):
+                continue
+            item = reader.get_item(name)
+            parameter_dict[name] = _create_parameter(name, item["type"], item["dims"], reader.get(name))
+
+        logger.info("Loading checkpoint files process is finished.")
+
+    except BaseException as e:
+        logger.error("Failed to load the checkpoint file `%s`.", ckpt_file_name)
+        raise RuntimeError(e.__str__())
 
     return parameter_dict
 
@@ -361,6 +605,7 @@ def load_param_into_net(net, parameter_dict, strict_load=False):
 
     strict_load = Validator.check_bool(strict_load)
     logger.info("Execute the process of loading parameters into net.")
+    _skip_init_of_loaded_params(net, parameter_dict)
     net.init_parameters_data()
     param_not_load = []
     for _, param in net.parameters_and_names():
@@ -387,6 +632,17 @@ def load_param_into_net(net, parameter_dict, strict_load=False):
     return param_not_load
 
 
+def _skip_init_of_loaded_params(net, parameter_dict):
+    """Skip initializing the data of the parameters not initialized yet, which are overwritten by the checkpoint."""
+    for _, param in net.parameters_and_names():
+        new_param = parameter_dict.get(param.name)
+        if param.init_mode is None or param.inited_param is not None or not isinstance(new_param, Parameter):
+            continue
+        if isinstance(new_param.data, Tensor) and new_param.data.dtype == param.dtype and \
+                tuple(new_param.data.shape) == tuple(param.shape):
+            param.init_mode = Tensor(dtype=param.dtype, shape=param.shape, init=_Uninitialized())
+
+
 def _load_dismatch_prefix_params(net, parameter_dict, param_not_load):
     """When some net parameter did not load, try to continue load."""
     prefix_name = ""
@@ -1050,6 +1306,9 @@ def _merge_and_split(sliced_params, train_strategy, predict_strategy):
 def _load_single_param(ckpt_file_name, param_name):
     """Load a parameter from checkpoint."""
     logger.info("Execute the process of loading checkpoint files.")
+    if is_raw_checkpoint(ckpt_file_name):
+        return _load_single_raw_param(ckpt_file_name, param_name)
+
     checkpoint_list = Checkpoint()
 
     try:
@@ -1069,29 +1328,14 @@ def _load_single_param(ckpt_file_name, param_name):
             data = element.tensor.tensor_content
             data_type = element.tensor.tensor_type
             np_type = tensor_to_np_type[data_type]
-            ms_type = tensor_to_ms_type[data_type]
             element_data = np.frombuffer(data, np_type)
             param_data_list.append(element_data)
             if (element_id == len(checkpoint_list.value) - 1) or \
                     (element.tag != checkpoint_list.value[element_id + 1].tag):
                 param_data = np.concatenate((param_data_list), axis=0)
                 param_data_list.clear()
-                dims = element.tensor.dims
-                if dims == [0]:
-                    if 'Float' in data_type:
-                        param_data = float(param_data[0])
-                    elif 'Int' in data_type:
-                        param_data = int(param_data[0])
-                    parameter = Parameter(Tensor(param_data, ms_type), name=element.tag)
-                elif dims == [1]:
-                    parameter = Parameter(Tensor(param_data, ms_type), name=element.tag)
-                else:
-                    param_dim = []
-                    for dim in dims:
-                        param_dim.append(dim)
-                    param_value = param_data.reshape(param_dim)
-                    parameter = Parameter(Tensor(param_value, ms_type), name=element.tag)
-            break
+                parameter = _create_parameter(element.tag, data_type, list(element.tensor.dims), param_data)
+                break
         logger.info("Loading checkpoint files process is finished.")
 
     except BaseException as e:
@@ -1102,3 +1346,214 @@ def _load_single_param(ckpt_file_name, param_name):
         raise ValueError(f"There is no parameter named {param_name} in this checkpoint file {ckpt_file_name}, "
                          f"please check parameter name or checkpoint file.")
     return parameter
+
+
+def _load_single_raw_param(ckpt_file_name, param_name):
+    """Load a parameter from checkpoint saved with the raw layout."""
+    try:
+        chain = _get_checkpoint_chain(ckpt_file_name)
+    except BaseException as e:
+        logger.error("Failed to read the checkpoint file `%s`, please check the correct of the file.", ckpt_file_name)
+        raise ValueError(e.__str__())
+
+    for reader in reversed(chain):
+        if param_name in reader:
+            item = reader.get_item(param_name)
+            return _create_parameter(param_name, item["type"], item["dims"], reader.get(param_name))
+    raise ValueError(f"There is no parameter named {param_name} in this checkpoint file {ckpt_file_name}, "
+                     f"please check parameter name or checkpoint file.")
+
+
+def _get_sharded_file_name(ckpt_dir, rank):
+    """Gets the name of the checkpoint file written by rank in a sharded checkpoint directory."""
+    return os.path.join(ckpt_dir, f"rank_{rank}.ckpt")
+
+
+def _get_sharded_param_layout(param_name, layout, slice_shape):
+    """
+    Gets the global layout of a sliced parameter, which lists the unique slices and the rank holding each of them.
+
+    Args:
+        param_name (str): The parameter name.
+        layout (tuple): The layout of the parameter in parameter_layout_dict.
+        slice_shape (list): The shape of the parameter slice on the local device.
+
+    Returns:
+        Dict, the whole shape, device matrix, tensor map and slices of the parameter.
+    """
+    dev_mat = list(layout[0])
+    tensor_map = list(layout[1])
+    field_size = layout[3]
+    uniform_split = layout[4]
+    if field_size or uniform_split == 0:
+        raise ValueError(f"Sharded checkpoint only supports uniform split parameter without field size, "
+                         f"but got parameter {param_name}.")
+    tensor_strategy = _get_tensor_strategy(dev_mat, tensor_map)
+    shape = [dim * split for dim, split in zip(slice_shape, tensor_strategy)]
+    slices = []
+    for slice_index, rank in sorted(_get_unique_slice_ranks(dev_mat, tensor_map).items()):
+        offset = _get_tensor_slice_offset(tensor_strategy, slice_shape, slice_index)
+        slices.append({"rank": rank, "offset": offset, "shape": list(slice_shape)})
+    return {"shape": shape, "dev_matrix": dev_mat, "tensor_map": tensor_map, "slices": slices}
+
+
+def save_sharded_checkpoint(network, ckpt_dir):
+    """
+    Saves the parameter slices of the local device into a sharded checkpoint directory.
+
+    Unlike `save_checkpoint` with integrated_save, sliced parameters are not all-gathered: each rank writes
+    only the unique slices it holds into `rank_{rank_id}.ckpt` with the raw layout, and rank 0 writes
+    `layout_manifest.json`, the global layout derived from `parameter_layout_dict`, which records the whole
+    shape of every parameter and the rank and offset of each of its slices. Parameters sharded by the parallel
+    optimizer are only gathered inside their optimizer shard group.
+
+    Args:
+        network (Cell): The network in automatic or semi automatic parallel mode.
+        ckpt_dir (str): The directory shared by all the ranks to save the checkpoint files.
+
+    Raises:
+        TypeError: The network is not a Cell.
+        ValueError: A parameter is split unevenly or with field size.
+
+    Examples:
+        >>> save_sharded_checkpoint(net, "./sharded_ckpt")
+        >>> load_sharded_checkpoint(predict_net, "./sharded_ckpt", predict_strategy)
+    """
+    network = Validator.check_isinstance("network", network, nn.Cell)
+    ckpt_dir = _make_directory(ckpt_dir)
+    rank = _get_global_rank()
+    logger.info("Execute the process of saving sharded checkpoint files of rank %d.", rank)
+
+    network.init_parameters_data()
+    param_dict = {}
+    for _, param in network.parameters_and_names():
+        param_dict[param.name] = param
+
+    parameters = {}
+    data_list = {}
+    for name, param in param_dict.items():
+        param_data = Tensor(param.data)
+        layout = network.parameter_layout_dict.get(name)
+        if layout is not None and len(layout) >= 6:
+            param_data = _get_merged_param_data(network, name, param_data, False)
+            param_layout = _get_sharded_param_layout(name, layout, list(param_data.shape))
+        else:
+            shape = list(param_data.shape)
+            param_layout = {"shape": shape, "dev_matrix": [1], "tensor_map": [-1] * len(shape),
+                            "slices": [{"rank": 0, "offset": [0] * len(shape), "shape": shape}]}
+        dims, tensor_type, data = _get_param_save_data(param_data)
+        param_layout["type"] = tensor_type
+        parameters[name] = param_layout
+        if any(param_slice["rank"] == rank for param_slice in param_layout["slices"]):
+            data_list[name] = [dims, tensor_type, data]
+
+    _exec_save(_get_sharded_file_name(ckpt_dir, rank), data_list, "raw")
+    if rank == 0:
+        manifest_file_name = os.path.join(ckpt_dir, _SHARDED_MANIFEST_NAME)
+        # the other ranks may read the manifest concurrently, it is published by a rename
+        tmp_file_name = "{}.{}".format(manifest_file_name, os.getpid())
+        with open(tmp_file_name, "w") as f:
+            json.dump({"version": 1, "parameters": parameters}, f)
+        os.chmod(tmp_file_name, stat.S_IRUSR)
+        os.replace(tmp_file_name, manifest_file_name)
+    logger.info("Saving sharded checkpoint process is finished.")
+
+
+def _read_sharded_region(param_name, param_layout, offset, shape, get_reader):
+    """
+    Reads the region [offset, offset + shape) of a parameter from the slices intersecting it.
+
+    Only the bytes of the intersections are read from the memory-mapped files of the ranks holding the slices.
+    """
+    region = np.empty(shape, tensor_to_np_type[param_layout["type"]])
+    end = [start + dim for start, dim in zip(offset, shape)]
+    for param_slice in param_layout["slices"]:
+        src_index, dst_index = [], []
+        for axis, (slice_start, slice_dim) in enumerate(zip(param_slice["offset"], param_slice["shape"])):
+            low = max(offset[axis], slice_start)
+            high = min(end[axis], slice_start + slice_dim)
+            if low >= high:
+                break
+            src_index.append(slice(low - slice_start, high - slice_start))
+            dst_index.append(slice(low - offset[axis], high - offset[axis]))
+        else:
+            src = get_reader(param_slice["rank"]).get(param_name).reshape(param_slice["shape"])
+            region[tuple(dst_index)] = src[tuple(src_index)]
+    return region
+
+
+def _get_predict_slice(param_name, shape, tensor_layout, rank):
+    """Gets the offset and shape of the slice of rank in the predict strategy."""
+    dev_mat, tensor_map, param_split_shape = tensor_layout[:3]
+    if param_split_shape:
+        raise ValueError(f"Sharded checkpoint only supports uniform split predict strategy, "
+                         f"but got parameter {param_name}.")
+    tensor_strategy = _get_tensor_strategy(dev_mat, tensor_map)
+    if len(tensor_strategy) != len(shape) or any(dim % split for dim, split in zip(shape, tensor_strategy)):
+        raise ValueError(f"The shape {shape} of parameter {param_name} can not be split by the predict strategy "
+                         f"{tensor_strategy}.")
+    slice_shape = [dim // split for dim, split in zip(shape, tensor_strategy)]
+    slice_index = _get_tensor_slice_index(dev_mat, tensor_strategy, tensor_map, rank)
+    return _get_tensor_slice_offset(tensor_strategy, slice_shape, slice_index), slice_shape
+
+
+def load_sharded_checkpoint(network, ckpt_dir, predict_strategy=None, strict_load=False):
+    """
+    Loads a checkpoint directory saved by `save_sharded_checkpoint` into network.
+
+    The parameters are resharded from the train layout recorded in the manifest to the predict strategy on the
+    fly, every rank only reads the byte ranges of the slices intersecting its own slice, without merging the whole
+    parameters.
+
+    Args:
+        network (Cell): Network for predication or training.
+        ckpt_dir (str): The directory of the sharded checkpoint.
+        predict_strategy (dict): Strategy of predication process, whose key is parameter name, and value is a list or
+            a tuple that the first four elements are [dev_matrix, tensor_map, param_split_shape, field]. Parameters
+            not in predict_strategy are loaded as whole tensors. If None, it means that the predication process
+            just uses single device. Default: None.
+        strict_load (bool): Whether to strict load the parameter into net. Default: False.
+
+    Returns:
+        List, the names of the parameters in the network which are not loaded.
+
+    Raises:
+        TypeError: The type of inputs do not match the requirements.
+        ValueError: The checkpoint directory or predict strategy is incorrect.
+    """
+    network = Validator.check_isinstance("network", network, nn.Cell)
+    manifest_file_name = os.path.join(str(ckpt_dir), _SHARDED_MANIFEST_NAME)
+    if not os.path.isfile(manifest_file_name):
+        raise ValueError(f"Please make sure that {ckpt_dir} is a sharded checkpoint directory with "
+                         f"{_SHARDED_MANIFEST_NAME}.")
+    if not _check_predict_strategy(predict_strategy):
+        raise ValueError(f"Please make sure that the key of predict_strategy is str, "
+                         f"and the value is a list or a tuple that the first four elements are "
+                         f"dev_matrix (list[int]), tensor_map (list[int]), "
+                         f"param_split_shape (list[int]) and field_size (zero).")
+
+    with open(manifest_file_name, "r") as f:
+        parameters = json.load(f)["parameters"]
+    rank = _get_global_rank() if predict_strategy else 0
+
+    readers = {}
+
+    def _get_reader(src_rank):
+        if src_rank not in readers:
+            readers[src_rank] = RawCheckpointReader(_get_sharded_file_name(ckpt_dir, src_rank))
+        return readers[src_rank]
+
+    param_dict = {}
+    for _, param in network.parameters_and_names():
+        if param.name not in parameters or param.name in param_dict:
+            continue
+        param_layout = parameters[param.name]
+        shape = param_layout["shape"]
+        offset = [0] * len(shape)
+        if predict_strategy and param.name in predict_strategy:
+            offset, shape = _get_predict_slice(param.name, shape, predict_strategy[param.name], rank)
+        param_data = _read_sharded_region(param.name, param_layout, offset, shape, _get_reader)
+        dims = shape if shape else [0]
+        param_dict[param.name] = _create_parameter(param.name, param_layout["type"], dims, param_data.reshape(-1))
+
+    return load_param_into_net(network, param_dict, strict_load)
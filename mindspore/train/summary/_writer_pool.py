@@ -15,8 +15,10 @@
 """Write events to disk in a base directory."""
 import os
 import time
+import queue
 import signal
-from collections import deque
+import threading
+from collections import defaultdict
 
 import mindspore.log as logger
 from mindspore.train.summary.enums import PluginEnum, WriterPluginEnum
@@ -32,6 +34,12 @@ try:
 except ValueError:
     import multiprocessing as ctx
 
+# The data of these plugins can be dropped or sampled when training outpaces the disk,
+# the graph, lineage and explain data are always written.
+_DROPPABLE_PLUGINS = (PluginEnum.SCALAR.value, PluginEnum.TENSOR.value, PluginEnum.HISTOGRAM.value,
+                      PluginEnum.IMAGE.value)
+_BACKPRESSURE_POLICIES = ('block', 'drop', 'sample')
+
 
 def _pack_data(datadict, wall_time):
     """Pack data according to which plugin."""
@@ -63,21 +71,38 @@ class WriterPool(ctx.Process):
     """
     Use a set of pooled resident processes for writing a list of file.
 
+    The writer process blocks on its queue and on the completion of packing tasks, the packed data is written
+    in the order of receiving. The queue is bounded, when it is full the scalar, tensor, histogram and image data
+    is handled by the back-pressure policy, while the other data always waits for the queue.
+
     Args:
         base_dir (str): The base directory to hold all the files.
         max_file_size (Optional[int]): The maximum size of each file that can be written to disk in bytes.
         raise_exception (bool, optional): Sets whether to throw an exception when an RuntimeError exception occurs
             in recording data. Default: False, this means that error logs are printed and no exception is thrown.
-        export_options (Union[None, dict]): Perform custom operations on the export data. Default: None.
+        num_process (int): The number of processes packing the data, 0 means packing in the writer process.
+            Default: 2.
+        max_queue_size (int): The maximum number of records waiting in the queue. Default: 16.
+        backpressure_policy (str): The handling of droppable data when the queue is full, 'block' waits for the
+            queue, 'drop' drops the data and 'sample' only writes one of every `sample_interval` records.
+            Default: 'block'.
+        sample_interval (int): The sampling interval of the 'sample' policy. Default: 10.
         filedict (dict): The mapping from plugin to filename.
     """
 
-    def __init__(self, base_dir, max_file_size, raise_exception=False, **filedict) -> None:
+    def __init__(self, base_dir, max_file_size, raise_exception=False, num_process=2, max_queue_size=16,
+                 backpressure_policy='block', sample_interval=10, **filedict) -> None:
         super().__init__()
         self._base_dir, self._filedict = base_dir, filedict
-        self._queue, self._writers_ = ctx.Queue(ctx.cpu_count() * 2), None
+        self._queue, self._writers_ = ctx.Queue(max_queue_size), None
         self._max_file_size = max_file_size
         self._raise_exception = raise_exception
+        self._num_process = num_process
+        self._max_queue_size = max_queue_size
+        self._backpressure_policy = backpressure_policy
+        self._sample_interval = sample_interval
+        self._congested_count = 0
+        self._dropped = defaultdict(int)
         self.start()
 
     def run(self):
@@ -94,27 +119,60 @@ class WriterPool(ctx.Process):
         # which causes the main process to fail to exit.
         signal.signal(signal.SIGINT, signal.SIG_IGN)
 
-        with ctx.Pool(min(ctx.cpu_count(), 32)) as pool:
-            deq = deque()
-            while True:
-                while deq and deq[0].ready():
-                    for plugin, data in deq.popleft().get():
-                        self._write(plugin, data)
-
-                if not self._queue.empty():
-                    action, data = self._queue.get()
-                    if action == 'WRITE':
-                        deq.append(pool.apply_async(_pack_data, (data, time.time())))
-                    elif action == 'FLUSH':
-                        self._flush()
-                    elif action == 'END':
-                        break
-            for result in deq:
-                for plugin, data in result.get():
-                    self._write(plugin, data)
-
+        pool = ctx.Pool(self._num_process) if self._num_process > 0 else None
+        try:
+            self._serve(pool)
+        finally:
+            if pool is not None:
+                pool.terminate()
             self._close()
 
+    def _serve(self, pool):
+        """Receive the actions, pack the data and write them in the order of receiving."""
+        events = queue.Queue()
+        # bound the number of records received but not written yet
+        in_flight = threading.BoundedSemaphore(max(self._num_process, 1) * 2 + 2)
+        receiver = threading.Thread(target=self._receive, args=(events, in_flight), daemon=True)
+        receiver.start()
+
+        done, next_seq = {}, 0
+        while True:
+            event, seq, action, data = events.get()
+            if event == 'RECEIVED' and action == 'WRITE':
+                if pool is None:
+                    done[seq] = (action, _pack_data(data, time.time()))
+                else:
+                    pool.apply_async(_pack_data, (data, time.time()),
+                                     callback=lambda result, seq=seq: events.put(('DONE', seq, 'WRITE', result)),
+                                     error_callback=lambda exc, seq=seq: events.put(('DONE', seq, 'ERROR', exc)))
+            else:
+                done[seq] = (action, data)
+
+            while next_seq in done:
+                action, data = done.pop(next_seq)
+                next_seq += 1
+                in_flight.release()
+                if action == 'WRITE':
+                    for plugin, packed in data:
+                        self._write(plugin, packed)
+                elif action == 'ERROR':
+                    logger.error(f'Failed to pack the summary data: {data}')
+                elif action == 'FLUSH':
+                    self._flush()
+                elif action == 'END':
+                    return
+
+    def _receive(self, events, in_flight):
+        """Block on the queue and forward the actions with their sequence numbers."""
+        seq = 0
+        while True:
+            in_flight.acquire()
+            action, data = self._queue.get()
+            events.put(('RECEIVED', seq, action, data))
+            seq += 1
+            if action == 'END':
+                return
+
     @property
     def _writers(self):
         """Get the writers in the subprocess."""
@@ -166,7 +224,42 @@ class WriterPool(ctx.Process):
         Args:
             data (Optional[str, Tuple[list, int]]): The data to write.
         """
-        self._queue.put(('WRITE', data))
+        if self._backpressure_policy == 'block':
+            self._queue.put(('WRITE', data))
+            return
+        try:
+            self._queue.put_nowait(('WRITE', data))
+            return
+        except queue.Full:
+            pass
+
+        self._congested_count += 1
+        keep_droppable = self._backpressure_policy == 'sample' and \
+            (self._congested_count - 1) % self._sample_interval == 0
+        kept = {}
+        for plugin, datalist in data.items():
+            if plugin in _DROPPABLE_PLUGINS and not keep_droppable:
+                self._dropped[plugin] += len(datalist)
+            else:
+                kept[plugin] = datalist
+        if kept:
+            self._queue.put(('WRITE', kept))
+
+    def get_metrics(self):
+        """
+        Get the metrics of the writer.
+
+        Returns:
+            dict, the number of records waiting in the queue, the capacity of the queue and the number of dropped
+            records of each plugin.
+        """
+        try:
+            queue_depth = self._queue.qsize()
+        except NotImplementedError:
+            queue_depth = -1
+        return {'queue_depth': queue_depth,
+                'queue_capacity': self._max_queue_size,
+                'dropped_records': dict(self._dropped)}
 
     def flush(self):
         """Flush the writer and sync data to disk."""
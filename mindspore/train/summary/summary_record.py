@@ -39,6 +39,13 @@ _DEFAULT_EXPORT_OPTIONS = {
     'tensor_format': 'npy',
 }
 
+_DEFAULT_WRITER_OPTIONS = {
+    'num_process': 2,
+    'max_queue_size': 16,
+    'backpressure_policy': 'block',
+    'sample_interval': 10,
+}
+
 
 def _cache_summary_tensor_data(summary):
     """
@@ -82,6 +89,26 @@ def process_export_options(export_options):
     return export_options
 
 
+def process_writer_options(writer_options):
+    """Check the writer options and fill the default values."""
+    check_value_type('writer_options', writer_options, [dict, type(None)])
+    options = dict(_DEFAULT_WRITER_OPTIONS)
+    if writer_options is None:
+        return options
+
+    unexpected_params = set(writer_options) - set(_DEFAULT_WRITER_OPTIONS)
+    if unexpected_params:
+        raise ValueError(f'For `writer_options` the keys {unexpected_params} are unsupported, '
+                         f'expect the follow keys: {list(_DEFAULT_WRITER_OPTIONS.keys())}')
+    options.update(writer_options)
+
+    Validator.check_non_negative_int(options.get('num_process'), 'num_process')
+    Validator.check_positive_int(options.get('max_queue_size'), 'max_queue_size')
+    Validator.check_string(options.get('backpressure_policy'), ['block', 'drop', 'sample'], 'backpressure_policy')
+    Validator.check_positive_int(options.get('sample_interval'), 'sample_interval')
+    return options
+
+
 class SummaryRecord:
     """
     SummaryRecord is used to record the summary data and lineage data.
@@ -115,6 +142,18 @@ class SummaryRecord:
             - tensor_format (Union[str, None]): Customize the export tensor format.
               Default: None, it means there is no export tensor.
 
+        writer_options (Union[None, dict]): Configure the process writing the summary files. Default: None, it means
+            using the default value of each option shown below.
+
+            - num_process (int): The number of processes packing the data, 0 means packing in the writer process.
+              Default: 2.
+            - max_queue_size (int): The maximum number of records waiting to be written, it bounds the memory used
+              when training outpaces the disk. Default: 16.
+            - backpressure_policy (str): How to handle the scalar, tensor, histogram and image data when the queue
+              is full. 'block' waits for the queue, 'drop' drops the data and 'sample' only keeps one of every
+              `sample_interval` records. The graph and lineage data always waits. Default: 'block'.
+            - sample_interval (int): The sampling interval of the 'sample' policy. Default: 10.
+
     Raises:
         TypeError: If the parameter type is incorrect.
 
@@ -132,7 +171,7 @@ class SummaryRecord:
     """
 
     def __init__(self, log_dir, file_prefix="events", file_suffix="_MS",
-                 network=None, max_file_size=None, raise_exception=False, export_options=None):
+                 network=None, max_file_size=None, raise_exception=False, export_options=None, writer_options=None):
 
         self._closed, self._event_writer = False, None
         self._mode, self._data_pool = 'train', defaultdict(list)
@@ -153,6 +192,7 @@ class SummaryRecord:
             max_file_size = None
 
         Validator.check_value_type(arg_name='raise_exception', arg_value=raise_exception, valid_types=bool)
+        writer_options = process_writer_options(writer_options)
 
         self.prefix = file_prefix
         self.suffix = file_suffix
@@ -176,6 +216,7 @@ class SummaryRecord:
         self._event_writer = WriterPool(log_dir,
                                         max_file_size,
                                         raise_exception,
+                                        **writer_options,
                                         **filename_dict)
         _get_summary_tensor_data()
         atexit.register(self.close)
@@ -359,6 +400,23 @@ class SummaryRecord:
         """
         return self.full_file_name
 
+    def get_writer_metrics(self):
+        """
+        Get the metrics of the process writing the summary files.
+
+        Returns:
+            dict, the number of records waiting in the queue('queue_depth'), the capacity of the queue
+            ('queue_capacity') and the number of dropped records of each plugin('dropped_records').
+
+        Examples:
+            >>> with SummaryRecord(log_dir="./summary_dir", writer_options={'backpressure_policy': 'drop'}) as sr:
+            ...     metrics = sr.get_writer_metrics()
+        """
+        if self._closed or not self._event_writer:
+            logger.error("The record writer is closed.")
+            return {}
+        return self._event_writer.get_metrics()
+
     def flush(self):
         """
         Flush the event file to disk.
@@ -0,0 +1,84 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""test the performance of the graph kernel splitter on synthetic graphs"""
+import random
+import time
+
+from mindspore._extends.graph_kernel.model import GraphBuilder
+from mindspore._extends.graph_kernel.model.graph_split import GraphSplitGpu, GraphSplitAscend
+from mindspore._extends.graph_kernel.model.model import Tensor
+
+graph_sizes = [1000, 5000, 10000, 20000, 50000]
+shape_size = 64
+# the inputs of an op are picked from the latest tensors mostly
+input_window = 12
+
+
+def gen_graph(num_ops, seed=0):
+    """Generate a graph of elemwise, broadcast, reduce, reshape and transpose ops."""
+    rng = random.Random(seed)
+    gb = GraphBuilder()
+    full, row, col = [shape_size, shape_size], [1, shape_size], [shape_size, 1]
+    with gb.graph_scope("main"):
+        tensors = {"F": [gb.tensor(full, "float32"), gb.tensor(full, "float16")],
+                   "R": [gb.tensor(row, "float32")], "C": [gb.tensor(col, "float32")]}
+        latest = []
+
+        def pick(kind):
+            cands = [t for k, t in latest[-input_window:] if k == kind]
+            if not cands or rng.random() < 0.05:
+                cands = tensors[kind]
+            return rng.choice(cands)
+
+        for _ in range(num_ops):
+            r = rng.random()
+            if r < 0.3:
+                kind = rng.choice("FFFRC")
+                out = gb.emit(rng.choice(["Abs", "Neg", "Exp"]), [pick(kind)])
+            elif r < 0.55:
+                out, kind = gb.emit(rng.choice(["TensorAdd", "Mul"]), [pick("F"), pick(rng.choice("FFRC"))]), "F"
+            elif r < 0.65:
+                axis = rng.choice([0, 1])
+                out = gb.emit("ReduceSum", [pick("F")], attrs={"reduce_axis": (axis,), "keep_dims": True})
+                kind = "R" if axis == 0 else "C"
+            elif r < 0.72:
+                out, kind = gb.emit("Reshape", [pick("F")], attrs={"shape": full}), "F"
+            elif r < 0.77:
+                inp = pick("F")
+                out, kind = gb.tensor(full, inp.dtype), "F"
+                gb.op("Transpose", out, [inp])
+            elif r < 0.82:
+                out, kind = gb.emit("BroadcastTo", [pick(rng.choice("RC"))], attrs={"shape": full}), "F"
+            else:
+                out, kind = gb.emit("Sqrt", [pick("F")]), "F"
+            if rng.random() < 0.05:
+                out.para_type = Tensor.PARA_OUTPUT
+            latest.append((kind, out))
+            tensors[kind].append(out)
+    return gb.get()[0]
+
+
+def test_graph_split_perf():
+    for num_ops in graph_sizes:
+        graph = gen_graph(num_ops)
+        for splitter in (GraphSplitGpu, GraphSplitAscend):
+            start = time.time()
+            subgraphs, _ = splitter(graph).split()
+            end = time.time()
+            print("{} ops, {}: {} subgraphs, {:.2f}s".format(num_ops, splitter.__name__, len(subgraphs), end - start))
+
+
+if __name__ == '__main__':
+    test_graph_split_perf()
@@ -476,6 +476,69 @@ def test_generator_17():
         i = i + 1
 
 
+def test_generator_18():
+    """
+    Test multi column generator Mp + Python sampler + shared memory
+    """
+    logger.info("Test multi column generator with shared memory")
+
+    sampler = [x for x in range(256)]
+    source = [(np.array([x]), np.full((x % 8 + 1, 4), x, np.float32)) for x in range(256)]
+    # apply dataset operations
+    data1 = ds.GeneratorDataset(source, ["col0", "col1"], sampler=sampler, num_parallel_workers=2,
+                                python_multiprocessing=True, shared_memory_slots=4)
+
+    i = 0
+    for item in data1.create_dict_iterator(num_epochs=1, output_numpy=True):  # each data is a dictionary
+        golden = np.array([i])
+        np.testing.assert_array_equal(item["col0"], golden)
+        golden = np.full((i % 8 + 1, 4), i, np.float32)
+        np.testing.assert_array_equal(item["col1"], golden)
+        i = i + 1
+    assert i == 256
+
+
+def test_generator_19():
+    """
+    Test multi column generator Mp + Python sampler + chunk dispatch
+    """
+    logger.info("Test multi column generator with chunk dispatch")
+
+    sampler = [x for x in range(256)]
+    source = [(np.array([x]), np.array([x + 1])) for x in range(256)]
+    # apply dataset operations
+    data1 = ds.GeneratorDataset(source, ["col0", "col1"], sampler=sampler, num_parallel_workers=4,
+                                dispatch_chunk_size=8)
+
+    i = 0
+    for item in data1.create_dict_iterator(num_epochs=1, output_numpy=True):  # each data is a dictionary
+        golden = np.array([i])
+        np.testing.assert_array_equal(item["col0"], golden)
+        golden = np.array([i + 1])
+        np.testing.assert_array_equal(item["col1"], golden)
+        i = i + 1
+    assert i == 256
+
+
+def test_generator_20():
+    """
+    Test multi column generator Mp + Python sampler + non-deterministic order
+    """
+    logger.info("Test multi column generator with non-deterministic order")
+
+    sampler = [x for x in range(256)]
+    source = [(np.array([x]), np.array([x + 1])) for x in range(256)]
+    # apply dataset operations
+    data1 = ds.GeneratorDataset(source, ["col0", "col1"], sampler=sampler, num_parallel_workers=4,
+                                deterministic=False)
+
+    col0 = []
+    for item in data1.create_dict_iterator(num_epochs=1, output_numpy=True):  # each data is a dictionary
+        np.testing.assert_array_equal(item["col1"], item["col0"] + 1)
+        col0.append(item["col0"][0])
+    assert sorted(col0) == sampler
+
+
 def test_generator_error_1():
     def generator_np():
         for i in range(64):
@@ -764,6 +827,9 @@ if __name__ == "__main__":
     test_generator_15()
     test_generator_16()
     test_generator_17()
+    test_generator_18()
+    test_generator_19()
+    test_generator_20()
     test_generator_error_1()
     test_generator_error_2()
     test_generator_error_3()
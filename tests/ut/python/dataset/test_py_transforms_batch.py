@@ -0,0 +1,118 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""
+Testing the batch execution of py_transforms in DE
+"""
+import numpy as np
+from numpy.testing import assert_allclose
+import pytest
+
+import mindspore.dataset.transforms.py_transforms as py_transforms
+import mindspore.dataset.vision.py_transforms as py_vision
+import mindspore.dataset.vision.py_transforms_util as util
+
+MEAN = [0.475, 0.45, 0.392]
+STD = [0.275, 0.267, 0.278]
+
+
+def generate_images(num_imgs=4, height=12, width=10):
+    np.random.seed(0)
+    return np.random.randint(0, 256, (num_imgs, height, width, 3)).astype(np.uint8)
+
+
+def test_batch_compose_same_as_per_image():
+    """
+    Test BatchCompose of the deterministic transforms gives the same images as Compose
+    """
+    imgs = generate_images()
+    transforms = [py_vision.CenterCrop((8, 6)),
+                  py_vision.ToTensor(),
+                  py_vision.Normalize(MEAN, STD)]
+    expected = np.stack([py_transforms.Compose([py_vision.ToPIL()] + transforms)(img)[0] for img in imgs])
+
+    output = py_transforms.BatchCompose(transforms)(imgs)
+    assert output.shape == (4, 3, 8, 6)
+    assert output.dtype == expected.dtype
+    assert_allclose(output, expected, rtol=1e-6)
+
+
+def test_batch_compose_list_input():
+    """
+    Test BatchCompose as per_batch_map takes a list of images and returns a tuple of a list
+    """
+    imgs = generate_images()
+    output = py_transforms.BatchCompose([py_vision.ToTensor(), py_vision.NormalizePad(MEAN, STD)])(list(imgs), None)
+    assert isinstance(output, tuple) and len(output) == 1
+    assert len(output[0]) == 4
+    expected = util.normalize(util.to_tensor(imgs[1], np.float32), MEAN, STD, pad_channel=True)
+    assert_allclose(output[0][1], expected, rtol=1e-6)
+
+
+def test_batch_compose_fallback():
+    """
+    Test BatchCompose applies the transforms without the batch execution on the images one by one
+    """
+    imgs = generate_images()
+    output = py_transforms.BatchCompose([py_vision.ToTensor(), lambda img: img[:, ::2, ::2]])(imgs)
+    assert output.shape == (4, 3, 6, 5)
+    assert_allclose(output[2], util.to_tensor(imgs[2], np.float32)[:, ::2, ::2])
+
+
+def test_random_flips():
+    """
+    Test the batch random flips flip the whole images of a batch or not at all
+    """
+    imgs = generate_images(num_imgs=16)
+    flipped = util.random_horizontal_flips(imgs, 0.5, True)
+    for img, output in zip(imgs, flipped):
+        assert np.array_equal(output, img) or np.array_equal(output, img[:, ::-1])
+    assert np.array_equal(util.random_vertical_flips(imgs, 1, True), imgs[:, ::-1])
+
+    chw_imgs = util.hwc_to_chws(imgs)
+    assert np.array_equal(util.random_horizontal_flips(chw_imgs, 1, False), chw_imgs[..., ::-1])
+    assert np.array_equal(util.random_vertical_flips(chw_imgs, 0, False), chw_imgs)
+
+
+def test_random_erasing_batch():
+    """
+    Test the batch RandomErasing erases a rectangle of each image to the value
+    """
+    imgs = util.to_tensors(generate_images(num_imgs=8, height=32, width=32), np.float32) + 1
+    output, is_hwc = py_vision.RandomErasing(prob=1, value=0).apply_batch(imgs, False)
+    assert not is_hwc
+    assert np.all(imgs > 0)
+    for img in output:
+        rows, cols = np.nonzero((img == 0).all(axis=0))
+        assert rows.size == (rows.max() - rows.min() + 1) * (cols.max() - cols.min() + 1)
+
+    output, _ = py_vision.RandomErasing(prob=0).apply_batch(imgs, False)
+    assert np.array_equal(output, imgs)
+
+
+def test_center_crops_invalid():
+    """
+    Test the batch center crop larger than the images
+    """
+    with pytest.raises(ValueError):
+        util.center_crops(generate_images(), 16, True)
+
+
+if __name__ == "__main__":
+    test_batch_compose_same_as_per_image()
+    test_batch_compose_list_input()
+    test_batch_compose_fallback()
+    test_random_flips()
+    test_random_erasing_batch()
+    test_center_crops_invalid()
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import gc
+
 import numpy as np
 import pytest
 
@@ -250,6 +252,49 @@ def test_case_9():
         i = i + 4
 
 
+def test_case_10():
+    """
+    Test PyFunc
+    """
+    logger.info("Test multiple 1-1 PyFunc persistent workers: lambda x : x + x")
+
+    # apply dataset operations
+    data1 = ds.TFRecordDataset(DATA_DIR, SCHEMA_DIR, shuffle=False)
+
+    data1 = data1.map(operations=[(lambda x: x + x), (lambda x: x + 1)], input_columns="col0", output_columns="out",
+                      num_parallel_workers=2, python_multiprocessing=True, persistent_workers=True, rows_per_task=4)
+
+    # The worker pool is reused by the iterators of the following epochs
+    for _ in range(2):
+        i = 0
+        for item in data1.create_dict_iterator(num_epochs=1, output_numpy=True):  # each data is a dictionary
+            # In this test, the dataset is 2x2 sequential tensors
+            golden = np.array([[i * 2 + 1, (i + 1) * 2 + 1], [(i + 2) * 2 + 1, (i + 3) * 2 + 1]])
+            np.testing.assert_array_equal(item["out"], golden)
+            i = i + 4
+
+
+def test_case_10_pool_closed():
+    """
+    Test the persistent worker pool is closed with its dataset
+    """
+    logger.info("Test PyFunc persistent workers closed with the dataset")
+
+    data1 = ds.TFRecordDataset(DATA_DIR, SCHEMA_DIR, shuffle=False)
+    data1 = data1.map(operations=(lambda x: x + x), input_columns="col0", output_columns="out",
+                      num_parallel_workers=2, python_multiprocessing=True, persistent_workers=True)
+    for _ in data1.create_dict_iterator(num_epochs=1, output_numpy=True):
+        pass
+    # the pool of the iterator is reused
+    pool = data1.worker_pool_holder.get(data1.operations, 2, data1.rows_per_task)
+    assert pool.is_alive()
+    assert pool.stats()["rows"] > 0
+
+    del data1
+    gc.collect()
+    assert not pool.is_alive()
+
+
 def test_pyfunc_implicit_compose():
     """
     Test Implicit Compose with pyfunc
@@ -319,6 +364,8 @@ if __name__ == "__main__":
     test_case_7()
     test_case_8()
     test_case_9()
+    test_case_10()
+    test_case_10_pool_closed()
     test_pyfunc_implicit_compose()
     test_pyfunc_execption()
     skip_test_pyfunc_execption_multiprocess()
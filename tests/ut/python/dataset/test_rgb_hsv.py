@@ -131,6 +131,43 @@ def test_rgb_hsv_batch_chw():
     assert_allclose(rgb_base.flatten(), rgb_de.flatten(), rtol=1e-5, atol=0)
 
 
+def test_rgb_hsv_batch_uint8():
+    rgb_imgs = np.random.randint(0, 256, (4, 3, 2, 8)).astype(np.uint8)
+    hsv_de = util.rgb_to_hsvs(rgb_imgs, False)
+    assert hsv_de.dtype == np.uint8
+    hsv_base = util.rgb_to_hsvs(rgb_imgs.astype(np.float32) / 255, False)
+    assert_allclose(hsv_base.flatten() * 255, hsv_de.flatten(), rtol=0, atol=0.5)
+
+    rgb_de = util.hsv_to_rgbs(hsv_de, False)
+    assert rgb_de.dtype == np.uint8
+    assert np.abs(rgb_de.astype(np.int32) - rgb_imgs).max() <= 3
+
+
+def test_adjust_hue_array():
+    rgb_flat = generate_numpy_random_rgb((64, 3)).astype(np.float32)
+    rgb_imgs = rgb_flat.reshape((4, 2, 8, 3))
+    hue_factors = np.array([0.1, -0.2, 0.5, 0])
+    rgb_base = []
+    for r, g, b in rgb_flat.astype(np.float64):
+        h, s, v = colorsys.rgb_to_hsv(r, g, b)
+        rgb_base.append((h, s, v))
+    hsv_base = np.array(rgb_base).reshape((4, 2, 8, 3))
+    hsv_base[..., 0] = (hsv_base[..., 0] + hue_factors[:, None, None]) % 1.0
+    rgb_base = np.array([colorsys.hsv_to_rgb(h, s, v) for h, s, v in hsv_base.reshape((64, 3))])
+    rgb_de = util.adjust_hue_array(rgb_imgs, hue_factors)
+    assert rgb_de.shape == rgb_imgs.shape
+    assert_allclose(rgb_base.flatten(), rgb_de.flatten(), rtol=1e-5, atol=1e-6)
+
+
+def test_random_color_adjust_array():
+    rgb_imgs = np.random.randint(0, 256, (4, 8, 8, 3)).astype(np.uint8)
+    adjusted = util.random_color_adjust_array(rgb_imgs, 0, 0, 0, 0)
+    assert adjusted.dtype == np.uint8
+    assert np.abs(adjusted.astype(np.int32) - rgb_imgs).max() <= 3
+    adjusted = util.random_color_adjust_array(rgb_imgs.transpose(0, 3, 1, 2), 0.4, 0.4, 0.4, 0.1, is_hwc=False)
+    assert adjusted.shape == (4, 3, 8, 8)
+
+
 def test_rgb_hsv_pipeline():
     # First dataset
     transforms1 = [
@@ -168,4 +205,7 @@ if __name__ == "__main__":
     test_rgb_hsv_batch_hwc()
     test_rgb_hsv_chw()
     test_rgb_hsv_batch_chw()
+    test_rgb_hsv_batch_uint8()
+    test_adjust_hue_array()
+    test_random_color_adjust_array()
     test_rgb_hsv_pipeline()
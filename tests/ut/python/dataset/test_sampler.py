@@ -165,6 +165,57 @@ def test_python_sampler():
     assert list(sp1.get_indices()) == [0, 1, 2, 3, 4]
 
 
+def test_python_array_sampler():
+    manifest_file = "../data/dataset/testManifestData/test5trainimgs.json"
+    map_ = {(172876, 0): 0, (54214, 0): 1, (54214, 1): 2, (173673, 0): 3, (64631, 1): 4}
+
+    class ArraySampler(ds.Sampler):
+        def indices(self):
+            return np.arange(self.dataset_size - 1, -1, -1)
+
+    class ChunkSampler(ds.Sampler):
+        def indices(self):
+            return (np.arange(start, min(start + 2, self.dataset_size)) for start in range(0, self.dataset_size, 2))
+
+    def test_config(num_repeats, sampler):
+        data1 = ds.ManifestDataset(manifest_file, sampler=sampler).repeat(num_repeats)
+        res = []
+        for item in data1.create_dict_iterator(num_epochs=1, output_numpy=True):
+            res.append(map_[(item["image"].shape[0], item["label"].item())])
+        return res
+
+    assert test_config(2, ArraySampler()) == [4, 3, 2, 1, 0, 4, 3, 2, 1, 0]
+    assert test_config(2, ChunkSampler(3)) == [0, 1, 2, 0, 1, 2]
+
+    sp1 = ChunkSampler().create(samples_per_buffer=2)
+    sp1.set_num_rows(5)
+    sp1.set_num_samples(5)
+    sp1.initialize()
+    assert list(sp1.get_indices()) == [0, 1, 2, 3, 4]
+    assert list(sp1.get_indices()) == [0, 1, 2, 3, 4]
+
+
+def test_python_sampler_chunks():
+    class ChunkSampler(ds.Sampler):
+        def indices(self):
+            return (np.arange(start, start + 3) for start in range(0, 9, 3))
+
+    class IterSampler(ds.Sampler):
+        def __iter__(self):
+            return iter(range(9))
+
+    for sampler in [ChunkSampler(), IterSampler()]:
+        sampler._handshake(9, 8)
+        assert sampler.get_num_samples() == 8
+        for _ in range(2):
+            chunks = [sampler._get_next_indices(4), sampler._get_next_indices(4), sampler._get_next_indices(4)]
+            assert [chunk.tolist() for chunk in chunks] == [[0, 1, 2, 3], [4, 5, 6, 7], []]
+        assert sampler._get_next_indices(5).tolist() == [0, 1, 2, 3, 4]
+        assert sampler._get_next_indices(5).tolist() == [5, 6, 7]
+        assert sampler._get_indices().tolist() == list(range(8))
+    assert list(ChunkSampler()) == list(range(9))
+
+
 def test_subset_sampler():
     manifest_file = "../data/dataset/testManifestData/test5trainimgs.json"
     map_ = {(172876, 0): 0, (54214, 0): 1, (54214, 1): 2, (173673, 0): 3, (64631, 1): 4}
@@ -249,6 +300,8 @@ if __name__ == '__main__':
     test_random_sampler_multi_iter(True)
     test_sampler_py_api()
     test_python_sampler()
+    test_python_array_sampler()
+    test_python_sampler_chunks()
     test_subset_sampler()
     test_sampler_chain()
     test_add_sampler_invalid_input()
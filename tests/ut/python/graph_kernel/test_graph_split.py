@@ -0,0 +1,183 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""test the graph kernel splitters"""
+import random
+
+import pytest
+from mindspore._extends.graph_kernel.model import GraphBuilder
+from mindspore._extends.graph_kernel.model.graph_split import GraphSplitGpu, GraphSplitAscend
+from mindspore._extends.graph_kernel.model.model import Tensor
+
+
+def diamond():
+    """a -> (b, c) -> d, all elemwise"""
+    gb = GraphBuilder()
+    with gb.graph_scope("diamond") as g:
+        x = gb.tensor([32, 32], "float32", name="x")
+        g.set_input(x)
+        a = gb.emit("Abs", [x], name="a")
+        b = gb.emit("Neg", [a], name="b")
+        c = gb.emit("Exp", [a], name="c")
+        d = gb.emit("TensorAdd", [b, c], name="d")
+        g.set_output(d)
+    return gb.get()[0]
+
+
+def transpose_cycle():
+    """a -> d is elemwise, but fusing them alone makes a cycle through the transpose"""
+    gb = GraphBuilder()
+    with gb.graph_scope("transpose_cycle") as g:
+        x = gb.tensor([32, 32], "float32", name="x")
+        g.set_input(x)
+        a = gb.emit("Abs", [x], name="a")
+        t = gb.tensor([32, 32], "float32", name="t")
+        gb.op("Transpose", t, [a])
+        u = gb.emit("Neg", [t], name="u")
+        d = gb.emit("TensorAdd", [a, u], name="d")
+        g.set_output(d)
+    return gb.get()[0]
+
+
+def reduce_cycle():
+    """a -> d is elemwise, but d also depends on a through the reduce"""
+    gb = GraphBuilder()
+    with gb.graph_scope("reduce_cycle") as g:
+        x = gb.tensor([32, 64], "float32", name="x")
+        g.set_input(x)
+        a = gb.emit("Exp", [x], name="a")
+        r = gb.emit("ReduceSum", [a], name="r", attrs={"reduce_axis": (1,), "keep_dims": True})
+        s = gb.emit("Sqrt", [r], name="s")
+        d = gb.emit("RealDiv", [a, s], name="d")
+        e = gb.emit("ReduceSum", [d], name="e", attrs={"reduce_axis": (0,), "keep_dims": True})
+        g.set_output(d, e)
+    return gb.get()[0]
+
+
+def reshape_diamond():
+    """two paths of reshapes from a to e, one of them through a transpose"""
+    gb = GraphBuilder()
+    with gb.graph_scope("reshape_diamond") as g:
+        x = gb.tensor([32, 32], "float16", name="x")
+        y = gb.tensor([1024], "float16", name="y")
+        g.set_input(x, y)
+        a = gb.emit("Cast", [x], name="a", attrs={"dst_type": "float16"})
+        b = gb.emit("Reshape", [a], name="b", attrs={"shape": [1024]})
+        c = gb.emit("Mul", [b, y], name="c")
+        t = gb.tensor([32, 32], "float16", name="t")
+        gb.op("Transpose", t, [a])
+        d = gb.emit("Reshape", [t], name="d", attrs={"shape": [1024]})
+        e = gb.emit("TensorAdd", [c, d], name="e")
+        g.set_output(e)
+    return gb.get()[0]
+
+
+def random_graph(num_ops, seed):
+    """Generate a graph of elemwise, broadcast, reduce, reshape and transpose ops."""
+    rng = random.Random(seed)
+    gb = GraphBuilder()
+    full, row, col = [16, 16], [1, 16], [16, 1]
+    with gb.graph_scope("random") as g:
+        tensors = {"F": [gb.tensor(full, "float32")], "R": [gb.tensor(row, "float32")],
+                   "C": [gb.tensor(col, "float32")]}
+        g.set_input(*[t[0] for t in tensors.values()])
+        for _ in range(num_ops):
+            r = rng.random()
+            if r < 0.3:
+                kind = rng.choice("FFRC")
+                out = gb.emit(rng.choice(["Abs", "Neg", "Exp"]), [rng.choice(tensors[kind][-6:])])
+            elif r < 0.55:
+                inputs = [rng.choice(tensors["F"][-6:]), rng.choice(tensors[rng.choice("FFRC")][-6:])]
+                out, kind = gb.emit(rng.choice(["TensorAdd", "Mul"]), inputs), "F"
+            elif r < 0.7:
+                axis = rng.choice([0, 1])
+                out = gb.emit("ReduceSum", [rng.choice(tensors["F"][-6:])],
+                              attrs={"reduce_axis": (axis,), "keep_dims": True})
+                kind = "R" if axis == 0 else "C"
+            elif r < 0.8:
+                out, kind = gb.emit("Reshape", [rng.choice(tensors["F"][-6:])], attrs={"shape": full}), "F"
+            elif r < 0.9:
+                out, kind = gb.tensor(full, "float32"), "F"
+                gb.op("Transpose", out, [rng.choice(tensors["F"][-6:])])
+            else:
+                out = gb.emit("BroadcastTo", [rng.choice(tensors[rng.choice("RC")][-6:])], attrs={"shape": full})
+                kind = "F"
+            if rng.random() < 0.1:
+                out.para_type = Tensor.PARA_OUTPUT
+            tensors[kind].append(out)
+    return gb.get()[0]
+
+
+def split_names(splitter, graph):
+    subgraphs, modes = splitter(graph).split()
+    return sorted(([op.output.name for op in subgraph.ops], mode) for subgraph, mode in zip(subgraphs, modes))
+
+
+def check_split(splitter, graph):
+    """Check that the subgraphs cover the ops once and no cycle exists between them."""
+    subgraphs, _ = splitter(graph).split()
+    area_of = {}
+    for i, subgraph in enumerate(subgraphs):
+        for op in subgraph.ops:
+            assert op not in area_of
+            area_of[op] = i
+    assert set(area_of) == set(graph.ops)
+
+    out_areas = [set() for _ in subgraphs]
+    for op in graph.ops:
+        for t in op.inputs:
+            if t.op is not None and area_of[t.op] != area_of[op]:
+                out_areas[area_of[t.op]].add(area_of[op])
+    in_degree = [0] * len(subgraphs)
+    for outs in out_areas:
+        for j in outs:
+            in_degree[j] += 1
+    ready = [i for i, d in enumerate(in_degree) if d == 0]
+    visited = 0
+    while ready:
+        i = ready.pop()
+        visited += 1
+        for j in out_areas[i]:
+            in_degree[j] -= 1
+            if in_degree[j] == 0:
+                ready.append(j)
+    assert visited == len(subgraphs), "cycle between the fused areas"
+
+
+@pytest.mark.parametrize("graph_fn, expected", [
+    (diamond, [(["a", "b", "c", "d"], "composite")]),
+    (transpose_cycle, [(["a", "t"], "composite"), (["u", "d"], "composite")]),
+    (reduce_cycle, [(["a", "r", "s"], "composite"), (["d", "e"], "composite")]),
+    (reshape_diamond, [(["a", "t"], "composite"), (["b", "c", "d", "e"], "composite")]),
+])
+def test_graph_split_gpu(graph_fn, expected):
+    check_split(GraphSplitGpu, graph_fn())
+    assert split_names(GraphSplitGpu, graph_fn()) == expected
+
+
+@pytest.mark.parametrize("graph_fn, expected", [
+    (diamond, [(["a", "b", "c", "d"], "composite")]),
+    (transpose_cycle, [(["a"], "basic"), (["t"], "basic"), (["u", "d"], "composite")]),
+    (reduce_cycle, [(["a", "r"], "composite"), (["s", "d", "e"], "composite")]),
+    (reshape_diamond, [(["a"], "basic"), (["b", "c", "d", "e"], "composite"), (["t"], "basic")]),
+])
+def test_graph_split_ascend(graph_fn, expected):
+    check_split(GraphSplitAscend, graph_fn())
+    assert split_names(GraphSplitAscend, graph_fn()) == expected
+
+
+@pytest.mark.parametrize("splitter", [GraphSplitGpu, GraphSplitAscend])
+def test_graph_split_no_cycle(splitter):
+    for seed in range(20):
+        check_split(splitter, random_graph(60, seed))
@@ -14,6 +14,7 @@
 # ============================================================================
 """test_bleu_score"""
 import math
+import numpy as np
 import pytest
 from mindspore.nn.metrics import BleuScore
 
@@ -71,3 +72,47 @@ def test_bleu_score_runtime():
 
     with pytest.raises(RuntimeError):
         metric.eval()
+
+
+def _generate_corpus(vocab_size, num_sentences=200, seed=0):
+    """generate the corpora of token ids"""
+    rng = np.random.RandomState(seed)
+    candidate_corpus = [rng.randint(0, vocab_size, rng.randint(0, 12)) for _ in range(num_sentences)]
+    reference_corpus = [[rng.randint(0, vocab_size, rng.randint(0, 12)) for _ in range(rng.randint(1, 4))]
+                        for _ in range(num_sentences)]
+    return candidate_corpus, reference_corpus
+
+
+@pytest.mark.parametrize('vocab_size', [4, 1000, 1 << 40])
+@pytest.mark.parametrize('smooth', [False, True])
+def test_bleu_score_token_ids(vocab_size, smooth):
+    """test_bleu_score_token_ids_same_as_counter"""
+    candidate_corpus, reference_corpus = _generate_corpus(vocab_size)
+    expected = BleuScore(smooth=smooth)
+    expected.update([candidate.tolist() for candidate in candidate_corpus],
+                    [[ref.tolist() for ref in references] for references in reference_corpus])
+
+    metric = BleuScore(smooth=smooth, token_ids=True)
+    metric.clear()
+    metric.update(candidate_corpus[:50], reference_corpus[:50])
+    metric.update(candidate_corpus[50:], reference_corpus[50:])
+    assert metric.eval().tobytes() == expected.eval().tobytes()
+
+
+def test_bleu_score_token_ids_workers():
+    """test_bleu_score_token_ids_workers"""
+    candidate_corpus, reference_corpus = _generate_corpus(10)
+    metric = BleuScore(token_ids=True)
+    metric.update(candidate_corpus, reference_corpus)
+    parallel_metric = BleuScore(token_ids=True, num_workers=2)
+    parallel_metric.update(candidate_corpus, reference_corpus)
+    assert parallel_metric.eval() == metric.eval()
+
+
+def test_bleu_score_token_ids_invalid():
+    """test_bleu_score_token_ids_invalid"""
+    metric = BleuScore(token_ids=True)
+    with pytest.raises(TypeError):
+        metric.update([['i', 'have', 'a', 'pen']], [[['i', 'have', 'a', 'pen']]])
+    with pytest.raises(ValueError):
+        metric.update([np.array([1, 2])], [[]])
@@ -0,0 +1,116 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""test_streaming_curve"""
+
+import numpy as np
+import pytest
+from mindspore import Tensor
+from mindspore.nn.metrics import ROC, auc, StreamingROC, StreamingAUC, StreamingPrecisionRecall
+
+
+def _generate(num_samples=1000, num_bins=100, class_num=None, seed=0):
+    """Generate the scores at the centers of the bins and the labels."""
+    rng = np.random.RandomState(seed)
+    shape = (num_samples,) if class_num is None else (num_samples, class_num)
+    x = (rng.randint(0, num_bins, shape) + 0.5) / num_bins
+    y = rng.randint(0, 2 if class_num is None else class_num, num_samples)
+    return x, y
+
+
+def test_streaming_roc():
+    """test_streaming_roc_same_as_roc"""
+    x, y = _generate()
+    metric = StreamingROC(num_bins=100)
+    metric.clear()
+    for start in range(0, 1000, 300):
+        metric.update(Tensor(x[start:start + 300]), Tensor(y[start:start + 300]))
+    fpr, tpr, thresholds = metric.eval()
+
+    expected_fpr, expected_tpr, expected_thresholds = ROC(pos_label=1)(x, y)
+    assert np.allclose(fpr, expected_fpr)
+    assert np.allclose(tpr, expected_tpr)
+    assert np.allclose(thresholds[1:], expected_thresholds[1:] - 0.005)
+
+
+def test_streaming_roc_multiclass():
+    """test_streaming_roc_multiclass_same_as_roc"""
+    x, y = _generate(class_num=3)
+    fpr, tpr, _ = StreamingROC(class_num=3, num_bins=100)(x, y)
+    assert len(fpr) == 3
+    for c in range(3):
+        expected_fpr, expected_tpr, _ = ROC(pos_label=c)(x[:, c], y)
+        assert np.allclose(fpr[c], expected_fpr)
+        assert np.allclose(tpr[c], expected_tpr)
+
+
+def test_streaming_auc_error_bound():
+    """test_streaming_auc_within_error_bound"""
+    rng = np.random.RandomState(1)
+    y = rng.randint(0, 2, 10000)
+    x = 1 / (1 + np.exp(-(rng.randn(10000) + y)))
+    expected = auc(*ROC(pos_label=1)(x, y)[:2])
+
+    for num_bins in (10, 100, 1000):
+        metric = StreamingAUC(num_bins=num_bins)
+        metric.update(x, y)
+        assert abs(metric.eval() - expected) <= metric.error_bound()
+    assert metric.error_bound() < 1e-3
+
+
+def test_streaming_merge():
+    """test_streaming_merge_of_ranks"""
+    x, y = _generate(class_num=4)
+    metric = StreamingAUC(num_bins=100)
+    metric.update(x, y)
+
+    ranks = [StreamingAUC(num_bins=100) for _ in range(2)]
+    ranks[0].update(x[:400], y[:400])
+    ranks[1].update(x[400:], y[400:])
+    merged = StreamingAUC(num_bins=100)
+    merged.merge(ranks[0])
+    merged.merge(ranks[1].histograms.astype(np.float32))
+    assert np.array_equal(merged.histograms, metric.histograms)
+    assert merged.eval() == metric.eval()
+
+    with pytest.raises(ValueError):
+        merged.merge(StreamingAUC(num_bins=10))
+    with pytest.raises(ValueError):
+        merged.merge(np.zeros((2, 3, 100)))
+
+
+def test_streaming_precision_recall():
+    """test_streaming_precision_recall_binary"""
+    x = np.array([0.95, 0.35, 0.75, 0.15, 0.75])
+    y = np.array([1, 0, 1, 0, 0])
+    precision, recall, thresholds = StreamingPrecisionRecall(num_bins=10)(x, y)
+    assert np.allclose(precision, [1., 2 / 3, 0.5, 0.4])
+    assert np.allclose(recall, [0.5, 1., 1., 1.])
+    assert np.allclose(thresholds, [0.9, 0.7, 0.3, 0.1])
+
+
+def test_streaming_invalid():
+    """test_streaming_invalid_inputs"""
+    metric = StreamingROC()
+    with pytest.raises(RuntimeError):
+        metric.eval()
+    with pytest.raises(ValueError):
+        metric.update(np.array([0.2, 0.5]))
+    with pytest.raises(ValueError):
+        metric.update(np.array([0.2, np.nan]), np.array([0, 1]))
+    metric.update(np.array([0.2, 0.5]), np.array([1, 1]))
+    with pytest.raises(ValueError):
+        metric.eval()
+    with pytest.raises(ValueError):
+        StreamingROC(score_range=(1.0, 0.0))
@@ -68,6 +68,25 @@ def test_imagenet_to_mindrecord(fixture_file):
         assert os.path.exists(MINDRECORD_FILE + str(i) + ".db")
     read(MINDRECORD_FILE + "0")
 
+def test_imagenet_to_mindrecord_with_progress_file(fixture_file):
+    """test transform imagenet dataset to mindrecord with loading workers and progress file."""
+    progress_file = MINDRECORD_FILE + ".progress"
+    imagenet_transformer = ImageNetToMR(IMAGENET_MAP_FILE, IMAGENET_IMAGE_DIR,
+                                        MINDRECORD_FILE, PARTITION_NUMBER, num_workers=2,
+                                        progress_file=progress_file)
+    imagenet_transformer.transform()
+    for i in range(PARTITION_NUMBER):
+        assert os.path.exists(MINDRECORD_FILE + str(i))
+        assert os.path.exists(MINDRECORD_FILE + str(i) + ".db")
+    read(MINDRECORD_FILE + "0")
+    # the finished transformation is not run again
+    imagenet_transformer = ImageNetToMR(IMAGENET_MAP_FILE, IMAGENET_IMAGE_DIR,
+                                        MINDRECORD_FILE, PARTITION_NUMBER, num_workers=2,
+                                        progress_file=progress_file)
+    imagenet_transformer.transform()
+    read(MINDRECORD_FILE + "0")
+    os.remove(progress_file)
+
 def test_imagenet_to_mindrecord_default_partition_number(fixture_file):
     """
     test transform imagenet dataset to mindrecord
@@ -1000,3 +1000,57 @@ def test_write_read_process_without_ndarray_type():
 
     os.remove("{}".format(mindrecord_file_name))
     os.remove("{}.db".format(mindrecord_file_name))
+
+
+def test_write_read_process_with_pack_workers():
+    mindrecord_file_name = "test.mindrecord"
+    data = [{"file_name": "{:03d}.jpg".format(i), "label": i,
+             "mask": np.array([i, i + 1, i + 2], dtype=np.int64),
+             "segments": np.array([[i, 1.6], [65.2, 8.3]], dtype=np.float32),
+             "data": bytes("image bytes {}".format(i), encoding='UTF-8')} for i in range(200)]
+    # the invalid rows are removed
+    data[10]["segments"] = np.array([1.0, 2.0, 3.0], dtype=np.float32)
+    data[150]["label"] = "150"
+    writer = FileWriter(mindrecord_file_name)
+    schema = {"file_name": {"type": "string"},
+              "label": {"type": "int32"},
+              "mask": {"type": "int64", "shape": [-1]},
+              "segments": {"type": "float32", "shape": [2, 2]},
+              "data": {"type": "bytes"}}
+    writer.add_schema(schema, "data is so cool")
+    writer.set_pack_workers(2)
+    writer.write_raw_data(data)
+    writer.commit()
+    assert len(data) == 198
+
+    reader = FileReader(mindrecord_file_name)
+    count = 0
+    for x in reader.get_next():
+        assert len(x) == 5
+        for field in x:
+            if isinstance(x[field], np.ndarray):
+                assert (x[field] == data[count][field]).all()
+            else:
+                assert x[field] == data[count][field]
+        count = count + 1
+    assert count == 198
+    reader.close()
+
+    os.remove("{}".format(mindrecord_file_name))
+    os.remove("{}.db".format(mindrecord_file_name))
+
+
+def test_pack_workers_closed_without_commit():
+    mindrecord_file_name = "test_pack_workers.mindrecord"
+    data = [{"file_name": "{:03d}.jpg".format(i), "label": i} for i in range(200)]
+    writer = FileWriter(mindrecord_file_name)
+    writer.add_schema({"file_name": {"type": "string"}, "label": {"type": "int32"}}, "data is so cool")
+    writer.set_pack_workers(2)
+    writer.write_raw_data(data)
+    assert writer._pack_pool is not None  # pylint: disable=protected-access
+    writer.close()
+    assert writer._pack_pool is None  # pylint: disable=protected-access
+
+    for file_name in (mindrecord_file_name, mindrecord_file_name + ".db"):
+        if os.path.exists(file_name):
+            os.remove(file_name)
@@ -0,0 +1,119 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""test the parallel compilation of the akg kernels with the kernel cache"""
+import json
+import os
+import shutil
+import tempfile
+import time
+from multiprocessing import TimeoutError as MpTimeoutError
+
+import pytest
+from mindspore._extends.parallel_compile.akg_compiler import akg_process
+from mindspore._extends.parallel_compile.kernel_cache import get_kernel_cache
+
+COMPILE_LOG = "compiled.log"
+
+
+class FakeAkgMs:
+    """The akg compiler compiling a kernel into a file in the kernel meta directory, the stuck kernels never finish."""
+
+    @staticmethod
+    def compilewithjson(json_str):
+        kernel_name = json.loads(json_str)["op"]
+        if kernel_name.startswith("stuck"):
+            time.sleep(600)
+        os.makedirs("kernel_meta", exist_ok=True)
+        with open(os.path.join("kernel_meta", kernel_name + ".o"), "w") as f:
+            f.write(kernel_name)
+        with open(COMPILE_LOG, "a") as f:
+            f.write(kernel_name + "\n")
+        return True
+
+
+class FakeAkg:
+    ms = FakeAkgMs
+    __version__ = "fake"
+
+
+def init_fake_worker():
+    """Set up a compile worker with the fake akg."""
+    # pylint: disable=W0212
+    akg_process._akg = FakeAkg
+    akg_process._akg_version = FakeAkg.__version__
+    akg_process._kernel_cache = get_kernel_cache(akg_process.KERNEL_CACHE_PATH_ENV)
+
+
+def kernel_json(kernel_name):
+    return json.dumps({"op": kernel_name, "process": "cuda", "op_desc": [{"name": "Add"}]})
+
+
+def compile_kernels(kernel_names, wait_time=60):
+    process = akg_process.create_akg_parallel_process(2, wait_time)
+    for kernel_name in kernel_names:
+        process.accept_json(kernel_json(kernel_name))
+    return process.compile()
+
+
+def compiled_kernels():
+    if not os.path.exists(COMPILE_LOG):
+        return []
+    with open(COMPILE_LOG) as f:
+        return sorted(f.read().split())
+
+
+@pytest.fixture(name="work_dir")
+def fixture_work_dir(monkeypatch):
+    """The kernels are compiled under a temporary directory with the kernel cache in it."""
+    work_dir = tempfile.mkdtemp(prefix="akg_process_")
+    monkeypatch.chdir(work_dir)
+    monkeypatch.setenv(akg_process.KERNEL_CACHE_PATH_ENV, os.path.join(work_dir, "cache"))
+    monkeypatch.setattr(akg_process, "_init_akg_worker", init_fake_worker)
+    akg_process._reset_compile_pool(kill=True)  # pylint: disable=W0212
+    yield work_dir
+    akg_process._reset_compile_pool(kill=True)  # pylint: disable=W0212
+    shutil.rmtree(work_dir)
+
+
+def test_compile_pool_reused(work_dir):
+    """ the compile workers are reused by the compilations """
+    assert compile_kernels(["add_1", "add_2"])
+    pool = akg_process._compile_pool  # pylint: disable=W0212
+    assert pool is not None
+    assert compile_kernels(["add_3"])
+    assert akg_process._compile_pool is pool  # pylint: disable=W0212
+    assert compiled_kernels() == ["add_1", "add_2", "add_3"]
+    assert sorted(os.listdir(os.path.join(work_dir, "kernel_meta"))) == ["add_1.o", "add_2.o", "add_3.o"]
+
+
+def test_compile_with_kernel_cache(work_dir):
+    """ the kernels compiled before are loaded from the kernel cache """
+    assert compile_kernels(["add_1", "add_2"])
+    shutil.rmtree(os.path.join(work_dir, "kernel_meta"))
+    akg_process._reset_compile_pool()  # pylint: disable=W0212
+    assert compile_kernels(["add_1", "add_2", "add_3"])
+    assert compiled_kernels() == ["add_1", "add_2", "add_3"]
+    assert sorted(os.listdir(os.path.join(work_dir, "kernel_meta"))) == ["add_1.o", "add_2.o", "add_3.o"]
+
+
+def test_compile_timeout(work_dir):
+    """ the stuck workers are killed on timeout and the pool is rebuilt by the next compilation """
+    with pytest.raises(MpTimeoutError):
+        compile_kernels(["stuck_1", "add_1"], wait_time=2)
+    assert akg_process._compile_pool is None  # pylint: disable=W0212
+    assert compile_kernels(["add_2"])
+    assert akg_process._compile_pool is not None  # pylint: disable=W0212
+    assert "add_2" in compiled_kernels()
+    assert not os.path.exists(os.path.join(work_dir, "kernel_meta", "stuck_1.o"))
@@ -0,0 +1,118 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""test the cache of the compiled kernels"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import pytest
+from mindspore._extends.parallel_compile.kernel_cache import KernelCache, get_kernel_cache
+
+KERNEL_INFO = {"op_info": {"kernel_name": "add_1", "name": "add"}}
+
+
+@pytest.fixture(name="tmp_dir")
+def fixture_tmp_dir():
+    tmp_dir = tempfile.mkdtemp(prefix="kernel_cache_")
+    yield tmp_dir
+    shutil.rmtree(tmp_dir)
+
+
+def compile_kernel(kernel_meta_path, kernel_name):
+    """Write the files of a compiled kernel, the info file is not cached."""
+    os.makedirs(kernel_meta_path, exist_ok=True)
+    for suffix in (".o", ".json", ".info"):
+        with open(os.path.join(kernel_meta_path, kernel_name + suffix), "w") as f:
+            f.write(kernel_name + suffix)
+    return {"compile_info": kernel_name}
+
+
+def test_get_kernel_cache(monkeypatch, tmp_dir):
+    """ the kernel cache is enabled by the environment only """
+    monkeypatch.delenv("MS_TEST_KERNEL_CACHE_PATH", raising=False)
+    assert get_kernel_cache("MS_TEST_KERNEL_CACHE_PATH") is None
+    monkeypatch.setenv("MS_TEST_KERNEL_CACHE_PATH", "")
+    assert get_kernel_cache("MS_TEST_KERNEL_CACHE_PATH") is None
+    monkeypatch.setenv("MS_TEST_KERNEL_CACHE_PATH", tmp_dir)
+    assert get_kernel_cache("MS_TEST_KERNEL_CACHE_PATH").cache_path == os.path.realpath(tmp_dir)
+
+
+def test_kernel_key(tmp_dir):
+    """ the key changes with the kernel, the compiler, the target and the contents of the source files """
+    impl_file = os.path.join(tmp_dir, "add.py")
+    with open(impl_file, "w") as f:
+        f.write("def add(): pass\n")
+    key = KernelCache.kernel_key(KERNEL_INFO, "1.0", "Ascend910", [impl_file])
+    assert KernelCache.kernel_key(dict(KERNEL_INFO), "1.0", "Ascend910", [impl_file]) == key
+    assert KernelCache.kernel_key(KERNEL_INFO, "1.0", "Ascend910") != key
+    assert KernelCache.kernel_key(KERNEL_INFO, "1.1", "Ascend910", [impl_file]) != key
+    assert KernelCache.kernel_key(KERNEL_INFO, "1.0", "Ascend310", [impl_file]) != key
+    with open(impl_file, "w") as f:
+        f.write("def add(): return 1\n")
+    assert KernelCache.kernel_key(KERNEL_INFO, "1.0", "Ascend910", [impl_file]) != key
+
+
+def test_save_and_load(tmp_dir):
+    """ the files of a kernel are saved into the cache and loaded into another kernel meta directory """
+    cache = KernelCache(os.path.join(tmp_dir, "cache"), os.path.join(tmp_dir, "kernel_meta"))
+    key = cache.kernel_key(KERNEL_INFO, "1.0", "Ascend910")
+    assert cache.load(key, "add_1") is None
+    assert not cache.save(key, "add_1")
+    result = compile_kernel(cache.kernel_meta_path, "add_1")
+    assert cache.save(key, "add_1", result)
+    assert not cache.save(key, "add_1", result)
+
+    other = KernelCache(os.path.join(tmp_dir, "cache"), os.path.join(tmp_dir, "other_kernel_meta"))
+    assert other.load(key, "add_1") == {"kernel_name": "add_1", "result": result}
+    assert sorted(os.listdir(other.kernel_meta_path)) == ["add_1.json", "add_1.o"]
+    assert other.load(key, "sub_1") is None
+
+
+def test_compile_once(tmp_dir):
+    """ a kernel is compiled on a miss and loaded with the result of the compilation on a hit """
+    cache = KernelCache(os.path.join(tmp_dir, "cache"), os.path.join(tmp_dir, "kernel_meta"))
+    key = cache.kernel_key(KERNEL_INFO, "1.0", "Ascend910")
+    compiled = []
+
+    def compile_fn():
+        compiled.append(key)
+        return compile_kernel(cache.kernel_meta_path, "add_1")
+
+    assert cache.compile_once(key, "add_1", compile_fn) == (False, {"compile_info": "add_1"})
+    assert cache.compile_once(key, "add_1", compile_fn) == (True, {"compile_info": "add_1"})
+    assert len(compiled) == 1
+    entry_dir = os.path.dirname(cache._entry_path(key))  # pylint: disable=W0212
+    assert not [f for f in os.listdir(entry_dir) if f.endswith(".lock")]
+
+
+def test_lock_of_dead_owner(tmp_dir):
+    """ the lock left by a killed process is taken over, the lock of a live process is respected """
+    cache = KernelCache(os.path.join(tmp_dir, "cache"), os.path.join(tmp_dir, "kernel_meta"))
+    key = cache.kernel_key(KERNEL_INFO, "1.0", "Ascend910")
+    lock_file = cache._try_lock(key)  # pylint: disable=W0212
+    assert lock_file and cache._try_lock(key) is None  # pylint: disable=W0212
+    os.remove(lock_file)
+
+    owner = subprocess.Popen([sys.executable, "-c", "pass"])
+    owner.wait()
+    with open(lock_file, "w") as f:
+        f.write(str(owner.pid))
+    # the lock of the dead owner is removed, then taken
+    assert cache._try_lock(key) is None  # pylint: disable=W0212
+    assert cache._try_lock(key) == lock_file  # pylint: disable=W0212
+    with open(lock_file) as f:
+        assert f.read() == str(os.getpid())
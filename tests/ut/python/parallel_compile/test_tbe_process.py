@@ -0,0 +1,144 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""test the parallel compilation of the tbe ops with the kernel cache"""
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import pytest
+from mindspore._extends.parallel_compile.kernel_cache import get_kernel_cache
+from mindspore._extends.parallel_compile.tbe_compiler import tbe_process
+
+
+class FakeCompiler:
+    """The tbe compiler compiling an op into a file in the kernel meta directory, the stuck ops never finish."""
+
+    @staticmethod
+    def compile_with_json(op_json):
+        kernel_name = json.loads(op_json)["op_info"]["kernel_name"]
+        if kernel_name.startswith("stuck"):
+            time.sleep(600)
+        os.makedirs("kernel_meta", exist_ok=True)
+        with open(os.path.join("kernel_meta", kernel_name + ".o"), "w") as f:
+            f.write(kernel_name)
+        return {"kernel_name": kernel_name}
+
+
+def init_fake_worker(started_tasks):
+    """Set up a compile worker with the fake compiler instead of te."""
+    # pylint: disable=W0212
+    tbe_process._started_tasks = started_tasks
+    tbe_process._tbe_compiler = FakeCompiler
+    tbe_process._te_version = "fake"
+    tbe_process._kernel_cache = get_kernel_cache(tbe_process.KERNEL_CACHE_PATH_ENV)
+
+
+def op_json(kernel_name, impl_path=None):
+    kernel_info = {"op_info": {"kernel_name": kernel_name, "name": "add", "socVersion": "Ascend910"}}
+    if impl_path is not None:
+        kernel_info["impl_path"] = impl_path
+    return json.dumps(kernel_info)
+
+
+def compile_all(process, op_jsons):
+    """Compile the ops, and get the result of each kernel name."""
+    task_names = {process.start_compile_op(j): json.loads(j)["op_info"]["kernel_name"] for j in op_jsons}
+    results = {}
+    while True:
+        ret = process.wait_any()
+        if ret[0] == 0:
+            return results
+        task_id, status, result = ret
+        results[task_names[task_id]] = (status, result)
+
+
+@pytest.fixture(name="work_dir")
+def fixture_work_dir(monkeypatch):
+    """The kernels are compiled under a temporary directory with the kernel cache in it."""
+    work_dir = tempfile.mkdtemp(prefix="tbe_process_")
+    monkeypatch.chdir(work_dir)
+    monkeypatch.setenv(tbe_process.KERNEL_CACHE_PATH_ENV, os.path.join(work_dir, "cache"))
+    monkeypatch.setenv("MS_BUILD_PROCESS_NUM", "2")
+    monkeypatch.setattr(tbe_process, "_init_tbe_worker", init_fake_worker)
+    yield work_dir
+    shutil.rmtree(work_dir)
+
+
+def test_compile_with_kernel_cache(work_dir):
+    """ the ops compiled by a previous process are loaded from the kernel cache """
+    op_jsons = [op_json("add_1"), op_json("add_2")]
+    process = tbe_process.TbeProcess()
+    try:
+        results = compile_all(process, op_jsons)
+        assert results == {"add_1": ("Success", json.dumps({"kernel_name": "add_1"})),
+                           "add_2": ("Success", json.dumps({"kernel_name": "add_2"}))}
+        assert process.cache_stats() == {"ops": 2, "hits": 0, "hit_rate": 0.0}
+    finally:
+        process.exit()
+
+    shutil.rmtree(os.path.join(work_dir, "kernel_meta"))
+    process = tbe_process.TbeProcess()
+    try:
+        assert compile_all(process, op_jsons) == results
+        assert process.cache_stats() == {"ops": 2, "hits": 2, "hit_rate": 1.0}
+        assert sorted(os.listdir(os.path.join(work_dir, "kernel_meta"))) == ["add_1.o", "add_2.o"]
+    finally:
+        process.exit()
+
+
+def test_custom_op_impl_in_key(work_dir):
+    """ a custom op is compiled again after its implementation is changed """
+    impl_file = os.path.join(work_dir, "add.py")
+    with open(impl_file, "w") as f:
+        f.write("def add(): pass\n")
+    impl_files = tbe_process._get_impl_files(json.loads(op_json("add_1", impl_file)))  # pylint: disable=W0212
+    assert impl_files == [os.path.realpath(impl_file)]
+
+    process = tbe_process.TbeProcess()
+    try:
+        compile_all(process, [op_json("add_1", impl_file)])
+        compile_all(process, [op_json("add_1", impl_file)])
+        assert process.cache_stats()["hits"] == 1
+        with open(impl_file, "w") as f:
+            f.write("def add(): return 1\n")
+        compile_all(process, [op_json("add_1", impl_file)])
+        assert process.cache_stats() == {"ops": 3, "hits": 1, "hit_rate": 1 / 3}
+    finally:
+        process.exit()
+
+
+def test_compile_timeout(work_dir, monkeypatch):
+    """ only the stuck op fails on timeout, its worker is replaced and the other ops are compiled """
+    monkeypatch.setattr(tbe_process, "_COMPILE_TIMEOUT", 2)
+    monkeypatch.setattr(tbe_process, "_POLL_INTERVAL", 0.1)
+    process = tbe_process.TbeProcess()
+    try:
+        results = compile_all(process, [op_json("stuck_1"), op_json("add_1"), op_json("add_2")])
+        assert results["stuck_1"] == ("TBEException:ERROR: compile task timeout after 2s", "_")
+        assert results["add_1"][0] == "Success"
+        assert results["add_2"][0] == "Success"
+        # the new worker compiles the next ops
+        assert compile_all(process, [op_json("add_3")])["add_3"][0] == "Success"
+    finally:
+        process.exit()
+    # the lock left by the killed worker is taken over
+    cache = get_kernel_cache(tbe_process.KERNEL_CACHE_PATH_ENV)
+    key = cache.kernel_key(json.loads(op_json("stuck_1")), "fake", "Ascend910")
+    lock_file = cache._entry_path(key) + ".lock"  # pylint: disable=W0212
+    assert os.path.exists(lock_file)
+    assert cache._try_lock(key) is None  # pylint: disable=W0212
+    assert cache._try_lock(key) == lock_file  # pylint: disable=W0212
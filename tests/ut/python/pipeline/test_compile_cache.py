@@ -0,0 +1,71 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test the persistent compile cache """
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+import mindspore.nn as nn
+from mindspore import Tensor, context
+from mindspore.common import _compile_cache
+from mindspore.common._compile_cache import CompileCache, COMPILE_CACHE_ENV, get_compile_cache
+from mindspore.common.api import _executor
+from mindspore.ops import operations as P
+
+
+class Net(nn.Cell):
+    """ Net definition """
+
+    def __init__(self, out_channels=10):
+        super(Net, self).__init__()
+        self.fc = nn.Dense(16, out_channels)
+        self.relu = P.ReLU()
+
+    def construct(self, x):
+        return self.relu(self.fc(x))
+
+
+def test_graph_key():
+    """ the key is the same for the instances of a network, and changes with the network and the inputs """
+    context.set_context(mode=context.GRAPH_MODE)
+    x = Tensor(np.ones([4, 16]).astype(np.float32))
+    key = CompileCache.graph_key(Net(), "train", (x,))
+    assert CompileCache.graph_key(Net(), "train", (x,)) == key
+    assert CompileCache.graph_key(Net(), "eval", (x,)) != key
+    assert CompileCache.graph_key(Net(12), "train", (x,)) != key
+    assert CompileCache.graph_key(Net(), "train", (Tensor(np.ones([8, 16]).astype(np.float32)),)) != key
+
+
+def test_compile_cache_hit(monkeypatch):
+    """ the graph compiled by a previous run is a cache hit """
+    context.set_context(mode=context.GRAPH_MODE)
+    cache_path = tempfile.mkdtemp(prefix="compile_cache_")
+    monkeypatch.setenv(COMPILE_CACHE_ENV, cache_path)
+    # set to the directories under the cache by get_compile_cache, restored by the monkeypatch
+    monkeypatch.delenv("MS_TBE_KERNEL_CACHE_PATH", raising=False)
+    monkeypatch.delenv("MS_AKG_KERNEL_CACHE_PATH", raising=False)
+    try:
+        x = Tensor(np.ones([4, 16]).astype(np.float32))
+        compile_cache = get_compile_cache()
+        _executor.compile(Net(), x, phase="predict")
+        assert (compile_cache.hits, compile_cache.misses) == (0, 1)
+        _executor.compile(Net(), x, phase="predict")
+        assert (compile_cache.hits, compile_cache.misses) == (1, 1)
+        assert os.path.isdir(os.path.join(cache_path, "graphs"))
+    finally:
+        _compile_cache._compile_cache = None
+        shutil.rmtree(cache_path)
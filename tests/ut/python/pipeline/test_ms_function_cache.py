@@ -0,0 +1,120 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+""" test the bounded ms_function cache and the shape buckets """
+import numpy as np
+import pytest
+
+import mindspore.nn as nn
+from mindspore import Tensor, context
+from mindspore.common.api import ms_function, set_ms_function_cache_size, get_ms_function_cache_info, \
+    pad_to_bucket, bucket_mask, ms_compile_cache, _PhaseCache
+from mindspore.ops import operations as P
+
+
+class Net(nn.Cell):
+    """ Net definition """
+
+    def __init__(self):
+        super(Net, self).__init__()
+        self.relu = P.ReLU()
+
+    @ms_function
+    def construct(self, x):
+        return self.relu(x)
+
+
+class BucketNet(nn.Cell):
+    """ Net with the sequence axis bucketed """
+
+    def __init__(self):
+        super(BucketNet, self).__init__()
+        self.mul = P.Mul()
+
+    @ms_function(shape_buckets={0: {1: (4, 8)}, 1: {1: (4, 8)}})
+    def construct(self, x, mask):
+        return self.mul(x, mask)
+
+
+def setup_function():
+    context.set_context(mode=context.PYNATIVE_MODE)
+    ms_compile_cache.clear()
+
+
+def teardown_function():
+    set_ms_function_cache_size(None)
+
+
+def test_ms_function_cache_eviction():
+    """ the least recently used graphs are released when the cache is full """
+    set_ms_function_cache_size(2)
+    net = Net()
+    for length in (3, 4, 5, 3):
+        net(Tensor(np.ones([2, length]).astype(np.float32)))
+    info = get_ms_function_cache_info()
+    assert info["size"] <= 2
+    assert info["max_size"] == 2
+    assert info["evictions"] >= 2
+    assert info["misses"] == 4
+    assert info["compile_time"] > 0
+
+
+class FakeExecutor:
+    """ Executor releasing the pipelines whose phase contains the given one """
+
+    def __init__(self):
+        self.phases = set()
+
+    def del_net_res(self, phase):
+        self.phases = {p for p in self.phases if phase not in p}
+
+
+def test_phase_cache_protects_exact_key():
+    """ only the pipeline just cached is protected, not the ones whose phase it contains """
+    executor = FakeExecutor()
+    cache = _PhaseCache(max_size=1)
+    for key_id in (3, 13):
+        key, phase = ("name", key_id), "_{}name".format(key_id)
+        executor.phases.add(phase)
+        cache.put(key, phase, executor)
+    assert ("name", 3) not in cache
+    assert cache.get(("name", 13)) == "_13name"
+    assert executor.phases == {"_13name"}
+    assert cache.evictions == 1
+
+
+def test_ms_function_cache_size_invalid():
+    with pytest.raises(ValueError):
+        set_ms_function_cache_size(0)
+
+
+def test_shape_buckets():
+    """ the inputs of the lengths in a bucket share a compiled graph """
+    net = BucketNet()
+    for length in (2, 3, 4, 3):
+        lengths = [length - 1, length]
+        x = Tensor(np.ones([2, length]).astype(np.float32))
+        out = net(x, bucket_mask(lengths, (4, 8)))
+        assert out.shape == (2, 4)
+        assert out.asnumpy().sum() == sum(lengths)
+    info = get_ms_function_cache_info()
+    assert (info["hits"], info["misses"]) == (3, 1)
+
+
+def test_pad_to_bucket():
+    x = np.ones([2, 5]).astype(np.float32)
+    padded = pad_to_bucket(x, (4, 8), axis=1)
+    assert padded.shape == (2, 8)
+    assert padded[:, 5:].sum() == 0
+    assert pad_to_bucket(x, (2, 4), axis=1) is x
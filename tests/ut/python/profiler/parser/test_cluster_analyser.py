@@ -0,0 +1,89 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the analyser of the step traces of a cluster."""
+import csv
+import json
+import os
+import shutil
+import tempfile
+
+from unittest import TestCase
+
+from mindspore.profiler.common.util import PER_MS_SYSCNT
+from mindspore.profiler.parser.cluster_analyser import ClusterStepTraceAnalyser
+
+HEADER = ['step_num', 'start_point', 'end_point', 'total', 'fp_point', 'bp_point', 'iteration_interval',
+          'fp_and_bp', 'tail', 'stream_5_0_start_point', 'stream_5_0_end_point', 'stream_5_0']
+
+
+def write_step_trace(output_path, device_id, total_ms, reduce_ms):
+    """Write the step trace file of a device, the time of the steps are in milliseconds."""
+    file_path = os.path.join(output_path, 'step_trace_raw_{}_detail_time.csv'.format(device_id))
+    rows = []
+    start = 0
+    for step, (total, reduce) in enumerate(zip(total_ms, reduce_ms)):
+        total, reduce = total * PER_MS_SYSCNT, reduce * PER_MS_SYSCNT
+        end = start + total
+        rows.append([step + 1, start, end, total, start + 100, end - reduce, 100, total - 100 - reduce, reduce,
+                     end - reduce, end, reduce])
+        start = end
+    with open(file_path, 'w') as file:
+        csv_writer = csv.writer(file)
+        csv_writer.writerow(HEADER)
+        csv_writer.writerows(rows)
+        csv_writer.writerow(['-'] + [0] * (len(HEADER) - 1))
+
+
+class TestClusterStepTraceAnalyser(TestCase):
+    """Test the class of ClusterStepTraceAnalyser."""
+
+    def setUp(self) -> None:
+        """Initialization before test case execution."""
+        self.output_path = tempfile.mkdtemp(prefix='cluster_')
+        write_step_trace(self.output_path, 0, [10, 10, 10], [4, 3, 4])
+        write_step_trace(self.output_path, 1, [10, 10, 10], [2, 3, 1])
+        write_step_trace(self.output_path, 2, [14, 14, 14], [3, 5, 4])
+
+    def test_analyse(self):
+        """Test the summary of the step time and the slow ranks."""
+        analyser = ClusterStepTraceAnalyser(self.output_path, [0, 1, 2, 3])
+        summary = analyser.analyse()
+        assert summary['missing_devices'] == ['3']
+        assert summary['devices']['2']['steps'] == 3
+        assert summary['devices']['2']['mean'] == 14.0
+        assert summary['step_time']['median'] == 10.0
+        assert summary['step_time']['skew'] == 4.0
+        assert summary['step_time']['slowest_rank'] == '2'
+        assert summary['slow_ranks'] == ['2']
+
+    def test_all_reduce_skew(self):
+        """Test the wait skew of the AllReduce operators."""
+        summary = ClusterStepTraceAnalyser(self.output_path, [0, 1, 2]).analyse()
+        all_reduce = summary['all_reduce']['stream_5_0']
+        assert all_reduce['mean_duration'] == {'0': 3.6667, '1': 2.0, '2': 4.0}
+        assert all_reduce['max_wait_skew'] == 3.0
+        assert all_reduce['mean_wait_skew'] == 2.3333
+        assert all_reduce['last_arrival_steps'] == {'0': 1, '1': 2}
+
+    def test_save(self):
+        """Test saving the summary."""
+        analyser = ClusterStepTraceAnalyser(self.output_path, [0, 1, 2])
+        file_path = analyser.save(analyser.analyse())
+        with open(file_path) as summary_file:
+            assert json.load(summary_file)['slow_ranks'] == ['2']
+
+    def tearDown(self) -> None:
+        """Run after test case execution."""
+        shutil.rmtree(self.output_path)
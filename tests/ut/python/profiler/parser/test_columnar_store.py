@@ -0,0 +1,62 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the columnar store of the parsed profiling data."""
+import os
+import shutil
+import tempfile
+
+from unittest import TestCase
+
+from mindspore.profiler.parser.columnar_store import ColumnarStore
+
+
+class TestColumnarStore(TestCase):
+    """Test the class of ColumnarStore."""
+
+    def setUp(self) -> None:
+        """Initialization before test case execution."""
+        self.output_path = tempfile.mkdtemp(prefix='columnar_store_')
+        self.store = ColumnarStore.from_columns([
+            ('op_name', ['Conv2D-op1', 'ReLU-op2', 'Conv2D-op3', 'MatMul-op4']),
+            ('op_type', ['Conv2D', 'ReLU', 'Conv2D', 'MatMul']),
+            ('avg_execution_time', [1.5, 0.5, 2.5, 3.0])])
+
+    def test_index(self):
+        """Test the index of a column."""
+        index = self.store.index('op_type')
+        assert sorted(index) == ['Conv2D', 'MatMul', 'ReLU']
+        assert index['Conv2D'].tolist() == [0, 2]
+        assert index['MatMul'].tolist() == [3]
+
+    def test_match(self):
+        """Test the vectorized conditions."""
+        assert self.store.match('op_type', 'in', ['Conv2D', 'Add']).tolist() == [True, False, True, False]
+        assert self.store.match('op_type', 'not_in', ['Conv2D']).tolist() == [False, True, False, True]
+        assert self.store.match('op_name', 'partial_match_str_in', ['op2', 'Mat']).tolist() == \
+               [False, True, False, True]
+        assert not self.store.match('op_name', 'unknown', ['op2']).any()
+
+    def test_save_and_load(self):
+        """Test saving the store into a npy file."""
+        file_path = os.path.join(self.output_path, 'aicore_intermediate_0_detail.npy')
+        self.store.save(file_path)
+        store = ColumnarStore.load(file_path)
+        assert len(store) == 4
+        assert store.column('op_name').tolist() == self.store.column('op_name').tolist()
+        assert store.column('avg_execution_time').tolist() == [1.5, 0.5, 2.5, 3.0]
+
+    def tearDown(self) -> None:
+        """Run after test case execution."""
+        shutil.rmtree(self.output_path)
@@ -0,0 +1,93 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the hwts log parser."""
+import os
+import shutil
+import struct
+import tempfile
+
+from unittest import TestCase
+
+import numpy as np
+
+from mindspore.profiler.parser.hwts_log_parser import HWTSLogParser
+
+
+def pack_record(log_type, cnt, core_id, blk_id, task_id, syscnt, stream_id, is_warn=0):
+    """Pack a 64 bytes hwts record."""
+    head = log_type | (is_warn << 3) | (cnt << 4)
+    if log_type == 4:
+        return struct.pack("<BBHHHQIIQ", head, core_id, 0, blk_id, task_id, 0, stream_id, 0, syscnt).ljust(64, b'\0')
+    return struct.pack("<BBHHHQI", head, core_id, 0, blk_id, task_id, syscnt, stream_id).ljust(64, b'\0')
+
+
+class TestHWTSLogParser(TestCase):
+    """Test the class of HWTS Log Parser."""
+
+    def setUp(self) -> None:
+        """Initialization before test case execution."""
+        self.profiling_dir = tempfile.mkdtemp(prefix='hwts_data_')
+        self.output_path = tempfile.mkdtemp(prefix='output_format_data_hwts_')
+        self.output_file = os.path.join(self.output_path, 'output_format_data_hwts_0.txt')
+        self.columnar_file = os.path.join(self.output_path, 'output_format_data_hwts_0.npy')
+        records = [pack_record(0, 1, 2, 3, 10, 1000, 5),
+                   pack_record(1, 1, 2, 3, 30000, 2000, 5),
+                   b' ' * 64,
+                   pack_record(6, 1, 2, 3, 10, 3000, 5),
+                   pack_record(4, 15, 7, 8, 11, 4000, 6),
+                   pack_record(4, 15, 7, 8, 11, 5000, 6, is_warn=1)]
+        with open(os.path.join(self.profiling_dir, 'hwts.data.slice_0'), 'wb') as hwts_data:
+            hwts_data.write(b''.join(records) + b'\0' * 10)
+
+    def test_hwts_log_parser(self):
+        """Test the parser of hwts log records."""
+        parser = HWTSLogParser(self.profiling_dir, self.output_file, self.columnar_file)
+        assert parser.execute()
+        with open(self.output_file) as result_file:
+            lines = result_file.read().split('\n')
+        assert lines[0] == '=' * 20 + '45 HWTS data' + '=' * 20
+        assert lines[2:6] == [
+            "%-14s %-4s %-8s %-9s %-8s %-15s %s" % ('Start of task', 1, 2, 3, '5_10', 1000, 5),
+            "%-14s %-4s %-8s %-9s %-8s %-15s %s" % ('End of task', 1, 2, 3, 30000, 2000, 5),
+            "%-14s %-4s %-8s %-9s %-8s %-15s %s" % ('Block PMU', 15, 7, 8, '6_11', 4000, 6),
+            "%-14s %-4s %-8s %-9s %-8s %-15s %s" % ('Block PMU', 15, 7, 8, '6_11', None, 6)]
+        assert lines[6:] == ['', '']
+
+        columns = np.load(self.columnar_file)
+        assert columns['log_type'].tolist() == [0, 1, 4, 4]
+        assert columns['task_id'].tolist() == [10, 30000, 11, 11]
+        assert columns['syscnt'][:3].tolist() == [1000, 2000, 4000]
+        assert columns['syscnt_valid'].tolist() == [True, True, True, False]
+
+    def test_hwts_log_parser_time_ranges(self):
+        """Test keeping the records within the time ranges of the sampled steps."""
+        parser = HWTSLogParser(self.profiling_dir, self.output_file, self.columnar_file,
+                               time_ranges=[[1500, 4500]])
+        assert parser.execute()
+        columns = np.load(self.columnar_file)
+        # the record without a valid syscnt follows the previous record
+        assert columns['log_type'].tolist() == [1, 4, 4]
+        assert columns['syscnt_valid'].tolist() == [True, True, False]
+
+        parser = HWTSLogParser(self.profiling_dir, self.output_file, self.columnar_file,
+                               time_ranges=[[3000, 3500], [500, 1000]])
+        assert parser.execute()
+        columns = np.load(self.columnar_file)
+        assert columns['syscnt'].tolist() == [1000]
+
+    def tearDown(self) -> None:
+        """Run after test case execution."""
+        shutil.rmtree(self.profiling_dir)
+        shutil.rmtree(self.output_path)
@@ -0,0 +1,94 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the streaming timeline writer."""
+import json
+import os
+import shutil
+import tempfile
+
+from unittest import TestCase
+
+import numpy as np
+
+from mindspore.profiler.parser.timeline_writer import TimelineWriter
+
+
+def make_events(num):
+    """Make the timeline events in time order."""
+    return [{'name': 'op_{}'.format(i % 7), 'ph': 'X', 'pid': 0, 'tid': i % 3, 'ts': i * 10.0, 'dur': 5.0}
+            for i in range(num)]
+
+
+class TestTimelineWriter(TestCase):
+    """Test the class of TimelineWriter."""
+
+    def setUp(self) -> None:
+        """Initialization before test case execution."""
+        self.output_path = tempfile.mkdtemp(prefix='timeline_')
+        self.display_file = os.path.join(self.output_path, 'ascend_timeline_display_0.json')
+
+    def test_write_chunks(self):
+        """Test the events beyond the size limit going to the following files."""
+        events = make_events(1000)
+        with TimelineWriter(self.display_file, size_limit=16 * 1024, buffer_size=1000) as writer:
+            writer.write_all(events)
+        with open(writer.index_file_path) as index_file:
+            index = json.load(index_file)
+        assert len(index) > 1
+        assert index[0]['file'] == 'ascend_timeline_display_0.json'
+        assert index[1]['file'] == 'ascend_timeline_display_0_part1.json'
+
+        loaded = []
+        for window in index:
+            file_path = os.path.join(self.output_path, window['file'])
+            assert os.path.getsize(file_path) <= 16 * 1024
+            with open(file_path) as display_file:
+                part = json.load(display_file)
+            assert len(part) == window['num_events']
+            assert window['start_ts'] == part[0]['ts']
+            assert window['end_ts'] == part[-1]['ts'] + part[-1]['dur']
+            loaded.extend(part)
+        assert loaded == events
+
+    def test_write_unlimited(self):
+        """Test writing all the events into the display file."""
+        events = make_events(100)
+        writer = TimelineWriter(self.display_file)
+        writer.write_all(events)
+        assert len(writer.close()) == 1
+        with open(self.display_file) as display_file:
+            assert json.load(display_file) == events
+
+    def test_write_empty(self):
+        """Test writing an empty timeline."""
+        TimelineWriter(self.display_file).close()
+        with open(self.display_file) as display_file:
+            assert json.load(display_file) == []
+
+    def test_write_columnar(self):
+        """Test the columnar output of the events."""
+        events = make_events(50)
+        columnar_file = os.path.join(self.output_path, 'ascend_timeline_display_0.npz')
+        with TimelineWriter(self.display_file, columnar_file_path=columnar_file) as writer:
+            writer.write_all(events)
+        columns = np.load(columnar_file)
+        names = columns['names'][columns['name_id']]
+        assert names.tolist() == [event['name'] for event in events]
+        assert columns['tid'].tolist() == [event['tid'] for event in events]
+        assert columns['ts'].tolist() == [event['ts'] for event in events]
+
+    def tearDown(self) -> None:
+        """Run after test case execution."""
+        shutil.rmtree(self.output_path)
@@ -0,0 +1,64 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the offline analysis of the profiler."""
+import os
+import shutil
+import tempfile
+
+from unittest import TestCase, mock
+
+from mindspore.profiler import profiling
+from mindspore.profiler.profiling import Profiler
+
+
+class TestOfflineAnalyse(TestCase):
+    """Test the analysis of the data of an Ascend device offline."""
+
+    def setUp(self) -> None:
+        """Initialization before test case execution."""
+        self.output_path = tempfile.mkdtemp(prefix='profiling_')
+        os.makedirs(os.path.join(self.output_path, 'JOB1'))
+
+    def test_create_offline(self):
+        """Test the profiler created offline is set up by the constructor."""
+        profiler = Profiler._create_offline(self.output_path, '3', 'Variable,Cast')  # pylint: disable=W0212
+        assert profiler._dev_id == '3'  # pylint: disable=W0212
+        assert profiler._device_target == 'Ascend'  # pylint: disable=W0212
+        assert profiler._filt_optype_names == ['Variable', 'Cast']  # pylint: disable=W0212
+        assert profiler._step_sampler is None  # pylint: disable=W0212
+        assert not profiler._timeline_columnar  # pylint: disable=W0212
+        assert os.listdir(self.output_path) == ['JOB1']
+
+    def test_analyse_without_pipeline_file(self):
+        """Test the analysis finishes when the minddata pipeline file is missing."""
+        framework_parser = mock.MagicMock()
+        framework_parser.return_value.to_task_id_full_op_name_dict.return_value = {'1_1': 'Default/Add-op1'}
+        optime_parser = mock.MagicMock()
+        with mock.patch.object(profiling, 'FrameworkParser', framework_parser), \
+                mock.patch.object(profiling, 'DataPreProcessParser'), \
+                mock.patch.object(profiling, 'MinddataParser'), \
+                mock.patch.object(profiling, 'HWTSLogParser'), \
+                mock.patch.object(profiling, 'OPComputeTimeParser', optime_parser), \
+                mock.patch.object(Profiler, '_analyse_step_trace'), \
+                mock.patch.object(Profiler, '_analyser_op_info'), \
+                mock.patch.object(Profiler, '_analyse_timeline') as analyse_timeline:
+            profiler = Profiler._create_offline(self.output_path, '0', 'Variable')  # pylint: disable=W0212
+            profiler._ascend_analyse('JOB1')  # pylint: disable=W0212
+        optime_parser.return_value.execute.assert_called_once()
+        analyse_timeline.assert_called_once()
+
+    def tearDown(self) -> None:
+        """Run after test case execution."""
+        shutil.rmtree(self.output_path)
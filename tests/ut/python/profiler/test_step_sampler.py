@@ -0,0 +1,113 @@
+# Copyright 2021 Huawei Technologies Co., Ltd
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+"""Test the sampler of the profiled steps."""
+import csv
+import os
+import shutil
+import tempfile
+
+from unittest import TestCase
+
+import pytest
+
+from mindspore.profiler.common.step_sampler import StepSampler
+from mindspore.profiler.parser.step_trace_parser import GpuStepTraceParser
+
+
+def test_step_windows():
+    """Test the windows of the sampled steps."""
+    sampler = StepSampler(start_step=3, stop_step=14, step_interval=5, window_steps=2)
+    assert sampler.window_ids(range(1, 17)).tolist() == \
+           [-1, -1, 0, 0, -1, -1, -1, 1, 1, -1, -1, -1, 2, 2, -1, -1]
+    assert StepSampler().window_ids([1, 2, 3]).tolist() == [0, 1, 2]
+
+
+def test_step_select():
+    """Test the time window and the retention of the most recent windows."""
+    steps = list(range(1, 11))
+    start_times = [step * 100 for step in steps]
+    sampler = StepSampler(step_interval=2, max_windows=2)
+    assert sampler.select(steps, start_times, 100).nonzero()[0].tolist() == [6, 8]
+    sampler = StepSampler(time_window=(2, 5))
+    assert sampler.select(steps, start_times, 100).nonzero()[0].tolist() == [2, 3, 4]
+    sampler = StepSampler(window_steps=2, step_interval=4, time_window=(0, 7), max_windows=1)
+    assert sampler.select(steps, start_times, 100).nonzero()[0].tolist() == [4, 5]
+
+
+def test_invalid_sampler():
+    """Test the invalid parameters."""
+    with pytest.raises(TypeError):
+        StepSampler(start_step=1.5)
+    with pytest.raises(ValueError):
+        StepSampler(start_step=0)
+    with pytest.raises(ValueError):
+        StepSampler(start_step=5, stop_step=4)
+    with pytest.raises(ValueError):
+        StepSampler(step_interval=2, window_steps=3)
+    with pytest.raises(ValueError):
+        StepSampler(time_window=(3, 1))
+    with pytest.raises(TypeError):
+        StepSampler(time_window=3)
+
+
+class TestSampledStepTrace(TestCase):
+    """Test the step trace parser with a step sampler."""
+
+    def setUp(self) -> None:
+        """Initialization before test case execution."""
+        self.output_path = tempfile.mkdtemp(prefix='step_sampler_')
+        self.input_file = os.path.join(self.output_path, 'step_trace_profiling_0.txt')
+        self.output_file = os.path.join(self.output_path, 'step_trace_raw_0_detail_time.csv')
+        # the start and end of fp, bp and the end of the iteration of 6 steps
+        steps = range(6)
+        lines = ['Default/Conv2D-op1 ' + ' '.join('{},{}'.format(i * 100 + 10, i * 100 + 20) for i in steps),
+                 'Gradients/Conv2D-op2 ' + ' '.join('{},{}'.format(i * 100 + 60, i * 100 + 70) for i in steps),
+                 'Default/Assign-op3 ' + ' '.join('{},{}'.format(i * 100 + 80, i * 100 + 90) for i in steps)]
+        with open(self.input_file, 'w') as input_file:
+            input_file.write('\n'.join(lines) + '\n')
+
+    def test_sampled_steps(self):
+        """Test saving the sampled steps and their time ranges."""
+        parser = GpuStepTraceParser(input_dir=self.input_file, output_file_path=self.output_file,
+                                    step_sampler=StepSampler(start_step=2, step_interval=2, max_windows=2))
+        parser.parse_and_save()
+        with open(self.output_file) as result_file:
+            rows = list(csv.reader(result_file))
+        assert [row[0] for row in rows[1:]] == ['4', '6', '-']
+        # the average of the sampled steps
+        assert rows[-1] == ['-', '380', '490', '110', '410', '470', '30', '60', '20']
+        assert parser.step_time_ranges.tolist() == [[280, 390], [480, 590]]
+
+    def test_sampled_average(self):
+        """Test the average of a single sampled step and the exclusion of the first step."""
+        parser = GpuStepTraceParser(input_dir=self.input_file, output_file_path=self.output_file,
+                                    step_sampler=StepSampler(start_step=4, max_windows=1))
+        parser.parse_and_save()
+        with open(self.output_file) as result_file:
+            rows = list(csv.reader(result_file))
+        assert rows[1:] == [['6', '480', '590', '110', '510', '570', '30', '60', '20'],
+                            ['-', '480', '590', '110', '510', '570', '30', '60', '20']]
+
+        parser = GpuStepTraceParser(input_dir=self.input_file, output_file_path=self.output_file,
+                                    step_sampler=StepSampler(stop_step=2))
+        parser.parse_and_save()
+        with open(self.output_file) as result_file:
+            rows = list(csv.reader(result_file))
+        assert [row[0] for row in rows[1:]] == ['1', '2', '-']
+        assert rows[-1] == ['-', '80', '190', '110', '110', '170', '30', '60', '20']
+
+    def tearDown(self) -> None:
+        """Run after test case execution."""
+        shutil.rmtree(self.output_path)
@@ -22,6 +22,7 @@ import pytest
 
 from mindspore.common.tensor import Tensor
 from mindspore.train.summary.summary_record import SummaryRecord
+from mindspore.train.summary._writer_pool import WriterPool
 
 
 def get_test_data(step):
@@ -78,3 +79,38 @@ class TestSummaryRecord:
         with pytest.raises(TypeError):
             with SummaryRecord(summary_dir) as sr:
                 sr.record(step)
+
+    @pytest.mark.parametrize("writer_options", [{'unknown': 1}, {'backpressure_policy': 'wait'},
+                                                {'max_queue_size': 0}])
+    def test_writer_options_with_value_error(self, writer_options):
+        summary_dir = tempfile.mkdtemp(dir=self.base_summary_dir)
+        with pytest.raises(ValueError):
+            with SummaryRecord(summary_dir, writer_options=writer_options):
+                pass
+
+    def test_writer_metrics(self):
+        summary_dir = tempfile.mkdtemp(dir=self.base_summary_dir)
+        writer_options = {'num_process': 0, 'max_queue_size': 2, 'backpressure_policy': 'drop'}
+        with SummaryRecord(summary_dir, writer_options=writer_options) as sr:
+            for step in range(10):
+                sr.add_value('scalar', 'loss', Tensor(np.array(step).astype(np.float32)))
+                sr.record(step)
+            metrics = sr.get_writer_metrics()
+        assert metrics['queue_capacity'] == 2
+        assert 0 <= metrics['queue_depth'] <= 2
+
+    def test_writer_metrics_dropped(self, monkeypatch):
+        """Test the dropped records of each plugin and the queue depth when the queue is full."""
+        # the queue is not consumed without the writer process
+        monkeypatch.setattr(WriterPool, 'start', lambda self: None)
+        summary_dir = tempfile.mkdtemp(dir=self.base_summary_dir)
+        writer = WriterPool(summary_dir, None, num_process=0, max_queue_size=2, backpressure_policy='drop',
+                            summary='summary.file')
+        data = {'scalar': [{'tag': 'loss', 'step': 0, 'value': 1.0}, {'tag': 'lr', 'step': 0, 'value': 0.1}],
+                'image': [{'tag': 'input', 'step': 0, 'value': None}]}
+        for _ in range(5):
+            writer.write(data)
+        metrics = writer.get_metrics()
+        assert metrics['queue_capacity'] == 2
+        assert metrics['queue_depth'] in (2, -1)
+        assert metrics['dropped_records'] == {'scalar': 6, 'image': 3}
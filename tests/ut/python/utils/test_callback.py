@@ -14,7 +14,9 @@
 # ============================================================================
 """test callback function."""
 import os
+import shutil
 import stat
+import tempfile
 from unittest import mock
 
 import numpy as np
@@ -23,12 +25,14 @@ import pytest
 import mindspore.common.dtype as mstype
 import mindspore.nn as nn
 from mindspore.common.api import ms_function
+from mindspore.common.parameter import Parameter
 from mindspore.common.tensor import Tensor
 from mindspore.nn import TrainOneStepCell, WithLossCell
 from mindspore.nn.optim import Momentum
 from mindspore.train.callback import ModelCheckpoint, RunContext, LossMonitor, _InternalCallbackParam, \
     _CallbackManager, Callback, CheckpointConfig, _set_cur_net, _checkpoint_cb_for_save_op
 from mindspore.train.callback._checkpoint import _check_file_name_prefix, _chg_ckpt_file_name_if_same_exist
+from mindspore.train.serialization import load_checkpoint, _get_checkpoint_base
 
 class Net(nn.Cell):
     """Net definition."""
@@ -350,6 +354,17 @@ def test_Checkpoint_Config():
         CheckpointConfig(0, None, 0, 0, True)
 
 
+def test_Checkpoint_Config_incremental_save():
+    """Test CheckpointConfig incremental save only supports raw format."""
+    with pytest.raises(ValueError):
+        CheckpointConfig(incremental_save=True)
+
+    config = CheckpointConfig(ckpt_format="raw", write_workers=4, incremental_save=True)
+    assert config.ckpt_format == "raw"
+    assert config.write_workers == 4
+    assert config.incremental_save
+
+
 def test_step_end_save_graph():
     """Test save checkpoint."""
     train_config = CheckpointConfig(
@@ -377,3 +392,45 @@ def test_step_end_save_graph():
         os.remove('./test_files/test-graph.meta')
     ckpoint_cb.step_end(run_context)
     assert not os.path.exists('./test_files/test-graph.meta')
+
+
+class ParamNet(nn.Cell):
+    """ParamNet definition."""
+
+    def __init__(self):
+        super(ParamNet, self).__init__()
+        self.weight = Parameter(Tensor(np.zeros([4]).astype(np.float32)), name="weight")
+        self.bias = Parameter(Tensor(np.ones([2]).astype(np.float32)), name="bias")
+
+    def construct(self, x):
+        return x * self.weight + self.bias
+
+
+def test_incremental_save_keep_checkpoint_max():
+    """Test the chains of delta checkpoints are removed as a whole and the latest checkpoint is kept."""
+    directory = tempfile.mkdtemp(prefix="incremental_ckpt_")
+    train_config = CheckpointConfig(save_checkpoint_steps=1, keep_checkpoint_max=3, ckpt_format="raw",
+                                    incremental_save=True, full_save_interval=10)
+    net = ParamNet()
+    cb_params = _InternalCallbackParam()
+    cb_params.train_network = net
+    cb_params.cur_epoch_num = 1
+    cb_params.batch_num = 100
+    ckpoint_cb = ModelCheckpoint(prefix="inc", directory=directory, config=train_config)
+    try:
+        for step in range(1, 10):
+            net.weight.set_data(Tensor(np.full([4], step).astype(np.float32)))
+            cb_params.cur_step_num = step
+            ckpoint_cb._save_ckpt(cb_params)  # pylint: disable=W0212
+            files = [os.path.join(directory, f) for f in os.listdir(directory) if f.endswith(".ckpt")]
+            assert len(files) <= train_config.keep_checkpoint_max
+            assert ckpoint_cb.latest_ckpt_file_name in files
+            for ckpt_file in files:
+                base_file = _get_checkpoint_base(ckpt_file)
+                assert base_file is None or os.path.exists(base_file)
+            par_dict = load_checkpoint(ckpoint_cb.latest_ckpt_file_name)
+            assert np.all(par_dict['weight'].data.asnumpy() == step)
+            assert np.all(par_dict['bias'].data.asnumpy() == 1)
+        ckpoint_cb.end(RunContext(cb_params))
+    finally:
+        shutil.rmtree(directory)
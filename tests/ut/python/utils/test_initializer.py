@@ -203,6 +203,46 @@ def test_init_he_uniform_error():
         init.initializer(init.HeUniform(), [6], ms.float32).init_data()
 
 
+def test_lazy_init_in_chunks():
+    """ test the chunks initialized with multiple threads are reproducible """
+    chunk_size = init._INIT_CHUNK_SIZE
+    num_workers = init._LAZY_INIT['num_workers']
+    init._INIT_CHUNK_SIZE = 64
+    init.set_lazy_init(True, num_workers=4)
+    try:
+        ms.set_seed(1)
+        tensor1 = init.initializer(init.Uniform(scale=0.5), [100, 20], ms.float32).init_data()
+        tensor2 = init.initializer(init.TruncatedNormal(sigma=0.1), [100, 20], ms.float32).init_data()
+        init.set_lazy_init(True, num_workers=1)
+        ms.set_seed(1)
+        tensor3 = init.initializer(init.Uniform(scale=0.5), [100, 20], ms.float32).init_data()
+        tensor4 = init.initializer(init.TruncatedNormal(sigma=0.1), [100, 20], ms.float32).init_data()
+    finally:
+        init._INIT_CHUNK_SIZE = chunk_size
+        init.set_lazy_init(False, num_workers=num_workers)
+    assert np.array_equal(tensor1.asnumpy(), tensor3.asnumpy())
+    assert np.array_equal(tensor2.asnumpy(), tensor4.asnumpy())
+    assert not np.array_equal(tensor1.asnumpy()[:3], tensor1.asnumpy()[3:6])
+    assert _check_uniform(tensor1, -0.5, 0.5)
+    _check_value(tensor2, -0.2, 0.2)
+
+
+def test_lazy_init_rows():
+    """ test a range of rows of a parameter is the same as the rows of the whole parameter """
+    initializer = init.HeUniform()
+    initializer.seed = 5
+    chunk_size = init._INIT_CHUNK_SIZE
+    init._INIT_CHUNK_SIZE = 30
+    try:
+        whole = init._init_in_chunks(initializer, (12, 10), np.float32)
+        rows = init._init_in_chunks(initializer, (12, 10), np.float32, rows=(4, 8))
+    finally:
+        init._INIT_CHUNK_SIZE = chunk_size
+    assert rows.shape == (4, 10)
+    assert np.array_equal(rows, whole[4:8])
+    assert init._init_in_chunks(InitTwo(), (12, 10), np.float32) is None
+
+
 def test_conv2d_abnormal_kernel_negative():
     kernel = np.random.randn(64, 3, 7, 7).astype(np.float32)
     with py.raises(ValueError):
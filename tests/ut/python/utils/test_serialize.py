@@ -23,15 +23,17 @@ import pytest
 import mindspore.common.dtype as mstype
 import mindspore.nn as nn
 from mindspore import context
+from mindspore.common.initializer import set_lazy_init
 from mindspore.common.parameter import Parameter
 from mindspore.common.tensor import Tensor
 from mindspore.nn import SoftmaxCrossEntropyWithLogits
 from mindspore.nn import WithLossCell, TrainOneStepCell
 from mindspore.nn.optim.momentum import Momentum
 from mindspore.ops import operations as P
+from mindspore.train import serialization
 from mindspore.train.callback import _CheckpointManager
 from mindspore.train.serialization import save_checkpoint, load_checkpoint, load_param_into_net, \
-     export, _save_graph
+     export, _save_graph, _CheckpointWriter, _get_checkpoint_base, save_sharded_checkpoint, load_sharded_checkpoint
 from ..ut_filter import non_graph_engine
 
 context.set_context(mode=context.GRAPH_MODE, print_file_path="print/print.pb")
@@ -136,6 +138,110 @@ def test_load_checkpoint():
     assert isinstance(par_dict, dict)
 
 
+def test_save_and_load_raw_checkpoint():
+    """ test save_checkpoint and load_checkpoint with the raw layout"""
+    weight = np.random.randint(0, 255, [12, 1024]).astype(np.float32)
+    parameter_list = [{'name': "conv1.weight", 'data': Tensor(weight)},
+                      {'name': "fc.bias", 'data': Tensor(np.ones([3]).astype(np.float16))},
+                      {'name': "global_step", 'data': Tensor(np.array(5).astype(np.int32))}]
+    ckpt_file_name = os.path.join(_cur_dir, './raw_parameters.ckpt')
+    save_checkpoint(parameter_list, ckpt_file_name, ckpt_format="raw")
+
+    par_dict = load_checkpoint(ckpt_file_name)
+    assert len(par_dict) == 3
+    assert par_dict['conv1.weight'].data.shape == (12, 1024)
+    assert np.all(par_dict['conv1.weight'].data.asnumpy() == weight)
+    assert par_dict['fc.bias'].data.dtype == mstype.float16
+
+    par_dict = load_checkpoint(ckpt_file_name, filter_prefix="conv1")
+    assert 'conv1.weight' not in par_dict
+    assert len(par_dict) == 2
+
+
+def test_incremental_save_and_load_delta_checkpoint():
+    """ test _CheckpointWriter saves delta checkpoints and load_checkpoint resolves the chain"""
+    weight = np.random.randint(0, 255, [12, 1024]).astype(np.float32)
+    bias = np.ones([3]).astype(np.float32)
+    writer = _CheckpointWriter(write_workers=2, incremental_save=True, full_save_interval=3)
+    base_file = os.path.join(_cur_dir, './delta_base.ckpt')
+    delta_file = os.path.join(_cur_dir, './delta_1.ckpt')
+    writer.save([{'name': "weight", 'data': Tensor(weight)}, {'name': "bias", 'data': Tensor(bias)}], base_file)
+    writer.save([{'name': "weight", 'data': Tensor(weight)}, {'name': "bias", 'data': Tensor(bias * 2)}],
+                delta_file, async_save=True)
+    writer.close()
+
+    assert _get_checkpoint_base(base_file) is None
+    assert _get_checkpoint_base(delta_file) == os.path.realpath(base_file)
+    par_dict = load_checkpoint(delta_file)
+    assert np.all(par_dict['weight'].data.asnumpy() == weight)
+    assert np.all(par_dict['bias'].data.asnumpy() == bias * 2)
+
+
+def test_save_and_load_sharded_checkpoint():
+    """ test save_sharded_checkpoint and load_sharded_checkpoint in stand alone mode"""
+    net = Net()
+    save_sharded_checkpoint(net, "./sharded_ckpt")
+    assert os.path.exists("./sharded_ckpt/layout_manifest.json")
+    assert os.path.exists("./sharded_ckpt/rank_0.ckpt")
+
+    new_net = Net()
+    param_not_load = load_sharded_checkpoint(new_net, "./sharded_ckpt")
+    assert not param_not_load
+    assert np.all(new_net.fc.weight.data.asnumpy() == net.fc.weight.data.asnumpy())
+
+
+class ShardedNet(nn.Cell):
+    """Net holding the parameter slices of a device."""
+
+    def __init__(self, weight, bias, parameter_layout_dict=None):
+        super(ShardedNet, self).__init__()
+        self.weight = Parameter(Tensor(weight), name="weight")
+        self.bias = Parameter(Tensor(bias), name="bias")
+        if parameter_layout_dict is not None:
+            self.parameter_layout_dict = parameter_layout_dict
+
+    def construct(self, x):
+        return x * self.weight + self.bias
+
+
+def test_load_sharded_checkpoint_with_another_strategy(monkeypatch):
+    """ test the slices saved by 4 devices with a 2x2 layout are loaded by 4 devices splitting the rows only"""
+    weight = np.arange(32).reshape([8, 4]).astype(np.float32)
+    bias = np.arange(4).astype(np.float16)
+    # the weight is split by the rows and the columns, the bias is repeated on all the devices
+    train_layout = {"weight": ([2, 2], [1, 0], [], 0, True, ""), "bias": ([2, 2], [-1], [], 0, True, "")}
+    for rank in range(4):
+        monkeypatch.setattr(serialization, "_get_global_rank", lambda rank=rank: rank)
+        row, col = rank // 2, rank % 2
+        net = ShardedNet(weight[row * 4:(row + 1) * 4, col * 2:(col + 1) * 2], bias, train_layout)
+        save_sharded_checkpoint(net, "./resharded_ckpt")
+    assert sorted(os.listdir("./resharded_ckpt")) == ["layout_manifest.json", "rank_0.ckpt", "rank_1.ckpt",
+                                                      "rank_2.ckpt", "rank_3.ckpt"]
+
+    predict_strategy = {"weight": [[4], [0, -1], [], 0]}
+    for rank in range(4):
+        monkeypatch.setattr(serialization, "_get_global_rank", lambda rank=rank: rank)
+        new_net = ShardedNet(np.zeros([2, 4], np.float32), np.zeros([4], np.float16))
+        assert not load_sharded_checkpoint(new_net, "./resharded_ckpt", predict_strategy)
+        assert np.all(new_net.weight.data.asnumpy() == weight[rank * 2:(rank + 1) * 2])
+        assert np.all(new_net.bias.data.asnumpy() == bias)
+
+    new_net = ShardedNet(np.zeros([8, 4], np.float32), np.zeros([4], np.float16))
+    assert not load_sharded_checkpoint(new_net, "./resharded_ckpt")
+    assert np.all(new_net.weight.data.asnumpy() == weight)
+
+
+def test_load_sharded_checkpoint_error_dir():
+    with pytest.raises(ValueError):
+        load_sharded_checkpoint(Net(), "./not_exist_sharded_ckpt")
+
+
+def test_save_checkpoint_error_format():
+    parameter_list = [{'name': "param", 'data': Tensor(np.ones([2]).astype(np.float32))}]
+    with pytest.raises(ValueError):
+        save_checkpoint(parameter_list, "./error_format.ckpt", ckpt_format="h5")
+
+
 def test_checkpoint_manager():
     """ test_checkpoint_manager """
     ckp_mgr = _CheckpointManager()
@@ -280,6 +386,22 @@ def test_load_param_into_net():
     assert net.conv1.weight.data.asnumpy()[0][0][0][0] == 1
 
 
+def test_load_param_into_net_lazy_init():
+    set_lazy_init(True)
+    try:
+        net = Net(10)
+        assert net.conv1.weight.has_init
+        assert net.fc.weight.has_init
+
+        parameter_dict = {"conv1.weight": Parameter(Tensor(np.ones(shape=(64, 3, 7, 7)), dtype=mstype.float32),
+                                                    name="conv1.weight")}
+        load_param_into_net(net, parameter_dict)
+        assert np.all(net.conv1.weight.data.asnumpy() == 1)
+        assert not net.fc.weight.has_init
+    finally:
+        set_lazy_init(False)
+
+
 def test_save_checkpoint_for_network():
     """ test save_checkpoint for network"""
     net = Net()
@@ -381,8 +503,9 @@ def test_print():
 
 def teardown_module():
     files = ['parameters.ckpt', 'new_ckpt.ckpt', 'empty.ckpt']
-    for item in files:
-        file_name = './' + item
+    file_names = ['./' + item for item in files]
+    file_names += [os.path.join(_cur_dir, item) for item in ['raw_parameters.ckpt', 'delta_base.ckpt', 'delta_1.ckpt']]
+    for file_name in file_names:
         if not os.path.exists(file_name):
             continue
         os.chmod(file_name, stat.S_IWRITE)
@@ -390,3 +513,6 @@ def teardown_module():
     import shutil
     if os.path.exists('./print'):
         shutil.rmtree('./print')
+    for ckpt_dir in ['./sharded_ckpt', './resharded_ckpt']:
+        if os.path.exists(ckpt_dir):
+            shutil.rmtree(ckpt_dir)